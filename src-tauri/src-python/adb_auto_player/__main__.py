@@ -22,38 +22,30 @@ sys.excepthook = _write_crash_log
 import asyncio
 import logging
 import multiprocessing
-import queue
 from concurrent.futures import ThreadPoolExecutor
 from contextvars import copy_context
-from datetime import datetime
 from functools import wraps
-from logging.handlers import QueueHandler, QueueListener
-from multiprocessing import Process, Queue, freeze_support
+from logging.handlers import QueueListener
+from multiprocessing import Queue, freeze_support
 from os import getenv
 from typing import Any, Literal, NoReturn, Optional
 
 from adb_auto_player.commands import log_debug_info
-from adb_auto_player.device.adb import AdbClientHelper, AdbController
+from adb_auto_player.device.adb import AdbClientHelper
 from adb_auto_player.device.adb.adb_scanner import (
     scan_emulator_ports as scan_emulator_ports_impl,
 )
 from adb_auto_player.file_loader import SettingsLoader
-from adb_auto_player.ipc import GameGUIOptions, LogMessage
+from adb_auto_player.ipc import LogMessage, ProfileStateUpdate
 from adb_auto_player.log import LogPreset
 from adb_auto_player.models.decorators import CacheGroup
 from adb_auto_player.models.pydantic.app_settings import AppSettings
 from adb_auto_player.models.registries import GameMetadata
 from adb_auto_player.registries import CACHE_REGISTRY, CUSTOM_ROUTINE_REGISTRY
-from adb_auto_player.task_loader import get_game_tasks
+from adb_auto_player.task_worker import TaskRequest, TaskWorker, TaskWorkerPool
 from adb_auto_player.tauri_context import TauriContext
-from adb_auto_player.tauri_helpers import get_game_gui_options, get_game_metadata
-from adb_auto_player.util import (
-    Execute,
-    LogMessageFactory,
-    RuntimeInfo,
-    StringHelper,
-    SummaryGenerator,
-)
+from adb_auto_player.tauri_helpers import ProfileStateService, get_game_metadata
+from adb_auto_player.util import LogMessageFactory, RuntimeInfo, StringHelper
 from anyio.from_thread import start_blocking_portal
 from pydantic import BaseModel
 from pytauri import (
@@ -72,7 +64,7 @@ SIGTERM_EXIT_CODE = -15
 
 commands: Commands = Commands(experimental_gen_ts=PYTAURI_GEN_TS)
 
-task_processes: dict[int, Process | None] = {}
+task_processes: dict[int, TaskWorker | None] = {}
 task_listeners: dict[int, QueueListener | None] = {}
 task_labels: dict[int, str | None] = {}
 # Queue | None breaks on macOS standalone build because Queue is seen as function.
@@ -80,8 +72,9 @@ task_summary_queues: dict[int, Optional[Queue]] = {}  # noqa: UP045
 
 _base_app_config_dir: Path | None = None
 _base_resource_dir: Path | None = None
+task_worker_pool = TaskWorkerPool()
 
-profile_state_locks: dict[int, asyncio.Lock] = {}
+profile_state_services: dict[int, ProfileStateService] = {}
 _executor = ThreadPoolExecutor(max_workers=4)
 
 
@@ -191,50 +184,12 @@ def _setup_logging() -> None:
     logger.setLevel(logging.DEBUG)
 
 
-def run_task(
-    command: str,
-    log_queue: Queue,
-    summary_queue: Queue,
-    app_config_dir: Path,
-    resource_dir: Path,
-) -> None:
-    """Wrapper to run task in a separate process."""
-    queue_handler = QueueHandler(log_queue)
-    logger = logging.getLogger()
-    logger.setLevel(logging.DEBUG)
-    logger.addHandler(queue_handler)
-
-    def summary_callback(msg: str | None):
-        # We are catching all exceptions here regardless
-        # because we never want the summary to actually stop the process via error
-        if summary_queue.full():
-            try:
-                summary_queue.get_nowait()
-            except (queue.Empty, Exception):
-                pass
-        try:
-            summary_queue.put_nowait(msg)
-        except (queue.Full, Exception):
-            # queue.Full should really never happen here but leaving as is
-            pass
-
-    SummaryGenerator.set_callback(summary_callback)
-    SettingsLoader.set_app_config_dir(app_config_dir)
-    SettingsLoader.set_resource_dir(resource_dir)
-
-    try:
-        e = Execute.find_command_and_execute(command, get_game_tasks())
-        if isinstance(e, BaseException):
-            logging.error(e)
-            sys.exit(1)
-    except Exception as exc:
-        logging.error(exc)
-        sys.exit(1)
-
-
 class StartTaskBody(ProfileContext):
     args: list[str]
     label: str
+    profile: bool = False
+    memory_watch: bool = False
+    record_session: bool = False
 
 
 class TaskCompletedEventEvent(BaseModel):
@@ -247,12 +202,17 @@ class EmptyModel(BaseModel):
     pass
 
 
+class EmulatorDeviceFoundEvent(BaseModel):
+    profile_index: int
+    serial: str
+
+
 @tauri_profile_aware_command
 async def start_task(
     app_handle: AppHandle,
     body: StartTaskBody,
 ) -> None:
-    if not _base_app_config_dir:
+    if not _base_app_config_dir or not _base_resource_dir:
         logging.error("Cannot resolve App Config Dir")
         return
 
@@ -262,30 +222,30 @@ async def start_task(
         logging.warning("Task is already running!")
         return
 
-    log_queue = Queue()
-    summary_queue = Queue(maxsize=2)
+    app_config_dir = _base_app_config_dir / f"{body.profile_index}"
+    task_process = task_worker_pool.acquire(
+        body.profile_index, app_config_dir, _base_resource_dir
+    )
+    summary_queue = task_process.summary_queue
     task_summary_queues[body.profile_index] = summary_queue
 
     listener = QueueListener(
-        log_queue, TauriQueueHandler(app_handle, body.profile_index)
+        task_process.log_queue, TauriQueueHandler(app_handle, body.profile_index)
     )
     task_listeners[body.profile_index] = listener
     listener.start()
 
-    task_process = Process(
-        target=run_task,
-        args=(
-            " ".join(body.args),
-            log_queue,
-            summary_queue,
-            _base_app_config_dir / f"{body.profile_index}",
-            _base_resource_dir,
-        ),
-    )
-
     task_processes[body.profile_index] = task_process
     task_labels[body.profile_index] = body.label
-    task_process.start()
+    _refresh_profile_state(body.profile_index)
+    task_process.submit(
+        TaskRequest(
+            command=" ".join(body.args),
+            profile=body.profile,
+            memory_watch=body.memory_watch,
+            record=body.record_session,
+        )
+    )
 
     while task_process and task_process.is_alive():
         await asyncio.sleep(0.5)
@@ -310,6 +270,8 @@ async def start_task(
     task_summary_queues[body.profile_index] = None
 
     exit_code = task_process.exitcode
+    _prefork_task_worker(body.profile_index)
+    _refresh_profile_state(body.profile_index)
 
     Emitter.emit(
         app_handle,
@@ -332,6 +294,15 @@ async def start_task(
     return
 
 
+def _prefork_task_worker(profile_index: int) -> None:
+    """Warm up the process of the next task of the profile."""
+    task_worker_pool.prefork(
+        profile_index,
+        SettingsLoader.get_app_config_dir(),
+        SettingsLoader.get_resource_dir(),
+    )
+
+
 @tauri_profile_aware_command
 async def stop_task(
     app_handle: AppHandle,
@@ -341,7 +312,6 @@ async def stop_task(
     if task_process and task_process.is_alive():
         logging.info("Stopping Task")
         task_process.terminate()
-        task_process.join()
         await asyncio.sleep(0.5)  # wait a bit for start_task tear down
 
 
@@ -411,44 +381,26 @@ async def get_game_settings_form(
     )
 
 
-class ProfileState(BaseModel):
-    game_menu: GameGUIOptions | None
-    device_id: str | None
-    active_task: str | None
-
-
-class ProfileStateUpdate(BaseModel):
-    state: ProfileState
-    timestamp: float
-    index: int
-
-
-def get_profile_state_lock(index: int) -> asyncio.Lock:
-    if index not in profile_state_locks:
-        profile_state_locks[index] = asyncio.Lock()
-    return profile_state_locks[index]
-
+def _get_profile_state_service(
+    app_handle: AppHandle, profile_index: int
+) -> ProfileStateService:
+    service = profile_state_services.get(profile_index)
+    if service is None:
+        service = ProfileStateService(
+            profile_index,
+            publish=lambda update: Emitter.emit(
+                app_handle, "profile-state-update", update
+            ),
+            active_task=lambda: task_labels.get(profile_index, None),
+            on_device_error=lambda: _cache_clear(CacheGroup.ADB, profile_index),
+        )
+        profile_state_services[profile_index] = service
+    return service
 
-def _get_state_sync(profile_index: int) -> ProfileState:
-    """Synchronous helper function that runs in thread pool.
 
-    Context variables are already set by copy_context().
-    """
-    try:
-        state = ProfileState(
-            game_menu=get_game_gui_options(),
-            device_id=AdbController().d.serial,
-            active_task=task_labels.get(profile_index, None),
-        )
-    except Exception as e:
-        _cache_clear(CacheGroup.ADB, profile_index)
-        logging.error(e)
-        state = ProfileState(
-            game_menu=None,
-            device_id=None,
-            active_task=task_labels.get(profile_index, None),
-        )
-    return state
+def _refresh_profile_state(profile_index: int) -> None:
+    if service := profile_state_services.get(profile_index):
+        service.refresh()
 
 
 @tauri_profile_aware_command
@@ -456,33 +408,20 @@ async def get_profile_state(
     app_handle: AppHandle,
     body: ProfileContext,
 ) -> None:
-    lock = get_profile_state_lock(body.profile_index)
+    """Subscribe to "profile-state-update" events of the profile.
 
-    # if already running, skip completely to prevent race conditions
-    if lock.locked():
-        return
+    The state is pushed whenever it changes, calling this again publishes the
+    current state.
+    """
+    task_process = task_processes.get(body.profile_index, None)
+    if not task_process or not task_process.is_alive():
+        _prefork_task_worker(body.profile_index)
 
-    # convert to ms for FE
-    timestamp = int(datetime.now().timestamp() * 1000)
-
-    async with lock:
-        ctx = copy_context()
-        loop = asyncio.get_event_loop()
-        state = await loop.run_in_executor(
-            _executor,
-            lambda: ctx.run(_get_state_sync, body.profile_index),
-        )
-
-        Emitter.emit(
-            app_handle,
-            "profile-state-update",
-            ProfileStateUpdate(
-                state=state,
-                index=body.profile_index,
-                timestamp=timestamp,
-            ),
-        )
-    return
+    service = _get_profile_state_service(app_handle, body.profile_index)
+    if service.is_running():
+        service.refresh()
+    else:
+        service.start()
 
 
 @tauri_profile_aware_command
@@ -492,9 +431,18 @@ async def scan_emulator_ports(
 ) -> list[str]:
     ctx = copy_context()
     loop = asyncio.get_event_loop()
+
+    def on_device(serial: str) -> None:
+        # Lets the GUI show the first device before the scan deadline.
+        Emitter.emit(
+            app_handle,
+            "emulator-device-found",
+            EmulatorDeviceFoundEvent(profile_index=body.profile_index, serial=serial),
+        )
+
     ports = await loop.run_in_executor(
         _executor,
-        lambda: ctx.run(scan_emulator_ports_impl),
+        lambda: ctx.run(scan_emulator_ports_impl, on_device=on_device),
     )
     return ports
 
@@ -510,6 +458,14 @@ async def cache_clear(
 
     _cache_clear(CacheGroup.GAME_SETTINGS, body.profile_index)
 
+    if service := profile_state_services.get(body.profile_index):
+        service.reset()
+
+    # The spare task worker loaded the previous settings.
+    if task_worker_pool.has_spare(body.profile_index):
+        task_worker_pool.recycle(body.profile_index)
+        _prefork_task_worker(body.profile_index)
+
 
 class SaveLogFileBody(BaseModel):
     content: str
@@ -566,7 +522,9 @@ def main() -> int:
             for process in task_processes.values():
                 if process and process.is_alive():
                     process.terminate()
-                    process.join()
+            task_worker_pool.recycle()
+            for service in profile_state_services.values():
+                service.stop(timeout=1)
             _executor.shutdown(wait=False, cancel_futures=True)
             try:
                 AdbClientHelper.get_adb_client().server_kill()
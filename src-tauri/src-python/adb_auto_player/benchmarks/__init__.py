@@ -0,0 +1,11 @@
+"""Micro-benchmarks."""
+
+from . import suite
+from .micro_benchmark import BenchmarkComparison, BenchmarkResult, MicroBenchmark
+
+__all__ = [
+    "BenchmarkComparison",
+    "BenchmarkResult",
+    "MicroBenchmark",
+    "suite",
+]
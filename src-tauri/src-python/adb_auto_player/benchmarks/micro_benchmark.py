@@ -0,0 +1,199 @@
+"""Harness timing registered micro-benchmarks and comparing them to baselines."""
+
+import json
+import logging
+import re
+import statistics
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from time import perf_counter
+from typing import Any, ClassVar
+
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.25
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Timing of one benchmark, all times are seconds per call.
+
+    Attributes:
+        name: Benchmark name, e.g. `TemplateMatcher.find_template_match[best]`.
+        median: Median of the repeats, used for comparisons.
+        minimum: Fastest repeat.
+        mean: Mean of the repeats.
+        stdev: Standard deviation of the repeats.
+        calls: Calls per repeat.
+    """
+
+    name: str
+    median: float
+    minimum: float
+    mean: float
+    stdev: float
+    calls: int
+
+    def __str__(self) -> str:
+        """Result as one line."""
+        return (
+            f"{self.name:<60} {self.median * 1000:10.3f} ms "
+            f"(min {self.minimum * 1000:.3f}, +-{self.stdev * 1000:.3f}, "
+            f"{self.calls} calls)"
+        )
+
+
+@dataclass(frozen=True)
+class BenchmarkComparison:
+    """Median of a benchmark against its baseline.
+
+    Attributes:
+        name: Benchmark name.
+        baseline: Baseline median in seconds per call.
+        current: Current median in seconds per call.
+    """
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Relative change, 0.3 means 30% slower."""
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    def is_regression(self, threshold: float = DEFAULT_THRESHOLD) -> bool:
+        """Whether the benchmark got at least `threshold` slower."""
+        return self.change >= threshold
+
+    def __str__(self) -> str:
+        """Comparison as one line."""
+        return (
+            f"{self.name:<60} {self.baseline * 1000:10.3f} ms -> "
+            f"{self.current * 1000:10.3f} ms ({self.change:+.0%})"
+        )
+
+
+class MicroBenchmark:
+    """Registry and runner of micro-benchmarks.
+
+    A benchmark is a setup function returning the callable to time, so loading
+    fixtures is not part of the measurement. Benchmarks raising an exception,
+    e.g. because an OCR engine is not installed, are skipped.
+    """
+
+    _setups: ClassVar[dict[str, Callable[[], Callable[[], Any]]]] = {}
+
+    @classmethod
+    def register(
+        cls, name: str
+    ) -> Callable[[Callable[[], Callable[[], Any]]], Callable[[], Callable[[], Any]]]:
+        """Decorator registering a benchmark setup under `name`."""
+
+        def decorator(
+            setup: Callable[[], Callable[[], Any]],
+        ) -> Callable[[], Callable[[], Any]]:
+            cls._setups[name] = setup
+            return setup
+
+        return decorator
+
+    @classmethod
+    def names(cls, pattern: str | None = None) -> list[str]:
+        """Registered benchmark names, filtered by the regex `pattern`."""
+        return [
+            name for name in cls._setups if pattern is None or re.search(pattern, name)
+        ]
+
+    @classmethod
+    def run(
+        cls,
+        pattern: str | None = None,
+        repeat: int = DEFAULT_REPEAT,
+        min_time: float = DEFAULT_MIN_TIME,
+    ) -> list[BenchmarkResult]:
+        """Run the registered benchmarks.
+
+        Args:
+            pattern: Regex selecting benchmarks by name, all if None.
+            repeat: Number of timed repeats per benchmark.
+            min_time: Minimum seconds per repeat, fast benchmarks are called
+                multiple times per repeat.
+
+        Returns:
+            list[BenchmarkResult]: Results of benchmarks that were not skipped.
+        """
+        results = []
+        for name in cls.names(pattern):
+            try:
+                func = cls._setups[name]()
+                result = cls.measure(name, func, repeat=repeat, min_time=min_time)
+            except Exception as e:
+                logging.warning(f"Skipping {name}: {e}")
+                continue
+            logging.info(str(result))
+            results.append(result)
+        return results
+
+    @staticmethod
+    def measure(
+        name: str,
+        func: Callable[[], Any],
+        repeat: int = DEFAULT_REPEAT,
+        min_time: float = DEFAULT_MIN_TIME,
+    ) -> BenchmarkResult:
+        """Time `func`, the first call is a warmup and not measured."""
+        func()
+        calls = 1
+        while (elapsed := _time_calls(func, calls)) < min_time:
+            calls *= 2
+        timings = [elapsed / calls]
+        timings += [_time_calls(func, calls) / calls for _ in range(repeat - 1)]
+        return BenchmarkResult(
+            name=name,
+            median=statistics.median(timings),
+            minimum=min(timings),
+            mean=statistics.fmean(timings),
+            stdev=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            calls=calls,
+        )
+
+    @staticmethod
+    def save(results: list[BenchmarkResult], path: Path) -> Path:
+        """Write results as a JSON baseline, parent directories are created."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps([asdict(result) for result in results], indent=2),
+            encoding="utf-8",
+        )
+        return path
+
+    @staticmethod
+    def load(path: Path) -> dict[str, BenchmarkResult]:
+        """Read a JSON baseline written by `save`."""
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return {entry["name"]: BenchmarkResult(**entry) for entry in data}
+
+    @staticmethod
+    def compare(
+        results: list[BenchmarkResult],
+        baseline: dict[str, BenchmarkResult],
+    ) -> list[BenchmarkComparison]:
+        """Compare medians of results that have a baseline."""
+        return [
+            BenchmarkComparison(
+                name=result.name,
+                baseline=baseline[result.name].median,
+                current=result.median,
+            )
+            for result in results
+            if result.name in baseline
+        ]
+
+
+def _time_calls(func: Callable[[], Any], calls: int) -> float:
+    start = perf_counter()
+    for _ in range(calls):
+        func()
+    return perf_counter() - start
@@ -0,0 +1,148 @@
+"""Micro-benchmarks of the vision, OCR and I/O hot paths.
+
+Fixtures are the images in tests/data and the AFK Journey templates, so results
+are reproducible offline and on CPU.
+"""
+
+import io
+from collections.abc import Callable
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any
+
+import cv2
+from adb_auto_player.image_manipulation import IO, Color, Cropping
+from adb_auto_player.image_manipulation import io as image_io
+from adb_auto_player.image_manipulation.hero_resizer import find_optimal_scale
+from adb_auto_player.models import ConfidenceValue
+from adb_auto_player.models.image_manipulation import CropRegions
+from adb_auto_player.models.template_matching import MatchMode
+from adb_auto_player.ocr import RapidOCRBackend, TesseractBackend
+from adb_auto_player.template_matching import TemplateMatcher
+from adb_auto_player.util import StringHelper
+
+from .micro_benchmark import MicroBenchmark
+
+_TESTS_DIR = Path(__file__).parents[2] / "tests"
+_DATA_DIR = _TESTS_DIR / "data"
+_TEMPLATE_MATCHING_DATA_DIR = _TESTS_DIR / "template_matching" / "data"
+_OCR_DATA_DIR = _TESTS_DIR / "ocr" / "test_tesseract_backend" / "data"
+_GAME_TEMPLATE_DIR = Path(__file__).parents[1] / "games" / "afk_journey" / "templates"
+
+_SCREENSHOT = _DATA_DIR / "template_match_base.png"
+_TEMPLATE = _DATA_DIR / "template_match_template.png"
+_POPUP = _OCR_DATA_DIR / "popup_no_hero_placed_talent_buff_tile.png"
+
+
+def _load(path: Path) -> Any:
+    return cv2.imread(str(path))
+
+
+def _register_match_mode(match_mode: MatchMode) -> None:
+    @MicroBenchmark.register(f"TemplateMatcher.find_template_match[{match_mode}]")
+    def _setup() -> Callable[[], Any]:
+        base, template = _load(_SCREENSHOT), _load(_TEMPLATE)
+        return lambda: TemplateMatcher.find_template_match(
+            base, template, match_mode=match_mode
+        )
+
+
+for _match_mode in MatchMode:
+    _register_match_mode(_match_mode)
+
+
+@MicroBenchmark.register("TemplateMatcher.find_template_match[grayscale]")
+def _find_template_match_grayscale() -> Callable[[], Any]:
+    base, template = _load(_SCREENSHOT), _load(_TEMPLATE)
+    return lambda: TemplateMatcher.find_template_match(base, template, grayscale=True)
+
+
+@MicroBenchmark.register("TemplateMatcher.find_template_match[game template]")
+def _find_game_template_match() -> Callable[[], Any]:
+    base, template = _load(_POPUP), _load(_GAME_TEMPLATE_DIR / "confirm_text.png")
+    return lambda: TemplateMatcher.find_template_match(base, template)
+
+
+@MicroBenchmark.register("TemplateMatcher.find_all_template_matches")
+def _find_all_template_matches() -> Callable[[], Any]:
+    base = _load(_TEMPLATE_MATCHING_DATA_DIR / "guitar_girl_with_notes.png")
+    template = _load(_TEMPLATE_MATCHING_DATA_DIR / "small_note.png")
+    return lambda: TemplateMatcher.find_all_template_matches(base, template)
+
+
+@MicroBenchmark.register("Cropping.crop")
+def _crop() -> Callable[[], Any]:
+    image = _load(_SCREENSHOT)
+    regions = CropRegions(left=0.1, right=0.2, top="100px", bottom="25%")
+    return lambda: Cropping.crop(image, regions)
+
+
+@MicroBenchmark.register("IO.load_image[cached]")
+def _load_image_cached() -> Callable[[], Any]:
+    IO.load_image(_TEMPLATE)
+    return lambda: IO.load_image(_TEMPLATE)
+
+
+@MicroBenchmark.register("IO.load_image[uncached]")
+def _load_image_uncached() -> Callable[[], Any]:
+    def load() -> None:
+        image_io.template_cache.clear()
+        IO.load_image(_SCREENSHOT)
+
+    return load
+
+
+@MicroBenchmark.register("IO.get_bgr_np_array_from_png_bytes")
+def _decode_png() -> Callable[[], Any]:
+    data = _SCREENSHOT.read_bytes()
+    return lambda: IO.get_bgr_np_array_from_png_bytes(data)
+
+
+@MicroBenchmark.register("Color.to_grayscale")
+def _to_grayscale() -> Callable[[], Any]:
+    image = _load(_SCREENSHOT)
+    return lambda: Color.to_grayscale(image)
+
+
+@MicroBenchmark.register("Color.to_rgb")
+def _to_rgb() -> Callable[[], Any]:
+    image = _load(_SCREENSHOT)
+    return lambda: Color.to_rgb(image)
+
+
+@MicroBenchmark.register("hero_resizer.find_optimal_scale")
+def _find_optimal_scale() -> Callable[[], Any]:
+    screenshot = _TEMPLATE_MATCHING_DATA_DIR / "guitar_girl_with_notes.png"
+    template = _TEMPLATE_MATCHING_DATA_DIR / "small_note.png"
+
+    def calibrate() -> None:
+        with redirect_stdout(io.StringIO()):
+            find_optimal_scale(template, screenshot_path=str(screenshot))
+
+    return calibrate
+
+
+@MicroBenchmark.register("TesseractBackend.detect_text_blocks")
+def _tesseract() -> Callable[[], Any]:
+    backend = TesseractBackend()
+    image = _load(_POPUP)
+    return lambda: backend.detect_text_blocks(image)
+
+
+@MicroBenchmark.register("RapidOCRBackend.detect_text_blocks")
+def _rapidocr() -> Callable[[], Any]:
+    backend = RapidOCRBackend()
+    image = _load(_POPUP)
+    return lambda: backend.detect_text_blocks(image)
+
+
+@MicroBenchmark.register("StringHelper.fuzzy_substring_match")
+def _fuzzy_substring_match() -> Callable[[], Any]:
+    text = (
+        "No hero is placed on the Talent Buff tile. Are you sure you want to "
+        "start the battle? Do not show this again today. Cancel Confirm"
+    )
+    threshold = ConfidenceValue("80%")
+    return lambda: StringHelper.fuzzy_substring_match(
+        text, "Talent Bufff tiles", threshold
+    )
@@ -49,6 +49,26 @@ class ArgparseHelper:
             default=None,
             help="adb_auto_player directory",
         )
+        parser.add_argument(
+            "--trace",
+            action="store_true",
+            help="Export a Chrome trace of the task to debug/traces",
+        )
+        parser.add_argument(
+            "--profile",
+            action="store_true",
+            help="Write sampled stacks of the task to debug/profiles",
+        )
+        parser.add_argument(
+            "--memory-watch",
+            action="store_true",
+            help="Log memory growth of the task and write a report to debug/memory",
+        )
+        parser.add_argument(
+            "--record",
+            action="store_true",
+            help="Record frames, inputs and decisions of the task to data/recordings",
+        )
 
         return parser
 
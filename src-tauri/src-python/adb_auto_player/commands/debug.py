@@ -4,7 +4,11 @@ import logging
 import pprint
 import time
 
-from adb_auto_player.device.adb import AdbClientHelper, AdbController
+from adb_auto_player.device.adb import (
+    AdbClientHelper,
+    AdbController,
+    DeviceHealthMonitor,
+)
 from adb_auto_player.file_loader import SettingsLoader
 from adb_auto_player.models.geometry import PointOutsideDisplay
 from adb_auto_player.util import RuntimeInfo
@@ -36,11 +40,18 @@ def log_debug_info() -> None:
     _test_input_delay(controller)
     _log_display_info(controller)
     _test_resize_display(controller)
+    _log_device_health()
 
     logging.info("--- Debug Info End ---")
     return
 
 
+def _log_device_health() -> None:
+    logging.info("--- ADB Device Health ---")
+    for serial, stats in DeviceHealthMonitor.snapshot().items():
+        logging.info(f"{serial}: {pprint.pformat(stats)}")
+
+
 def _log_hardware_info() -> None:
     logging.info("--- Hardware Info Start ---")
     logging.info(f"OS: {RuntimeInfo.platform()}")
@@ -0,0 +1,26 @@
+"""Task Metrics Commands."""
+
+import logging
+
+from adb_auto_player.decorators import register_command
+from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.ipc import CommandGUICategory
+from adb_auto_player.models.decorators import GUIMetadata
+from adb_auto_player.util import MetricsLedger
+
+
+@register_command(
+    gui=GUIMetadata(
+        label="Task Metrics Summary",
+        category=CommandGUICategory.SETTINGS_PHONE_DEBUG,
+        tooltip="Log average durations of recent task runs and detected slowdowns",
+    ),
+    name="TaskMetricsSummary",
+)
+def _log_task_metrics_summary():
+    # Printing the summary is not a task run worth keeping in the history.
+    MetricsLedger.enabled = False
+    ledger = MetricsLedger.in_app_config_dir(SettingsLoader.get_app_config_dir())
+    logging.info("--- Task Metrics ---")
+    for line in ledger.summary().splitlines():
+        logging.info(line)
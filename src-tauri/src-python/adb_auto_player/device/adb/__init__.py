@@ -1,10 +1,32 @@
 from .adb_client import AdbClientHelper
 from .adb_controller import AdbController
 from .adb_input_device import InputDevice
+from .async_adb import AsyncAdbClient, AsyncAdbStream
+from .async_transport import (
+    AdbEventLoop,
+    AsyncSync,
+    AsyncTransportDevice,
+    SyncAdbStream,
+)
 from .blue_stacks_at_translated_set_2_keyboard import ATTranslatedSet2Keyboard
 from .blue_stacks_virtual_gamepad import BlueStacksVirtualGamepad
 from .blue_stacks_virtual_touch import BlueStacksVirtualTouch
-from .device_stream import DeviceStream, StreamingNotSupportedError
+from .decoder_selection import (
+    DecoderChoice,
+    DecoderSelector,
+    StreamingNotSupportedError,
+)
+from .device_health import (
+    AdbServerRestartGate,
+    CircuitState,
+    DeviceHealth,
+    DeviceHealthMonitor,
+)
+from .device_probe import DeviceProbe
+from .device_stream import DeviceStream
+from .event_stream_writer import EventStreamWriter, Gesture, InputEvent
+from .frame_broker import FrameBroker, FrameReader, SharedFrame, SharedFrameRing
+from .screenrecord_segments import ScreenrecordSegmentManager, SegmentGapStats
 from .xiaomi_input import XiaomiInput
 from .xiaomi_joystick import XiaomiJoystick
 
@@ -12,11 +34,33 @@ __all__ = [
     "ATTranslatedSet2Keyboard",
     "AdbClientHelper",
     "AdbController",
+    "AdbEventLoop",
+    "AdbServerRestartGate",
+    "AsyncAdbClient",
+    "AsyncAdbStream",
+    "AsyncSync",
+    "AsyncTransportDevice",
     "BlueStacksVirtualGamepad",
     "BlueStacksVirtualTouch",
+    "CircuitState",
+    "DecoderChoice",
+    "DecoderSelector",
+    "DeviceHealth",
+    "DeviceHealthMonitor",
+    "DeviceProbe",
     "DeviceStream",
+    "EventStreamWriter",
+    "FrameBroker",
+    "FrameReader",
+    "Gesture",
     "InputDevice",
+    "InputEvent",
+    "ScreenrecordSegmentManager",
+    "SegmentGapStats",
+    "SharedFrame",
+    "SharedFrameRing",
     "StreamingNotSupportedError",
+    "SyncAdbStream",
     "XiaomiInput",
     "XiaomiJoystick",
 ]
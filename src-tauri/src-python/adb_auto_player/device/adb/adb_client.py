@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 from logging import DEBUG, WARNING
 
 from adb_auto_player.decorators import register_cache
@@ -10,6 +11,7 @@ from adbutils import AdbClient, AdbDevice, AdbError
 from adbutils._proto import AdbDeviceInfo
 
 from .adb_utils import _set_adb_path
+from .device_discovery import first_device
 
 
 class AdbClientHelper:
@@ -196,6 +198,9 @@ def _try_common_ports_and_device_ids(
     And also for cases where Bluestacks prompts the user to create a
     new instance with a different Android version. Even after closing the first
     instance, it may remain in the device list but not be connectable.
+
+    All device ids are probed concurrently, the first one in the list that
+    can be connected wins.
     """
     logging.debug("Trying common device ids")
     common_device_ids: list[str] = [
@@ -210,12 +215,7 @@ def _try_common_ports_and_device_ids(
     if checked_device_id in common_device_ids:
         common_device_ids.remove(checked_device_id)
 
-    for potential_device_id in common_device_ids:
-        device = _connect_to_device(client, potential_device_id)
-        if device is not None:
-            return device
-
-    return None
+    return first_device(partial(_connect_to_device, client), common_device_ids)
 
 
 def _connect_to_device(client: AdbClient, device_id: str) -> AdbDevice | None:
@@ -10,6 +10,13 @@ from adb_auto_player.models.geometry import Coordinates
 from adb_auto_player.tauri_context import profile_aware_cache
 
 from .adb_device import AdbDeviceWrapper
+from .device_probe import DeviceProbe
+
+_ORIENTATION_SECTIONS = (
+    "surface_orientation",
+    "current_rotation",
+    "display_orientation",
+)
 
 
 class AdbController:
@@ -17,9 +24,13 @@ class AdbController:
 
     d: AdbDeviceWrapper
 
-    def __init__(self):
-        """Init."""
-        self.d = AdbDeviceWrapper.create_from_settings()
+    def __init__(self, d: AdbDeviceWrapper | None = None):
+        """Init.
+
+        Args:
+            d: Device to control, resolved from ADB Settings if None.
+        """
+        self.d = d or AdbDeviceWrapper.create_from_settings()
         # Physical display id (for `screencap -d`) and WM logical display id (for
         # `input -d`) of the display hosting the game, resolved lazily on first use.
         # See `_resolve_display_ids`.
@@ -27,6 +38,31 @@ class AdbController:
         self._input_display_id: str | None = None
         self._display_ids_resolved: bool = False
 
+    def probe(self) -> DeviceProbe | None:
+        """Query the device capabilities in a single shell round trip.
+
+        Later calls to `get_display_info`, `is_controlling_emulator`,
+        `get_input_device`, display targeting and `DeviceStream` use the probed
+        outputs instead of querying the device one command at a time.
+
+        Returns:
+            DeviceProbe | None: The probe, None if probing failed.
+        """
+        try:
+            return DeviceProbe.run(self.d)
+        except Exception as e:
+            logging.debug(f"Device probe failed: {e}")
+            return None
+
+    def probed_section(self, name: str) -> str | None:
+        """Output of a probed command, None if the device was not probed."""
+        probe = DeviceProbe.get(self.d.serial)
+        return probe.section(name) if probe else None
+
+    def _take_probed(self, name: str) -> str | None:
+        probe = DeviceProbe.get(self.d.serial)
+        return probe.take(name) if probe else None
+
     def set_display_size(self, display_size: str) -> None:
         """Set display size.
 
@@ -49,7 +85,7 @@ class AdbController:
         Returns:
             DisplayInfo: Resolution and orientation.
         """
-        result = self.d.shell("wm size")
+        result = self._take_probed("wm_size") or self.d.shell("wm size")
         if not result:
             raise GenericAdbUnrecoverableError("Unable to determine screen resolution")
 
@@ -75,7 +111,10 @@ class AdbController:
 
         return DisplayInfo(
             resolution=Resolution.from_string(resolution_str),
-            orientation=_check_orientation(self.d),
+            orientation=_check_orientation(
+                self.d,
+                {name: self._take_probed(name) for name in _ORIENTATION_SECTIONS},
+            ),
         )
 
     def get_running_app(self) -> str | None:
@@ -166,7 +205,9 @@ class AdbController:
                 WM logical display id for `input -d`), or (None, None) to fall back to
                 adb's defaults.
         """
-        display_output = self.d.shell("dumpsys display")
+        display_output = self._take_probed("display_viewports") or self.d.shell(
+            "dumpsys display"
+        )
         if not isinstance(display_output, str):
             return None, None
 
@@ -311,7 +352,9 @@ class AdbController:
     @profile_aware_cache(maxsize=1)
     def is_controlling_emulator(self):
         """Whether the controlled device is an emulator or not."""
-        result = str(self.d.shell('getprop | grep "Build"'))
+        result = self.probed_section("getprop")
+        if result is None:
+            result = str(self.d.shell('getprop | grep "Build"'))
         if "Build" in result:
             return True
         logging.debug('getprop does not contain "Build" assuming Phone')
@@ -319,7 +362,7 @@ class AdbController:
 
     def get_input_device(self, name: str) -> str | None:
         """Return /dev/input/eventX for a given input device name."""
-        content = _get_input_devices(self.d)
+        content = self.probed_section("input_devices") or _get_input_devices(self.d)
         blocks = content.strip().split("\n\n")
         for block in blocks:
             if f'N: Name="{name}"' in block:
@@ -329,7 +372,9 @@ class AdbController:
         return None
 
 
-def _check_orientation(d: AdbDeviceWrapper) -> Orientation:
+def _check_orientation(
+    d: AdbDeviceWrapper, probed: dict[str, str | None] | None = None
+) -> Orientation:
     """Check device orientation using multiple fallback methods.
 
     Tries different orientation detection methods in order of reliability,
@@ -338,6 +383,8 @@ def _check_orientation(d: AdbDeviceWrapper) -> Orientation:
 
     Args:
         d (AdbDevice): ADB device.
+        probed: Outputs of the checks from `DeviceProbe`, checks without an
+            output query the device.
 
     Returns:
         Orientation: Device orientation (PORTRAIT or LANDSCAPE).
@@ -345,10 +392,13 @@ def _check_orientation(d: AdbDeviceWrapper) -> Orientation:
     Raises:
         GenericAdbUnrecoverableError: If unable to perform any orientation checks.
     """
+    probed = probed or {}
+
     # Check 1: SurfaceOrientation (most reliable)
     try:
         orientation_check = str(
-            d.shell("dumpsys input | grep 'SurfaceOrientation'")
+            probed.get("surface_orientation")
+            or d.shell("dumpsys input | grep 'SurfaceOrientation'")
         ).strip()
         if orientation_check:
             if "Orientation: 0" in orientation_check:
@@ -363,7 +413,8 @@ def _check_orientation(d: AdbDeviceWrapper) -> Orientation:
     # Check 2: Current rotation (fallback)
     try:
         rotation_check = str(
-            d.shell_unsafe("dumpsys window | grep mCurrentRotation")
+            probed.get("current_rotation")
+            or d.shell_unsafe("dumpsys window | grep mCurrentRotation")
         ).strip()
         if rotation_check:
             if "ROTATION_0" in rotation_check:
@@ -377,7 +428,8 @@ def _check_orientation(d: AdbDeviceWrapper) -> Orientation:
     # Check 3: Display orientation (last resort)
     try:
         display_check = str(
-            d.shell_unsafe("dumpsys display | grep -E 'orientation'")
+            probed.get("display_orientation")
+            or d.shell_unsafe("dumpsys display | grep -E 'orientation'")
         ).strip()
         if display_check:
             if "orientation=0" in display_check:
@@ -1,7 +1,10 @@
 from adb_auto_player.exceptions import GenericAdbUnrecoverableError
+from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.util import RunMetrics, Tracer
 from adbutils import AdbConnection, AdbDevice
 
 from .adb_client import AdbClientHelper
+from .async_transport import AsyncTransportDevice
 from .retry_decorator import adb_retry
 
 
@@ -18,6 +21,10 @@ class AdbDeviceWrapper:
 
     d: AdbDevice
     default_socket_timeout: float = 10.0
+    # Run shell and sync services on the shared asyncio transport instead of a
+    # blocking socket per call, see AsyncTransportDevice. Forces the transport on
+    # regardless of the async_transport ADB setting.
+    use_async_transport: bool = False
 
     def __init__(self, d: AdbDevice):
         """Init."""
@@ -26,8 +33,19 @@ class AdbDeviceWrapper:
     @staticmethod
     def create_from_settings() -> "AdbDeviceWrapper":
         """Create a new AdbDeviceWrapper instance from ADB Settings."""
-        return AdbDeviceWrapper(d=AdbClientHelper.resolve_adb_device())
+        device = AdbClientHelper.resolve_adb_device()
+        RunMetrics.device_serial = device.serial
+        use_async_transport = (
+            AdbDeviceWrapper.use_async_transport
+            or SettingsLoader.adb_settings().advanced.async_transport
+        )
+        if use_async_transport and device.serial:
+            device = AsyncTransportDevice(
+                AdbClientHelper.get_adb_client(), device.serial
+            )
+        return AdbDeviceWrapper(d=device)
 
+    @Tracer.trace("adb.shell", "adb")
     @adb_retry
     def shell(
         self,
@@ -49,6 +67,7 @@ class AdbDeviceWrapper:
         _check_output_for_error(output)
         return output
 
+    @Tracer.trace("adb.screenshot", "adb")
     @adb_retry
     def screenshot(self, display_id: str | None = None) -> str | bytes:
         """Screenshot.
@@ -81,6 +100,7 @@ class AdbDeviceWrapper:
         cmdargs.extend(args)
         return cmdargs
 
+    @Tracer.trace("adb.tap", "adb")
     @adb_retry
     def tap(self, x: str, y: str, display_id: str | None = None) -> None:
         """Tap.
@@ -97,6 +117,7 @@ class AdbDeviceWrapper:
         ) as connection:
             connection.read_until_close()
 
+    @Tracer.trace("adb.keyevent", "adb")
     @adb_retry
     def keyevent(self, key: str, display_id: str | None = None) -> None:
         """Key event.
@@ -110,6 +131,7 @@ class AdbDeviceWrapper:
         ) as connection:
             connection.read_until_close()
 
+    @Tracer.trace("adb.swipe", "adb")
     @adb_retry
     def swipe(
         self,
@@ -137,6 +159,7 @@ class AdbDeviceWrapper:
         ) as connection:
             connection.read_until_close()
 
+    @Tracer.trace("adb.shell_unsafe", "adb")
     def shell_unsafe(
         self,
         cmdargs: str | list | tuple,
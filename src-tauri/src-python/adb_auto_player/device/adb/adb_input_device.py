@@ -3,6 +3,8 @@ from abc import ABC, abstractmethod
 from adb_auto_player.device.adb import AdbController
 from adb_auto_player.exceptions import AutoPlayerError
 
+from .event_stream_writer import EventStreamWriter, Gesture
+
 
 class InputDevice(ABC):
     """Abstract class for Android Input Device."""
@@ -10,6 +12,7 @@ class InputDevice(ABC):
     EV_SYN = 0x00
 
     _input_device: str | None = None
+    _event_writer: EventStreamWriter | None = None
 
     @property
     @abstractmethod
@@ -27,11 +30,24 @@ class InputDevice(ABC):
             raise AutoPlayerError(f"Input device '{self.name}' cannot be initialized.")
         return self._input_device
 
+    @property
+    def event_writer(self) -> EventStreamWriter:
+        """Persistent event stream for this input device."""
+        if self._event_writer is None:
+            self._event_writer = EventStreamWriter(
+                AdbController().d, self.input_device_file
+            )
+        return self._event_writer
+
+    def send_gesture(
+        self, gesture: Gesture, wait: bool = True, realtime: bool = False
+    ) -> None:
+        """Send a gesture in a single write, see `EventStreamWriter.play`."""
+        self.event_writer.play(gesture, wait=wait, realtime=realtime)
+
     def sendevent(self, ev_type: int, code: int, value: int) -> None:
         """ADB sendevent."""
-        AdbController().d.shell(
-            f"sendevent {self.input_device_file} {ev_type} {code} {value}"
-        )
+        self.send_gesture(Gesture().event(ev_type, code, value))
 
     def ev_syn(self) -> None:
         """EV_SYN."""
@@ -3,11 +3,19 @@
 import logging
 import os
 import re
-import socket
+from collections.abc import Callable, Iterator
+from functools import partial
 from typing import TypedDict
 
 import psutil
-from adb_auto_player.device.adb.adb_client import AdbClientHelper
+from adb_auto_player.device.adb.adb_client import (
+    AdbClientHelper,
+    _connect_to_device,
+)
+from adb_auto_player.device.adb.device_discovery import (
+    DEFAULT_DEADLINE_SECONDS,
+    discover_devices,
+)
 
 
 class _EmulatorInfo(TypedDict):
@@ -60,17 +68,6 @@ EMULATORS: dict[str, _EmulatorInfo] = {
 }
 
 
-def is_port_open(port: int) -> bool:
-    """Check if a TCP port is open on localhost."""
-    try:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            s.settimeout(0.2)
-            s.connect(("127.0.0.1", port))
-            return True
-    except Exception:
-        return False
-
-
 def _get_running_emulators_and_ports() -> tuple[list[str], set[int]]:
     """Scan running processes for emulators and extract their ports."""
     running_emulators = []
@@ -113,8 +110,37 @@ def _get_bluestacks_ports() -> set[int]:
     return ports
 
 
-def scan_emulator_ports() -> list[str]:
-    """Scan for active emulator ADB ports on loopback."""
+def scan_emulator_ports(
+    deadline: float = DEFAULT_DEADLINE_SECONDS,
+    on_device: Callable[[str], None] | None = None,
+) -> list[str]:
+    """Scan for active emulator ADB ports on loopback.
+
+    Args:
+        deadline: Seconds after which unanswered ports are given up on.
+        on_device: Called with each serial as soon as it is confirmed, e.g. to
+            show the first device before the scan finished.
+    """
+    result = []
+    for serial in iter_emulator_devices(deadline):
+        result.append(serial)
+        if on_device is not None:
+            on_device(serial)
+    logging.debug(f"Discovered active ADB devices: {result}")
+    return result
+
+
+def iter_emulator_devices(
+    deadline: float = DEFAULT_DEADLINE_SECONDS,
+) -> Iterator[str]:
+    """Yield serials of active ADB devices as soon as they are confirmed.
+
+    Devices already known to the ADB server come first, then loopback ports of
+    running emulators in the order their handshake succeeds.
+
+    Args:
+        deadline: Seconds after which unanswered ports are given up on.
+    """
     candidate_ports: set[int] = set()
 
     # 1. Process scanning
@@ -131,36 +157,29 @@ def scan_emulator_ports() -> list[str]:
     # 4. Standard fallback
     candidate_ports.add(5555)
 
-    # 5. Filter open ports
-    open_ports = [port for port in sorted(candidate_ports) if is_port_open(port)]
-    logging.debug(f"Discovered open loopback ports: {open_ports}")
-
-    # 6. Test ADB connectivity
-    active_devices = []
+    # 5. Devices the ADB server already knows about
     client = AdbClientHelper.get_adb_client()
-
+    found: set[str] = set()
     try:
-        connected = client.list()
-        for d in connected:
-            if d.state == "device":
-                active_devices.append(d.serial)
+        for d in client.list():
+            if d.state == "device" and d.serial not in found:
+                found.add(d.serial)
+                logging.info(f"Discovered ADB device: {d.serial}")
+                yield d.serial
     except Exception as e:
         logging.debug(f"Failed to list connected devices: {e}")
 
-    for port in open_ports:
-        device_id = f"127.0.0.1:{port}"
-        if device_id in active_devices:
-            continue
-
-        try:
-            device = AdbClientHelper.get_adb_device(device_id)
-            if device is not None:
-                active_devices.append(device_id)
-        except Exception as e:
-            logging.debug(f"Failed to connect to device {device_id}: {e}")
-
-    # De-duplicate preserving order
-    seen = set()
-    result = [d for d in active_devices if not (d in seen or seen.add(d))]
-    logging.info(f"Discovered active ADB devices: {result}")
-    return result
+    # 6. Probe open ports and test ADB connectivity concurrently
+    device_ids = [
+        f"127.0.0.1:{port}"
+        for port in sorted(candidate_ports)
+        if f"127.0.0.1:{port}" not in found
+    ]
+    for device in discover_devices(
+        partial(_connect_to_device, client), device_ids, deadline
+    ):
+        serial = device.serial
+        if serial is not None and serial not in found:
+            found.add(serial)
+            logging.info(f"Discovered ADB device: {serial}")
+            yield serial
@@ -0,0 +1,290 @@
+"""Asyncio client for the ADB host protocol.
+
+The ADB server opens one socket per service request, so concurrent shell,
+sync and stream services of any number of devices only cost a socket each
+when their I/O runs on an event loop instead of a blocking thread per call.
+
+Protocol reference: `SERVICES.TXT`, `SYNC.TXT` and `protocol.txt` in the
+`adb` sources.
+"""
+
+import asyncio
+import socket
+import struct
+import time
+
+from adbutils import AdbError, AdbTimeout
+from adbutils._utils import list2cmdline
+
+_OKAY = b"OKAY"
+_FAIL = b"FAIL"
+_STATUS_SIZE = 4
+_LENGTH_PREFIX_SIZE = 4
+_SYNC_HEADER_SIZE = 8
+_CONNECT_TIMEOUT_SECONDS = 3.0
+_READ_SIZE = 4096
+_SYNC_DATA_MAX = 64 * 1024
+_DEFAULT_FILE_MODE = 0o644
+
+
+class AsyncAdbStream:
+    """A socket connected to the ADB server, speaking one service."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        """Wrap a connected non-blocking socket."""
+        self.sock = sock
+        self._closed = False
+
+    @classmethod
+    async def open(
+        cls, host: str, port: int, timeout: float = _CONNECT_TIMEOUT_SECONDS
+    ) -> "AsyncAdbStream":
+        """Connect to the ADB server.
+
+        Raises:
+            AdbTimeout: The server did not accept the connection in time.
+            AdbError: The server is not reachable.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        try:
+            async with asyncio.timeout(timeout):
+                await asyncio.get_running_loop().sock_connect(sock, (host, port))
+        except TimeoutError as e:
+            sock.close()
+            raise AdbTimeout("connect to adb server timeout") from e
+        except OSError as e:
+            sock.close()
+            raise AdbError(f"connect to adb server failed: {e}") from e
+        return cls(sock)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stream was closed."""
+        return self._closed
+
+    def close(self) -> None:
+        """Close the socket."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+        self.sock.close()
+
+    async def send(self, data: bytes) -> None:
+        """Send all of `data`."""
+        await asyncio.get_running_loop().sock_sendall(self.sock, data)
+
+    async def send_command(self, command: str) -> None:
+        """Send a length-prefixed service request."""
+        payload = command.encode("utf-8")
+        await self.send(f"{len(payload):04x}".encode() + payload)
+
+    async def recv(self, n: int) -> bytes:
+        """Receive up to `n` bytes, empty once the service closed the socket."""
+        return await asyncio.get_running_loop().sock_recv(self.sock, n)
+
+    def recv_nowait(self, n: int) -> bytes:
+        """Receive up to `n` already available bytes.
+
+        Raises:
+            BlockingIOError: No data is available.
+        """
+        return self.sock.recv(n)
+
+    async def read(self, n: int) -> bytes:
+        """Read `n` bytes, fewer if the socket closed."""
+        data = bytearray()
+        while len(data) < n:
+            chunk = await self.recv(n - len(data))
+            if not chunk:
+                break
+            data.extend(chunk)
+        return bytes(data)
+
+    async def read_exact(self, n: int) -> bytes:
+        """Read exactly `n` bytes.
+
+        Raises:
+            EOFError: The socket closed early.
+        """
+        data = await self.read(n)
+        if len(data) < n:
+            raise EOFError(f"Expected {n} bytes, got {len(data)}")
+        return data
+
+    async def read_string_block(self) -> str:
+        """Read a hex length-prefixed string."""
+        length = await self.read(_LENGTH_PREFIX_SIZE)
+        if len(length) < _LENGTH_PREFIX_SIZE:
+            raise AdbError("connection closed")
+        return (await self.read(int(length, 16))).decode("utf-8", errors="replace")
+
+    async def read_until_close(self, encoding: str | None = "utf-8") -> str | bytes:
+        """Read until the service closes the socket."""
+        data = bytearray()
+        while chunk := await self.recv(_READ_SIZE):
+            data.extend(chunk)
+        return data.decode(encoding, errors="replace") if encoding else bytes(data)
+
+    async def check_okay(self) -> None:
+        """Consume the OKAY status of a request.
+
+        Raises:
+            AdbError: The server answered FAIL or something unexpected.
+        """
+        status = await self.read(_STATUS_SIZE)
+        if status == _FAIL:
+            raise AdbError(await self.read_string_block())
+        if status != _OKAY:
+            raise AdbError(f"Unknown data: {status!r}")
+
+    async def __aenter__(self) -> "AsyncAdbStream":
+        """Return the stream."""
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        """Close the stream."""
+        self.close()
+
+
+class AsyncAdbClient:
+    """ADB server client running on asyncio."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 5037) -> None:
+        """Initialize the client, no connection is made until a request."""
+        self.host = host
+        self.port = port
+
+    async def _request(self, command: str) -> AsyncAdbStream:
+        stream = await AsyncAdbStream.open(self.host, self.port)
+        try:
+            await stream.send_command(command)
+            await stream.check_okay()
+        except BaseException:
+            stream.close()
+            raise
+        return stream
+
+    async def server_version(self) -> int:
+        """Version of the ADB server, 41 for 1.0.41."""
+        async with await self._request("host:version") as stream:
+            return int(await stream.read_string_block(), 16)
+
+    async def list_devices(self) -> list[tuple[str, str]]:
+        """Serials and states of all devices known to the server."""
+        async with await self._request("host:devices") as stream:
+            output = await stream.read_string_block()
+        return [
+            (serial, state)
+            for serial, _, state in (
+                line.partition("\t") for line in output.splitlines() if line
+            )
+        ]
+
+    async def connect(self, address: str) -> str:
+        """`adb connect`, returns the message of the server."""
+        async with await self._request(f"host:connect:{address}") as stream:
+            return await stream.read_string_block()
+
+    async def get_state(self, serial: str) -> str:
+        """State of a device, e.g. `device` or `offline`."""
+        async with await self._request(f"host-serial:{serial}:get-state") as stream:
+            return await stream.read_string_block()
+
+    async def open_transport(self, serial: str) -> AsyncAdbStream:
+        """Connect to the device, the stream accepts one device service."""
+        return await self._request(f"host:transport:{serial}")
+
+    async def open_shell(
+        self, serial: str, cmdargs: str | list | tuple
+    ) -> AsyncAdbStream:
+        """Start a shell command and return its output stream."""
+        if isinstance(cmdargs, list | tuple):
+            cmdargs = list2cmdline(cmdargs)
+        stream = await self.open_transport(serial)
+        try:
+            await stream.send_command(f"shell:{cmdargs}")
+            await stream.check_okay()
+        except BaseException:
+            stream.close()
+            raise
+        return stream
+
+    async def shell(
+        self,
+        serial: str,
+        cmdargs: str | list | tuple,
+        encoding: str | None = "utf-8",
+        rstrip: bool = True,
+    ) -> str | bytes:
+        """Run a shell command and return its output."""
+        async with await self.open_shell(serial, cmdargs) as stream:
+            output = await stream.read_until_close(encoding)
+        if isinstance(output, str) and rstrip:
+            return output.rstrip()
+        return output
+
+    async def pull(self, serial: str, path: str) -> bytes:
+        """Read a file with the sync service.
+
+        Raises:
+            AdbError: The device refused to send the file.
+        """
+        async with await self._open_sync(serial) as stream:
+            await _send_sync(stream, b"RECV", path.encode("utf-8"))
+            data = bytearray()
+            while True:
+                header = await stream.read_exact(_SYNC_HEADER_SIZE)
+                kind, length = header[:4], struct.unpack("<I", header[4:])[0]
+                if kind == b"DONE":
+                    break
+                if kind == b"FAIL":
+                    raise AdbError((await stream.read_exact(length)).decode())
+                if kind != b"DATA":
+                    raise AdbError(f"Unexpected sync response: {kind!r}")
+                data.extend(await stream.read_exact(length))
+            await _send_sync(stream, b"QUIT", b"")
+        return bytes(data)
+
+    async def push(
+        self, serial: str, data: bytes, path: str, mode: int = _DEFAULT_FILE_MODE
+    ) -> None:
+        """Write a file with the sync service.
+
+        Raises:
+            AdbError: The device refused the file.
+        """
+        async with await self._open_sync(serial) as stream:
+            await _send_sync(stream, b"SEND", f"{path},{mode}".encode())
+            for offset in range(0, len(data), _SYNC_DATA_MAX):
+                await _send_sync(
+                    stream, b"DATA", data[offset : offset + _SYNC_DATA_MAX]
+                )
+            # The modification time of the file is wall-clock time.
+            mtime = int(time.time())  # noqa: TID251
+            await stream.send(b"DONE" + struct.pack("<I", mtime))
+            header = await stream.read_exact(_SYNC_HEADER_SIZE)
+            if header[:4] == b"FAIL":
+                length = struct.unpack("<I", header[4:])[0]
+                raise AdbError((await stream.read_exact(length)).decode())
+            if header[:4] != _OKAY:
+                raise AdbError(f"Unexpected sync response: {header[:4]!r}")
+            await _send_sync(stream, b"QUIT", b"")
+
+    async def _open_sync(self, serial: str) -> AsyncAdbStream:
+        stream = await self.open_transport(serial)
+        try:
+            await stream.send_command("sync:")
+            await stream.check_okay()
+        except BaseException:
+            stream.close()
+            raise
+        return stream
+
+
+async def _send_sync(stream: AsyncAdbStream, kind: bytes, payload: bytes) -> None:
+    await stream.send(kind + struct.pack("<I", len(payload)) + payload)
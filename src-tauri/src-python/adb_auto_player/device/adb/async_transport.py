@@ -0,0 +1,344 @@
+"""Blocking facade over `AsyncAdbClient`.
+
+All devices share one event loop thread. Blocking callers submit a coroutine
+and wait for its result, so any number of concurrent shell commands and
+streams are served by that thread instead of one socket-owning thread each.
+`AsyncTransportDevice` is an `AdbDevice`, so `AdbDeviceWrapper`, the retry
+decorator and everything built on them work unchanged.
+"""
+
+import asyncio
+import pathlib
+import stat
+import threading
+from collections.abc import Coroutine, Iterator
+from concurrent.futures import CancelledError, Future
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, BinaryIO, ClassVar, Literal, overload
+
+from adbutils import AdbClient, AdbConnection, AdbDevice, AdbError, AdbTimeout
+from adbutils.sync import Sync
+
+from .async_adb import AsyncAdbClient, AsyncAdbStream
+
+_DEFAULT_SOCKET_TIMEOUT = 10.0
+_CONNECT_TIMEOUT_SECONDS = 10.0
+_TRANSFER_TIMEOUT_SECONDS = 60.0
+
+
+class AdbEventLoop:
+    """The event loop thread running all async ADB I/O of this process."""
+
+    _loop: ClassVar[asyncio.AbstractEventLoop | None] = None
+    _thread: ClassVar[threading.Thread | None] = None
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(cls) -> asyncio.AbstractEventLoop:
+        """Return the loop, starting its thread on first use."""
+        with cls._lock:
+            if cls._loop is None or cls._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="AdbEventLoop", daemon=True
+                )
+                thread.start()
+                cls._loop, cls._thread = loop, thread
+            return cls._loop
+
+    @classmethod
+    def submit(cls, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the loop."""
+        loop = cls.get()
+        if threading.current_thread() is cls._thread:
+            coro.close()
+            raise RuntimeError("Blocking ADB call made from the ADB event loop")
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    @classmethod
+    def run(cls, coro: Coroutine, timeout: float | None = None) -> Any:
+        """Run a coroutine on the loop and wait for its result.
+
+        Raises:
+            TimeoutError: The coroutine did not finish in time, it is cancelled.
+        """
+        future = cls.submit(coro)
+        try:
+            return future.result(timeout)
+        except FuturesTimeoutError as e:
+            future.cancel()
+            raise TimeoutError("ADB request timed out") from e
+
+
+class _SocketView:
+    """The subset of `socket.socket` used on `AdbConnection.conn`."""
+
+    def __init__(self, stream: "SyncAdbStream") -> None:
+        self._stream = stream
+        self._timeout: float | None = None
+
+    def gettimeout(self) -> float | None:
+        return self._timeout
+
+    def settimeout(self, timeout: float | None) -> None:
+        self._timeout = timeout
+
+    def setblocking(self, flag: bool) -> None:
+        self._timeout = None if flag else 0.0
+
+    def recv(self, n: int) -> bytes:
+        if self._timeout == 0.0:
+            return self._stream._run(_call(self._stream.stream.recv_nowait, n))
+        return self._stream._run(self._stream.stream.recv(n), self._timeout)
+
+
+class SyncAdbStream(AdbConnection):
+    """Blocking view of an `AsyncAdbStream`, usable as an `AdbConnection`.
+
+    No socket of its own is opened, every method reads from and writes to the
+    stream on the `AdbEventLoop`.
+    """
+
+    def __init__(self, stream: AsyncAdbStream, timeout: float | None = None) -> None:
+        """Wrap a stream.
+
+        Args:
+            stream: Stream running on the `AdbEventLoop`.
+            timeout: Timeout of every read, None to block.
+        """
+        self.stream = stream
+        self.timeout = timeout
+        self._pending: set[Future] = set()
+        self._pending_lock = threading.Lock()
+        self._socket_view = _SocketView(self)
+
+    @property
+    def conn(self) -> _SocketView:
+        """Socket-like access for code written against `AdbConnection.conn`."""
+        return self._socket_view
+
+    @property
+    def closed(self) -> bool:
+        """Whether the stream was closed."""
+        return self.stream.closed
+
+    def send(self, data: bytes) -> int:
+        """Send all of `data`."""
+        self._run(self.stream.send(data), self.timeout)
+        return len(data)
+
+    def recv(self, n: int) -> bytes:
+        """Receive up to `n` bytes."""
+        return self._read(self.stream.recv(n))
+
+    def read(self, n: int) -> bytes:
+        """Read `n` bytes, fewer if the stream ended."""
+        return self._read(self.stream.read(n))
+
+    def read_until_close(self, encoding: str | None = "utf-8") -> str | bytes:
+        """Read until the device closes the stream."""
+        return self._read(self.stream.read_until_close(encoding))
+
+    def close(self) -> None:
+        """Close the stream, blocked reads return empty like on a closed socket."""
+        with self._pending_lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.cancel()
+        AdbEventLoop.submit(_close(self.stream))
+
+    def __enter__(self) -> "SyncAdbStream":
+        """Return the stream."""
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        """Close the stream."""
+        self.close()
+
+    def _read(self, coro: Coroutine) -> Any:
+        try:
+            return self._run(coro, self.timeout)
+        except TimeoutError as e:
+            raise AdbTimeout("adb read timeout") from e
+        except CancelledError:
+            # Closed while reading, same as reading from a closed socket.
+            return b""
+
+    def _run(self, coro: Coroutine, timeout: float | None = None) -> Any:
+        future = AdbEventLoop.submit(coro)
+        with self._pending_lock:
+            self._pending.add(future)
+        try:
+            return future.result(timeout)
+        except FuturesTimeoutError as e:
+            future.cancel()
+            raise TimeoutError("ADB read timed out") from e
+        finally:
+            with self._pending_lock:
+                self._pending.discard(future)
+
+
+class AsyncTransportDevice(AdbDevice):
+    """`AdbDevice` whose shell services run on the `AdbEventLoop`."""
+
+    def __init__(
+        self,
+        client: AdbClient,
+        serial: str,
+        async_client: AsyncAdbClient | None = None,
+    ) -> None:
+        """Initialize the device.
+
+        Args:
+            client: Blocking client, used for services not implemented here.
+            serial: Device serial.
+            async_client: Client for the event loop, defaults to the server
+                of `client`.
+        """
+        super().__init__(client, serial=serial)
+        self.async_client = async_client or AsyncAdbClient(client.host, client.port)
+
+    def open_shell(self, cmdargs: str | list | tuple) -> SyncAdbStream:
+        """Start a shell command and return its output stream."""
+        return SyncAdbStream(
+            _run(
+                self.async_client.open_shell(str(self.serial), cmdargs),
+                _CONNECT_TIMEOUT_SECONDS,
+            )
+        )
+
+    @overload
+    def shell(
+        self,
+        cmdargs: str | list | tuple,
+        stream: Literal[True],
+        timeout: float | None = _DEFAULT_SOCKET_TIMEOUT,
+        encoding: str | None = "utf-8",
+        rstrip: bool = True,
+    ) -> SyncAdbStream: ...
+
+    @overload
+    def shell(
+        self,
+        cmdargs: str | list | tuple,
+        *,
+        stream: Literal[False] = False,
+        timeout: float | None = _DEFAULT_SOCKET_TIMEOUT,
+        encoding: None,
+        rstrip: bool = True,
+    ) -> bytes: ...
+
+    @overload
+    def shell(
+        self,
+        cmdargs: str | list | tuple,
+        stream: Literal[False] = False,
+        timeout: float | None = _DEFAULT_SOCKET_TIMEOUT,
+        *,
+        encoding: str,
+        rstrip: bool = True,
+    ) -> str: ...
+
+    @overload
+    def shell(
+        self,
+        cmdargs: str | list | tuple,
+        stream: Literal[False] = False,
+        timeout: float | None = _DEFAULT_SOCKET_TIMEOUT,
+        rstrip: bool = True,
+    ) -> str: ...
+
+    def shell(
+        self,
+        cmdargs: str | list | tuple,
+        stream: bool = False,
+        timeout: float | None = _DEFAULT_SOCKET_TIMEOUT,
+        encoding: str | None = "utf-8",
+        rstrip: bool = True,
+    ) -> SyncAdbStream | str | bytes:
+        """Run a shell command, same contract as `AdbDevice.shell`."""
+        if stream:
+            return self.open_shell(cmdargs)
+        return _run(
+            self.async_client.shell(str(self.serial), cmdargs, encoding, rstrip),
+            timeout,
+        )
+
+    def get_state(self) -> str:
+        """Return the device state, e.g. `device` or `offline`."""
+        return _run(
+            self.async_client.get_state(str(self.serial)), _CONNECT_TIMEOUT_SECONDS
+        )
+
+    @property
+    def sync(self) -> Sync:
+        """Sync service transferring file contents on the event loop."""
+        return AsyncSync(self)
+
+
+class AsyncSync(Sync):
+    """`Sync` whose file transfers run on the `AdbEventLoop`.
+
+    `push`, `pull`, `read_bytes` and `read_text` transfer through
+    `AsyncAdbClient`. `stat`, `list` and `exists` are single requests and keep
+    using the blocking client.
+    """
+
+    def __init__(self, device: AsyncTransportDevice) -> None:
+        """Init."""
+        super().__init__(device)
+        self._async_device = device
+
+    def iter_content(self, path: str) -> Iterator[bytes]:
+        """Yield the content of a device file."""
+        device = self._async_device
+        yield _run(
+            device.async_client.pull(str(device.serial), path),
+            _TRANSFER_TIMEOUT_SECONDS,
+        )
+
+    def _push_file(
+        self,
+        src: pathlib.Path | str | bytes | bytearray | BinaryIO,
+        dst: str,
+        mode: int = 0o755,
+        check: bool = False,
+    ) -> int:
+        if isinstance(src, bytes | bytearray):
+            data = bytes(src)
+        elif isinstance(src, pathlib.Path | str):
+            data = pathlib.Path(src).read_bytes()
+        elif hasattr(src, "read"):
+            data = src.read()
+        else:
+            raise TypeError(f"Invalid src type: {type(src)}")
+
+        device = self._async_device
+        _run(
+            device.async_client.push(
+                str(device.serial), data, dst, stat.S_IFREG | mode
+            ),
+            _TRANSFER_TIMEOUT_SECONDS,
+        )
+        if check and (size := self.stat(dst).size) != len(data):
+            raise AdbError(
+                f"Push not complete, expect pushed {len(data)}, actually pushed {size}"
+            )
+        return len(data)
+
+
+def _run(coro: Coroutine, timeout: float | None) -> Any:
+    try:
+        return AdbEventLoop.run(coro, timeout)
+    except TimeoutError as e:
+        raise AdbTimeout("adb timeout") from e
+
+
+async def _call(func, *args) -> Any:
+    return func(*args)
+
+
+async def _close(stream: AsyncAdbStream) -> None:
+    # Let cancelled reads unregister from the selector before the socket closes.
+    await asyncio.sleep(0)
+    stream.close()
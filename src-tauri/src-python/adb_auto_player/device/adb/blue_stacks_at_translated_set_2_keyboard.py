@@ -1,4 +1,5 @@
-from adb_auto_player.device.adb import AdbController, InputDevice
+from adb_auto_player.device.adb.adb_input_device import InputDevice
+from adb_auto_player.device.adb.event_stream_writer import Gesture
 
 
 class ATTranslatedSet2Keyboard(InputDevice):
@@ -52,26 +53,21 @@ class ATTranslatedSet2Keyboard(InputDevice):
         """Name of the input device."""
         return "AT Translated Set 2 keyboard"
 
-    def press(self, key_code: int) -> None:
-        """Press and immediately release a key."""
-        self._batch(
-            [
-                f"1 {key_code} 1",  # KEY DOWN
-                "0 0 0",  # SYN_REPORT
-                f"1 {key_code} 0",  # KEY UP
-                "0 0 0",  # SYN_REPORT
-            ]
+    def press(self, key_code: int, duration: float = 0.0) -> None:
+        """Press a key and release it after duration seconds."""
+        self.send_gesture(
+            Gesture()
+            .key(key_code, down=True)
+            .syn()
+            .pause(duration)
+            .key(key_code, down=False)
+            .syn()
         )
 
     def hold(self, key_code: int) -> None:
         """Press and hold a key (do NOT release yet)."""
-        self._batch([f"1 {key_code} 1", "0 0 0"])  # KEY DOWN  # SYN_REPORT
+        self.send_gesture(Gesture().key(key_code, down=True).syn(), wait=False)
 
     def release(self, key_code: int) -> None:
         """Release a previously held key."""
-        self._batch([f"1 {key_code} 0", "0 0 0"])  # KEY UP  # SYN_REPORT
-
-    # ---------- low-level helpers ----------
-    def _batch(self, cmds: list[str]) -> None:
-        full_cmds = [f"sendevent {self.input_device_file} {cmd}" for cmd in cmds]
-        AdbController().d.shell("; ".join(full_cmds))
+        self.send_gesture(Gesture().key(key_code, down=False).syn(), wait=False)
@@ -1,7 +1,5 @@
-import time
-
-from adb_auto_player.device.adb import AdbController
 from adb_auto_player.device.adb.adb_input_device import InputDevice
+from adb_auto_player.device.adb.event_stream_writer import Gesture
 from adb_auto_player.models.device import DPad, Stick
 
 
@@ -64,6 +62,16 @@ class BlueStacksVirtualGamepad(InputDevice):
             )
             self._held = True
 
+        def _timed(self, x, y, magnitude, duration):
+            self._parent._move_stick(
+                self._x,
+                self._y,
+                int(x * magnitude),
+                int(y * magnitude),
+                duration,
+            )
+            self._held = False
+
         def release(self, force=False):
             if self._held or force:
                 self._parent._release_stick(self._x, self._y)
@@ -82,24 +90,16 @@ class BlueStacksVirtualGamepad(InputDevice):
             self._hold(self._parent.ABS_MAX, self._parent.CENTER, magnitude)
 
         def up(self, duration=1.0, magnitude=1.0):
-            self.hold_up(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed(self._parent.CENTER, self._parent.ABS_MIN, magnitude, duration)
 
         def down(self, duration=1.0, magnitude=1.0):
-            self.hold_down(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed(self._parent.CENTER, self._parent.ABS_MAX, magnitude, duration)
 
         def left(self, duration=1.0, magnitude=1.0):
-            self.hold_left(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed(self._parent.ABS_MIN, self._parent.CENTER, magnitude, duration)
 
         def right(self, duration=1.0, magnitude=1.0):
-            self.hold_right(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed(self._parent.ABS_MAX, self._parent.CENTER, magnitude, duration)
 
     # ────────────────────────────────────────────────────────────
     class _DPad(DPad):
@@ -133,24 +133,20 @@ class BlueStacksVirtualGamepad(InputDevice):
                 self._y_held = False
 
         def up(self, duration=1.0):
-            self.hold_up()
-            time.sleep(duration)
-            self.release()
+            self._parent._press_hat(self._parent.ABS_HAT0Y, -1, duration)
+            self._x_held = self._y_held = False
 
         def down(self, duration=1.0):
-            self.hold_down()
-            time.sleep(duration)
-            self.release()
+            self._parent._press_hat(self._parent.ABS_HAT0Y, 1, duration)
+            self._x_held = self._y_held = False
 
         def left(self, duration=1.0):
-            self.hold_left()
-            time.sleep(duration)
-            self.release()
+            self._parent._press_hat(self._parent.ABS_HAT0X, -1, duration)
+            self._x_held = self._y_held = False
 
         def right(self, duration=1.0):
-            self.hold_right()
-            time.sleep(duration)
-            self.release()
+            self._parent._press_hat(self._parent.ABS_HAT0X, 1, duration)
+            self._x_held = self._y_held = False
 
     # ────────────────────────────────────────────────────────────
     def __init__(self):
@@ -161,37 +157,43 @@ class BlueStacksVirtualGamepad(InputDevice):
 
     # ─── Low-level helpers ───────────────────────────────────────
     def _hold_stick(self, x_code, y_code, x_val, y_val):
-        _batch_shell_commands(
-            [
-                f"sendevent {self.input_device_file} 3 {x_code} {x_val}",
-                f"sendevent {self.input_device_file} 3 {y_code} {y_val}",
-                f"sendevent {self.input_device_file} {self.EV_SYN} 0 0",
-            ]
+        self.send_gesture(
+            Gesture().abs(x_code, x_val).abs(y_code, y_val).syn(), wait=False
         )
 
     def _release_stick(self, x_code, y_code):
-        _batch_shell_commands(
-            [
-                f"sendevent {self.input_device_file} 3 {x_code} {self.CENTER}",
-                f"sendevent {self.input_device_file} 3 {y_code} {self.CENTER}",
-                f"sendevent {self.input_device_file} {self.EV_SYN} 0 0",
-            ]
+        self.send_gesture(
+            Gesture().abs(x_code, self.CENTER).abs(y_code, self.CENTER).syn(),
+            wait=False,
         )
 
-    def _hold_hat(self, axis, value):
-        _batch_shell_commands(
-            [
-                f"sendevent {self.input_device_file} 3 {axis} {value}",
-                f"sendevent {self.input_device_file} {self.EV_SYN} 0 0",
-            ]
+    def _move_stick(self, x_code, y_code, x_val, y_val, duration):
+        self.send_gesture(
+            Gesture()
+            .abs(x_code, x_val)
+            .abs(y_code, y_val)
+            .syn()
+            .pause(duration)
+            .abs(x_code, self.CENTER)
+            .abs(y_code, self.CENTER)
+            .syn()
         )
 
+    def _hold_hat(self, axis, value):
+        self.send_gesture(Gesture().abs(axis, value).syn(), wait=False)
+
     def _release_hat(self, axis):
-        _batch_shell_commands(
-            [
-                f"sendevent {self.input_device_file} 3 {axis} 0",
-                f"sendevent {self.input_device_file} {self.EV_SYN} 0 0",
-            ]
+        self.send_gesture(Gesture().abs(axis, 0).syn(), wait=False)
+
+    def _press_hat(self, axis, value, duration):
+        self.send_gesture(
+            Gesture()
+            .abs(axis, value)
+            .syn()
+            .pause(duration)
+            .abs(self.ABS_HAT0X, 0)
+            .abs(self.ABS_HAT0Y, 0)
+            .syn()
         )
 
     # ---------------- Sticks ----------------
@@ -220,7 +222,3 @@ class BlueStacksVirtualGamepad(InputDevice):
     def dpad(self) -> DPad:
         """D-pad."""
         return self._dpad
-
-
-def _batch_shell_commands(commands: list[str]) -> None:
-    AdbController().d.shell("; ".join(commands))
@@ -1,7 +1,5 @@
-import typing
-
-from adb_auto_player.device.adb import AdbController
 from adb_auto_player.device.adb.adb_input_device import InputDevice
+from adb_auto_player.device.adb.event_stream_writer import Gesture
 from adb_auto_player.models.device import DisplayInfo
 from adb_auto_player.models.geometry import Coordinates
 
@@ -35,45 +33,19 @@ class BlueStacksVirtualTouch(InputDevice):
     ABS_MT_POSITION_X = 0x0035
     ABS_MT_POSITION_Y = 0x0036
 
-    RELEASE_FRAME_CMDS: typing.ClassVar = [
-        "0 2 0",  # SYN_MT_REPORT
-        "0 0 0",  # SYN_REPORT
-    ]
-
     # ---------- public API ----------
 
     def hold(self, coordinates: Coordinates) -> None:
         """Finger down and hold."""
-        sx = self._scale_x(coordinates.x)
-        sy = self._scale_y(coordinates.y)
-
-        cmds = [
-            f"{self.EV_ABS} {self.ABS_MT_POSITION_X} {sx}",
-            f"{self.EV_ABS} {self.ABS_MT_POSITION_Y} {sy}",
-            "0 2 0",  # SYN_MT_REPORT
-            "0 0 0",  # SYN_REPORT
-        ]
-
-        self._batch(cmds)
+        self.send_gesture(self._finger_down(coordinates), wait=False)
 
     def release(self) -> None:
         """Release the currently held finger."""
-        self._batch(self.RELEASE_FRAME_CMDS)
+        self.send_gesture(self._finger_up(), wait=False)
 
     def tap(self, coordinates: Coordinates) -> None:
-        """Fast tap using a single batch command."""
-        sx = self._scale_x(coordinates.x)
-        sy = self._scale_y(coordinates.y)
-
-        cmds = [
-            f"{self.EV_ABS} {self.ABS_MT_POSITION_X} {sx}",
-            f"{self.EV_ABS} {self.ABS_MT_POSITION_Y} {sy}",
-            "0 2 0",  # SYN_MT_REPORT
-            "0 0 0",  # SYN_REPORT
-            *self.RELEASE_FRAME_CMDS,  # finger up
-        ]
-
-        self._batch(cmds)
+        """Fast tap using a single write."""
+        self.send_gesture(self._finger_down(coordinates).extend(self._finger_up()))
 
     # ---------- scaling ----------
 
@@ -84,6 +56,15 @@ class BlueStacksVirtualTouch(InputDevice):
         return int(y * self.ABS_MAX / self.display_info.resolution.height)
 
     # ---------- low-level helpers ----------
-    def _batch(self, cmds: list[str]) -> None:
-        full_cmds = [f"sendevent {self.input_device_file} {cmd}" for cmd in cmds]
-        AdbController().d.shell("; ".join(full_cmds))
+    def _finger_down(self, coordinates: Coordinates) -> Gesture:
+        return (
+            Gesture()
+            .abs(self.ABS_MT_POSITION_X, self._scale_x(coordinates.x))
+            .abs(self.ABS_MT_POSITION_Y, self._scale_y(coordinates.y))
+            .mt_syn()
+            .syn()
+        )
+
+    @staticmethod
+    def _finger_up() -> Gesture:
+        return Gesture().mt_syn().syn()
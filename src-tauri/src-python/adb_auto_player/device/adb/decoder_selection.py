@@ -0,0 +1,372 @@
+"""Benchmark H264 decoders and remember the fastest one per host.
+
+Which decoder is fastest depends on the GPU, drivers and CPU core count, and a
+hardware decoder that can be created is not necessarily faster than software
+decoding once frames are copied back to system memory. DecoderSelector
+decodes a sample clip with every candidate once, ranks them by the time a
+frame takes from packet to RGB array plus the frames a decoder holds back,
+and stores the ranking in the app config dir so later processes skip the
+benchmark. The benchmark runs in a background thread, streams started before
+it finished use the decoders in preference order.
+"""
+
+import io
+import json
+import logging
+import platform
+import threading
+import time
+from dataclasses import asdict, dataclass
+from fractions import Fraction
+from pathlib import Path
+from typing import ClassVar
+
+import av
+import numpy as np
+from adb_auto_player.exceptions import AutoPlayerWarningError
+from adb_auto_player.file_loader import SettingsLoader
+from av.video.codeccontext import VideoCodecContext
+
+_RANKING_FILE = "decoder_ranking.json"
+_RANKING_VERSION = 1
+_SAMPLE_SIZE = (720, 1280)
+_SAMPLE_FRAMES = 30
+_SAMPLE_FPS = 30
+_SOFTWARE_DECODER = "h264"
+# (thread_count, thread_type), thread_count 0 lets FFmpeg decide.
+_SOFTWARE_THREADING = [(1, "SLICE"), (0, "SLICE"), (2, "FRAME"), (4, "FRAME")]
+_HARDWARE_DECODERS = [
+    "h264_cuvid",  # NVIDIA GPU (high priority hardware decoder)
+    "h264_qsv",  # Intel Quick Sync (hardware)
+    "h264_vaapi",  # Intel/AMD VAAPI (hardware)
+    "h264_v4l2m2m",  # ARM/Linux hardware decoder
+]
+
+
+class StreamingNotSupportedError(AutoPlayerWarningError):
+    """Streaming is not yet implemented for the specified platform."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class DecoderChoice:
+    """A decoder with its threading configuration and benchmark result."""
+
+    decoder: str
+    thread_count: int = 0
+    thread_type: str = "SLICE"
+    ms_per_frame: float | None = None
+    output_delay_frames: int = 0
+
+    @property
+    def is_hardware(self) -> bool:
+        """Whether this is a hardware decoder."""
+        return self.decoder != _SOFTWARE_DECODER
+
+    @property
+    def score_ms(self) -> float:
+        """Time until a frame is available, lower is better."""
+        if self.ms_per_frame is None:
+            return float("inf")
+        return self.ms_per_frame + self.output_delay_frames * 1000 / _SAMPLE_FPS
+
+    def create_context(self) -> VideoCodecContext:
+        """Create a decoder context with this configuration."""
+        codec = VideoCodecContext.create(self.decoder, "r")
+        if not isinstance(codec, VideoCodecContext):
+            raise TypeError(f"{self.decoder} is not a video decoder")
+        if not self.is_hardware:
+            codec.thread_type = self.thread_type
+            codec.thread_count = self.thread_count
+        return codec
+
+    def __str__(self) -> str:
+        """Return a string representation of the decoder choice."""
+        if self.is_hardware:
+            return self.decoder
+        return f"{self.decoder} ({self.thread_type}, threads={self.thread_count})"
+
+
+class DecoderSelector:
+    """Selects the H264 decoder for device streaming.
+
+    The ranking is computed once per host and reused until PyAV, the
+    available codecs or the machine change.
+    """
+
+    _ranking: ClassVar[list[DecoderChoice] | None] = None
+    _preference: ClassVar[list[DecoderChoice] | None] = None
+    _benchmark_thread: ClassVar[threading.Thread | None] = None
+    # Incremented by reset, a benchmark started before does not store its result.
+    _generation: ClassVar[int] = 0
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def best(cls, hardware_decoding: bool) -> DecoderChoice:
+        """Return the fastest decoder.
+
+        Args:
+            hardware_decoding: Consider hardware decoders.
+
+        Raises:
+            StreamingNotSupportedError: No H264 decoder works.
+        """
+        allowed = [
+            choice
+            for choice in cls.ranking()
+            if hardware_decoding or not choice.is_hardware
+        ]
+        if not allowed:
+            raise StreamingNotSupportedError(
+                "No h264 decoders available cannot handle Device Streaming."
+            )
+        choice = allowed[0]
+        if hardware_decoding and not choice.is_hardware:
+            if any(c.is_hardware for c in cls.ranking()):
+                logging.debug("Software decoding is faster than hardware decoding")
+            else:
+                logging.warning(
+                    "Failed to initialise h264 hardware decoder, "
+                    "using software decoding"
+                )
+        logging.debug(f"Selected H264 decoder: {choice}")
+        return choice
+
+    @classmethod
+    def ranking(cls, wait: bool = False) -> list[DecoderChoice]:
+        """Working decoders, fastest first.
+
+        Without a persisted ranking the benchmark is started in a background
+        thread and the decoders are returned in preference order until it
+        finished.
+
+        Args:
+            wait: Wait for the benchmark instead of using the preference order.
+        """
+        with cls._lock:
+            if cls._ranking is None:
+                cls._ranking = cls._load()
+            if cls._ranking is not None:
+                return cls._ranking
+            thread = cls._start_benchmark()
+            if not wait:
+                if cls._preference is None:
+                    cls._preference = [c for c in _candidates() if _can_create(c)]
+                return cls._preference
+        thread.join()
+        return cls.ranking(wait=True)
+
+    @classmethod
+    def reset(cls, delete_file: bool = False) -> None:
+        """Forget the ranking so the next call loads or benchmarks again."""
+        with cls._lock:
+            cls._ranking = None
+            cls._preference = None
+            cls._generation += 1
+            if delete_file:
+                cls._ranking_path().unlink(missing_ok=True)
+
+    @classmethod
+    def _start_benchmark(cls) -> threading.Thread:
+        """Start the benchmark unless it is running, the caller holds the lock."""
+        thread = cls._benchmark_thread
+        if thread is not None and thread.is_alive():
+            return thread
+        try:
+            path = cls._ranking_path()
+        except RuntimeError:
+            path = None
+        thread = threading.Thread(
+            target=cls._benchmark_and_save,
+            args=(path, cls._generation),
+            name="DecoderBenchmark",
+            daemon=True,
+        )
+        cls._benchmark_thread = thread
+        thread.start()
+        return thread
+
+    @classmethod
+    def _load(cls) -> list[DecoderChoice] | None:
+        try:
+            data = json.loads(cls._ranking_path().read_text())
+        except (OSError, ValueError, RuntimeError):
+            return None
+        if data.get("fingerprint") != _fingerprint():
+            return None
+        try:
+            return [DecoderChoice(**entry) for entry in data["ranking"]]
+        except (KeyError, TypeError):
+            return None
+
+    @classmethod
+    def _benchmark_and_save(cls, path: Path | None, generation: int) -> None:
+        try:
+            ranking = _benchmark_candidates()
+        except Exception as e:
+            logging.debug(f"H264 decoder benchmark failed: {e}")
+            ranking = [c for c in _candidates() if _can_create(c)]
+        else:
+            if path is not None:
+                _save(path, ranking)
+        with cls._lock:
+            if generation == cls._generation:
+                cls._ranking = ranking
+
+    @staticmethod
+    def _ranking_path() -> Path:
+        return SettingsLoader.get_app_config_dir() / _RANKING_FILE
+
+
+def _benchmark_candidates() -> list[DecoderChoice]:
+    """Benchmark every candidate, preference order if no sample can be encoded."""
+    candidates = _candidates()
+    sample = _create_sample_clip()
+    if sample is None:
+        # Stored as well, so later processes do not try to encode again.
+        logging.debug("No H264 encoder for the sample clip, not benchmarking")
+        return [c for c in candidates if _can_create(c)]
+
+    start = time.perf_counter()
+    ranking = sorted(
+        (
+            result
+            for result in (_benchmark(c, sample) for c in candidates)
+            if result is not None
+        ),
+        key=lambda choice: choice.score_ms,
+    )
+    logging.debug(
+        f"Benchmarked {len(candidates)} H264 decoders in "
+        f"{time.perf_counter() - start:.2f}s: "
+        + ", ".join(f"{c} {c.score_ms:.2f}ms" for c in ranking)
+    )
+    return ranking
+
+
+def _save(path: Path, ranking: list[DecoderChoice]) -> None:
+    try:
+        path.write_text(
+            json.dumps(
+                {
+                    "fingerprint": _fingerprint(),
+                    "ranking": [asdict(choice) for choice in ranking],
+                },
+                indent=2,
+            )
+        )
+    except (OSError, RuntimeError) as e:
+        logging.debug(f"Could not save H264 decoder ranking: {e}")
+
+
+def _fingerprint() -> dict:
+    return {
+        "version": _RANKING_VERSION,
+        "av": av.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "decoders": _available_decoders(),
+    }
+
+
+def _available_decoders() -> list[str]:
+    available = av.codecs_available
+    return [
+        decoder
+        for decoder in [*_HARDWARE_DECODERS, _SOFTWARE_DECODER]
+        if decoder in available
+    ]
+
+
+def _candidates() -> list[DecoderChoice]:
+    candidates = [
+        DecoderChoice(decoder)
+        for decoder in _available_decoders()
+        if decoder != _SOFTWARE_DECODER
+    ]
+    if _SOFTWARE_DECODER in _available_decoders():
+        candidates.extend(
+            DecoderChoice(_SOFTWARE_DECODER, count, thread_type)
+            for count, thread_type in _SOFTWARE_THREADING
+        )
+    return candidates
+
+
+def _can_create(choice: DecoderChoice) -> bool:
+    try:
+        choice.create_context()
+        return True
+    except Exception:
+        return False
+
+
+def _create_sample_clip() -> bytes | None:
+    """Encode a clip resembling a scrolling game screen.
+
+    Generated instead of shipped so the benchmark does not depend on a
+    bundled resource, it only has to exercise the decoder realistically.
+    """
+    width, height = _SAMPLE_SIZE
+    rng = np.random.default_rng(0)
+    # Flat panels with text-like noise, scrolled by a few pixels per frame.
+    background = np.repeat(
+        np.linspace(40, 200, height, dtype=np.uint8)[:, None, None], width, axis=1
+    ).repeat(3, axis=2)
+    for top in range(0, height, 160):
+        background[top + 20 : top + 60, 40:-40] = rng.integers(
+            0, 255, (40, width - 80, 3), dtype=np.uint8
+        )
+
+    output = io.BytesIO()
+    try:
+        container = av.open(output, "w", format="h264")
+        stream = container.add_stream("h264", rate=_SAMPLE_FPS)
+        stream.width = width
+        stream.height = height
+        stream.pix_fmt = "yuv420p"
+        stream.time_base = Fraction(1, _SAMPLE_FPS)
+        # screenrecord uses MediaCodec, which does not reorder frames.
+        stream.options = {"tune": "zerolatency"}
+        for index in range(_SAMPLE_FRAMES):
+            image = np.roll(background, -index * 8, axis=0)
+            frame = av.VideoFrame.from_ndarray(image, format="rgb24")
+            for packet in stream.encode(frame.reformat(format="yuv420p")):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+        container.close()
+    except Exception as e:
+        logging.debug(f"Could not encode H264 sample clip: {e}")
+        return None
+    return output.getvalue()
+
+
+def _benchmark(choice: DecoderChoice, sample: bytes) -> DecoderChoice | None:
+    """Decode the sample like DeviceStream does, None if the decoder fails."""
+    try:
+        codec = choice.create_context()
+        packets = [*codec.parse(sample), *codec.parse(b"")]
+        decoded = 0
+        output_delay = None
+        start = time.perf_counter()
+        for index, packet in enumerate([*packets, None]):
+            for frame in codec.decode(packet):
+                frame.to_ndarray(format="rgb24")
+                if output_delay is None:
+                    output_delay = index
+                decoded += 1
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        logging.debug(f"H264 decoder {choice} failed: {e}")
+        return None
+    if decoded == 0:
+        return None
+    return DecoderChoice(
+        decoder=choice.decoder,
+        thread_count=choice.thread_count,
+        thread_type=choice.thread_type,
+        ms_per_frame=round(elapsed / decoded * 1000, 3),
+        output_delay_frames=output_delay or 0,
+    )
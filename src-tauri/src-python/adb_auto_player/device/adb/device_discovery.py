@@ -0,0 +1,118 @@
+"""Concurrent discovery of ADB devices.
+
+Probing candidates one after another makes a scan as slow as the sum of all
+timeouts, a host without emulators waits for every closed port and every
+failed handshake. Here every candidate is probed on its own thread and results
+are yielded as soon as they are known, bounded by an overall deadline.
+"""
+
+import logging
+import re
+import socket
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import as_completed
+
+from adbutils import AdbDevice
+
+DEFAULT_DEADLINE_SECONDS = 5.0
+PORT_TIMEOUT_SECONDS = 0.2
+_MAX_WORKERS = 32
+_LOOPBACK_DEVICE_ID = re.compile(r"^(?:127\.0\.0\.1|localhost):(\d+)$")
+
+
+def is_port_open(port: int, timeout: float = PORT_TIMEOUT_SECONDS) -> bool:
+    """Check if a TCP port is open on localhost."""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(timeout)
+            s.connect(("127.0.0.1", port))
+            return True
+    except Exception:
+        return False
+
+
+def probe_devices(
+    connect: Callable[[str], AdbDevice | None],
+    device_ids: Iterable[str],
+    deadline: float = DEFAULT_DEADLINE_SECONDS,
+) -> Iterator[tuple[str, AdbDevice | None]]:
+    """Probe device ids concurrently and yield results as they complete.
+
+    Loopback device ids are only handed to ADB if their port accepts a TCP
+    connection, so closed ports are rejected without an ADB handshake.
+
+    Args:
+        connect: Connects a device id, returns None if it is not available.
+        device_ids: Serials or `host:port` addresses to try.
+        deadline: Seconds after which probes that did not finish are abandoned.
+
+    Yields:
+        tuple[str, AdbDevice | None]: Device id and the connected device, None
+            if it could not be connected.
+    """
+    device_ids = list(dict.fromkeys(device_ids))
+    if not device_ids:
+        return
+
+    def probe(device_id: str) -> AdbDevice | None:
+        match = _LOOPBACK_DEVICE_ID.match(device_id)
+        if match and not is_port_open(int(match.group(1))):
+            return None
+        try:
+            return connect(device_id)
+        except Exception as e:
+            logging.debug(f"Failed to connect to device {device_id}: {e}")
+            return None
+
+    end = time.monotonic() + deadline
+    executor = ThreadPoolExecutor(
+        max_workers=min(_MAX_WORKERS, len(device_ids)),
+        thread_name_prefix="AdbDiscovery",
+    )
+    futures = {executor.submit(probe, device_id): device_id for device_id in device_ids}
+    try:
+        for future in as_completed(futures, timeout=max(0.0, end - time.monotonic())):
+            yield futures[future], future.result()
+    except FuturesTimeoutError:
+        pending = [futures[f] for f in futures if not f.done()]
+        logging.debug(f"Device discovery deadline reached, abandoned: {pending}")
+    finally:
+        # Do not wait for abandoned handshakes, they end with their socket timeout.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def discover_devices(
+    connect: Callable[[str], AdbDevice | None],
+    device_ids: Iterable[str],
+    deadline: float = DEFAULT_DEADLINE_SECONDS,
+) -> Iterator[AdbDevice]:
+    """Yield connectable devices in the order they are confirmed."""
+    for _, device in probe_devices(connect, device_ids, deadline):
+        if device is not None:
+            yield device
+
+
+def first_device(
+    connect: Callable[[str], AdbDevice | None],
+    device_ids: Iterable[str],
+    deadline: float = DEFAULT_DEADLINE_SECONDS,
+) -> AdbDevice | None:
+    """Return the connectable device that comes first in `device_ids`.
+
+    Returns as soon as every device id before the best confirmed one has
+    failed, without waiting for the remaining probes.
+    """
+    device_ids = list(dict.fromkeys(device_ids))
+    results: dict[str, AdbDevice | None] = {}
+    for device_id, device in probe_devices(connect, device_ids, deadline):
+        results[device_id] = device
+        for candidate in device_ids:
+            if candidate not in results:
+                break
+            if results[candidate] is not None:
+                return results[candidate]
+    # Deadline reached, use the best device that was confirmed in time.
+    return next((results[c] for c in device_ids if results.get(c) is not None), None)
@@ -0,0 +1,257 @@
+"""Per-device connection health tracking and ADB server restart coordination.
+
+Restarting the ADB server drops the transport of every connected device, so
+one flaky emulator would knock every other profile off its connection.
+DeviceHealthMonitor keeps latency and error statistics per serial, trips a
+circuit breaker with exponential backoff for the failing serial only, and
+AdbServerRestartGate makes a server restart an explicit, cross-process
+decision instead of the default recovery step.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import ClassVar
+
+_LATENCY_SMOOTHING = 0.2
+_BACKOFF_INITIAL = 2.0
+_BACKOFF_MAX = 60.0
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker state of a device."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass
+class DeviceHealth:
+    """Connection statistics of a single device serial."""
+
+    serial: str
+    calls: int = 0
+    errors: int = 0
+    consecutive_failures: int = 0
+    latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    state: CircuitState = CircuitState.CLOSED
+    backoff_seconds: float = 0.0
+    transport_reconnects: int = 0
+    server_restarts: int = 0
+    recoveries: int = 0
+    last_recovery_seconds: float | None = None
+    _open_until: float = 0.0
+    _failing_since: float | None = None
+
+    @property
+    def error_rate(self) -> float:
+        """Share of calls that failed."""
+        return self.errors / self.calls if self.calls else 0.0
+
+    def to_dict(self) -> dict:
+        """Public statistics as a JSON-serializable dict."""
+        data = {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+        data["state"] = str(self.state)
+        data["error_rate"] = round(self.error_rate, 4)
+        return data
+
+
+class DeviceHealthMonitor:
+    """Process-wide registry of DeviceHealth keyed by device serial."""
+
+    _devices: ClassVar[dict[str, DeviceHealth]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def get(cls, serial: str) -> DeviceHealth:
+        """Return the health record for a serial, creating it if needed."""
+        with cls._lock:
+            if serial not in cls._devices:
+                cls._devices[serial] = DeviceHealth(serial=serial)
+            return cls._devices[serial]
+
+    @classmethod
+    def record_success(cls, serial: str, latency_seconds: float) -> None:
+        """Record a successful call and close the circuit if it was tripped."""
+        health = cls.get(serial)
+        latency_ms = latency_seconds * 1000
+        with cls._lock:
+            health.calls += 1
+            health.latency_ms = (
+                latency_ms
+                if health.calls == 1
+                else (1 - _LATENCY_SMOOTHING) * health.latency_ms
+                + _LATENCY_SMOOTHING * latency_ms
+            )
+            health.max_latency_ms = max(health.max_latency_ms, latency_ms)
+            health.consecutive_failures = 0
+            if health._failing_since is None:
+                return
+            recovery = time.monotonic() - health._failing_since
+            health._failing_since = None
+            health.recoveries += 1
+            health.last_recovery_seconds = round(recovery, 3)
+            health.state = CircuitState.CLOSED
+            health.backoff_seconds = 0.0
+        logging.debug(
+            f"Device {serial} recovered after {recovery:.2f}s "
+            f"(transport reconnects: {health.transport_reconnects}, "
+            f"server restarts: {health.server_restarts})"
+        )
+
+    @classmethod
+    def record_failure(cls, serial: str) -> None:
+        """Record a failed call."""
+        health = cls.get(serial)
+        with cls._lock:
+            health.calls += 1
+            health.errors += 1
+            health.consecutive_failures += 1
+            if health._failing_since is None:
+                health._failing_since = time.monotonic()
+
+    @classmethod
+    def record_transport_reconnect(cls, serial: str) -> None:
+        """Count a reconnect of only this device's transport."""
+        health = cls.get(serial)
+        with cls._lock:
+            health.transport_reconnects += 1
+
+    @classmethod
+    def record_server_restart(cls, serial: str) -> None:
+        """Count an ADB server restart triggered by this device."""
+        health = cls.get(serial)
+        with cls._lock:
+            health.server_restarts += 1
+
+    @classmethod
+    def trip(cls, serial: str) -> float:
+        """Open the circuit, doubling the backoff on every consecutive trip.
+
+        Returns:
+            Backoff in seconds before the device should be tried again.
+        """
+        health = cls.get(serial)
+        with cls._lock:
+            health.backoff_seconds = (
+                min(_BACKOFF_MAX, health.backoff_seconds * 2)
+                if health.backoff_seconds
+                else _BACKOFF_INITIAL
+            )
+            health.state = CircuitState.OPEN
+            health._open_until = time.monotonic() + health.backoff_seconds
+        logging.warning(
+            f"Device {serial} is unresponsive, "
+            f"pausing ADB calls for {health.backoff_seconds:.0f}s"
+        )
+        return health.backoff_seconds
+
+    @classmethod
+    def wait_if_open(cls, serial: str) -> None:
+        """Block until the circuit of an open device allows a trial call."""
+        health = cls.get(serial)
+        if health.state != CircuitState.OPEN:
+            return
+        remaining = health._open_until - time.monotonic()
+        if remaining > 0:
+            logging.debug(f"Device {serial} circuit open, waiting {remaining:.1f}s")
+            time.sleep(remaining)
+        with cls._lock:
+            health.state = CircuitState.HALF_OPEN
+
+    @classmethod
+    def snapshot(cls) -> dict[str, dict]:
+        """Statistics of all tracked devices keyed by serial."""
+        with cls._lock:
+            return {serial: h.to_dict() for serial, h in cls._devices.items()}
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget all tracked devices."""
+        with cls._lock:
+            cls._devices.clear()
+
+
+class AdbServerRestartGate:
+    """Cross-process permission to restart the shared ADB server.
+
+    All AdbAutoPlayer processes talking to the same server port share a lock
+    file and a state file in the system temp dir. A restart is only granted
+    when no other process holds the lock and no restart happened within the
+    cooldown, so several failing profiles cause at most one restart.
+    """
+
+    cooldown_seconds: float = 120.0
+    stale_lock_seconds: float = 30.0
+
+    def __init__(self, port: int, directory: Path | None = None) -> None:
+        """Initialize the gate for the ADB server on `port`.
+
+        Args:
+            port: ADB server port.
+            directory: Where to keep the coordination files, defaults to the
+                system temp dir.
+        """
+        base = directory or Path(tempfile.gettempdir()) / "AdbAutoPlayer"
+        self.lock_path = base / f"adb_server_{port}.lock"
+        self.state_path = base / f"adb_server_{port}.json"
+
+    def try_acquire(self, serial: str) -> bool:
+        """Claim the restart, returns False if another process owns it or did one.
+
+        Args:
+            serial: Serial of the failing device, recorded for diagnostics.
+        """
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_lock()
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            logging.debug("ADB server restart already in progress in another process")
+            return False
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+
+        last_restart = self._read_state().get("wall_time", 0.0)
+        # Wall clock time is needed to compare across processes.
+        if time.time() - last_restart < self.cooldown_seconds:  # noqa: TID251
+            logging.debug("ADB server was restarted recently, not restarting again")
+            self.release()
+            return False
+
+        self.state_path.write_text(
+            json.dumps(
+                {
+                    "wall_time": time.time(),  # noqa: TID251
+                    "pid": os.getpid(),
+                    "serial": serial,
+                }
+            )
+        )
+        return True
+
+    def release(self) -> None:
+        """Release the restart lock."""
+        self.lock_path.unlink(missing_ok=True)
+
+    def _read_state(self) -> dict:
+        try:
+            return json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _remove_stale_lock(self) -> None:
+        try:
+            age = time.time() - self.lock_path.stat().st_mtime  # noqa: TID251
+        except OSError:
+            return
+        if age > self.stale_lock_seconds:
+            self.lock_path.unlink(missing_ok=True)
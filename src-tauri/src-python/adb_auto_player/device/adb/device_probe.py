@@ -0,0 +1,204 @@
+"""Collect device capabilities in a single `adb shell` round trip.
+
+Starting a task used to run a chain of shell commands, `wm size`, up to three
+orientation checks, `getprop` twice, `getevent -pl`, `/proc/bus/input/devices`
+and `dumpsys display`, each costing a round trip. DeviceProbe sends them as
+one script that prints every output in its own section.
+
+Sections that only change with the system image (`getprop`, `getevent -pl`)
+are persisted per serial and reused while the build fingerprint and physical
+resolution stay the same, so later tasks only query the sections that can
+change between runs.
+"""
+
+import json
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import ClassVar
+
+from adb_auto_player.file_loader import SettingsLoader
+
+from .adb_device import AdbDeviceWrapper
+
+_PROBE_DIR = "device_probe"
+_MARKER = "@@aap-probe:"
+
+# Only change with the system image, persisted per serial.
+_PERSISTED_SECTIONS: dict[str, str] = {
+    "getprop": "getprop",
+    "getevent": "getevent -pl",
+}
+# Queried on every probe, valid while the process runs.
+_SESSION_SECTIONS: dict[str, str] = {
+    "build_fingerprint": "getprop ro.build.fingerprint",
+    "input_devices": "cat /proc/bus/input/devices",
+}
+# Can change any time, only valid directly after probing.
+_VOLATILE_SECTIONS: dict[str, str] = {
+    "wm_size": "wm size",
+    "surface_orientation": "dumpsys input | grep 'SurfaceOrientation'",
+    "current_rotation": "dumpsys window | grep mCurrentRotation",
+    "display_orientation": "dumpsys display | grep -E 'orientation'",
+    "display_viewports": 'dumpsys display | grep "uniqueId=\'local:"',
+}
+
+
+@dataclass
+class DeviceProbe:
+    """Outputs of the probed shell commands.
+
+    Volatile sections such as the resolution or orientation are handed out once
+    by `take`, whoever needs them later has to query the device again.
+    """
+
+    serial: str
+    fingerprint: str
+    sections: dict[str, str] = field(default_factory=dict)
+    volatile: dict[str, str] = field(default_factory=dict)
+    round_trips: int = 0
+    from_cache: bool = False
+
+    _probes: ClassVar[dict[str, "DeviceProbe"]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def run(cls, d: AdbDeviceWrapper, directory: Path | None = None) -> "DeviceProbe":
+        """Probe the device and register the result for its serial.
+
+        Args:
+            d: Device to probe.
+            directory: Where probes are persisted, defaults to the app config dir.
+        """
+        serial = str(d.serial)
+        path = _probe_path(serial, directory)
+        cached = _load(path)
+
+        sections = _SESSION_SECTIONS | _VOLATILE_SECTIONS
+        if not cached:
+            sections |= _PERSISTED_SECTIONS
+        output = _run_script(d, sections)
+        probe = cls(
+            serial=serial,
+            fingerprint=_fingerprint(output),
+            sections={
+                name: output[name] for name in _SESSION_SECTIONS if name in output
+            },
+            volatile={
+                name: output[name] for name in _VOLATILE_SECTIONS if name in output
+            },
+            round_trips=1,
+        )
+
+        if cached and cached.get("fingerprint") == probe.fingerprint:
+            probe.sections |= cached.get("sections", {})
+            probe.from_cache = True
+        elif cached:
+            logging.debug(f"Device {serial} changed, probing capabilities again")
+            probe.sections |= _run_script(d, _PERSISTED_SECTIONS)
+            probe.round_trips += 1
+        else:
+            probe.sections |= {
+                name: output[name] for name in _PERSISTED_SECTIONS if name in output
+            }
+
+        if not probe.from_cache and probe.fingerprint:
+            _save(path, probe)
+        logging.debug(
+            f"Probed device {serial} in {probe.round_trips} round trip(s), "
+            f"cached: {probe.from_cache}"
+        )
+        with cls._lock:
+            cls._probes[serial] = probe
+        return probe
+
+    @classmethod
+    def get(cls, serial: str | None) -> "DeviceProbe | None":
+        """Return the probe of a device if it was probed in this process."""
+        with cls._lock:
+            return cls._probes.get(str(serial))
+
+    @classmethod
+    def clear(cls, serial: str | None = None) -> None:
+        """Forget probes of one or all devices in this process."""
+        with cls._lock:
+            if serial is None:
+                cls._probes.clear()
+            else:
+                cls._probes.pop(str(serial), None)
+
+    def section(self, name: str) -> str | None:
+        """Return a persisted or session section, None if it was not probed."""
+        return self.sections.get(name)
+
+    def take(self, name: str) -> str | None:
+        """Return a volatile section once, None if it was already used."""
+        with self._lock:
+            return self.volatile.pop(name, None)
+
+
+def _run_script(d: AdbDeviceWrapper, sections: dict[str, str]) -> dict[str, str]:
+    script = "; ".join(
+        f"echo '{_MARKER}{name}'; {command} 2>&1" for name, command in sections.items()
+    )
+    output = d.shell(script)
+    if not isinstance(output, str):
+        return {}
+    return _parse_sections(output)
+
+
+def _parse_sections(output: str) -> dict[str, str]:
+    """Split probe script output into its sections."""
+    sections: dict[str, list[str]] = {}
+    current: list[str] | None = None
+    for line in output.splitlines():
+        if line.startswith(_MARKER):
+            current = sections.setdefault(line[len(_MARKER) :].strip(), [])
+        elif current is not None:
+            current.append(line)
+    return {name: "\n".join(lines).strip() for name, lines in sections.items()}
+
+
+def _fingerprint(output: dict[str, str]) -> str:
+    """Build fingerprint and physical resolution, empty if the probe failed."""
+    build = output.get("build_fingerprint", "")
+    physical_size = re.search(r"Physical size:\s*(\S+)", output.get("wm_size", ""))
+    if not build or not physical_size:
+        return ""
+    return f"{build}|{physical_size.group(1)}"
+
+
+def _probe_path(serial: str, directory: Path | None) -> Path:
+    directory = directory or SettingsLoader.get_app_config_dir() / _PROBE_DIR
+    name = re.sub(r"[^\w.-]", "_", serial)
+    return directory / f"{name}.json"
+
+
+def _load(path: Path) -> dict | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _save(path: Path, probe: DeviceProbe) -> None:
+    try:
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {
+                    "fingerprint": probe.fingerprint,
+                    "sections": {
+                        name: probe.sections[name]
+                        for name in _PERSISTED_SECTIONS
+                        if name in probe.sections
+                    },
+                }
+            ),
+            encoding="utf-8",
+        )
+    except OSError as e:
+        logging.debug(f"Could not save device probe: {e}")
@@ -1,84 +1,42 @@
 """ADB Auto Player Device Stream Module."""
 
 import logging
+import math
 import threading
 import time
-from functools import lru_cache
 
-import av
 import numpy as np
-from adb_auto_player.exceptions import AutoPlayerWarningError
 from adb_auto_player.file_loader import SettingsLoader
 from adb_auto_player.util.runtime import RuntimeInfo
 from adbutils import AdbConnection
-from av.codec.codec import UnknownCodecError
-from av.codec.context import CodecContext
 from av.video.codeccontext import VideoCodecContext
 
 from .adb_controller import AdbController
-
-
-@lru_cache(maxsize=1)
-def _get_best_decoder(hardware_decoding: bool) -> str:
-    """Find and cache the best available H264 decoder."""
-    selected_decoder = None
-
-    if hardware_decoding:
-        h264_decoders = _get_available_h264_decoders()
-
-        for decoder in h264_decoders:
-            try:
-                _ = CodecContext.create(decoder, "r")
-                selected_decoder = decoder
-                break
-            except UnknownCodecError:
-                continue
-
-    # explicitly try software h264 decoder
-    if not selected_decoder:
-        try:
-            _ = CodecContext.create("h264", "r")
-            selected_decoder = "h264"
-        except UnknownCodecError:
-            pass
-
-    if hardware_decoding and selected_decoder == "h264":
-        logging.warning(
-            "Failed to initialise h264 hardware decoder, using software decoding"
-        )
-
-    if selected_decoder:
-        logging.debug(f"Selected H264 decoder: {selected_decoder}")
-        return selected_decoder
-
-    raise StreamingNotSupportedError(
-        "No h264 decoders available cannot handle Device Streaming."
-    )
+from .decoder_selection import DecoderSelector, StreamingNotSupportedError
+from .screenrecord_segments import ScreenrecordSegmentManager, SegmentGapStats
 
 
 def _get_codec_context() -> VideoCodecContext:
-    """Get codec context using cached decoder selection."""
-    decoder_name = _get_best_decoder(
+    """Get codec context using the benchmarked decoder selection."""
+    return DecoderSelector.best(
         SettingsLoader.adb_settings().advanced.hardware_decoding
-    )
-    return VideoCodecContext.create(decoder_name, "r")  # ty: ignore[invalid-return-type]
-
-
-class StreamingNotSupportedError(AutoPlayerWarningError):
-    """Streaming is not yet implemented for the specified platform."""
-
-    pass
+    ).create_context()
 
 
 class DeviceStream:
     """Device screen streaming."""
 
-    def __init__(self, controller: AdbController, fps: int | None = None):
+    def __init__(
+        self, controller: AdbController, fps: int | None = None, scale: float = 1.0
+    ):
         """Initialize the screen stream.
 
         Args:
             controller: AdbDevice instance
             fps: Target frames per second (default: 30)
+            scale: Fraction of the display resolution requested from
+                `screenrecord`, e.g. 0.5 encodes, transfers and decodes a
+                quarter of the pixels. Not supported on BlueStacks.
 
         Raises:
             StreamingNotSupportedError
@@ -96,6 +54,11 @@ class DeviceStream:
         self.codec = _get_codec_context()
         self.controller = controller
         self.fps = fps
+        if not 0 < scale <= 1:
+            raise ValueError(f"Stream scale must be in (0, 1], got {scale}")
+        # Actual scale of the frames, stays 1.0 if --size cannot be used.
+        self.scale = 1.0
+        self._requested_scale = scale
         self.latest_frame: np.ndarray | None = None
         self._frame_lock = threading.Lock()
         self._running = False
@@ -104,6 +67,7 @@ class DeviceStream:
         self._stream_thread: threading.Thread | None = None
         self._monitor_thread: threading.Thread | None = None
         self._process: AdbConnection | None = None
+        self._segments: ScreenrecordSegmentManager | None = None
 
     def _should_use_time_limit(self) -> bool:
         """Determine if chunked streaming should be used based on emulator brand."""
@@ -112,11 +76,17 @@ class DeviceStream:
             return False
 
         try:
-            props = str(self.controller.d.shell("getprop")).lower()
+            props = str(
+                self.controller.probed_section("getprop")
+                or self.controller.d.shell("getprop")
+            ).lower()
             if "bluestacks" in props:
                 self._is_bluestacks = True
                 return True
-            devices = str(self.controller.d.shell("getevent -pl")).lower()
+            devices = str(
+                self.controller.probed_section("getevent")
+                or self.controller.d.shell("getevent -pl")
+            ).lower()
             if "bluestacks" in devices:
                 self._is_bluestacks = True
                 return True
@@ -164,9 +134,16 @@ class DeviceStream:
                 except Exception:
                     pass
 
+    @property
+    def segment_stats(self) -> SegmentGapStats | None:
+        """Handoff and gap statistics of time-limited streaming, if used."""
+        return self._segments.stats() if self._segments else None
+
     def stop(self) -> None:
         """Stop the screen streaming thread."""
         self._running = False
+        if self._segments:
+            self._segments.stop()
         if self._process:
             try:
                 self._process.close()
@@ -188,8 +165,11 @@ class DeviceStream:
         with self._frame_lock:
             return self.latest_frame
 
-    def _handle_stream(self) -> None:
-        """Generic stream handler."""
+    def _set_latest_frame(self, frame: np.ndarray) -> None:
+        with self._frame_lock:
+            self.latest_frame = frame
+
+    def _screenrecord_cmdargs(self, time_limit: bool) -> str:
         # Keep the streamed display in sync with screenshot()/tap() on devices
         # that expose more than one virtual display (see
         # AdbController.resolve_display_targeting) — otherwise `screenrecord`
@@ -204,18 +184,33 @@ class DeviceStream:
         else:
             try:
                 res = self.controller.get_display_info().resolution
-                parts.append(f"--size {res.width}x{res.height}")
+                width, height = _scaled_size(
+                    res.width, res.height, self._requested_scale
+                )
+                parts.append(f"--size {width}x{height}")
+                self.scale = width / res.width
             except Exception:
                 pass
             parts.extend(display_args)
             parts.append("--bit-rate 2000000")
         base_cmd = " ".join(parts)
-
-        cmdargs = (
-            f"{base_cmd} --time-limit=1 -" if self._use_time_limit else f"{base_cmd} -"
+        return f"{base_cmd} --time-limit=1 -" if time_limit else f"{base_cmd} -"
+
+    def _stream_segments(self) -> None:
+        """Stream chained `--time-limit=1` sessions without gaps between them."""
+        cmdargs = self._screenrecord_cmdargs(time_limit=True)
+        self._segments = ScreenrecordSegmentManager(
+            open_segment=lambda: self.controller.d.shell(cmdargs=cmdargs, stream=True),
+            create_codec=_get_codec_context,
+            on_frame=self._set_latest_frame,
+            is_running=lambda: self._running,
         )
+        self._segments.run()
+
+    def _handle_stream(self) -> None:
+        """Generic stream handler."""
         self._process = self.controller.d.shell(
-            cmdargs=cmdargs,
+            cmdargs=self._screenrecord_cmdargs(time_limit=False),
             stream=True,
         )
 
@@ -250,7 +245,10 @@ class DeviceStream:
         """Background thread that continuously captures frames."""
         while self._running:
             try:
-                self._handle_stream()
+                if self._use_time_limit:
+                    self._stream_segments()
+                else:
+                    self._handle_stream()
             except Exception as e:
                 if self._running:
                     if "was aborted by the software in your host machine" not in str(e):
@@ -266,14 +264,17 @@ class DeviceStream:
                             raise
 
 
-def _get_available_h264_decoders():
-    """Returns a list of available H264 decoders."""
-    known_decoders = [
-        "h264_cuvid",  # NVIDIA GPU (high priority hardware decoder)
-        "h264_qsv",  # Intel Quick Sync (hardware)
-        "h264_vaapi",  # Intel/AMD VAAPI (hardware)
-        "h264_v4l2m2m",  # ARM/Linux hardware decoder
-        "h264",  # Software fallback decoder
-    ]
-    available = av.codecs_available
-    return [decoder for decoder in known_decoders if decoder in available]
+def _scaled_size(width: int, height: int, scale: float) -> tuple[int, int]:
+    """Scale dimensions to even numbers, as H264 encoders require.
+
+    The scale is lowered to the nearest value at which both dimensions stay
+    even integers, so the aspect ratio and with it one scale factor for both
+    axes is kept exactly. Full size is used if there is no such value.
+    """
+    if scale == 1.0:
+        return width, height
+    divisor = math.gcd(width, height)
+    steps = math.floor(scale * divisor / 2)
+    if steps < 1:
+        return width, height
+    return width * 2 * steps // divisor, height * 2 * steps // divisor
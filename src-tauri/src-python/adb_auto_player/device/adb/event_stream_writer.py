@@ -0,0 +1,248 @@
+"""Write kernel input events to a device through one persistent shell.
+
+`adb shell sendevent ...` opens a new ADB connection and shell per event, so
+a stick move (two axes + SYN_REPORT) costs three round trips. The writer keeps
+a single `sh` session open and encodes a whole gesture, including the hold
+durations between events, into one write.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from itertools import count
+
+from .adb_device import AdbDeviceWrapper
+
+EV_SYN = 0x00
+EV_KEY = 0x01
+EV_ABS = 0x03
+SYN_REPORT = 0
+SYN_MT_REPORT = 2
+
+_SPIN_SECONDS = 0.002
+_ACK_TIMEOUT_MARGIN = 5.0
+
+
+@dataclass(frozen=True)
+class InputEvent:
+    """A single Linux input event."""
+
+    ev_type: int
+    code: int
+    value: int
+
+
+@dataclass
+class Gesture:
+    """Sequence of input events and pauses sent to the device as one unit.
+
+    Methods return the gesture so a gesture can be built in one expression:
+    `Gesture().abs(ABS_X, 100).abs(ABS_Y, 0).syn().pause(0.5)`.
+    """
+
+    steps: list[InputEvent | float] = field(default_factory=list)
+
+    def event(self, ev_type: int, code: int, value: int) -> "Gesture":
+        """Append an event."""
+        self.steps.append(InputEvent(ev_type, code, value))
+        return self
+
+    def key(self, code: int, down: bool) -> "Gesture":
+        """Append a key down or up event."""
+        return self.event(EV_KEY, code, int(down))
+
+    def abs(self, code: int, value: int) -> "Gesture":
+        """Append an absolute axis event."""
+        return self.event(EV_ABS, code, value)
+
+    def syn(self) -> "Gesture":
+        """Append a SYN_REPORT."""
+        return self.event(EV_SYN, SYN_REPORT, 0)
+
+    def mt_syn(self) -> "Gesture":
+        """Append a SYN_MT_REPORT."""
+        return self.event(EV_SYN, SYN_MT_REPORT, 0)
+
+    def pause(self, seconds: float) -> "Gesture":
+        """Append a pause, e.g. how long a key or stick is held."""
+        if seconds > 0:
+            self.steps.append(float(seconds))
+        return self
+
+    def extend(self, other: "Gesture") -> "Gesture":
+        """Append all steps of another gesture."""
+        self.steps.extend(other.steps)
+        return self
+
+    @property
+    def duration(self) -> float:
+        """Sum of all pauses in seconds."""
+        return sum(step for step in self.steps if isinstance(step, float))
+
+    def segments(self) -> list[tuple[float, list[InputEvent]]]:
+        """Split into (offset from start in seconds, events) at every pause."""
+        segments: list[tuple[float, list[InputEvent]]] = [(0.0, [])]
+        offset = 0.0
+        for step in self.steps:
+            if isinstance(step, InputEvent):
+                segments[-1][1].append(step)
+            else:
+                offset += step
+                segments.append((offset, []))
+        return [(offset, events) for offset, events in segments if events]
+
+
+class EventStreamWriter:
+    """Streams gestures for one input device file over a persistent shell.
+
+    Two playback modes are supported:
+    - device-timed (default): pauses become `sleep` in the shell script so the
+      whole gesture is a single write and holds are timed on the device.
+    - realtime: every segment between pauses is written when it is due,
+      scheduled with `perf_counter` on the host. Use this when the caller needs
+      the host clock to be authoritative, e.g. to line up with a frame.
+
+    If the persistent shell cannot be (re)opened the gesture is sent as a
+    one-shot `adb shell` command instead.
+    """
+
+    def __init__(self, device: AdbDeviceWrapper, device_file: str) -> None:
+        """Initialize the writer.
+
+        Args:
+            device: Device to write to.
+            device_file: Input device file, e.g. /dev/input/event3.
+        """
+        self.device = device
+        self.device_file = device_file
+        self._connection = None
+        self._lock = threading.Lock()
+        self._marker_ids = count()
+
+    def play(self, gesture: Gesture, wait: bool = True, realtime: bool = False) -> None:
+        """Send a gesture.
+
+        Args:
+            gesture: Gesture to send.
+            wait: Block until the device executed the gesture. Without waiting
+                the call returns as soon as the gesture is written.
+            realtime: Schedule segments on the host instead of on the device.
+        """
+        if not gesture.steps:
+            return
+        with self._lock:
+            if realtime:
+                self._play_realtime(gesture, wait)
+            else:
+                self._send(self._encode(gesture.steps), wait, gesture.duration)
+
+    def close(self) -> None:
+        """Close the persistent shell."""
+        with self._lock:
+            self._close_connection()
+
+    def _play_realtime(self, gesture: Gesture, wait: bool) -> None:
+        start = time.perf_counter()
+        segments = gesture.segments()
+        for index, (offset, events) in enumerate(segments):
+            _sleep_until(start + offset)
+            is_last = index == len(segments) - 1
+            self._send(self._encode(list(events)), wait and is_last, 0.0)
+
+    def _encode(self, steps: list[InputEvent | float]) -> str:
+        commands = []
+        for step in steps:
+            if isinstance(step, InputEvent):
+                commands.append(
+                    f"sendevent {self.device_file} "
+                    f"{step.ev_type} {step.code} {step.value}"
+                )
+            else:
+                commands.append(f"sleep {step:.3f}")
+        return "; ".join(commands)
+
+    def _send(self, script: str, wait: bool, duration: float) -> None:
+        marker = f"__aap_{next(self._marker_ids)}__" if wait else None
+        line = f"{script}; echo {marker}\n" if marker else f"{script}\n"
+        for _ in range(2):
+            sent = False
+            try:
+                connection = self._get_connection()
+                self._drain(connection)
+                connection.send(line.encode())
+                sent = True
+                if marker:
+                    self._read_until(connection, marker, duration)
+                return
+            except (OSError, EOFError) as e:
+                logging.debug(f"Persistent shell for {self.device_file} failed: {e}")
+                self._close_connection()
+                if sent:
+                    # The events may already have been injected, resending
+                    # would press keys twice.
+                    return
+
+        logging.debug("Falling back to one-shot shell for input events")
+        self.device.shell(script, timeout=duration + _ACK_TIMEOUT_MARGIN)
+
+    def _get_connection(self):
+        if self._connection is None:
+            connection = self.device.shell_unsafe("sh", stream=True)
+            if isinstance(connection, str | bytes):
+                raise OSError("Shell did not open a stream")
+            self._connection = connection
+        return self._connection
+
+    def _close_connection(self) -> None:
+        if self._connection is None:
+            return
+        try:
+            self._connection.close()
+        except Exception as e:
+            logging.debug(f"Closing persistent shell failed: {e}")
+        self._connection = None
+
+    @staticmethod
+    def _drain(connection) -> None:
+        """Discard unread shell output so the socket buffer never fills up."""
+        sock = connection.conn
+        timeout = sock.gettimeout()
+        sock.setblocking(False)
+        try:
+            while True:
+                data = sock.recv(4096)
+                if not data:
+                    raise EOFError("Shell closed")
+        except (BlockingIOError, InterruptedError):
+            pass
+        finally:
+            sock.settimeout(timeout)
+
+    @staticmethod
+    def _read_until(connection, marker: str, duration: float) -> None:
+        sock = connection.conn
+        timeout = sock.gettimeout()
+        sock.settimeout(duration + _ACK_TIMEOUT_MARGIN)
+        expected = marker.encode()
+        buffer = b""
+        try:
+            while expected not in buffer:
+                data = sock.recv(4096)
+                if not data:
+                    raise EOFError("Shell closed")
+                buffer = buffer[-len(expected) :] + data
+        except TimeoutError as e:
+            raise OSError(f"Timed out waiting for {marker}") from e
+        finally:
+            sock.settimeout(timeout)
+
+
+def _sleep_until(deadline: float) -> None:
+    """Sleep until a perf_counter deadline, spinning for the last few ms."""
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return
+        if remaining > _SPIN_SECONDS:
+            time.sleep(remaining - _SPIN_SECONDS)
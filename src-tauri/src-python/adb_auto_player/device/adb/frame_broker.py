@@ -0,0 +1,528 @@
+"""Share one device stream between processes through shared memory.
+
+Every `DeviceStream` runs its own `screenrecord` encoder on the device and its
+own decoder on the host, so a second consumer of the same device (a preview,
+a debug capture, another analysis process) doubles the load on both. The
+FrameBroker process owns the only stream for a serial and publishes decoded
+BGR frames into a SharedFrameRing that any number of local readers attach to.
+
+Ring layout (all integers little endian):
+- header: magic, version, slot count, closed flag, slot capacity in bytes,
+  id of the latest published frame, time of the last read.
+- one header per slot: sequence, frame id, timestamp, height, width, channels.
+- slot data, `slot capacity` bytes per slot.
+
+Each slot is guarded by a sequence lock: the writer makes the sequence odd
+before touching the slot and even again afterwards. A reader that sees the
+same even sequence before and after reading got a consistent frame.
+Timestamps are `time.monotonic_ns()`, which is system wide on all supported
+platforms and therefore comparable between processes.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import signal
+import struct
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from pathlib import Path
+
+import cv2
+import numpy as np
+import psutil
+from adb_auto_player.file_loader import SettingsLoader
+
+from .adb_client import AdbClientHelper
+from .adb_controller import AdbController
+from .adb_device import AdbDeviceWrapper
+from .device_stream import DeviceStream
+
+_MAGIC = b"AAPF"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIIIQQQ")
+_HEADER_SIZE = 64
+_CLOSED_OFFSET = 12
+_LATEST_OFFSET = 24
+_LAST_READ_OFFSET = 32
+_SLOT_HEADER = struct.Struct("<QQQIII")
+_SLOT_HEADER_SIZE = 64
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+_MIN_SLOTS = 2
+_COLOR_NDIM = 3
+_READ_ATTEMPTS = 4
+_POLL_SECONDS = 0.005
+_STARTING_GRACE_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """A frame read from a SharedFrameRing.
+
+    When read without copying `image` is a read-only view into shared memory
+    that stays valid until the writer reuses the slot, see
+    `SharedFrameRing.is_valid`.
+    """
+
+    frame_id: int
+    timestamp_ns: int
+    image: np.ndarray
+    slot: int
+    sequence: int
+
+
+class SharedFrameRing:
+    """Fixed size ring of frames in `multiprocessing.shared_memory`.
+
+    One process writes, any number of processes read. Readers never block the
+    writer, a slow reader only ever sees the latest frame.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool) -> None:
+        """Wrap an existing shared memory block, use `create` or `attach`."""
+        buf = _buffer(shm)
+        magic, version, slot_count, _, slot_capacity, _, _ = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{shm.name} is not a frame ring")
+        self._shm = shm
+        self._buf: memoryview = buf
+        self._owner = owner
+        self.slot_count = slot_count
+        self.slot_capacity = slot_capacity
+
+    @classmethod
+    def create(
+        cls, name: str, slot_count: int, slot_capacity: int
+    ) -> "SharedFrameRing":
+        """Create a new ring.
+
+        Args:
+            name: Shared memory name.
+            slot_count: Number of frames kept, must be at least 2 so the
+                latest frame is never the one being written.
+            slot_capacity: Maximum frame size in bytes.
+        """
+        if slot_count < _MIN_SLOTS:
+            raise ValueError("slot_count must be at least 2")
+        size = _HEADER_SIZE + slot_count * (_SLOT_HEADER_SIZE + slot_capacity)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        buf = _buffer(shm)
+        buf[: _HEADER_SIZE + slot_count * _SLOT_HEADER_SIZE] = bytes(
+            _HEADER_SIZE + slot_count * _SLOT_HEADER_SIZE
+        )
+        _HEADER.pack_into(buf, 0, _MAGIC, _VERSION, slot_count, 0, slot_capacity, 0, 0)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedFrameRing":
+        """Attach to a ring created by another process.
+
+        Raises:
+            FileNotFoundError: No ring with this name exists.
+            ValueError: The shared memory block is not a frame ring.
+        """
+        return cls(_attach_shared_memory(name), owner=False)
+
+    @property
+    def name(self) -> str:
+        """Shared memory name."""
+        return self._shm.name
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer retired this ring."""
+        return bool(_U32.unpack_from(self._buf, _CLOSED_OFFSET)[0])
+
+    @property
+    def latest_frame_id(self) -> int:
+        """Id of the latest published frame, 0 if none was published yet."""
+        return _U64.unpack_from(self._buf, _LATEST_OFFSET)[0]
+
+    @property
+    def last_read_ns(self) -> int:
+        """`monotonic_ns` of the last read by any reader, 0 if never read."""
+        return _U64.unpack_from(self._buf, _LAST_READ_OFFSET)[0]
+
+    def write(self, image: np.ndarray, conversion: int | None = None) -> int:
+        """Publish a frame.
+
+        Args:
+            image: uint8 image.
+            conversion: Optional `cv2.COLOR_*` code, the converted image is
+                written straight into the slot without an intermediate copy.
+
+        Returns:
+            Id of the published frame.
+
+        Raises:
+            ValueError: The image is not uint8 or larger than a slot.
+        """
+        if image.dtype != np.uint8:
+            raise ValueError(f"Frames must be uint8, got {image.dtype}")
+        if image.nbytes > self.slot_capacity:
+            raise ValueError(
+                f"Frame of {image.nbytes} bytes exceeds slot capacity "
+                f"of {self.slot_capacity} bytes"
+            )
+        frame_id = self.latest_frame_id + 1
+        slot = frame_id % self.slot_count
+        header_offset = self._slot_header_offset(slot)
+        sequence = _U64.unpack_from(self._buf, header_offset)[0]
+        _U64.pack_into(self._buf, header_offset, sequence + 1)
+
+        height, width = image.shape[:2]
+        channels = image.shape[2] if image.ndim == _COLOR_NDIM else 1
+        target = self._slot_view(slot, height, width, channels)
+        if conversion is None:
+            np.copyto(target, image.reshape(target.shape))
+        else:
+            cv2.cvtColor(image, conversion, dst=target)
+
+        _SLOT_HEADER.pack_into(
+            self._buf,
+            header_offset,
+            sequence + 1,
+            frame_id,
+            time.monotonic_ns(),
+            height,
+            width,
+            channels,
+        )
+        _U64.pack_into(self._buf, header_offset, sequence + 2)
+        _U64.pack_into(self._buf, _LATEST_OFFSET, frame_id)
+        return frame_id
+
+    def latest(self, copy: bool = True) -> SharedFrame | None:
+        """Read the latest frame.
+
+        Args:
+            copy: Copy the image out of shared memory. Without copying the
+                image is a read-only view, check `is_valid` after using it.
+
+        Returns:
+            The latest frame, None if there is none or the writer kept
+            overwriting it while reading.
+        """
+        _U64.pack_into(self._buf, _LAST_READ_OFFSET, time.monotonic_ns())
+        for _ in range(_READ_ATTEMPTS):
+            frame_id = self.latest_frame_id
+            if frame_id == 0:
+                return None
+            slot = frame_id % self.slot_count
+            header_offset = self._slot_header_offset(slot)
+            sequence, slot_frame_id, timestamp_ns, height, width, channels = (
+                _SLOT_HEADER.unpack_from(self._buf, header_offset)
+            )
+            if sequence % 2 or slot_frame_id != frame_id:
+                continue
+            image = self._slot_view(slot, height, width, channels)
+            if copy:
+                image = image.copy()
+            else:
+                image.flags.writeable = False
+            if _U64.unpack_from(self._buf, header_offset)[0] != sequence:
+                continue
+            return SharedFrame(frame_id, timestamp_ns, image, slot, sequence)
+        return None
+
+    def is_valid(self, frame: SharedFrame) -> bool:
+        """Whether the slot of a frame read without copying was not reused."""
+        header_offset = self._slot_header_offset(frame.slot)
+        return _U64.unpack_from(self._buf, header_offset)[0] == frame.sequence
+
+    def mark_closed(self) -> None:
+        """Tell readers this ring is retired and they should reattach."""
+        _U32.pack_into(self._buf, _CLOSED_OFFSET, 1)
+
+    def close(self) -> None:
+        """Detach from the ring, the creator also removes it."""
+        try:
+            self._shm.close()
+        except BufferError:
+            # Zero-copy frames still reference the mapping, it is released
+            # once they are garbage collected.
+            logging.debug(f"Frame ring {self.name} still in use, not unmapped")
+        if self._owner:
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _slot_header_offset(self, slot: int) -> int:
+        return _HEADER_SIZE + slot * _SLOT_HEADER_SIZE
+
+    def _slot_view(
+        self, slot: int, height: int, width: int, channels: int
+    ) -> np.ndarray:
+        offset = (
+            _HEADER_SIZE
+            + self.slot_count * _SLOT_HEADER_SIZE
+            + slot * self.slot_capacity
+        )
+        shape = (height, width) if channels == 1 else (height, width, channels)
+        return np.ndarray(shape, dtype=np.uint8, buffer=self._buf, offset=offset)
+
+
+class FrameReader:
+    """Reads frames published by a FrameBroker.
+
+    Follows the broker to a new ring when it had to replace the ring, e.g.
+    because the resolution increased.
+    """
+
+    def __init__(self, broker: "FrameBroker", ring: SharedFrameRing) -> None:
+        """Initialize the reader, use `FrameBroker.attach`."""
+        self.broker = broker
+        self.ring: SharedFrameRing | None = ring
+
+    def latest(self, copy: bool = True) -> SharedFrame | None:
+        """Read the latest frame, see `SharedFrameRing.latest`."""
+        if self.ring is None or self.ring.closed:
+            self._reattach()
+        if self.ring is None:
+            return None
+        return self.ring.latest(copy=copy)
+
+    def get_latest_frame(self) -> np.ndarray | None:
+        """Copy of the latest BGR frame, None if no frame is available."""
+        frame = self.latest()
+        return frame.image if frame else None
+
+    def close(self) -> None:
+        """Detach from the ring."""
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+    def _reattach(self) -> None:
+        self.close()
+        self.ring = self.broker._attach_ring()
+
+
+class FrameBroker:
+    """Owns the device stream of one serial and publishes it to readers.
+
+    At most one broker runs per serial on a machine. It is found through an
+    info file in the system temp dir that holds the broker pid and the name
+    of its current ring. The broker exits when no reader read a frame for
+    `idle_timeout` seconds or when the process that started it exits.
+    """
+
+    slot_count: int = 4
+    idle_timeout: float = 30.0
+
+    def __init__(self, serial: str, directory: Path | None = None) -> None:
+        """Initialize the broker handle for a device.
+
+        Args:
+            serial: Device serial.
+            directory: Where to keep the info file, defaults to the system
+                temp dir.
+        """
+        self.serial = serial
+        digest = hashlib.sha1(serial.encode()).hexdigest()[:8]
+        base = directory or Path(tempfile.gettempdir()) / "AdbAutoPlayer"
+        self.info_path = base / f"frame_broker_{digest}.json"
+        # macOS limits shared memory names to 31 characters.
+        self.shm_prefix = f"aap_{digest}"
+        self._process: multiprocessing.Process | None = None
+
+    def start(self) -> bool:
+        """Start a broker process unless one is already running for the serial.
+
+        Returns:
+            True if a broker is running afterwards.
+        """
+        if self.is_running():
+            return True
+        self.info_path.parent.mkdir(parents=True, exist_ok=True)
+        self._remove_stale_info()
+        try:
+            fd = os.open(self.info_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            logging.debug(f"Frame broker for {self.serial} is being started")
+            return True
+        with os.fdopen(fd, "w") as f:
+            json.dump({"pid": None, "shm_name": None}, f)
+
+        process = multiprocessing.Process(
+            target=_run_frame_broker,
+            kwargs={
+                "serial": self.serial,
+                "info_path": self.info_path,
+                "shm_prefix": self.shm_prefix,
+                "slot_count": self.slot_count,
+                "idle_timeout": self.idle_timeout,
+                "app_config_dir": SettingsLoader.get_app_config_dir(),
+                "resource_dir": SettingsLoader.get_resource_dir(),
+            },
+            name=f"FrameBroker-{self.serial}",
+            daemon=True,
+        )
+        try:
+            process.start()
+        except Exception:
+            self.info_path.unlink(missing_ok=True)
+            raise
+        _write_info(self.info_path, {"pid": process.pid, "shm_name": None})
+        self._process = process
+        logging.debug(f"Started frame broker for {self.serial} (pid {process.pid})")
+        return True
+
+    def stop(self) -> None:
+        """Stop the broker process if it was started by this handle."""
+        if self._process is None:
+            return
+        self._process.terminate()
+        self._process.join(timeout=5)
+        self._process = None
+
+    def is_running(self) -> bool:
+        """Whether a broker process for the serial is alive."""
+        pid = _read_info(self.info_path).get("pid")
+        return bool(pid) and psutil.pid_exists(pid)
+
+    def attach(self) -> FrameReader | None:
+        """Attach a reader, None if no broker is publishing frames yet."""
+        ring = self._attach_ring()
+        return FrameReader(self, ring) if ring else None
+
+    def _attach_ring(self) -> SharedFrameRing | None:
+        info = _read_info(self.info_path)
+        pid = info.get("pid")
+        name = info.get("shm_name")
+        if not pid or not name or not psutil.pid_exists(pid):
+            return None
+        try:
+            return SharedFrameRing.attach(name)
+        except (FileNotFoundError, ValueError) as e:
+            logging.debug(f"Could not attach to frame ring {name}: {e}")
+            return None
+
+    def _remove_stale_info(self) -> None:
+        info = _read_info(self.info_path)
+        pid = info.get("pid")
+        if pid and psutil.pid_exists(pid):
+            return
+        try:
+            # Time is only compared to the file's mtime, which is wall clock.
+            age = time.time() - self.info_path.stat().st_mtime  # noqa: TID251
+        except OSError:
+            return
+        if pid or age > _STARTING_GRACE_SECONDS:
+            self.info_path.unlink(missing_ok=True)
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    """The mapped buffer of an open shared memory block."""
+    if shm.buf is None:
+        raise ValueError(f"{shm.name} is closed")
+    return shm.buf
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach without registering with the resource tracker.
+
+    The tracker would otherwise remove the block when the reader exits, even
+    though the broker still owns it.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        resource_tracker.unregister(shm._name, "shared_memory")  # ty: ignore[unresolved-attribute]
+    return shm
+
+
+def _read_info(path: Path) -> dict:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_info(path: Path, info: dict) -> None:
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(info))
+    os.replace(tmp_path, path)
+
+
+def _run_frame_broker(
+    *,
+    serial: str,
+    info_path: Path,
+    shm_prefix: str,
+    slot_count: int,
+    idle_timeout: float,
+    app_config_dir: Path,
+    resource_dir: Path,
+) -> None:
+    """Entry point of the broker process."""
+    if os.name == "posix":
+        # Run the cleanup in `finally` when the parent terminates the broker.
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    SettingsLoader.set_app_config_dir(app_config_dir)
+    SettingsLoader.set_resource_dir(resource_dir)
+
+    stream = None
+    try:
+        device = AdbClientHelper.get_adb_device(serial)
+        if device is None:
+            logging.error(f"Frame broker could not connect to {serial}")
+            return
+        stream = DeviceStream(AdbController(AdbDeviceWrapper(device)))
+        stream.start()
+        _publish_frames(stream, info_path, shm_prefix, slot_count, idle_timeout)
+    finally:
+        if stream is not None:
+            stream.stop()
+        if _read_info(info_path).get("pid") == os.getpid():
+            info_path.unlink(missing_ok=True)
+
+
+def _publish_frames(
+    stream: DeviceStream,
+    info_path: Path,
+    shm_prefix: str,
+    slot_count: int,
+    idle_timeout: float,
+) -> None:
+    """Copy new stream frames into the ring until readers stop reading."""
+    ring: SharedFrameRing | None = None
+    generation = 0
+    last_frame = None
+    started_ns = time.monotonic_ns()
+    try:
+        while True:
+            frame = stream.get_latest_frame()
+            if frame is not None and frame is not last_frame:
+                last_frame = frame
+                if ring is None or frame.nbytes > ring.slot_capacity:
+                    if ring is not None:
+                        ring.mark_closed()
+                        ring.close()
+                    ring = SharedFrameRing.create(
+                        f"{shm_prefix}_{os.getpid()}_{generation}",
+                        slot_count,
+                        frame.nbytes,
+                    )
+                    generation += 1
+                    _write_info(info_path, {"pid": os.getpid(), "shm_name": ring.name})
+                ring.write(frame, cv2.COLOR_RGB2BGR)
+
+            last_read_ns = max(ring.last_read_ns if ring else 0, started_ns)
+            if time.monotonic_ns() - last_read_ns > idle_timeout * 1e9:
+                logging.debug("Frame broker has no readers, exiting")
+                return
+            time.sleep(_POLL_SECONDS)
+    finally:
+        if ring is not None:
+            ring.mark_closed()
+            ring.close()
@@ -2,20 +2,31 @@ import logging
 import time
 from collections.abc import Callable
 from functools import wraps
+from typing import Any
 
 import psutil
 from adb_auto_player.exceptions import GenericAdbUnrecoverableError
 from adbutils import AdbDevice
 
 from .adb_client import AdbClientHelper
+from .async_transport import AsyncTransportDevice
+from .device_health import AdbServerRestartGate, DeviceHealthMonitor
+
+_SERVER_RESTART_SETTLE_SECONDS = 3.0
 
 
 def adb_retry(func: Callable) -> Callable:
-    """Decorator that adds retry logic with ADB process killing.
+    """Decorator that adds retry logic with escalating, device-scoped recovery.
 
     1. Try 2 times normally
-    2. If that fails, kill ADB server and recreate device
-    3. Try 2 more times
+    2. If that fails, reconnect only this device's transport and try 2 more times
+    3. If that fails, restart the ADB server if no other process did so recently
+       (see AdbServerRestartGate) and try 2 more times
+    4. If that fails, open the device's circuit breaker and raise
+
+    Latency and errors of every call are recorded per serial in
+    DeviceHealthMonitor, calls to a device with an open circuit wait out its
+    backoff first.
     """
 
     @wraps(func)
@@ -33,46 +44,38 @@ def adb_retry(func: Callable) -> Callable:
                 f"Got {type(self.d).__name__} instead."
             )
 
-        last_exception = None
+        serial = self.d.serial or "unknown"
         func_name = getattr(func, "__name__", repr(func))
-        # First 2 attempts
-        for attempt in range(2):
-            try:
-                return func(self, *args, **kwargs)
-            except GenericAdbUnrecoverableError as e:
-                raise e
-            except Exception as e:
-                last_exception = e
-                logging.debug(f"{func_name} attempt {attempt + 1} failed: {e}")
-                if attempt < 1:
-                    time.sleep(1)
-
-        logging.debug(
-            f"{func_name} initial attempts failed, "
-            "attempting to restart ADB server and recreate device"
-        )
-        _restart_adb_server()
-
-        new_device = _recreate_device(self.d)
-        if new_device is not None:
-            self.d = new_device
-            logging.debug("Device recreated successfully")
-        else:
-            raise GenericAdbUnrecoverableError(
-                f"ADB connection failed multiple times. Last error: {last_exception}"
-            )
-
-        for attempt in range(2):
-            try:
-                return func(self, *args, **kwargs)
-            except GenericAdbUnrecoverableError as e:
-                raise e
-            except Exception as e:
-                last_exception = e
-                logging.debug(f"{func_name} final attempt {attempt + 1} failed: {e}")
-                if attempt < 1:  # Don't sleep on the last attempt
-                    time.sleep(1)
-
+        DeviceHealthMonitor.wait_if_open(serial)
+
+        recovery_steps: list[tuple[str, Callable[[Any, str], bool] | None]] = [
+            ("initial", None),
+            ("after transport reconnect", _reconnect_transport),
+            ("after ADB server restart", _restart_adb_server_coordinated),
+        ]
+        last_exception: Exception | None = None
+        for label, recover in recovery_steps:
+            if recover is not None:
+                logging.debug(f"{func_name} {label.removeprefix('after ')} failed")
+                if not recover(self, serial):
+                    continue
+            for attempt in range(2):
+                start = time.perf_counter()
+                try:
+                    result = func(self, *args, **kwargs)
+                except GenericAdbUnrecoverableError as e:
+                    raise e
+                except Exception as e:
+                    DeviceHealthMonitor.record_failure(serial)
+                    last_exception = e
+                    logging.debug(f"{func_name} {label} attempt {attempt + 1}: {e}")
+                    if attempt < 1:
+                        time.sleep(1)
+                    continue
+                DeviceHealthMonitor.record_success(serial, time.perf_counter() - start)
+                return result
+
+        DeviceHealthMonitor.trip(serial)
         raise GenericAdbUnrecoverableError(
             f"ADB connection failed multiple times. Last error: {last_exception}"
         )
@@ -80,10 +83,64 @@ def adb_retry(func: Callable) -> Callable:
     return wrapper
 
 
+def _reconnect_transport(wrapper: Any, serial: str) -> bool:
+    """Reconnect only this device, leaving other devices on the server untouched.
+
+    Returns:
+        True if the device is connected again.
+    """
+    if ":" in serial:
+        # Network transports (emulators) can be dropped and re-established
+        # individually, USB and emulator-XXXX serials only get a fresh handle.
+        try:
+            AdbClientHelper.get_adb_client().disconnect(serial)
+        except Exception as e:
+            logging.debug(f"adb disconnect {serial} failed: {e}")
+
+    new_device = _recreate_device(wrapper.d)
+    if new_device is None:
+        return False
+    wrapper.d = new_device
+    DeviceHealthMonitor.record_transport_reconnect(serial)
+    logging.debug(f"Reconnected transport of {serial}")
+    return True
+
+
+def _restart_adb_server_coordinated(wrapper: Any, serial: str) -> bool:
+    """Restart the ADB server if this process is granted the restart.
+
+    If another process restarted the server recently or is doing so right now
+    the device is only recreated, as the restart already happened for it.
+
+    Returns:
+        True if the device is connected again.
+    """
+    gate = AdbServerRestartGate(AdbClientHelper.get_adb_client().port)
+    if gate.try_acquire(serial):
+        try:
+            logging.debug(f"Restarting ADB server because of {serial}")
+            _restart_adb_server()
+            DeviceHealthMonitor.record_server_restart(serial)
+        finally:
+            gate.release()
+    else:
+        time.sleep(_SERVER_RESTART_SETTLE_SECONDS)
+
+    new_device = _recreate_device(wrapper.d)
+    if new_device is None:
+        return False
+    wrapper.d = new_device
+    logging.debug("Device recreated successfully")
+    return True
+
+
 def _recreate_device(d: AdbDevice) -> AdbDevice | None:
     if d.serial is None:
         return None
-    return AdbClientHelper.get_adb_device(d.serial)
+    device = AdbClientHelper.get_adb_device(d.serial)
+    if device is not None and isinstance(d, AsyncTransportDevice):
+        return AsyncTransportDevice(AdbClientHelper.get_adb_client(), d.serial)
+    return device
 
 
 def _restart_adb_server() -> None:
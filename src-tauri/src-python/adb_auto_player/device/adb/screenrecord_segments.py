@@ -0,0 +1,257 @@
+"""Gapless playback of time-limited `screenrecord` sessions.
+
+With `--time-limit=1` every session ends after a second. Restarting only
+after the old session ended leaves the stream without frames for the time it
+takes to spawn `screenrecord`, initialize the encoder and receive the first
+keyframe. The segment manager starts the next session shortly before the
+current one expires, decodes both in parallel and switches to the new one on
+its first keyframe.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+from av.video.codeccontext import VideoCodecContext
+from av.video.frame import VideoFrame
+
+_READ_SIZE = 4096
+_MAX_BUFFER = 1024 * 1024
+_POLL_SECONDS = 0.01
+_RETRY_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class SegmentGapStats:
+    """Snapshot of ScreenrecordSegmentManager counters.
+
+    A gap is the time from the end of the active segment until the next frame
+    was published, a seamless handoff has no gap.
+    """
+
+    segments_started: int
+    segments_failed: int
+    handoffs: int
+    seamless_handoffs: int
+    gaps: int
+    avg_gap_ms: float
+    max_gap_ms: float
+    total_gap_ms: float
+
+
+class _Segment:
+    """One `screenrecord` session with its own decoder and reader thread."""
+
+    def __init__(
+        self,
+        connection: Any,
+        codec: VideoCodecContext,
+        on_frame: Callable[["_Segment", VideoFrame], None],
+        on_end: Callable[["_Segment"], None],
+    ) -> None:
+        self.connection = connection
+        self.codec = codec
+        self.started_at = time.monotonic()
+        self.ended = False
+        self._on_frame = on_frame
+        self._on_end = on_end
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._read, name="ScreenrecordSegment", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        self._closed = True
+        try:
+            self.connection.close()
+        except Exception as e:
+            logging.debug(f"Closing screenrecord segment failed: {e}")
+
+    def _read(self) -> None:
+        buffer = bytearray()
+        try:
+            while not self._closed:
+                chunk = self.connection.read(_READ_SIZE)
+                if not chunk:
+                    break
+                buffer.extend(chunk)
+                try:
+                    self._decode(self.codec.parse(buffer))
+                    buffer.clear()
+                except Exception:
+                    if len(buffer) > _MAX_BUFFER:
+                        del buffer[:-_MAX_BUFFER]
+            if not self._closed:
+                # The parser holds back the last frame until it sees the next
+                # start code, which never comes once the segment ended.
+                self._decode(self.codec.parse(b""))
+                self._decode([None])
+        except Exception as e:
+            if not self._closed:
+                logging.debug(f"Screenrecord segment error: {e}")
+        finally:
+            self.ended = True
+            self._on_end(self)
+
+    def _decode(self, packets) -> None:
+        for packet in packets:
+            for frame in self.codec.decode(packet):
+                if self._closed:
+                    return
+                self._on_frame(self, frame)
+
+
+class ScreenrecordSegmentManager:
+    """Chains time-limited `screenrecord` sessions without gaps.
+
+    The next segment is opened `lead_seconds` before the active one is
+    expected to end. Frames of the next segment are discarded until its
+    first keyframe, then it becomes the active segment and the previous one is
+    closed. If the next segment fails to open or does not deliver a keyframe
+    in time the stream degrades to sequential restarts.
+    """
+
+    segment_seconds: float = 1.0
+    lead_seconds: float = 0.4
+
+    def __init__(
+        self,
+        open_segment: Callable[[], Any],
+        create_codec: Callable[[], VideoCodecContext],
+        on_frame: Callable[[np.ndarray], None],
+        is_running: Callable[[], bool],
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            open_segment: Starts a `screenrecord` session and returns a
+                connection with `read(size)` and `close()`.
+            create_codec: Creates an H264 decoder, every segment gets its own.
+            on_frame: Receives every published frame as RGB array.
+            is_running: `run` returns once this returns False.
+        """
+        self._open_segment = open_segment
+        self._create_codec = create_codec
+        self._publish = on_frame
+        self._is_running = is_running
+        self._lock = threading.Lock()
+        self._active: _Segment | None = None
+        self._pending: _Segment | None = None
+        self._stopped = False
+        self._stale_since: float | None = None
+        self._segments_started = 0
+        self._segments_failed = 0
+        self._handoffs = 0
+        self._seamless_handoffs = 0
+        self._gaps: list[float] = []
+
+    def run(self) -> None:
+        """Open and hand over segments until stopped."""
+        while self._is_running() and not self._stopped:
+            with self._lock:
+                active = self._active
+                pending = self._pending
+            now = time.monotonic()
+
+            needs_segment = active is None or active.ended
+            due = (
+                active is not None
+                and now >= active.started_at + self.segment_seconds - self.lead_seconds
+            )
+            if pending is None and (needs_segment or due):
+                if not self._start_segment(active=needs_segment):
+                    time.sleep(_RETRY_SECONDS)
+                    continue
+            time.sleep(_POLL_SECONDS)
+        self.stop()
+
+    def stop(self) -> None:
+        """Close all segments."""
+        with self._lock:
+            self._stopped = True
+            segments = [s for s in (self._active, self._pending) if s is not None]
+            self._active = None
+            self._pending = None
+        for segment in segments:
+            segment.close()
+
+    def stats(self) -> SegmentGapStats:
+        """Return a snapshot of the handoff and gap counters."""
+        with self._lock:
+            gaps = list(self._gaps)
+            return SegmentGapStats(
+                segments_started=self._segments_started,
+                segments_failed=self._segments_failed,
+                handoffs=self._handoffs,
+                seamless_handoffs=self._seamless_handoffs,
+                gaps=len(gaps),
+                avg_gap_ms=sum(gaps) / len(gaps) * 1000 if gaps else 0.0,
+                max_gap_ms=max(gaps, default=0.0) * 1000,
+                total_gap_ms=sum(gaps) * 1000,
+            )
+
+    def _start_segment(self, active: bool) -> bool:
+        try:
+            connection = self._open_segment()
+            codec = self._create_codec()
+        except Exception as e:
+            logging.debug(f"Could not start screenrecord segment: {e}")
+            with self._lock:
+                self._segments_failed += 1
+            return False
+
+        with self._lock:
+            if self._stopped:
+                connection.close()
+                return True
+            self._segments_started += 1
+            segment = _Segment(connection, codec, self._on_frame, self._on_end)
+            if active:
+                self._active = segment
+            else:
+                self._pending = segment
+        return True
+
+    def _on_frame(self, segment: _Segment, frame: VideoFrame) -> None:
+        retired = None
+        with self._lock:
+            if segment is self._pending:
+                if not frame.key_frame:
+                    return
+                retired = self._active
+                self._active = segment
+                self._pending = None
+                self._handoffs += 1
+                if self._stale_since is None:
+                    self._seamless_handoffs += 1
+            elif segment is not self._active:
+                return
+        if retired is not None:
+            retired.close()
+
+        image = frame.to_ndarray(format="rgb24")
+        with self._lock:
+            if segment is not self._active:
+                return
+            if self._stale_since is not None:
+                self._gaps.append(time.monotonic() - self._stale_since)
+                self._stale_since = None
+            self._publish(image)
+
+    def _on_end(self, segment: _Segment) -> None:
+        with self._lock:
+            if segment is self._pending:
+                # Ended without a keyframe, the run loop starts another one.
+                self._pending = None
+                self._segments_failed += 1
+            elif segment is self._active and not self._stopped:
+                self._stale_since = time.monotonic()
+                if self._pending is not None:
+                    self._active = self._pending
+                    self._pending = None
+                    self._handoffs += 1
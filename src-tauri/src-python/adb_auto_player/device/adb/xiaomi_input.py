@@ -1,6 +1,5 @@
-from time import sleep
-
 from adb_auto_player.device.adb import InputDevice
+from adb_auto_player.device.adb.event_stream_writer import Gesture
 
 
 class XiaomiInput(InputDevice):
@@ -66,16 +65,19 @@ class XiaomiInput(InputDevice):
 
     def key_down(self, keycode: int) -> None:
         """Key down event."""
-        self.sendevent(self.EV_KEY, keycode, 1)
-        self.ev_syn()
+        self.send_gesture(Gesture().key(keycode, down=True).syn())
 
     def key_up(self, keycode: int) -> None:
         """Key up event."""
-        self.sendevent(self.EV_KEY, keycode, 0)
-        self.ev_syn()
+        self.send_gesture(Gesture().key(keycode, down=False).syn())
 
     def key_press(self, keycode: int, duration: float = 0.1) -> None:
-        """Key down for duration then release."""
-        self.key_down(keycode)
-        sleep(duration)
-        self.key_up(keycode)
+        """Key down for duration then release, sent as a single write."""
+        self.send_gesture(
+            Gesture()
+            .key(keycode, down=True)
+            .syn()
+            .pause(duration)
+            .key(keycode, down=False)
+            .syn()
+        )
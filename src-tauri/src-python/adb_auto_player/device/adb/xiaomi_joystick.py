@@ -1,6 +1,5 @@
-import time
-
 from adb_auto_player.device.adb.adb_input_device import InputDevice
+from adb_auto_player.device.adb.event_stream_writer import Gesture
 from adb_auto_player.models.device import DPad, Stick
 
 
@@ -93,69 +92,85 @@ class XiaomiJoystick(InputDevice):
             )
             self.joystick_held = True
 
+        def _timed_stick(
+            self,
+            x_val: int,
+            y_val: int,
+            magnitude: float,
+            duration: float,
+        ):
+            self._parent._move_stick(
+                self._x_code,
+                self._y_code,
+                int(x_val * magnitude),
+                int(y_val * magnitude),
+                duration,
+            )
+            self.joystick_held = False
+
         def hold_up(self, magnitude: float = 1.0):
             self._hold_stick(self._parent.CENTER, self._parent.ABS_MIN, magnitude)
 
         def up(self, duration: float = 1.0, magnitude: float = 1.0):
-            self.hold_up(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed_stick(
+                self._parent.CENTER, self._parent.ABS_MIN, magnitude, duration
+            )
 
         def hold_down(self, magnitude: float = 1.0):
             self._hold_stick(self._parent.CENTER, self._parent.ABS_MAX, magnitude)
 
         def down(self, duration: float = 1.0, magnitude: float = 1.0):
-            self.hold_down(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed_stick(
+                self._parent.CENTER, self._parent.ABS_MAX, magnitude, duration
+            )
 
         def hold_left(self, magnitude: float = 1.0):
             self._hold_stick(self._parent.ABS_MIN, self._parent.CENTER, magnitude)
 
         def left(self, duration: float = 1.0, magnitude: float = 1.0):
-            self.hold_left(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed_stick(
+                self._parent.ABS_MIN, self._parent.CENTER, magnitude, duration
+            )
 
         def hold_right(self, magnitude: float = 1.0):
             self._hold_stick(self._parent.ABS_MAX, self._parent.CENTER, magnitude)
 
         def right(self, duration: float = 1.0, magnitude: float = 1.0):
-            self.hold_right(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed_stick(
+                self._parent.ABS_MAX, self._parent.CENTER, magnitude, duration
+            )
 
         def hold_up_left(self, magnitude: float = 1.0):
             self._hold_stick(self._parent.ABS_MIN, self._parent.ABS_MIN, magnitude)
 
         def up_left(self, duration: float = 1.0, magnitude: float = 1.0):
-            self.hold_up_left(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed_stick(
+                self._parent.ABS_MIN, self._parent.ABS_MIN, magnitude, duration
+            )
 
         def hold_up_right(self, magnitude: float = 1.0):
             self._hold_stick(self._parent.ABS_MAX, self._parent.ABS_MIN, magnitude)
 
         def up_right(self, duration: float = 1.0, magnitude: float = 1.0):
-            self.hold_up_right(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed_stick(
+                self._parent.ABS_MAX, self._parent.ABS_MIN, magnitude, duration
+            )
 
         def hold_down_left(self, magnitude: float = 1.0):
             self._hold_stick(self._parent.ABS_MIN, self._parent.ABS_MAX, magnitude)
 
         def down_left(self, duration: float = 1.0, magnitude: float = 1.0):
-            self.hold_down_left(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed_stick(
+                self._parent.ABS_MIN, self._parent.ABS_MAX, magnitude, duration
+            )
 
         def hold_down_right(self, magnitude: float = 1.0):
             self._hold_stick(self._parent.ABS_MAX, self._parent.ABS_MAX, magnitude)
 
         def down_right(self, duration: float = 1.0, magnitude: float = 1.0):
-            self.hold_down_right(magnitude)
-            time.sleep(duration)
-            self.release()
+            self._timed_stick(
+                self._parent.ABS_MAX, self._parent.ABS_MAX, magnitude, duration
+            )
 
     class _DPad(DPad):
         """DPad implementation with 4-directional movement."""
@@ -167,24 +182,20 @@ class XiaomiJoystick(InputDevice):
 
         # ─── Timed Presses ─────────────────────────────────────────────
         def up(self, duration: float = 1.0) -> None:
-            self.hold_up()
-            time.sleep(duration)
-            self.release()
+            self._parent._press_hat(self._parent.ABS_HAT0Y, -1, duration)
+            self._hat_x_held = self._hat_y_held = False
 
         def down(self, duration: float = 1.0) -> None:
-            self.hold_down()
-            time.sleep(duration)
-            self.release()
+            self._parent._press_hat(self._parent.ABS_HAT0Y, 1, duration)
+            self._hat_x_held = self._hat_y_held = False
 
         def left(self, duration: float = 1.0) -> None:
-            self.hold_left()
-            time.sleep(duration)
-            self.release()
+            self._parent._press_hat(self._parent.ABS_HAT0X, -1, duration)
+            self._hat_x_held = self._hat_y_held = False
 
         def right(self, duration: float = 1.0) -> None:
-            self.hold_right()
-            time.sleep(duration)
-            self.release()
+            self._parent._press_hat(self._parent.ABS_HAT0X, 1, duration)
+            self._hat_x_held = self._hat_y_held = False
 
         # ─── Hold Methods ─────────────────────────────────────────────
         def hold_up(self) -> None:
@@ -220,24 +231,50 @@ class XiaomiJoystick(InputDevice):
         self._dpad = self._DPad(self)
 
     def _hold_stick(self, x_code: int, y_code: int, x_val: int, y_val: int) -> None:
-        self.sendevent(3, x_code, x_val)
-        self.sendevent(3, y_code, y_val)
-        self.ev_syn()
+        self.send_gesture(
+            Gesture().abs(x_code, x_val).abs(y_code, y_val).syn(), wait=False
+        )
 
     def _release_stick(self, x_code: int, y_code: int) -> None:
-        self.sendevent(3, x_code, self.CENTER)
-        self.sendevent(3, y_code, self.CENTER)
-        self.ev_syn()
+        self.send_gesture(
+            Gesture().abs(x_code, self.CENTER).abs(y_code, self.CENTER).syn(),
+            wait=False,
+        )
+
+    def _move_stick(
+        self, x_code: int, y_code: int, x_val: int, y_val: int, duration: float
+    ) -> None:
+        """Tilt a stick for duration seconds and center it in one write."""
+        self.send_gesture(
+            Gesture()
+            .abs(x_code, x_val)
+            .abs(y_code, y_val)
+            .syn()
+            .pause(duration)
+            .abs(x_code, self.CENTER)
+            .abs(y_code, self.CENTER)
+            .syn()
+        )
 
     def _hold_hat(self, axis_code: int, value: int) -> None:
         """Hold single D-pad axis."""
-        self.sendevent(3, axis_code, value)
-        self.ev_syn()
+        self.send_gesture(Gesture().abs(axis_code, value).syn(), wait=False)
 
     def _release_hat(self, axis_code: int) -> None:
         """Release D-pad."""
-        self.sendevent(3, axis_code, 0)
-        self.ev_syn()
+        self.send_gesture(Gesture().abs(axis_code, 0).syn(), wait=False)
+
+    def _press_hat(self, axis_code: int, value: int, duration: float) -> None:
+        """Press a D-pad direction for duration seconds, then release both axes."""
+        self.send_gesture(
+            Gesture()
+            .abs(axis_code, value)
+            .syn()
+            .pause(duration)
+            .abs(self.ABS_HAT0X, 0)
+            .abs(self.ABS_HAT0Y, 0)
+            .syn()
+        )
 
     # ---------------- Sticks ----------------
     @property
@@ -0,0 +1,14 @@
+"""Fake ADB server and scripted virtual devices for offline testing."""
+
+from .faults import Fault, Faults
+from .server import FakeAdbServer
+from .virtual_device import InputRecord, VirtualDevice, encode_h264
+
+__all__ = [
+    "FakeAdbServer",
+    "Fault",
+    "Faults",
+    "InputRecord",
+    "VirtualDevice",
+    "encode_h264",
+]
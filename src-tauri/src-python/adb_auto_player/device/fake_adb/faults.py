@@ -0,0 +1,85 @@
+"""Latency and fault injection for `FakeAdbServer` services."""
+
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from enum import StrEnum
+
+
+class Fault(StrEnum):
+    """How a service request fails."""
+
+    # The server answers FAIL, like for an offline or unauthorized device.
+    FAIL = "fail"
+    # The socket is closed without an answer, like a crashed adbd.
+    DROP = "drop"
+    # The request is accepted but never answered, like a hung device.
+    STALL = "stall"
+
+
+@dataclass
+class Faults:
+    """Latency and faults injected into every service of a virtual device.
+
+    Random faults are drawn per service request, scheduled faults are consumed
+    first so tests can fail exactly the next few requests.
+
+    Attributes:
+        latency: Seconds added before every answer.
+        jitter: Upper bound of random seconds added on top of `latency`.
+        fail_rate: Probability of `Fault.FAIL` per request.
+        drop_rate: Probability of `Fault.DROP` per request.
+        stall_rate: Probability of `Fault.STALL` per request.
+        bandwidth: Bytes per second of service output, None for unlimited.
+        seed: Seed of the random faults, for reproducible runs.
+    """
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    fail_rate: float = 0.0
+    drop_rate: float = 0.0
+    stall_rate: float = 0.0
+    bandwidth: float | None = None
+    seed: int | None = None
+
+    _random: random.Random = field(init=False, repr=False)
+    _scheduled: deque[Fault] = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Seed the random faults."""
+        self._random = random.Random(self.seed)
+        self._scheduled = deque()
+        self._lock = threading.Lock()
+
+    def schedule(self, fault: Fault, count: int = 1) -> None:
+        """Fail the next `count` service requests with `fault`."""
+        with self._lock:
+            self._scheduled.extend([fault] * count)
+
+    def delay(self) -> float:
+        """Seconds to wait before answering a request."""
+        with self._lock:
+            jitter = self._random.uniform(0.0, self.jitter) if self.jitter else 0.0
+        return self.latency + jitter
+
+    def next_fault(self) -> Fault | None:
+        """Fault of the next service request, None if it succeeds."""
+        with self._lock:
+            if self._scheduled:
+                return self._scheduled.popleft()
+            roll = self._random.random()
+        for fault, rate in (
+            (Fault.FAIL, self.fail_rate),
+            (Fault.DROP, self.drop_rate),
+            (Fault.STALL, self.stall_rate),
+        ):
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    def transfer_time(self, size: int) -> float:
+        """Seconds sending `size` bytes takes at the configured bandwidth."""
+        return size / self.bandwidth if self.bandwidth else 0.0
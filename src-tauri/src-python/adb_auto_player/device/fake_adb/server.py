@@ -0,0 +1,378 @@
+"""Local stand-in for the ADB server.
+
+FakeAdbServer speaks the ADB host protocol on a loopback port, so adbutils,
+`AsyncAdbClient` and everything built on them talk to it like to a real
+server. It serves `VirtualDevice`s instead of real transports, which makes the
+scanner, controller, stream and retry paths testable offline with any number
+of devices, including latency, bandwidth limits and faults.
+
+Implemented services: `host:version`, `host:devices(-l)`, `host:connect`,
+`host:disconnect`, `host:kill`, `host-serial:<serial>:<request>`,
+`host:transport(-any)`, `host:tport`, and on a device `shell:`, `exec:` and
+`sync:` with STAT, LIST, RECV and SEND.
+"""
+
+import asyncio
+import logging
+import stat
+import struct
+import threading
+import time
+from collections.abc import Iterable
+from itertools import count
+
+from .faults import Fault, Faults
+from .virtual_device import VirtualDevice
+
+DEFAULT_SERVER_VERSION = 41
+_OKAY = b"OKAY"
+_FAIL = b"FAIL"
+_LENGTH_PREFIX_SIZE = 4
+_SYNC_HEADER_SIZE = 8
+_SYNC_DATA_MAX = 64 * 1024
+_BACKLOG = 1024
+_STOP_TIMEOUT_SECONDS = 5.0
+_DIRECTORY_MODE = stat.S_IFDIR | 0o771
+_FILE_MODE = stat.S_IFREG | 0o644
+
+
+class FakeAdbServer:
+    """ADB server serving virtual devices on its own event loop thread.
+
+    Example:
+        with FakeAdbServer([VirtualDevice("emulator-5554")]) as server:
+            client = AdbClient("127.0.0.1", server.port)
+    """
+
+    def __init__(
+        self,
+        devices: Iterable[VirtualDevice] = (),
+        host: str = "127.0.0.1",
+        port: int = 0,
+        version: int = DEFAULT_SERVER_VERSION,
+    ) -> None:
+        """Initialize the server, it listens once started.
+
+        Args:
+            devices: Devices to serve.
+            host: Interface to listen on.
+            port: Port to listen on, 0 picks a free port.
+            version: Reported server version, adbutils selects transports by it.
+        """
+        self.devices: dict[str, VirtualDevice] = {d.serial: d for d in devices}
+        self.host = host
+        self.port = port
+        self.version = version
+        self.requests: list[str] = []
+        self.kill_requests = 0
+        self._transport_ids = count(1)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._server: asyncio.Server | None = None
+        self._connections: set[asyncio.Task] = set()
+
+    def add_device(self, device: VirtualDevice) -> VirtualDevice:
+        """Serve another device."""
+        self.devices[device.serial] = device
+        return device
+
+    def remove_device(self, serial: str) -> None:
+        """Stop serving a device, open services of it keep running."""
+        self.devices.pop(serial, None)
+
+    def start(self) -> "FakeAdbServer":
+        """Start listening, `port` is set once this returns."""
+        if self._loop is not None:
+            return self
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="FakeAdbServer", daemon=True
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._listen(), self._loop).result()
+        logging.debug(f"Fake ADB server listening on {self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        """Close the listener and every open connection."""
+        if self._loop is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._close(), self._loop).result(
+            _STOP_TIMEOUT_SECONDS
+        )
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(_STOP_TIMEOUT_SECONDS)
+        self._loop.close()
+        self._loop = None
+        self._thread = None
+
+    def __enter__(self) -> "FakeAdbServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *_) -> None:
+        """Stop the server."""
+        self.stop()
+
+    async def _listen(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=_BACKLOG
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def _close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        if task is not None:
+            self._connections.add(task)
+        try:
+            await self._serve_host(reader, writer)
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            if task is not None:
+                self._connections.discard(task)
+            writer.close()
+
+    async def _serve_host(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        request = await _read_request(reader)
+        self.requests.append(request)
+
+        if request == "host:version":
+            writer.write(_OKAY + _block(f"{self.version:04x}"))
+        elif request in ("host:devices", "host:devices-l"):
+            writer.write(_OKAY + _block(self._device_list(request.endswith("-l"))))
+        elif request.startswith("host:connect:"):
+            writer.write(_OKAY + _block(self._connect(request.split(":", 2)[2])))
+        elif request.startswith("host:disconnect:"):
+            writer.write(_OKAY + _block(self._disconnect(request.split(":", 2)[2])))
+        elif request == "host:kill":
+            # Devices stay connected, a restarted server would reconnect them.
+            self.kill_requests += 1
+            writer.write(_OKAY)
+        elif request.startswith("host-serial:"):
+            serial, _, query = request.removeprefix("host-serial:").rpartition(":")
+            device = await self._select(serial, writer)
+            if device is not None:
+                writer.write(_OKAY + _block(_query(device, query)))
+        elif request.startswith(("host:transport", "host:tport:")):
+            serial = _transport_serial(request)
+            device = await self._select(serial, writer)
+            if device is None:
+                return
+            writer.write(_OKAY)
+            if request.startswith("host:tport:"):
+                writer.write(struct.pack("<Q", next(self._transport_ids)))
+            await self._serve_device(device, reader, writer)
+        else:
+            writer.write(_FAIL + _block(f"unknown host service '{request}'"))
+
+    def _device_list(self, extended: bool) -> str:
+        lines = []
+        for index, device in enumerate(list(self.devices.values()), start=1):
+            if not device.listed:
+                continue
+            if extended:
+                lines.append(
+                    f"{device.serial:<22} {device.state} product:aap_virtual "
+                    f"model:Virtual_Device device:virtual transport_id:{index}\n"
+                )
+            else:
+                lines.append(f"{device.serial}\t{device.state}\n")
+        return "".join(lines)
+
+    def _connect(self, address: str) -> str:
+        device = self.devices.get(address)
+        if device is None:
+            return f"cannot connect to {address}: Connection refused"
+        if device.listed:
+            return f"already connected to {address}"
+        device.listed = True
+        return f"connected to {address}"
+
+    def _disconnect(self, address: str) -> str:
+        device = self.devices.get(address)
+        if device is None or not device.listed:
+            return f"error: no such device '{address}'"
+        device.listed = False
+        return f"disconnected {address}"
+
+    async def _select(
+        self, serial: str, writer: asyncio.StreamWriter
+    ) -> VirtualDevice | None:
+        """Resolve the device of a request and apply its latency and faults."""
+        if serial == "any":
+            listed = [d for d in list(self.devices.values()) if d.listed]
+            device = listed[0] if len(listed) == 1 else None
+        else:
+            device = self.devices.get(serial)
+        if device is None or not device.listed:
+            writer.write(_FAIL + _block(f"device '{serial}' not found"))
+            return None
+
+        await asyncio.sleep(device.faults.delay())
+        match device.faults.next_fault():
+            case Fault.FAIL:
+                writer.write(_FAIL + _block("device offline"))
+                return None
+            case Fault.DROP:
+                raise ConnectionResetError(f"Dropped request to {serial}")
+            case Fault.STALL:
+                await asyncio.Event().wait()
+        if device.state != "device":
+            writer.write(_FAIL + _block(f"device {device.state}"))
+            return None
+        return device
+
+    async def _serve_device(
+        self,
+        device: VirtualDevice,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        service = await _read_request(reader)
+        device.services.append(service)
+        if service == "sync:":
+            writer.write(_OKAY)
+            await _serve_sync(device, reader, writer)
+            return
+        if not service.startswith(("shell:", "exec:")):
+            writer.write(_FAIL + _block(f"unsupported service '{service}'"))
+            return
+        writer.write(_OKAY)
+        command = service.split(":", 1)[1]
+        async for chunk in device.execute(command, reader):
+            await _send(writer, chunk, device.faults)
+
+
+def _transport_serial(request: str) -> str:
+    if request in ("host:transport-any", "host:tport:any"):
+        return "any"
+    return request.removeprefix("host:transport:").removeprefix("host:tport:serial:")
+
+
+def _query(device: VirtualDevice, query: str) -> str:
+    if query == "get-state":
+        return device.state
+    if query == "get-serialno":
+        return device.serial
+    if query == "get-devpath":
+        return f"virtual:{device.serial}"
+    if query == "features":
+        return "shell_v2,cmd,stat_v2"
+    return ""
+
+
+async def _send(writer: asyncio.StreamWriter, data: bytes, faults: Faults) -> None:
+    if not data:
+        return
+    if faults.bandwidth:
+        await asyncio.sleep(faults.transfer_time(len(data)))
+    writer.write(data)
+    await writer.drain()
+
+
+async def _serve_sync(
+    device: VirtualDevice,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """Serve sync requests until QUIT or the client closes the socket."""
+    while True:
+        try:
+            header = await reader.readexactly(_SYNC_HEADER_SIZE)
+        except asyncio.IncompleteReadError:
+            return
+        kind, length = header[:4], struct.unpack("<I", header[4:])[0]
+        if kind == b"QUIT":
+            return
+        path = (await reader.readexactly(length)).decode("utf-8")
+        if kind == b"STAT":
+            writer.write(b"STAT" + struct.pack("<III", *_stat(device, path)))
+        elif kind == b"LIST":
+            prefix = path.rstrip("/") + "/"
+            for name, data in device.files.items():
+                if name.startswith(prefix) and "/" not in name[len(prefix) :]:
+                    entry = name[len(prefix) :].encode()
+                    writer.write(
+                        b"DENT"
+                        + struct.pack("<IIII", _FILE_MODE, len(data), 0, len(entry))
+                        + entry
+                    )
+            writer.write(b"DONE" + bytes(16))
+        elif kind == b"RECV":
+            await _send_file(device, path, writer)
+        elif kind == b"SEND":
+            await _receive_file(device, path.rsplit(",", 1)[0], reader, writer)
+        else:
+            return
+        await writer.drain()
+
+
+def _stat(device: VirtualDevice, path: str) -> tuple[int, int, int]:
+    # The modification time of the file is wall-clock time.
+    now = int(time.time())  # noqa: TID251
+    if path in device.files:
+        return _FILE_MODE, len(device.files[path]), now
+    prefix = path.rstrip("/") + "/"
+    if path in ("/", "/sdcard", "/data/local/tmp") or any(
+        name.startswith(prefix) for name in device.files
+    ):
+        return _DIRECTORY_MODE, 0, now
+    return 0, 0, 0
+
+
+async def _send_file(
+    device: VirtualDevice, path: str, writer: asyncio.StreamWriter
+) -> None:
+    data = device.files.get(path)
+    if data is None:
+        message = b"No such file or directory"
+        writer.write(b"FAIL" + struct.pack("<I", len(message)) + message)
+        return
+    for offset in range(0, len(data), _SYNC_DATA_MAX):
+        chunk = data[offset : offset + _SYNC_DATA_MAX]
+        await _send(
+            writer, b"DATA" + struct.pack("<I", len(chunk)) + chunk, device.faults
+        )
+    writer.write(b"DONE" + struct.pack("<I", 0))
+
+
+async def _receive_file(
+    device: VirtualDevice,
+    path: str,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    data = bytearray()
+    while True:
+        header = await reader.readexactly(_SYNC_HEADER_SIZE)
+        kind, length = header[:4], struct.unpack("<I", header[4:])[0]
+        if kind == b"DONE":
+            break
+        if kind != b"DATA":
+            raise ValueError(f"Unexpected sync request {kind!r}")
+        data.extend(await reader.readexactly(length))
+    device.files[path] = bytes(data)
+    writer.write(_OKAY + struct.pack("<I", 0))
+
+
+async def _read_request(reader: asyncio.StreamReader) -> str:
+    length = int(await reader.readexactly(_LENGTH_PREFIX_SIZE), 16)
+    return (await reader.readexactly(length)).decode("utf-8")
+
+
+def _block(text: str) -> bytes:
+    payload = text.encode("utf-8")
+    return f"{len(payload):04x}".encode() + payload
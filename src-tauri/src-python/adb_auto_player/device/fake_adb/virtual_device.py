@@ -0,0 +1,456 @@
+"""Scripted Android device served by `FakeAdbServer`.
+
+The device interprets the shell commands AdbAutoPlayer sends, `;` separated
+scripts and `grep`/`cut` pipelines included, with outputs shaped like those of
+a real device. Screenshots and screen recordings are replayed from PNG and
+H264 assets, input commands are accepted and logged for assertions.
+"""
+
+import asyncio
+import io
+import re
+import shlex
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
+from fractions import Fraction
+from pathlib import Path
+
+import av
+import cv2
+import numpy as np
+
+from .faults import Faults
+
+ShellOutput = str | bytes | AsyncIterator[bytes]
+ShellHandler = Callable[[list[str]], ShellOutput]
+
+_READ_SIZE = 4096
+_REDIRECTIONS = {"2>&1", "2>/dev/null", ">/dev/null"}
+_H264_START_CODE = b"\x00\x00\x01"
+_H264_NAL_TYPE_MASK = 0x1F
+_H264_VCL_NAL_TYPES = range(1, 6)
+_MONKEY_ABORTED = "** No activities found to run, monkey aborted.\n"
+
+
+@dataclass(frozen=True)
+class InputRecord:
+    """An input command received by a virtual device."""
+
+    timestamp: float
+    action: str
+    args: tuple[str, ...]
+    display_id: str | None = None
+
+
+@dataclass
+class VirtualDevice:
+    """Android device simulated by `FakeAdbServer`.
+
+    Attributes:
+        serial: Serial, `host:port` serials are only listed after `adb connect`
+            unless `listed` is set.
+        width: Physical display width.
+        height: Physical display height.
+        rotation: Surface rotation, 0 to 3.
+        state: State reported by `get-state`, e.g. `device` or `offline`.
+        listed: Whether `host:devices` lists the device.
+        screenshots: PNG frames, `screencap -p` cycles through them.
+        video: H264 Annex B stream replayed by `screenrecord`, encoded from
+            `screenshots` if not set.
+        video_fps: Frame rate `screenrecord` output is paced at.
+        properties: System properties returned by `getprop`.
+        input_devices: Names of the input devices under `/dev/input`.
+        packages: Packages `monkey` can launch, None to launch any.
+        foreground: Package of the resumed activity.
+        override_size: Size set by `wm size`, e.g. `1080x1920`.
+        files: Files served by `cat` and the sync service, keyed by path.
+        handlers: Custom shell commands, keyed by program name.
+        faults: Latency and faults injected into services of the device.
+        inputs: Input commands received so far.
+        services: Device services requested so far, e.g. `shell:wm size`.
+    """
+
+    serial: str
+    width: int = 1080
+    height: int = 1920
+    rotation: int = 0
+    state: str = "device"
+    listed: bool = True
+    screenshots: list[bytes] = field(default_factory=list)
+    video: bytes | None = None
+    video_fps: float = 30.0
+    properties: dict[str, str] = field(
+        default_factory=lambda: {
+            "ro.product.model": "AdbAutoPlayer Virtual Device",
+            "ro.build.fingerprint": "aap/virtual/virtual:13/AAP1/1:user/test-keys",
+            "ro.build.type": "user",
+        }
+    )
+    input_devices: list[str] = field(default_factory=lambda: ["virtual_touch"])
+    packages: set[str] | None = None
+    foreground: str | None = None
+    override_size: str | None = None
+    files: dict[str, bytes] = field(default_factory=dict)
+    handlers: dict[str, ShellHandler] = field(default_factory=dict)
+    faults: Faults = field(default_factory=Faults)
+    inputs: list[InputRecord] = field(default_factory=list)
+    services: list[str] = field(default_factory=list)
+
+    _screenshot_index: int = field(default=0, init=False, repr=False)
+    _video_units: list[bytes] | None = field(default=None, init=False, repr=False)
+
+    @classmethod
+    def from_assets(
+        cls,
+        serial: str,
+        screenshots: Iterable[Path] = (),
+        video: Path | None = None,
+        **kwargs,
+    ) -> "VirtualDevice":
+        """Create a device replaying PNG and H264 files.
+
+        The resolution is taken from the first screenshot unless given.
+        """
+        frames = [path.read_bytes() for path in screenshots]
+        if frames and "width" not in kwargs and "height" not in kwargs:
+            image = cv2.imdecode(np.frombuffer(frames[0], np.uint8), cv2.IMREAD_COLOR)
+            if image is not None:
+                kwargs["height"], kwargs["width"] = image.shape[:2]
+        return cls(
+            serial,
+            screenshots=frames,
+            video=video.read_bytes() if video else None,
+            **kwargs,
+        )
+
+    def screenshot(self) -> bytes:
+        """Next PNG frame, a black frame if no screenshots are set."""
+        if not self.screenshots:
+            self.screenshots.append(_blank_png(self.width, self.height))
+        frame = self.screenshots[self._screenshot_index % len(self.screenshots)]
+        self._screenshot_index += 1
+        return frame
+
+    def video_units(self) -> list[bytes]:
+        """H264 of `video` split into one chunk per frame."""
+        if self._video_units is None:
+            video = self.video
+            if video is None:
+                video = encode_h264(self.screenshots or [self.screenshot()])
+            self._video_units = _split_access_units(video)
+        return self._video_units
+
+    def record_input(
+        self, action: str, args: Iterable[str], display_id: str | None = None
+    ) -> None:
+        """Log an input command."""
+        self.inputs.append(
+            InputRecord(time.monotonic(), action, tuple(args), display_id)
+        )
+
+    async def execute(
+        self, script: str, stdin: asyncio.StreamReader
+    ) -> AsyncIterator[bytes]:
+        """Run a shell script and yield its output as it is produced.
+
+        Args:
+            script: Commands separated by `;`, each optionally piped into
+                `grep` or `cut`.
+            stdin: Input of the shell, read by `cat` and interactive `sh`.
+        """
+        for command in _split_unquoted(script, ";"):
+            stages = [_argv(stage) for stage in _split_unquoted(command, "|")]
+            stages = [argv for argv in stages if argv]
+            if not stages:
+                continue
+            if len(stages) == 1:
+                async for chunk in self._run(stages[0], stdin):
+                    yield chunk
+                continue
+            output = b"".join([chunk async for chunk in self._run(stages[0], stdin)])
+            text = output.decode("utf-8", errors="replace")
+            for argv in stages[1:]:
+                text = _filter(argv, text)
+            yield text.encode()
+
+    async def _run(
+        self, argv: list[str], stdin: asyncio.StreamReader
+    ) -> AsyncIterator[bytes]:
+        name = argv[0].rsplit("/", 1)[-1]
+        if handler := self.handlers.get(name):
+            output = handler(argv)
+        elif builtin := getattr(self, f"_sh_{name.replace('-', '_')}", None):
+            output = builtin(argv, stdin)
+        else:
+            output = f"/system/bin/sh: {name}: inaccessible or not found\n"
+        if isinstance(output, str):
+            yield output.encode()
+        elif isinstance(output, bytes):
+            yield output
+        else:
+            async for chunk in output:
+                yield chunk
+
+    async def _sh_sh(
+        self, argv: list[str], stdin: asyncio.StreamReader
+    ) -> AsyncIterator[bytes]:
+        if len(argv) > 2 and argv[1] == "-c":  # noqa: PLR2004
+            async for chunk in self.execute(argv[2], stdin):
+                yield chunk
+            return
+        # Interactive shell, every line is a script.
+        while line := await stdin.readline():
+            async for chunk in self.execute(line.decode().strip(), stdin):
+                yield chunk
+
+    def _sh_echo(self, argv: list[str], _) -> str:
+        return f"{' '.join(argv[1:])}\n"
+
+    def _sh_true(self, _argv: list[str], _) -> str:
+        return ""
+
+    def _sh_sleep(self, argv: list[str], _) -> AsyncIterator[bytes]:
+        return _silence(float(argv[1]) if len(argv) > 1 else 0.0)
+
+    async def _sh_cat(
+        self, argv: list[str], stdin: asyncio.StreamReader
+    ) -> AsyncIterator[bytes]:
+        if len(argv) == 1:
+            while data := await stdin.read(_READ_SIZE):
+                yield data
+            return
+        for path in argv[1:]:
+            if path == "/proc/bus/input/devices":
+                yield self._proc_input_devices().encode()
+            elif path in self.files:
+                yield self.files[path]
+            else:
+                yield f"cat: {path}: No such file or directory\n".encode()
+
+    def _sh_getprop(self, argv: list[str], _) -> str:
+        if len(argv) > 1:
+            return f"{self.properties.get(argv[1], '')}\n"
+        return "".join(
+            f"[{key}]: [{value}]\n" for key, value in sorted(self.properties.items())
+        )
+
+    def _sh_getevent(self, _argv: list[str], _) -> str:
+        return "".join(
+            f'add device {index}: /dev/input/event{index}\n  name:     "{name}"\n'
+            for index, name in enumerate(self.input_devices, start=1)
+        )
+
+    def _sh_wm(self, argv: list[str], _) -> str:
+        if argv[1:2] != ["size"]:
+            return ""
+        if len(argv) > 2:  # noqa: PLR2004
+            self.override_size = None if argv[2] == "reset" else argv[2]
+            return ""
+        output = f"Physical size: {self.width}x{self.height}\n"
+        if self.override_size:
+            output += f"Override size: {self.override_size}\n"
+        return output
+
+    def _sh_dumpsys(self, argv: list[str], _) -> str:
+        service = argv[1] if len(argv) > 1 else ""
+        section = argv[2] if len(argv) > 2 else ""  # noqa: PLR2004
+        if service == "input":
+            return f"    SurfaceOrientation: {self.rotation}\n"
+        if service == "window" and section == "displays":
+            window = (
+                f"    Window{{1 u0 {self.foreground}/.MainActivity}} visible=true\n"
+                if self.foreground
+                else ""
+            )
+            return f"Display: mDisplayId=0\n{window}"
+        if service == "window":
+            return f"  mCurrentRotation=ROTATION_{self.rotation * 90}\n"
+        if service == "display":
+            return (
+                "  mViewports=[DisplayViewport{type=INTERNAL, valid=true, "
+                "isActive=true, displayId=0, uniqueId='local:1', "
+                f"orientation={self.rotation}, "
+                f"deviceWidth={self.width}, deviceHeight={self.height}}}]\n"
+            )
+        if service == "activity" and self.foreground:
+            return (
+                "    mResumedActivity: ActivityRecord"
+                f"{{1a2b3c u0 {self.foreground}/.MainActivity t7}}\n"
+            )
+        return ""
+
+    def _sh_input(self, argv: list[str], _) -> str | AsyncIterator[bytes]:
+        args = argv[1:]
+        display_id = None
+        if args[:1] == ["-d"] and len(args) > 1:
+            display_id, args = args[1], args[2:]
+        if not args:
+            return "Usage: input [<source>] [-d DISPLAY_ID] <command> [<arg>...]\n"
+        self.record_input(args[0], args[1:], display_id)
+        # `input swipe` blocks for the duration of the gesture.
+        if args[0] == "swipe" and len(args) == 6:  # noqa: PLR2004
+            return _silence(int(args[5]) / 1000)
+        return ""
+
+    def _sh_sendevent(self, argv: list[str], _) -> str:
+        self.record_input("sendevent", argv[1:])
+        return ""
+
+    def _sh_screencap(self, _argv: list[str], _) -> bytes:
+        return self.screenshot()
+
+    async def _sh_screenrecord(self, argv: list[str], _) -> AsyncIterator[bytes]:
+        time_limit = None
+        for index, arg in enumerate(argv):
+            if arg.startswith("--time-limit="):
+                time_limit = float(arg.split("=", 1)[1])
+            elif arg == "--time-limit" and index + 1 < len(argv):
+                time_limit = float(argv[index + 1])
+        units = self.video_units()
+        interval = 1.0 / self.video_fps
+        start = time.monotonic()
+        index = 0
+        while time_limit is None or time.monotonic() - start < time_limit:
+            yield units[index % len(units)]
+            index += 1
+            await asyncio.sleep(max(0.0, start + index * interval - time.monotonic()))
+
+    def _sh_monkey(self, argv: list[str], _) -> str:
+        package = argv[argv.index("-p") + 1] if "-p" in argv[:-1] else None
+        if package is None or (
+            self.packages is not None and package not in self.packages
+        ):
+            return _MONKEY_ABORTED
+        self.foreground = package
+        return "Events injected: 1\n"
+
+    def _sh_am(self, argv: list[str], _) -> str:
+        if argv[1:2] == ["force-stop"] and argv[2:3] == [self.foreground]:
+            self.foreground = None
+        return ""
+
+    def _proc_input_devices(self) -> str:
+        return "".join(
+            f'I: Bus=0000 Vendor=0000 Product=0000 Version=0000\nN: Name="{name}"\n'
+            f"H: Handlers=event{index}\n\n"
+            for index, name in enumerate(self.input_devices, start=1)
+        )
+
+
+def encode_h264(screenshots: list[bytes], fps: int = 30) -> bytes:
+    """Encode PNG frames to an H264 Annex B stream like `screenrecord` sends."""
+    output = io.BytesIO()
+    container = av.open(output, "w", format="h264")
+    stream = container.add_stream("h264", rate=fps)
+    stream.pix_fmt = "yuv420p"
+    stream.time_base = Fraction(1, fps)
+    # MediaCodec does not reorder frames.
+    stream.options = {"tune": "zerolatency"}
+    images = []
+    for png in screenshots:
+        image = cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_COLOR)
+        if image is None:
+            raise ValueError("Screenshot is not a valid PNG")
+        images.append(image)
+    # H264 needs even dimensions, all frames get the size of the first one.
+    height, width = (size // 2 * 2 for size in images[0].shape[:2])
+    stream.width = width
+    stream.height = height
+    for image in images:
+        resized = cv2.resize(image, (width, height))
+        frame = av.VideoFrame.from_ndarray(resized, format="bgr24")
+        for packet in stream.encode(frame.reformat(format="yuv420p")):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+    return output.getvalue()
+
+
+def _split_access_units(video: bytes) -> list[bytes]:
+    """Split an Annex B stream into chunks ending with a picture NAL unit."""
+    units: list[bytes] = []
+    start = 0
+    position = video.find(_H264_START_CODE)
+    while position != -1:
+        nal_type_index = position + len(_H264_START_CODE)
+        following = video.find(_H264_START_CODE, nal_type_index)
+        nal_type = video[nal_type_index] & _H264_NAL_TYPE_MASK
+        if nal_type in _H264_VCL_NAL_TYPES and following != -1:
+            # Keep the leading zero of a 4 byte start code with the next unit.
+            end = following - 1 if video[following - 1] == 0 else following
+            units.append(video[start:end])
+            start = end
+        position = following
+    if start < len(video):
+        units.append(video[start:])
+    return units
+
+
+async def _silence(seconds: float) -> AsyncIterator[bytes]:
+    """Output nothing for `seconds`, like a command that blocks."""
+    await asyncio.sleep(seconds)
+    yield b""
+
+
+def _blank_png(width: int, height: int) -> bytes:
+    _, png = cv2.imencode(".png", np.zeros((height, width, 3), np.uint8))
+    return png.tobytes()
+
+
+def _split_unquoted(script: str, separator: str) -> list[str]:
+    """Split on `separator` outside of quotes."""
+    parts: list[str] = []
+    current: list[str] = []
+    quote: str | None = None
+    for char in script:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char == separator:
+            parts.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _argv(command: str) -> list[str]:
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        argv = command.split()
+    return [arg for arg in argv if arg not in _REDIRECTIONS]
+
+
+def _filter(argv: list[str], text: str) -> str:
+    """Apply a `grep` or `cut` pipeline stage."""
+    lines = text.splitlines()
+    if argv[0] == "grep":
+        flags = {arg for arg in argv[1:] if arg.startswith("-")}
+        pattern = next((arg for arg in argv[1:] if not arg.startswith("-")), "")
+        ignore_case = re.IGNORECASE if "-i" in flags else 0
+        if "-E" not in flags:
+            pattern = re.escape(pattern)
+        matcher = re.compile(pattern, ignore_case)
+        invert = "-v" in flags
+        lines = [line for line in lines if bool(matcher.search(line)) != invert]
+    elif argv[0] == "cut":
+        delimiter = "\t"
+        field_number = 1
+        for index, arg in enumerate(argv[1:], start=1):
+            if arg.startswith("-d"):
+                delimiter = arg[2:] or argv[index + 1]
+            elif arg.startswith("-f"):
+                field_number = int(arg[2:] or argv[index + 1])
+        lines = [
+            line.split(delimiter)[field_number - 1]
+            if delimiter in line and len(line.split(delimiter)) >= field_number
+            else (line if delimiter not in line else "")
+            for line in lines
+        ]
+    return "".join(f"{line}\n" for line in lines)
@@ -0,0 +1,19 @@
+"""Replay recorded sessions as a device for offline task benchmarks."""
+
+from .replay_benchmark import CallStats, ReplayBenchmark, TaskReport
+from .replay_controller import ReplayController, ReplayEvent
+from .replay_graph import ReplayGraph, ReplayState, ReplayTransition
+from .session_recorder import SessionArchive, SessionRecorder
+
+__all__ = [
+    "CallStats",
+    "ReplayBenchmark",
+    "ReplayController",
+    "ReplayEvent",
+    "ReplayGraph",
+    "ReplayState",
+    "ReplayTransition",
+    "SessionArchive",
+    "SessionRecorder",
+    "TaskReport",
+]
@@ -0,0 +1,244 @@
+"""Run Game tasks against a replayed session and report where time goes."""
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from .replay_controller import ReplayController
+from .replay_graph import ReplayGraph
+
+if TYPE_CHECKING:
+    from adb_auto_player.game import Game
+
+
+@dataclass
+class CallStats:
+    """Inclusive wall and CPU time of one profiled method."""
+
+    count: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, wall_seconds: float, cpu_seconds: float) -> None:
+        """Record one call."""
+        self.count += 1
+        self.wall_seconds += wall_seconds
+        self.cpu_seconds += cpu_seconds
+        self.max_seconds = max(self.max_seconds, wall_seconds)
+
+    def to_dict(self) -> dict:
+        """Statistics as a JSON-serializable dict."""
+        return {
+            "count": self.count,
+            "wall_ms": round(self.wall_seconds * 1000, 3),
+            "cpu_ms": round(self.cpu_seconds * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "mean_ms": round(self.wall_seconds / self.count * 1000, 3)
+            if self.count
+            else 0.0,
+        }
+
+
+@dataclass
+class TaskReport:
+    """Cost of one replayed task run."""
+
+    task: str
+    wall_seconds: float
+    cpu_seconds: float
+    calls: dict[str, CallStats] = field(default_factory=dict)
+    visited_states: list[str] = field(default_factory=list)
+    final_state: str = ""
+    screenshots: int = 0
+    inputs: int = 0
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        """Report as a JSON-serializable dict."""
+        return {
+            "task": self.task,
+            "wall_ms": round(self.wall_seconds * 1000, 3),
+            "cpu_ms": round(self.cpu_seconds * 1000, 3),
+            "screenshots": self.screenshots,
+            "inputs": self.inputs,
+            "final_state": self.final_state,
+            "visited_states": self.visited_states,
+            "error": self.error,
+            "calls": {name: stats.to_dict() for name, stats in self.calls.items()},
+        }
+
+    def format(self) -> str:
+        """Human readable summary, calls sorted by total wall time."""
+        lines = [
+            f"{self.task}: {self.wall_seconds * 1000:.1f} ms wall, "
+            f"{self.cpu_seconds * 1000:.1f} ms CPU, {self.screenshots} screenshots, "
+            f"{self.inputs} inputs, final state {self.final_state}"
+        ]
+        if self.error:
+            lines.append(f"  error: {self.error}")
+        for name, stats in sorted(
+            self.calls.items(), key=lambda item: item[1].wall_seconds, reverse=True
+        ):
+            lines.append(
+                f"  {name}: {stats.count}x, {stats.wall_seconds * 1000:.1f} ms wall, "
+                f"{stats.cpu_seconds * 1000:.1f} ms CPU, "
+                f"max {stats.max_seconds * 1000:.1f} ms"
+            )
+        return "\n".join(lines)
+
+
+class ReplayBenchmark:
+    """Run tasks of a Game on a `ReplayController` and profile them.
+
+    Every run starts a fresh controller at the start state of the graph, so
+    runs are repeatable. Wall and CPU time of the task are measured as a whole
+    and per profiled method, times of nested methods are inclusive, e.g.
+    `game.wait_for_template` contains the `game.get_screenshot` calls it made.
+    """
+
+    GAME_CALLS: ClassVar[tuple[str, ...]] = (
+        "get_screenshot",
+        "game_find_template_match",
+        "find_all_template_matches",
+        "find_worst_match",
+        "find_any_template",
+        "wait_for_template",
+        "wait_for_any_template",
+        "wait_until_template_disappears",
+        "wait_for_roi_change",
+        "wait_until_stable",
+    )
+    DEVICE_CALLS: ClassVar[tuple[str, ...]] = (
+        "screenshot",
+        "tap",
+        "swipe",
+        "hold",
+        "press_back_button",
+    )
+
+    def __init__(self, game: "Game", graph: ReplayGraph) -> None:
+        """Benchmark tasks of `game` on `graph`."""
+        self.game = game
+        self.graph = graph
+        self.controller: ReplayController | None = None
+        self._extra: list[tuple[object, str, str]] = []
+
+    def profile(self, target: object, names: Iterable[str], prefix: str) -> None:
+        """Also profile methods of another object, e.g. an OCR backend.
+
+        Args:
+            target: Instance or class the methods are looked up on.
+            names: Method names.
+            prefix: Prefix of the methods in the report.
+        """
+        self._extra.extend((target, name, prefix) for name in names)
+
+    def run(self, task: str | Callable[..., Any], *args, **kwargs) -> TaskReport:
+        """Run a task from the start state of the graph.
+
+        Args:
+            task: Name of a Game method or a callable.
+            *args: Positional arguments of the task.
+            **kwargs: Keyword arguments of the task.
+
+        Returns:
+            TaskReport: Timings, also if the task raised, see `TaskReport.error`.
+        """
+        func = getattr(self.game, task) if isinstance(task, str) else task
+        name = task if isinstance(task, str) else getattr(task, "__name__", "task")
+        controller = ReplayController(self.graph)
+        self.controller = controller
+        calls: dict[str, CallStats] = {}
+        lock = threading.Lock()
+        targets = [
+            *((self.game, n, "game") for n in self.GAME_CALLS),
+            *((controller, n, "device") for n in self.DEVICE_CALLS),
+            *self._extra,
+        ]
+
+        previous_device = self.game._device
+        self.game._device = controller
+        restore = [_instrument(*target, calls, lock) for target in targets]
+        # Replayed frames are served as screenshots, there is no H264 stream.
+        restore.append(_force_screenshots(self.game))
+
+        error = None
+        start_wall, start_cpu = time.perf_counter(), time.process_time()
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            logging.debug(f"Replayed task {name} failed: {error}")
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.process_time() - start_cpu
+            for undo in reversed(restore):
+                undo()
+            self.game._device = previous_device
+
+        report = TaskReport(
+            task=name,
+            wall_seconds=wall,
+            cpu_seconds=cpu,
+            calls=calls,
+            visited_states=list(controller.visited),
+            final_state=controller.state,
+            screenshots=controller.screenshots,
+            inputs=len(controller.events),
+            error=error,
+        )
+        logging.info(report.format())
+        return report
+
+
+def _instrument(
+    target: object,
+    name: str,
+    prefix: str,
+    calls: dict[str, CallStats],
+    lock: threading.Lock,
+) -> Callable[[], None]:
+    """Wrap a method to record its timings, returns the undo function."""
+    original = getattr(target, name, None)
+    if original is None:
+        return lambda: None
+    had_own = name in vars(target)
+    previous = vars(target).get(name)
+    key = f"{prefix}.{name}"
+
+    @wraps(original)
+    def timed(*args, **kwargs):
+        start_wall, start_cpu = time.perf_counter(), time.thread_time()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            wall = time.perf_counter() - start_wall
+            cpu = time.thread_time() - start_cpu
+            with lock:
+                calls.setdefault(key, CallStats()).add(wall, cpu)
+
+    setattr(target, name, timed)
+
+    def undo() -> None:
+        if had_own:
+            setattr(target, name, previous)
+        else:
+            delattr(target, name)
+
+    return undo
+
+
+def _force_screenshots(game: "Game") -> Callable[[], None]:
+    """Keep the game on screenshots, returns the undo function."""
+    original = game._start_device_streaming
+
+    def start_device_streaming(device_streaming: bool = True) -> None:
+        original(device_streaming=False)
+
+    setattr(game, "_start_device_streaming", start_device_streaming)
+    return lambda: delattr(game, "_start_device_streaming")
@@ -0,0 +1,160 @@
+"""AdbController serving a recorded session instead of a device."""
+
+import logging
+import threading
+from dataclasses import dataclass
+
+from adb_auto_player.device.adb import AdbController, DeviceProbe
+from adb_auto_player.models.device import DisplayInfo, Orientation
+from adb_auto_player.models.geometry import Coordinates
+
+from .replay_graph import ReplayGraph
+
+
+@dataclass(frozen=True)
+class ReplayEvent:
+    """Input received by a ReplayController and the state it led to."""
+
+    kind: str
+    point: Coordinates | None
+    state: str
+
+
+class ReplayController(AdbController):
+    """Drop-in AdbController for `Game` that replays a `ReplayGraph`.
+
+    Screenshots return the frames of the current state, inputs move along the
+    transitions of the graph. Nothing is sent to a device, inputs take effect
+    immediately, so tasks run as fast as their own processing allows.
+    """
+
+    def __init__(self, graph: ReplayGraph) -> None:
+        """Start replaying the graph from its start state."""
+        # No AdbDeviceWrapper, every method Game uses is served from the graph.
+        self.graph = graph
+        self._screenshot_display_id = None
+        self._input_display_id = None
+        self._display_ids_resolved = True
+        self._lock = threading.Lock()
+        self._running_app = graph.package
+        self.state = graph.start
+        self.visited: list[str] = [graph.start]
+        self.events: list[ReplayEvent] = []
+        self.screenshots = 0
+        self._screenshots_in_state = 0
+
+    @property
+    def identifier(self) -> str:
+        """Device identifier."""
+        return f"replay:{self.graph.name}"
+
+    @property
+    def is_controlling_emulator(self) -> bool:
+        """Replayed sessions are treated like phones."""
+        return False
+
+    def probe(self) -> DeviceProbe | None:
+        """Nothing to probe."""
+        return None
+
+    def probed_section(self, name: str) -> str | None:
+        """Nothing is probed."""
+        return None
+
+    def get_display_info(self) -> DisplayInfo:
+        """Resolution of the recorded frames."""
+        resolution = self.graph.resolution
+        return DisplayInfo(
+            resolution=resolution,
+            orientation=Orientation.LANDSCAPE
+            if resolution.is_landscape
+            else Orientation.PORTRAIT,
+        )
+
+    def set_display_size(self, display_size: str) -> None:
+        """Frames keep their recorded size."""
+        logging.debug(f"Replay ignores display size {display_size}")
+
+    def reset_display_size(self) -> None:
+        """Frames keep their recorded size."""
+
+    def resolve_display_targeting(self, package_name_prefixes: list[str]) -> None:
+        """Recorded sessions have a single display."""
+
+    def get_running_app(self) -> str | None:
+        """Package of the recorded session, None after `stop_game`."""
+        return self._running_app
+
+    def start_game(self, package_name: str) -> None:
+        """Replay from the start state."""
+        with self._lock:
+            self._running_app = package_name
+            self._enter(self.graph.start)
+
+    def stop_game(self, package_name: str) -> None:
+        """Mark the game as not running."""
+        self._running_app = None
+
+    def screenshot(self, package_name_prefixes: list[str] | None = None) -> bytes:
+        """PNG of the current state, states cycle through their frames."""
+        with self._lock:
+            state = self.graph.states[self.state]
+            frame = state.frames[self._screenshots_in_state % len(state.frames)]
+            self.screenshots += 1
+            self._screenshots_in_state += 1
+            transition = state.after_screenshots(self._screenshots_in_state)
+            if transition is not None:
+                self._enter(transition.to)
+            return frame
+
+    def tap(self, coordinates: Coordinates) -> None:
+        """Follow the tap transition of the current state."""
+        self._input("tap", coordinates)
+
+    def press_back_button(self) -> None:
+        """Follow the back transition of the current state."""
+        self._input("back")
+
+    def press_enter(self) -> None:
+        """Follow the enter transition of the current state."""
+        self._input("enter")
+
+    def swipe(
+        self,
+        start_point: Coordinates,
+        end_point: Coordinates,
+        duration: float = 1.0,
+    ) -> None:
+        """Follow the swipe transition of the current state."""
+        self._input("swipe", start_point)
+
+    def hold(self, coordinates: Coordinates, duration: float = 1.0) -> None:
+        """Follow the hold transition of the current state."""
+        self._input("hold", coordinates)
+
+    def hold_down(self, coordinates: Coordinates) -> None:
+        """Follow the hold transition of the current state."""
+        self._input("hold", coordinates)
+
+    def hold_release(self, coordinates: Coordinates) -> None:
+        """Releasing does not change the state."""
+
+    def get_input_device(self, name: str) -> str | None:
+        """Replayed sessions have no input devices."""
+        return None
+
+    def _input(self, kind: str, point: Coordinates | None = None) -> None:
+        with self._lock:
+            state = self.graph.states[self.state]
+            transition = next(
+                (t for t in state.transitions if t.matches(kind, point)), None
+            )
+            if transition is not None:
+                self._enter(transition.to)
+            self.events.append(ReplayEvent(kind, point, self.state))
+
+    def _enter(self, name: str) -> None:
+        if name != self.state:
+            self.visited.append(name)
+        self.state = name
+        self._screenshots_in_state = 0
@@ -0,0 +1,228 @@
+"""State graph of a recorded session.
+
+Every state of the graph is a screen of the game with one or more recorded
+frames, transitions move to another screen when the task sends an input that
+matches them or after a number of screenshots, e.g. for loading screens.
+
+A session directory holds the frames and a `replay.json`:
+
+    {
+        "resolution": "1080x1920",
+        "package": "com.farlightgames.igame.gp",
+        "start": "home",
+        "states": {
+            "home": {
+                "frames": ["home.png"],
+                "transitions": [
+                    {"on": "tap", "region": [0, 1700, 200, 1920], "to": "battle"}
+                ]
+            },
+            "battle": {
+                "frames": ["battle_1.png", "battle_2.png"],
+                "transitions": [
+                    {"on": "back", "to": "home"},
+                    {"on": "screenshots", "count": 10, "to": "home"}
+                ]
+            }
+        }
+    }
+
+Directories without `replay.json`, e.g. frames written by
+`scripts/extract_frames.py`, replay their frames in name order and advance one
+frame per input. Archives of `SessionRecorder` contain both in a zip file.
+"""
+
+import json
+import zipfile
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import cv2
+import numpy as np
+from adb_auto_player.models.device import Resolution
+from adb_auto_player.models.geometry import Coordinates
+
+GRAPH_FILE = "replay.json"
+# Event kinds sent by ReplayController, "input" matches all of them.
+INPUT_EVENTS = frozenset({"tap", "swipe", "hold", "back", "enter"})
+_ANY_INPUT = "input"
+_AFTER_SCREENSHOTS = "screenshots"
+
+
+@dataclass(frozen=True)
+class ReplayTransition:
+    """Edge of the state graph.
+
+    Attributes:
+        to: Name of the target state.
+        on: Event kind, one of `INPUT_EVENTS`, `input` for any input or
+            `screenshots` to advance after `count` screenshots.
+        region: Left, top, right and bottom of the area a tap, hold or swipe
+            has to start in, None for anywhere.
+        count: Screenshots taken in the state before a `screenshots` transition.
+    """
+
+    to: str
+    on: str = _ANY_INPUT
+    region: tuple[int, int, int, int] | None = None
+    count: int = 1
+
+    def matches(self, kind: str, point: Coordinates | None = None) -> bool:
+        """Whether an input event follows this transition."""
+        if self.on not in (kind, _ANY_INPUT) or kind not in INPUT_EVENTS:
+            return False
+        if self.region is None:
+            return True
+        if point is None:
+            return False
+        left, top, right, bottom = self.region
+        return left <= point.x <= right and top <= point.y <= bottom
+
+
+@dataclass
+class ReplayState:
+    """Screen of the recorded session."""
+
+    name: str
+    frames: list[bytes]
+    transitions: list[ReplayTransition] = field(default_factory=list)
+
+    def after_screenshots(self, count: int) -> ReplayTransition | None:
+        """Transition due after `count` screenshots in the state."""
+        return next(
+            (
+                t
+                for t in self.transitions
+                if t.on == _AFTER_SCREENSHOTS and count >= t.count
+            ),
+            None,
+        )
+
+
+@dataclass
+class ReplayGraph:
+    """States and transitions of a recorded session."""
+
+    states: dict[str, ReplayState]
+    start: str
+    resolution: Resolution
+    package: str | None = None
+    name: str = "replay"
+
+    def __post_init__(self) -> None:
+        """Validate the graph.
+
+        Raises:
+            ValueError: Unknown start or target state, or a state without frames.
+        """
+        if self.start not in self.states:
+            raise ValueError(f"Unknown start state: {self.start}")
+        for state in self.states.values():
+            if not state.frames:
+                raise ValueError(f"State without frames: {state.name}")
+            for transition in state.transitions:
+                if transition.to not in self.states:
+                    raise ValueError(
+                        f"Unknown target state {transition.to} in {state.name}"
+                    )
+                if transition.on not in INPUT_EVENTS | {
+                    _ANY_INPUT,
+                    _AFTER_SCREENSHOTS,
+                }:
+                    raise ValueError(f"Unknown event {transition.on} in {state.name}")
+
+    @classmethod
+    def load(cls, path: Path) -> "ReplayGraph":
+        """Load a session directory, `replay.json` file or recorded archive.
+
+        Archives are written by `SessionRecorder`.
+
+        Raises:
+            ValueError: The graph is invalid.
+        """
+        if path.suffix == ".zip":
+            with zipfile.ZipFile(path) as archive:
+                return cls._from_data(
+                    json.loads(archive.read(GRAPH_FILE)), archive.read, path.stem
+                )
+
+        graph_file = path / GRAPH_FILE if path.is_dir() else path
+        if not graph_file.exists():
+            return cls.from_frames(path)
+        directory = graph_file.parent
+        return cls._from_data(
+            json.loads(graph_file.read_text(encoding="utf-8")),
+            lambda frame: (directory / frame).read_bytes(),
+            directory.name,
+        )
+
+    @classmethod
+    def _from_data(
+        cls, data: dict, read_frame: Callable[[str], bytes], name: str
+    ) -> "ReplayGraph":
+        states = {
+            state_name: ReplayState(
+                name=state_name,
+                frames=[read_frame(frame) for frame in state["frames"]],
+                transitions=[
+                    ReplayTransition(
+                        to=t["to"],
+                        on=t.get("on", _ANY_INPUT),
+                        region=tuple(t["region"]) if "region" in t else None,
+                        count=t.get("count", 1),
+                    )
+                    for t in state.get("transitions", [])
+                ],
+            )
+            for state_name, state in data["states"].items()
+        }
+        start = data.get("start", next(iter(states), ""))
+        resolution = data.get("resolution")
+        return cls(
+            states=states,
+            start=start,
+            resolution=(
+                Resolution.from_string(resolution)
+                if resolution
+                else _frame_resolution(states[start].frames[0])
+            ),
+            package=data.get("package"),
+            name=data.get("name", name),
+        )
+
+    @classmethod
+    def from_frames(
+        cls, directory: Path, pattern: str = "*.png", package: str | None = None
+    ) -> "ReplayGraph":
+        """Replay frames in name order, advancing one frame per input.
+
+        Raises:
+            ValueError: No frames match `pattern`.
+        """
+        paths = sorted(directory.glob(pattern))
+        if not paths:
+            raise ValueError(f"No frames matching {pattern} in {directory}")
+        states = {
+            path.stem: ReplayState(
+                name=path.stem,
+                frames=[path.read_bytes()],
+                transitions=[ReplayTransition(to=following.stem)] if following else [],
+            )
+            for path, following in zip(paths, [*paths[1:], None], strict=True)
+        }
+        return cls(
+            states=states,
+            start=paths[0].stem,
+            resolution=_frame_resolution(states[paths[0].stem].frames[0]),
+            package=package,
+            name=directory.name,
+        )
+
+
+def _frame_resolution(png: bytes) -> Resolution:
+    image = cv2.imdecode(np.frombuffer(png, np.uint8), cv2.IMREAD_UNCHANGED)
+    if image is None:
+        raise ValueError("Frame is not a valid image")
+    height, width = image.shape[:2]
+    return Resolution(width, height)
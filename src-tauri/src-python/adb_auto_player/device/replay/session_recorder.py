@@ -0,0 +1,281 @@
+"""Record task runs into archives that can be inspected and replayed.
+
+An archive is a zip file, so single frames can be read without unpacking it:
+
+    frames/<digest>.png   Every distinct frame once, stored uncompressed.
+    events.jsonl          Frames, inputs and decisions in the order they happened.
+    replay.json           State graph derived from the events, see `ReplayGraph`.
+
+Every event has the seconds `t` since the recording started and its `type`:
+
+    {"t": 0.1, "type": "frame", "frame": "<digest>"}
+    {"t": 0.2, "type": "input", "kind": "tap", "points": [[540, 960]]}
+    {"t": 0.3, "type": "decision", "kind": "template", "name": "battle.png",
+     "score": 0.97, "seconds": 0.012, "frame": "<digest>"}
+"""
+
+import atexit
+import bisect
+import datetime
+import hashlib
+import json
+import logging
+import threading
+import zipfile
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+import cv2
+import numpy as np
+from adb_auto_player.models.geometry import Coordinates
+
+from .replay_graph import GRAPH_FILE
+
+EVENTS_FILE = "events.jsonl"
+FRAMES_DIR = "frames"
+# Taps within this many pixels of a recorded tap follow the same transition.
+TAP_RADIUS = 20
+
+
+class SessionRecorder:
+    """Write frames, inputs and decisions of a task run to an archive.
+
+    Thread-safe, inputs are also sent from the input dispatcher thread. The
+    archive is finished by `close`, at the latest when the interpreter exits.
+    """
+
+    def __init__(self, path: Path, package: str | None = None) -> None:
+        """Start recording to `path`, parent directories are created."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.package = package
+        self.events: list[dict[str, Any]] = []
+        self._frames: set[str] = set()
+        self._frame: str | None = None
+        self._resolution: tuple[int, int] | None = None
+        self._lock = threading.Lock()
+        self._start = monotonic()
+        self._started_at = datetime.datetime.now().isoformat(timespec="seconds")
+        self._archive: zipfile.ZipFile | None = zipfile.ZipFile(
+            path, "w", compression=zipfile.ZIP_DEFLATED
+        )
+        atexit.register(self.close)
+
+    def __enter__(self) -> "SessionRecorder":
+        """Return the recorder."""
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Finish the archive."""
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the archive is finished."""
+        return self._archive is None
+
+    def frame(self, image: np.ndarray) -> str:
+        """Record a captured frame, frames already in the archive are not stored.
+
+        Returns:
+            str: Digest of the frame.
+        """
+        digest = hashlib.blake2b(image.tobytes(), digest_size=16).hexdigest()
+        with self._lock:
+            if self._archive is None:
+                return digest
+            if digest not in self._frames:
+                ok, png = cv2.imencode(".png", image)
+                if not ok:
+                    logging.debug("Could not encode frame for the session recording")
+                    return digest
+                self._archive.writestr(
+                    f"{FRAMES_DIR}/{digest}.png",
+                    png.tobytes(),
+                    compress_type=zipfile.ZIP_STORED,
+                )
+                self._frames.add(digest)
+                if self._resolution is None:
+                    self._resolution = (image.shape[1], image.shape[0])
+            self._frame = digest
+            self._append({"type": "frame", "frame": digest})
+        return digest
+
+    def input(self, kind: str, *points: Coordinates, **details: Any) -> None:
+        """Record an input, e.g. `tap`, `swipe`, `hold` or `back`."""
+        with self._lock:
+            self._append(
+                {
+                    "type": "input",
+                    "kind": kind,
+                    "points": [[point.x, point.y] for point in points],
+                    **details,
+                }
+            )
+
+    def decision(
+        self,
+        kind: str,
+        name: str,
+        score: float | None,
+        seconds: float,
+        **details: Any,
+    ) -> None:
+        """Record a template or OCR result on the last recorded frame.
+
+        Args:
+            kind: e.g. `template` or `ocr`.
+            name: Template, OCR method or other subject of the decision.
+            score: Confidence of the result, None if nothing was found.
+            seconds: Time the decision took.
+            **details: Additional JSON-serializable information.
+        """
+        with self._lock:
+            self._append(
+                {
+                    "type": "decision",
+                    "kind": kind,
+                    "name": name,
+                    "score": None if score is None else round(float(score), 4),
+                    "seconds": round(seconds, 6),
+                    "frame": self._frame,
+                    **details,
+                }
+            )
+
+    def close(self) -> Path:
+        """Write events and state graph and finish the archive.
+
+        Returns:
+            Path: The archive.
+        """
+        with self._lock:
+            archive, self._archive = self._archive, None
+            if archive is None:
+                return self.path
+            atexit.unregister(self.close)
+            try:
+                archive.writestr(
+                    EVENTS_FILE,
+                    "".join(json.dumps(event) + "\n" for event in self.events),
+                )
+                if self._frames:
+                    archive.writestr(GRAPH_FILE, json.dumps(self._graph(), indent=2))
+            finally:
+                archive.close()
+        logging.info(
+            f"Session recording saved: {self.path} "
+            f"({len(self._frames)} frames, {len(self.events)} events)"
+        )
+        return self.path
+
+    def _append(self, event: dict[str, Any]) -> None:
+        if self._archive is None:
+            return
+        self.events.append({"t": round(monotonic() - self._start, 4), **event})
+
+    def _graph(self) -> dict[str, Any]:
+        """State graph with one state per distinct frame.
+
+        A frame change after an input becomes a transition on that input, a
+        change without input one after the screenshots taken of the frame.
+        """
+        states: dict[str, dict[str, Any]] = {}
+        current: str | None = None
+        screenshots = 0
+        pending: dict[str, Any] | None = None
+        for event in self.events:
+            if event["type"] == "input":
+                pending = event
+                continue
+            if event["type"] != "frame":
+                continue
+            digest = event["frame"]
+            if digest not in states:
+                states[digest] = {
+                    "frames": [f"{FRAMES_DIR}/{digest}.png"],
+                    "transitions": [],
+                }
+            if current is not None and digest != current:
+                _add_transition(states[current], digest, pending, screenshots)
+            if digest != current:
+                current, screenshots, pending = digest, 0, None
+            screenshots += 1
+
+        width, height = self._resolution or (0, 0)
+        return {
+            "name": self.path.stem,
+            "resolution": f"{width}x{height}",
+            "package": self.package,
+            "start": next(iter(states)),
+            "started_at": self._started_at,
+            "states": states,
+        }
+
+
+def _add_transition(
+    state: dict[str, Any],
+    target: str,
+    event: dict[str, Any] | None,
+    screenshots: int,
+) -> None:
+    transitions = state["transitions"]
+    if event is None:
+        transition: dict[str, Any] = {"on": "screenshots", "count": screenshots}
+    else:
+        transition = {"on": event["kind"]}
+        if event["points"]:
+            x, y = event["points"][0]
+            transition["region"] = [
+                max(0, x - TAP_RADIUS),
+                max(0, y - TAP_RADIUS),
+                x + TAP_RADIUS,
+                y + TAP_RADIUS,
+            ]
+    # The first recorded outcome wins, replays are deterministic.
+    if any(
+        {k: v for k, v in t.items() if k != "to"} == transition for t in transitions
+    ):
+        return
+    if transition["on"] == "screenshots" and any(
+        t["on"] == "screenshots" for t in transitions
+    ):
+        return
+    transitions.append({**transition, "to": target})
+
+
+class SessionArchive:
+    """Read a recorded session, frames are loaded on demand."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the archive at `path`."""
+        self.path = path
+        with zipfile.ZipFile(path) as archive:
+            self.events: list[dict[str, Any]] = [
+                json.loads(line)
+                for line in archive.read(EVENTS_FILE).decode("utf-8").splitlines()
+                if line
+            ]
+        self._frame_events = [e for e in self.events if e["type"] == "frame"]
+        self._frame_times = [e["t"] for e in self._frame_events]
+
+    def frame(self, digest: str) -> bytes:
+        """PNG of a recorded frame."""
+        with zipfile.ZipFile(self.path) as archive:
+            return archive.read(f"{FRAMES_DIR}/{digest}.png")
+
+    def frame_at(self, seconds: float) -> str | None:
+        """Digest of the frame on screen `seconds` after the recording started."""
+        index = bisect.bisect_right(self._frame_times, seconds) - 1
+        if index < 0:
+            return None
+        return self._frame_events[index]["frame"]
+
+    def decisions(self, kind: str | None = None) -> list[dict[str, Any]]:
+        """Recorded decisions, optionally only of one kind."""
+        return [
+            e
+            for e in self.events
+            if e["type"] == "decision" and (kind is None or e["kind"] == kind)
+        ]
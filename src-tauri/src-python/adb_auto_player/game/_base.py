@@ -3,17 +3,18 @@
 from abc import ABC, abstractmethod
 from functools import cached_property
 from pathlib import Path
-from time import sleep
-from typing import Literal
+from typing import Any, Literal
 
 import numpy as np
 from adb_auto_player.device.adb import AdbController, DeviceStream
+from adb_auto_player.device.replay import SessionRecorder
 from adb_auto_player.models import ConfidenceValue
 from adb_auto_player.models.device import DisplayInfo, Resolution
 from adb_auto_player.models.geometry import Coordinates, Point
 from adb_auto_player.models.image_manipulation import CropRegions
 from adb_auto_player.models.pydantic.app_settings import AppSettings
 from adb_auto_player.models.template_matching import MatchMode, TemplateMatchResult
+from adb_auto_player.util import Tracer
 from pydantic import BaseModel
 
 
@@ -34,6 +35,7 @@ class _GameBase(ABC):
     _device: AdbController | None
     _stream: DeviceStream | None
     _target_package_name: str | None
+    _stable_wait_saved: float
 
     # ------------------------------------------------------------------
     # Properties — implemented by Game
@@ -111,6 +113,9 @@ class _GameBase(ABC):
     @abstractmethod
     def get_screenshot(self) -> np.ndarray: ...
 
+    @abstractmethod
+    def get_scaled_screenshot(self) -> tuple[np.ndarray, float]: ...
+
     @abstractmethod
     def start_stream(self) -> None: ...
 
@@ -141,6 +146,7 @@ class _GameBase(ABC):
         grayscale: bool = False,
         crop_regions: CropRegions = CropRegions(),
         screenshot: np.ndarray | None = None,
+        screenshot_scale: float = 1.0,
     ) -> TemplateMatchResult | None: ...
 
     @abstractmethod
@@ -191,6 +197,18 @@ class _GameBase(ABC):
         timeout_message: str | None = None,
     ) -> Literal[True]: ...
 
+    @abstractmethod
+    def wait_until_stable(
+        self,
+        roi: CropRegions = CropRegions(),
+        max_wait: float = 2.0,
+        settle_frames: int = 2,
+        threshold: ConfidenceValue = ConfidenceValue("99%"),
+        poll_interval: float = 0.1,
+        *,
+        min_wait: float | None = None,
+    ) -> float: ...
+
     @abstractmethod
     def _tap_till_template_disappears(
         self,
@@ -229,17 +247,29 @@ class _GameBase(ABC):
     @abstractmethod
     def restart_game(self) -> None: ...
 
+    # _RecordingMixin
+    @property
+    @abstractmethod
+    def session_recorder(self) -> SessionRecorder | None: ...
+
+    @abstractmethod
+    def _record_input(
+        self, kind: str, *points: Coordinates, **details: Any
+    ) -> None: ...
+
     # ------------------------------------------------------------------
     # Concrete utility methods (depend only on app_settings)
     # ------------------------------------------------------------------
 
+    @Tracer.trace("Game.sleep_action", "sleep")
     def sleep_action(self) -> None:
-        """Sleep for the standard action delay."""
-        sleep(self.app_settings.advanced.action_delay)
+        """Wait for the screen to settle, at most the standard action delay."""
+        self.wait_until_stable(max_wait=self.app_settings.advanced.action_delay)
 
+    @Tracer.trace("Game.sleep_navigation", "sleep")
     def sleep_navigation(self) -> None:
-        """Sleep for the navigation-transition delay."""
-        sleep(self.app_settings.advanced.navigation_delay)
+        """Wait for the screen to settle, at most the navigation delay."""
+        self.wait_until_stable(max_wait=self.app_settings.advanced.navigation_delay)
 
     def _get_game_module(self) -> str:
         """Return the game's module name (segment after 'games' in module path)."""
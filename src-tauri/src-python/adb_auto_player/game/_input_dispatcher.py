@@ -0,0 +1,174 @@
+"""Single-worker dispatcher for non-blocking input commands."""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class InputDispatcherStats:
+    """Snapshot of InputDispatcher counters.
+
+    Latencies are measured from submission until the command finished.
+    """
+
+    depth: int
+    max_depth: int
+    submitted: int
+    executed: int
+    coalesced: int
+    failed: int
+    backpressure_waits: int
+    avg_latency_ms: float
+    max_latency_ms: float
+
+
+@dataclass
+class _Command:
+    action: Callable[[], None]
+    key: Hashable | None
+    submitted_at: float
+
+
+class InputDispatcher:
+    """Runs input commands in submission order on one worker thread.
+
+    - The queue is bounded: when the device falls behind, `submit` blocks the
+      producer until there is room instead of piling up commands.
+    - A command whose key matches one that is still waiting in the queue is
+      dropped, so tapping the same point in a tight loop does not queue up
+      duplicate taps.
+    - `wait_idle` lets blocking input (taps, swipes) run only after every
+      queued command finished, keeping the order the caller issued them in.
+    """
+
+    def __init__(self, max_queue_size: int = 8) -> None:
+        """Initialize the dispatcher, the worker thread is started lazily.
+
+        Args:
+            max_queue_size: Maximum number of queued commands.
+        """
+        self.max_queue_size = max_queue_size
+        self._pending: deque[_Command] = deque()
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+        self._busy = False
+        self._max_depth = 0
+        self._submitted = 0
+        self._executed = 0
+        self._coalesced = 0
+        self._failed = 0
+        self._backpressure_waits = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def submit(
+        self,
+        action: Callable[[], None],
+        key: Hashable | None = None,
+        timeout: float | None = None,
+    ) -> bool:
+        """Queue a command.
+
+        Args:
+            action: Callable executing the input, exceptions are logged.
+            key: Commands with equal keys still waiting in the queue are
+                coalesced into the one already queued. None disables this.
+            timeout: Maximum seconds to wait for room in the queue,
+                None waits indefinitely.
+
+        Returns:
+            True if the command was queued, False if it was coalesced or the
+            queue stayed full for `timeout` seconds.
+        """
+        with self._condition:
+            self._submitted += 1
+            if key is not None and any(c.key == key for c in self._pending):
+                self._coalesced += 1
+                return False
+            if len(self._pending) >= self.max_queue_size:
+                self._backpressure_waits += 1
+                if not self._condition.wait_for(
+                    lambda: len(self._pending) < self.max_queue_size, timeout
+                ):
+                    logging.debug("Input queue full, dropping command")
+                    return False
+            self._pending.append(_Command(action, key, time.perf_counter()))
+            self._max_depth = max(self._max_depth, len(self._pending))
+            self._ensure_worker()
+            self._condition.notify_all()
+        return True
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Block until all queued commands have finished.
+
+        Returns:
+            True if the dispatcher is idle, False on timeout.
+        """
+        if threading.current_thread() is self._worker:
+            # Called from a queued command, waiting would deadlock.
+            return True
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    @property
+    def depth(self) -> int:
+        """Number of commands waiting in the queue."""
+        with self._condition:
+            return len(self._pending)
+
+    def stats(self) -> InputDispatcherStats:
+        """Return a snapshot of the dispatcher counters."""
+        with self._condition:
+            return InputDispatcherStats(
+                depth=len(self._pending),
+                max_depth=self._max_depth,
+                submitted=self._submitted,
+                executed=self._executed,
+                coalesced=self._coalesced,
+                failed=self._failed,
+                backpressure_waits=self._backpressure_waits,
+                avg_latency_ms=(
+                    self._latency_total / self._executed * 1000
+                    if self._executed
+                    else 0.0
+                ),
+                max_latency_ms=self._latency_max * 1000,
+            )
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        self._worker = threading.Thread(
+            target=self._run, name="InputDispatcher", daemon=True
+        )
+        self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: bool(self._pending))
+                command = self._pending.popleft()
+                self._busy = True
+                self._condition.notify_all()
+
+            failed = False
+            try:
+                command.action()
+            except Exception as e:
+                failed = True
+                logging.warning(f"Input command failed: {e}")
+
+            latency = time.perf_counter() - command.submitted_at
+            with self._condition:
+                self._busy = False
+                self._executed += 1
+                self._failed += int(failed)
+                self._latency_total += latency
+                self._latency_max = max(self._latency_max, latency)
+                self._condition.notify_all()
@@ -4,12 +4,14 @@ import logging
 import threading
 from dataclasses import dataclass
 from enum import StrEnum, auto
+from functools import cached_property, partial
 from time import sleep
 
 from adb_auto_player.file_loader import SettingsLoader
 from adb_auto_player.models.geometry import Coordinates, Point
 
 from ._base import _GameBase
+from ._input_dispatcher import InputDispatcher
 
 
 class _SwipeDirection(StrEnum):
@@ -42,6 +44,11 @@ class _SwipeParams:
 class _InputMixin(_GameBase):
     """Mixin providing all user-input operations (tap, hold, swipe)."""
 
+    @cached_property
+    def input_dispatcher(self) -> InputDispatcher:
+        """Worker executing non-blocking taps in order."""
+        return InputDispatcher()
+
     def tap(
         self,
         coordinates: Coordinates,
@@ -58,6 +65,8 @@ class _InputMixin(_GameBase):
             coordinates (Coordinates): Point to click on.
             scale (bool, optional): Deprecated — does nothing.
             blocking (bool, optional): Whether to block until ADB confirms the tap.
+                Non-blocking taps are queued on `input_dispatcher`, a tap on a
+                point that is already queued is dropped.
             non_blocking_sleep_duration (float, optional): Sleep time in seconds for
                 non-blocking taps, needed to not DoS the ADB server.
             log_message (str | None, optional): Custom log message; default if None.
@@ -69,14 +78,13 @@ class _InputMixin(_GameBase):
             log_message = None
 
         if blocking:
+            self.input_dispatcher.wait_idle()
             self._click(coordinates, log_message)
         else:
-            thread = threading.Thread(
-                target=self._click,
-                args=(coordinates, log_message),
-                daemon=True,
+            self.input_dispatcher.submit(
+                partial(self._click, coordinates, log_message),
+                key=("tap", coordinates.x, coordinates.y),
             )
-            thread.start()
             if non_blocking_sleep_duration is not None:
                 sleep(non_blocking_sleep_duration)
 
@@ -86,6 +94,7 @@ class _InputMixin(_GameBase):
         log_message: str | None = None,
     ) -> None:
         """Internal click method — logging should be handled by the caller."""
+        self._record_input("tap", coordinates)
         self.device.tap(self._apply_vertical_offset(coordinates))
         if log_message is not None:
             logging.debug(log_message)
@@ -106,6 +115,8 @@ class _InputMixin(_GameBase):
 
     def press_back_button(self) -> None:
         """Press the device back button."""
+        self.input_dispatcher.wait_idle()
+        self._record_input("back")
         self.device.press_back_button()
 
     def swipe_down(
@@ -217,6 +228,10 @@ class _InputMixin(_GameBase):
         )
 
         logging.debug(f"swipe_{direction} - from ({sx}, {sy}) to ({ex}, {ey})")
+        self.input_dispatcher.wait_idle()
+        self._record_input(
+            "swipe", Point(sx, sy), Point(ex, ey), duration=params.duration
+        )
         self.device.swipe(
             self._apply_vertical_offset(Point(sx, sy)),
             self._apply_vertical_offset(Point(ex, ey)),
@@ -245,6 +260,8 @@ class _InputMixin(_GameBase):
                 f"hold: ({coordinates.x}, {coordinates.y}) for {duration} seconds"
             )
 
+        self.input_dispatcher.wait_idle()
+        self._record_input("hold", coordinates, duration=duration)
         if blocking:
             self.device.hold(coordinates=point, duration=duration)
             return None
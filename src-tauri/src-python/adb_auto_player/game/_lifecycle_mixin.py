@@ -21,6 +21,7 @@ class _LifecycleMixin(_GameBase):
         Args:
             device_streaming (bool, optional): Whether to start the H264 stream.
         """
+        self.device.probe()
         self._set_device_resolution()
         self._check_requirements()
         self.device.resolve_display_targeting(self.package_name_prefixes)
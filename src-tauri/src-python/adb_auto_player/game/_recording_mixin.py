@@ -0,0 +1,113 @@
+"""Session recording mixin — capture frames, inputs and decisions of a task run."""
+
+import datetime
+import logging
+from pathlib import Path
+from typing import Any
+
+from adb_auto_player.device.replay import SessionRecorder
+from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.models.geometry import Coordinates
+from adb_auto_player.util import Instrumentation, Measurement, RunMetrics
+
+from ._base import _GameBase
+
+
+class _RecordingMixin(_GameBase):
+    """Mixin recording task runs to archives that can be replayed offline.
+
+    Frames, inputs, template matches and the results of every OCR backend are
+    recorded. Archives are written by `SessionRecorder` and can be loaded with
+    `ReplayGraph.load` to replay and profile the run without a device.
+    """
+
+    # Record every task run to data/recordings in the app config dir.
+    record_sessions: bool = False
+    _session_recorder: SessionRecorder | None = None
+
+    @property
+    def session_recorder(self) -> SessionRecorder | None:
+        """Active recorder, started on first use when `record_sessions` is set."""
+        if self._session_recorder is None and self.record_sessions:
+            self.start_session_recording()
+        return self._session_recorder
+
+    def start_session_recording(self, path: Path | None = None) -> SessionRecorder:
+        """Record frames, inputs and decisions until `stop_session_recording`.
+
+        Args:
+            path: Archive to write, defaults to a timestamped zip file in
+                data/recordings of the app config dir.
+        """
+        self.stop_session_recording()
+        if path is None:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = (
+                SettingsLoader.get_app_config_dir()
+                / "data"
+                / "recordings"
+                / f"{type(self).__name__}_{timestamp}.zip"
+            )
+        self._session_recorder = SessionRecorder(
+            path, package=self._target_package_name
+        )
+        # Games create OCR backends in many places, all of them are recorded.
+        Instrumentation.set_observer(self._record_measurement)
+        logging.debug(f"Recording session to {path}")
+        return self._session_recorder
+
+    def stop_session_recording(self) -> Path | None:
+        """Finish the recording.
+
+        Returns:
+            Path | None: The archive, None if nothing was recorded.
+        """
+        recorder, self._session_recorder = self._session_recorder, None
+        if recorder is None:
+            return None
+        Instrumentation.set_observer(None)
+        return recorder.close()
+
+    def _record_measurement(self, measurement: Measurement) -> None:
+        result = measurement.result
+        details = dict(measurement.details)
+        if measurement.metric == RunMetrics.OCR:
+            kind = "ocr"
+            if isinstance(result, list):
+                score = max(
+                    (float(r.confidence) for r in result if hasattr(r, "confidence")),
+                    default=None,
+                )
+                details["texts"] = [getattr(r, "text", str(r)) for r in result]
+            else:
+                score = None
+                details["texts"] = [str(result)]
+        elif measurement.metric == RunMetrics.TEMPLATE_MATCH:
+            kind = details.pop("kind", "template")
+            if isinstance(result, list):
+                score = max((float(m.confidence) for m in result), default=None)
+                details["matches"] = len(result)
+            else:
+                score = None if result is None else float(result.confidence)
+        else:
+            return
+        self._record_decision(
+            kind, measurement.name, score, measurement.seconds, details
+        )
+
+    def _record_input(self, kind: str, *points: Coordinates, **details: Any) -> None:
+        recorder = self.session_recorder
+        if recorder is not None:
+            recorder.input(kind, *points, **details)
+
+    def _record_decision(
+        self,
+        kind: str,
+        name: str,
+        score: float | None,
+        seconds: float,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        recorder = self.session_recorder
+        if recorder is not None:
+            recorder.decision(kind, name, score, seconds, **(details or {}))
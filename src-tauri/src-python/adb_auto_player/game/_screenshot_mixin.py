@@ -7,15 +7,16 @@ from time import sleep
 
 import cv2
 import numpy as np
-from adb_auto_player.device.adb import DeviceStream
+from adb_auto_player.device.adb import DeviceStream, FrameBroker, FrameReader
 from adb_auto_player.exceptions import (
     AutoPlayerWarningError,
     GenericAdbUnrecoverableError,
     UnsupportedResolutionError,
 )
 from adb_auto_player.file_loader import SettingsLoader
-from adb_auto_player.image_manipulation import IO, Color
+from adb_auto_player.image_manipulation import IO, Color, DebugImageWriter
 from adb_auto_player.models.device import Resolution
+from adb_auto_player.util import Instrumentation, RunMetrics, Tracer
 
 from ._base import _GameBase
 
@@ -23,10 +24,32 @@ from ._base import _GameBase
 class _ScreenshotMixin(_GameBase):
     """Mixin providing screenshot capture and H264 device-stream management."""
 
+    # Publish the device stream through a FrameBroker process so other local
+    # processes can read the same frames without starting another encoder.
+    # Forces the broker on regardless of the frame_broker ADB device setting.
+    use_frame_broker: bool = False
+    # Fraction of the display resolution the device stream is recorded at.
+    # Template matching runs on the reduced frames, everything else gets
+    # frames upscaled to device resolution, see `get_scaled_screenshot`.
+    # Overrides the stream_scale ADB device setting when set.
+    stream_scale: float | None = None
+    _frame_reader: FrameReader | None = None
+
     def start_stream(self) -> None:
-        """Start the H264 device stream."""
+        """Start the H264 device stream.
+
+        With the Frame Broker enabled, the stream is read from the broker
+        process of the device instead of starting another stream on the device.
+        """
+        if self._attach_frame_broker():
+            return
+
         try:
-            self._stream = DeviceStream(self.device)
+            self._stream = DeviceStream(
+                self.device,
+                scale=self.stream_scale
+                or SettingsLoader.adb_settings().device.stream_scale,
+            )
         except AutoPlayerWarningError as e:
             logging.warning(f"{e}")
 
@@ -49,33 +72,110 @@ class _ScreenshotMixin(_GameBase):
             sleep(1)
             time_waiting += 1
 
+    def _attach_frame_broker(self) -> bool:
+        if not (
+            self.use_frame_broker or SettingsLoader.adb_settings().device.frame_broker
+        ):
+            return False
+        broker = FrameBroker(self.device.identifier)
+        if not broker.start():
+            return False
+
+        for _ in range(10):
+            reader = broker.attach()
+            if reader and reader.get_latest_frame() is not None:
+                logging.debug("Using frames from Frame Broker")
+                self._frame_reader = reader
+                return True
+            if reader:
+                reader.close()
+            sleep(1)
+        logging.warning("Frame Broker did not publish frames, using Device Stream")
+        return False
+
     def stop_stream(self) -> None:
         """Stop the H264 device stream."""
+        if self._frame_reader:
+            self._frame_reader.close()
+            self._frame_reader = None
         if self._stream:
             self._stream.stop()
             self._stream = None
 
+    @Tracer.trace("Game.get_screenshot", "screenshot")
     def get_screenshot(self) -> np.ndarray:
         """Get a screenshot from the device (stream-first, fallback screencap).
 
+        Sources in order: Frame Broker, own device stream, screencap.
+
         Returns:
-            np.ndarray: BGR screenshot.
+            np.ndarray: BGR screenshot in device resolution.
 
         Raises:
             GenericAdbUnrecoverableError: Screenshot cannot be captured.
         """
+        image, scale = self._capture_screenshot()
+        if scale == 1.0:
+            return image
+        width, height = self.display_info.dimensions
+        return cv2.resize(image, (width, height), interpolation=cv2.INTER_LINEAR)
+
+    @Tracer.trace("Game.get_scaled_screenshot", "screenshot")
+    def get_scaled_screenshot(self) -> tuple[np.ndarray, float]:
+        """Get a screenshot without upscaling reduced-resolution stream frames.
+
+        Coordinates found in the image must be divided by the scale to get
+        device coordinates, e.g. `TemplateMatchResult.scale(1 / scale)`.
+
+        Returns:
+            BGR screenshot and its scale relative to device resolution.
+
+        Raises:
+            GenericAdbUnrecoverableError: Screenshot cannot be captured.
+        """
+        if self._stream is None or self._stream.scale == 1.0:
+            return self.get_screenshot(), 1.0
+        return self._capture_screenshot()
+
+    def _capture_screenshot(self) -> tuple[np.ndarray, float]:
+        image, scale = self._read_screenshot()
+        recorder = self.session_recorder
+        if recorder is not None:
+            recorder.frame(
+                image
+                if scale == 1.0
+                else cv2.resize(image, self.display_info.dimensions)
+            )
+        return image, scale
+
+    @Instrumentation.measured(RunMetrics.SCREENSHOT, "Game.read_screenshot")
+    def _read_screenshot(self) -> tuple[np.ndarray, float]:
+        if self._frame_reader:
+            image = self._frame_reader.get_latest_frame()
+            if image is not None:
+                return self._apply_vertical_offset_to_screenshot(image), 1.0
+
         if self._stream:
             image = self._stream.get_latest_frame()
             if image is not None:
-                return self._apply_vertical_offset_to_screenshot(Color.to_bgr(image))
+                scale = self._stream.scale
+                return (
+                    self._apply_vertical_offset_to_screenshot(
+                        Color.to_bgr(image), scale
+                    ),
+                    scale,
+                )
 
         max_retries = 3
         for attempt in range(max_retries):
             try:
                 data = self.device.screenshot(self.package_name_prefixes)
                 if isinstance(data, bytes):
-                    return self._apply_vertical_offset_to_screenshot(
-                        IO.get_bgr_np_array_from_png_bytes(data)
+                    return (
+                        self._apply_vertical_offset_to_screenshot(
+                            IO.get_bgr_np_array_from_png_bytes(data)
+                        ),
+                        1.0,
                     )
             except (OSError, ValueError) as e:
                 logging.debug(
@@ -89,7 +189,9 @@ class _ScreenshotMixin(_GameBase):
         )
 
     @staticmethod
-    def _apply_vertical_offset_to_screenshot(image: np.ndarray) -> np.ndarray:
+    def _apply_vertical_offset_to_screenshot(
+        image: np.ndarray, scale: float = 1.0
+    ) -> np.ndarray:
         """Shift screenshot content to correct for device-specific misalignment.
 
         Some devices render game content a fixed number of pixels lower or
@@ -107,8 +209,11 @@ class _ScreenshotMixin(_GameBase):
         `_apply_vertical_offset`) because `Game` inherits from both mixins;
         an identical method name on both would collide in the MRO and one
         would silently shadow the other.
+
+        `scale` is the resolution of `image` relative to the device, the offset
+        is scaled accordingly.
         """
-        offset = SettingsLoader.adb_settings().device.vertical_offset
+        offset = round(SettingsLoader.adb_settings().device.vertical_offset * scale)
         if offset == 0:
             return image
         if offset > 0:
@@ -179,9 +284,10 @@ class _ScreenshotMixin(_GameBase):
         Intended for warning/error paths where the game reached a state the
         automation logic didn't recognize (unmatched popup, failed
         navigation, unresolved template, etc.) so a bug report includes the
-        actual screen instead of just a log line. Never raises — a failure
-        to save debug output must not interrupt the automation it's
-        diagnosing.
+        actual screen instead of just a log line. The image is written by
+        `DebugImageWriter` in the background and dropped if its queue is
+        full. Never raises — a failure to save debug output must not
+        interrupt the automation it's diagnosing.
 
         Args:
             screenshot: Image to save, typically the full device screenshot.
@@ -192,9 +298,8 @@ class _ScreenshotMixin(_GameBase):
             screenshot_dir = (
                 SettingsLoader.get_app_config_dir() / "data" / "screenshots" / category
             )
-            screenshot_dir.mkdir(parents=True, exist_ok=True)
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-            cv2.imwrite(str(screenshot_dir / f"{category}_{timestamp}.png"), screenshot)
+            DebugImageWriter.save(screenshot, screenshot_dir, f"{category}_{timestamp}")
         except Exception as e:
             logging.warning(f"Could not save debug screenshot ({category}): {e}")
 
@@ -217,12 +322,12 @@ class _ScreenshotMixin(_GameBase):
 
     def _start_device_streaming(self, device_streaming: bool = True) -> None:
         if not device_streaming:
-            if self._stream:
+            if self._stream or self._frame_reader:
                 logging.debug("Stopping device streaming")
-                self._stream.stop()
+                self.stop_stream()
             return
 
-        if self._stream:
+        if self._stream or self._frame_reader:
             logging.debug("Device stream already started")
             return
 
@@ -15,11 +15,15 @@ from adb_auto_player.models.geometry import Coordinates, Point
 from adb_auto_player.models.image_manipulation import CropRegions
 from adb_auto_player.models.template_matching import MatchMode, TemplateMatchResult
 from adb_auto_player.template_matching import TemplateMatcher
+from adb_auto_player.util import Instrumentation, RunMetrics, Tracer
 
 from ._base import _GameBase
 
 T = TypeVar("T")
 
+# Share of max_wait an unchanged screen is waited for in wait_until_stable.
+STABLE_MIN_WAIT_FRACTION = 0.4
+
 
 class _UndesiredResultError(Exception):
     """Raised inside polling loops to signal the desired result has not yet occurred."""
@@ -61,7 +65,8 @@ class _TemplateMixin(_GameBase):
             except _UndesiredResultError:
                 if monotonic() >= end_time:
                     raise GameTimeoutError(timeout_message)
-                sleep(delay)
+                with Tracer.span("poll_delay", "sleep", seconds=delay):
+                    sleep(delay)
 
     # ------------------------------------------------------------------
     # Single-template operations
@@ -75,6 +80,7 @@ class _TemplateMixin(_GameBase):
         grayscale: bool = False,
         crop_regions: CropRegions = CropRegions(),
         screenshot: np.ndarray | None = None,
+        screenshot_scale: float = 1.0,
     ) -> TemplateMatchResult | None:
         """Find a single template on the screen.
 
@@ -86,28 +92,38 @@ class _TemplateMixin(_GameBase):
             grayscale (bool, optional): Convert to grayscale. Defaults to False.
             crop_regions (CropRegions, optional): Region to search within.
             screenshot (np.ndarray, optional): Reuse an existing screenshot.
+            screenshot_scale (float, optional): Resolution of `screenshot`
+                relative to the device, see `get_scaled_screenshot`.
 
         Returns:
-            TemplateMatchResult | None
+            TemplateMatchResult | None: Match in device coordinates.
         """
-        crop_result = Cropping.crop(
-            image=screenshot if screenshot is not None else self.get_screenshot(),
-            crop_regions=crop_regions,
-        )
-
-        match = TemplateMatcher.find_template_match(
-            base_image=crop_result.image,
-            template_image=self._load_image(template=template, grayscale=grayscale),
-            match_mode=match_mode,
-            threshold=threshold or self.default_threshold,
-            grayscale=grayscale,
-        )
+        if screenshot is None:
+            screenshot, screenshot_scale = self.get_scaled_screenshot()
+        with Instrumentation.measure(
+            RunMetrics.TEMPLATE_MATCH, str(template)
+        ) as measurement:
+            crop_result = Cropping.crop(
+                image=screenshot, crop_regions=crop_regions.scale(screenshot_scale)
+            )
+            match = TemplateMatcher.find_template_match(
+                base_image=crop_result.image,
+                template_image=self._load_image(
+                    template=template, grayscale=grayscale, scale=screenshot_scale
+                ),
+                match_mode=match_mode,
+                threshold=threshold or self.default_threshold,
+                grayscale=grayscale,
+            )
+            measurement.result = match
 
         if match is None:
             return None
 
-        return match.with_offset(crop_result.offset).to_template_match_result(
-            template=str(template)
+        return (
+            match.with_offset(crop_result.offset)
+            .to_template_match_result(template=str(template))
+            .scale(1 / screenshot_scale)
         )
 
     def find_worst_match(
@@ -126,21 +142,29 @@ class _TemplateMixin(_GameBase):
         Returns:
             None | TemplateMatchResult
         """
-        crop_result = Cropping.crop(
-            image=self.get_screenshot(), crop_regions=crop_regions
-        )
-
-        result = TemplateMatcher.find_worst_template_match(
-            base_image=crop_result.image,
-            template_image=self._load_image(template=template, grayscale=grayscale),
-            grayscale=grayscale,
-        )
+        screenshot, scale = self.get_scaled_screenshot()
+        with Instrumentation.measure(
+            RunMetrics.TEMPLATE_MATCH, str(template), kind="worst_match"
+        ) as measurement:
+            crop_result = Cropping.crop(
+                image=screenshot, crop_regions=crop_regions.scale(scale)
+            )
+            result = TemplateMatcher.find_worst_template_match(
+                base_image=crop_result.image,
+                template_image=self._load_image(
+                    template=template, grayscale=grayscale, scale=scale
+                ),
+                grayscale=grayscale,
+            )
+            measurement.result = result
 
         if result is None:
             return None
 
-        return result.with_offset(crop_result.offset).to_template_match_result(
-            template=str(template)
+        return (
+            result.with_offset(crop_result.offset)
+            .to_template_match_result(template=str(template))
+            .scale(1 / scale)
         )
 
     def find_all_template_matches(
@@ -163,22 +187,28 @@ class _TemplateMixin(_GameBase):
         Returns:
             list[TemplateMatchResult]
         """
-        crop_result = Cropping.crop(
-            image=self.get_screenshot(), crop_regions=crop_regions
-        )
-
-        result = TemplateMatcher.find_all_template_matches(
-            base_image=crop_result.image,
-            template_image=self._load_image(template=template, grayscale=grayscale),
-            threshold=threshold or self.default_threshold,
-            grayscale=grayscale,
-            min_distance=min_distance,
-        )
+        screenshot, scale = self.get_scaled_screenshot()
+        with Instrumentation.measure(
+            RunMetrics.TEMPLATE_MATCH, str(template)
+        ) as measurement:
+            crop_result = Cropping.crop(
+                image=screenshot, crop_regions=crop_regions.scale(scale)
+            )
+            result = TemplateMatcher.find_all_template_matches(
+                base_image=crop_result.image,
+                template_image=self._load_image(
+                    template=template, grayscale=grayscale, scale=scale
+                ),
+                threshold=threshold or self.default_threshold,
+                grayscale=grayscale,
+                min_distance=max(1, round(min_distance * scale)),
+            )
+            measurement.result = result
 
         return [
-            match.with_offset(crop_result.offset).to_template_match_result(
-                template=str(template)
-            )
+            match.with_offset(crop_result.offset)
+            .to_template_match_result(template=str(template))
+            .scale(1 / scale)
             for match in result
         ]
 
@@ -210,11 +240,13 @@ class _TemplateMixin(_GameBase):
         Returns:
             TemplateMatchResult | None
         """
-        screenshot = screenshot if screenshot is not None else self.get_screenshot()
+        scale = 1.0
+        if screenshot is None:
+            screenshot, scale = self.get_scaled_screenshot()
 
         offset = None
         if crop_regions:
-            cropped = Cropping.crop(screenshot, crop_regions)
+            cropped = Cropping.crop(screenshot, crop_regions.scale(scale))
             screenshot = cropped.image
             offset = cropped.offset
 
@@ -227,11 +259,12 @@ class _TemplateMixin(_GameBase):
                 match_mode=match_mode,
                 threshold=threshold or self.default_threshold,
                 screenshot=screenshot,
+                screenshot_scale=scale,
                 grayscale=grayscale,
             )
             if result is not None:
                 if offset:
-                    return result.with_offset(offset)
+                    return result.with_offset(offset.scale(1 / scale))
                 return result
         return None
 
@@ -455,6 +488,93 @@ class _TemplateMixin(_GameBase):
             roi_changed, delay=delay, timeout=timeout, timeout_message=timeout_message
         )
 
+    @Tracer.trace("Game.wait_until_stable", "sleep")
+    def wait_until_stable(
+        self,
+        roi: CropRegions = CropRegions(),
+        max_wait: float = 2.0,
+        settle_frames: int = 2,
+        threshold: ConfidenceValue = ConfidenceValue("99%"),
+        poll_interval: float = 0.1,
+        *,
+        min_wait: float | None = None,
+    ) -> float:
+        """Wait until a region of interest changed and stopped changing.
+
+        Consecutive frames are compared and the wait ends once *settle_frames*
+        comparisons in a row are similar. Right after a tap the transition has
+        usually not started yet and the stream keeps returning the old frame,
+        so an unchanged screen only counts as settled after *min_wait*.
+        *max_wait* is an upper bound, so the call never waits longer than the
+        fixed delay it replaces. If the screen cannot be captured the full
+        *max_wait* is slept instead.
+
+        Args:
+            roi (CropRegions, optional): Region to monitor.
+            max_wait (float, optional): Maximum seconds to wait.
+            settle_frames (int, optional): Consecutive unchanged frames required.
+            threshold (ConfidenceValue, optional): Similarity threshold for two
+                frames to count as unchanged.
+            poll_interval (float, optional): Seconds between frames.
+            min_wait (float | None, optional): Seconds an unchanged screen has to
+                be waited for before it counts as settled, defaults to
+                `STABLE_MIN_WAIT_FRACTION` of *max_wait*.
+
+        Returns:
+            Seconds waited.
+        """
+        start_time = monotonic()
+        end_time = start_time + max_wait
+        if min_wait is None:
+            min_wait = max_wait * STABLE_MIN_WAIT_FRACTION
+        min_end_time = start_time + min_wait
+        if not self.app_settings.advanced.wait_for_stable_screen:
+            sleep(max_wait)
+            return max_wait
+
+        previous: np.ndarray | None = None
+        unchanged = 0
+        changed = False
+        while monotonic() < end_time:
+            try:
+                screenshot = self.get_screenshot()
+            except Exception as e:
+                logging.debug(f"wait_until_stable: cannot capture screen: {e}")
+                break
+            if not isinstance(screenshot, np.ndarray):
+                break
+            current = Cropping.crop(screenshot, roi).image
+
+            if previous is not None and TemplateMatcher.similar_image(
+                base_image=previous,
+                template_image=current,
+                threshold=threshold,
+                grayscale=True,
+            ):
+                unchanged += 1
+                if unchanged >= settle_frames and (
+                    changed or monotonic() >= min_end_time
+                ):
+                    elapsed = monotonic() - start_time
+                    saved = max(0.0, max_wait - elapsed)
+                    self._stable_wait_saved += saved
+                    logging.debug(
+                        f"Screen settled after {elapsed:.2f}s of {max_wait:.2f}s, "
+                        f"saved {saved:.2f}s (total saved "
+                        f"{self._stable_wait_saved:.1f}s)"
+                    )
+                    return elapsed
+            elif previous is not None:
+                unchanged = 0
+                changed = True
+            previous = current
+            sleep(max(0.0, min(poll_interval, end_time - monotonic())))
+
+        remaining = end_time - monotonic()
+        if remaining > 0:
+            sleep(remaining)
+        return monotonic() - start_time
+
     # ------------------------------------------------------------------
     # Image loading helpers
     # ------------------------------------------------------------------
@@ -463,9 +583,11 @@ class _TemplateMixin(_GameBase):
         self,
         template: str | Path,
         grayscale: bool = False,
+        scale: float = 1.0,
     ) -> np.ndarray:
         return IO.load_image(
             image_path=self.template_dir / template,
+            image_scale_factor=scale,
             grayscale=grayscale,
         )
 
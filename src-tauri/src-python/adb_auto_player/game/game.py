@@ -18,6 +18,7 @@ from pydantic import BaseModel
 from ._base import _GameBase
 from ._input_mixin import _InputMixin
 from ._lifecycle_mixin import _LifecycleMixin
+from ._recording_mixin import _RecordingMixin
 from ._screenshot_mixin import _ScreenshotMixin
 from ._task_mixin import _TaskMixin
 from ._template_mixin import _TemplateMixin
@@ -29,13 +30,14 @@ class Game(
     _TemplateMixin,
     _LifecycleMixin,
     _TaskMixin,
+    _RecordingMixin,
     _GameBase,
 ):
     """Generic Game base class.
 
-    Composes input, screenshot, template-matching, lifecycle and task-execution
-    capabilities. Concrete game classes must implement the *settings* abstract
-    property.
+    Composes input, screenshot, template-matching, lifecycle, task-execution and
+    session recording capabilities. Concrete game classes must implement the
+    *settings* abstract property.
     """
 
     def __init__(self) -> None:
@@ -52,6 +54,8 @@ class Game(
         self._device: AdbController | None = None
         self._stream: DeviceStream | None = None
         self._target_package_name: str | None = None
+        # Seconds saved by wait_until_stable compared to fixed delays.
+        self._stable_wait_saved: float = 0.0
 
     # ------------------------------------------------------------------
     # Abstract interface (concrete games must implement)
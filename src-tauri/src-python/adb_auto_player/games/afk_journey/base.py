@@ -3,9 +3,11 @@
 import logging
 import re
 from datetime import timedelta
+from functools import cached_property
 from time import monotonic, sleep
 from typing import Any
 
+import numpy as np
 from adb_auto_player.decorators import register_cache, register_game
 from adb_auto_player.exceptions import (
     AutoPlayerWarningError,
@@ -22,7 +24,7 @@ from adb_auto_player.models.geometry import Point
 from adb_auto_player.models.image_manipulation import CropRegions, CropResult
 from adb_auto_player.models.template_matching import TemplateMatchResult
 from adb_auto_player.tauri_context import profile_aware_cache
-from adb_auto_player.template_matching import TemplateMatcher
+from adb_auto_player.template_matching import DescriptorIndex, TemplateMatcher
 from adb_auto_player.util import SummaryGenerator
 
 from .battle_state import BattleState, Mode
@@ -455,8 +457,19 @@ class AFKJourneyBase(
 
         return self._find_any_excluded_hero(excluded_heroes_dict)
 
+    @cached_property
+    def _hero_portrait_index(self) -> DescriptorIndex:
+        """Descriptor index of all hero portrait templates."""
+        return DescriptorIndex.from_directory(
+            self.template_dir / "heroes", key_prefix="heroes/"
+        )
+
     def _find_any_excluded_hero(self, excluded_heroes: dict[str, str]) -> str | None:
-        """Find excluded hero templates.
+        """Find excluded hero portraits in the formation.
+
+        Candidates come from a nearest-neighbour lookup in the hero portrait
+        descriptor index, which works on downscaled images. Each candidate is
+        confirmed with a full resolution template match around the hit.
 
         Args:
             excluded_heroes (dict[str, str]): Dictionary of excluded heroes.
@@ -464,19 +477,45 @@ class AFKJourneyBase(
         Returns:
             str | None: Name of excluded hero
         """
-        try:
-            result = self.wait_for_any_template(
-                templates=list(excluded_heroes.keys()),
-                crop_regions=CropRegions(
-                    left="10%", right="30%", top="35%", bottom="40%"
-                ),
-                threshold=ConfidenceValue("85%"),
-                timeout=1.0,
-                delay=0.5,
+        crop_regions = CropRegions(left="10%", right="30%", top="35%", bottom="40%")
+        threshold = ConfidenceValue("85%")
+        end_time = monotonic() + 1.0
+        while True:
+            formation = Cropping.crop(self.get_screenshot(), crop_regions).image
+            matches = self._hero_portrait_index.find_all(
+                formation, keys=excluded_heroes.keys(), threshold=threshold
             )
-            return excluded_heroes.get(result.template)
-        except GameTimeoutError:
-            return None
+            for match in matches:
+                if self._confirm_hero_portrait(formation, match, threshold):
+                    return excluded_heroes.get(match.template)
+            if monotonic() >= end_time:
+                return None
+            sleep(0.5)
+
+    def _confirm_hero_portrait(
+        self,
+        formation: np.ndarray,
+        match: TemplateMatchResult,
+        threshold: ConfidenceValue,
+    ) -> bool:
+        """Match the portrait template at full resolution around a hit."""
+        # The hit is only accurate to one downscaled pixel.
+        padding = self._hero_portrait_index.downscale * 2
+        box = match.box
+        top, left = max(0, box.top - padding), max(0, box.left - padding)
+        region = formation[
+            top : box.top + box.height + padding,
+            left : box.left + box.width + padding,
+        ]
+        template = self._load_image(match.template)
+        if region.shape[0] < template.shape[0] or region.shape[1] < template.shape[1]:
+            return False
+        confirmed = TemplateMatcher.find_template_match(
+            base_image=region, template_image=template, threshold=threshold
+        )
+        if confirmed is None:
+            logging.debug(f"Descriptor hit {match.template} not confirmed")
+        return confirmed is not None
 
     def _start_battle(self) -> bool:
         """Begin battle.
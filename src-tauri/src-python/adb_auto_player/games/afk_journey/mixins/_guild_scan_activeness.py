@@ -7,6 +7,7 @@ from difflib import SequenceMatcher
 from time import sleep
 
 from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.image_manipulation import ListStitcher
 from adb_auto_player.models.geometry import Point
 from adb_auto_player.ocr import OCRBackend, RapidOCRBackend
 from adb_auto_player.ocr.qwen2vl_backend import QwenVLOCRBackend
@@ -81,7 +82,7 @@ class _GuildScanActivenessMixin(_GuildScanRankingsMixin):
             Point(self._GUILD_SWIPE_EX, self._GUILD_SWIPE_EY),
             duration=0.6,
         )
-        sleep(1.5)
+        self.wait_until_stable(max_wait=1.5)
 
         for attempt in range(3):
             screenshot = self.get_screenshot()
@@ -107,7 +108,7 @@ class _GuildScanActivenessMixin(_GuildScanRankingsMixin):
                     Point(self._GUILD_SWIPE_EX, self._GUILD_SWIPE_EY),
                     duration=0.6,
                 )
-                sleep(1.5)
+                self.wait_until_stable(max_wait=1.5)
 
         logging.error("Members button not found after multiple attempts.")
         return False
@@ -145,9 +146,15 @@ class _GuildScanActivenessMixin(_GuildScanRankingsMixin):
         screenshot,
         ocr_backend: OCRBackend,
         frame_label: str | None = None,
+        band_y_min: int | None = None,
     ) -> list[tuple[str | None, str | None]]:
-        """Parse (name, activeness_value) pairs from the guild members list screen."""
-        ocr_results = ocr_backend.detect_text_blocks(screenshot)
+        """Parse (name, activeness_value) pairs from the guild members list screen.
+
+        When `band_y_min` is given only rows below it are OCR'd.
+        """
+        ocr_results = self._detect_text_blocks_in_band(
+            screenshot, ocr_backend, band_y_min
+        )
 
         area_blocks = [
             res
@@ -260,9 +267,15 @@ class _GuildScanActivenessMixin(_GuildScanRankingsMixin):
         screenshot,
         ocr_backend: OCRBackend,
         frame_label: str | None = None,
+        band_y_min: int | None = None,
     ) -> list[tuple[str, int]]:
-        """Return (raw_name, chest_count) pairs from one Contribution Ranking frame."""
-        ocr_results = ocr_backend.detect_text_blocks(screenshot)
+        """Return (raw_name, chest_count) pairs from one Contribution Ranking frame.
+
+        When `band_y_min` is given only rows below it are OCR'd.
+        """
+        ocr_results = self._detect_text_blocks_in_band(
+            screenshot, ocr_backend, band_y_min
+        )
         area = [
             r
             for r in ocr_results
@@ -449,12 +462,31 @@ class _GuildScanActivenessMixin(_GuildScanRankingsMixin):
         seen_names: set[str] = set()
         contributions: dict[str, int] = {}
         no_new_count = 0
+        end_of_list_count = 0
+        stitcher = ListStitcher(
+            self._Y_CHEST_CONTRIB_MIN,
+            self._Y_CHEST_CONTRIB_MAX,
+            row_margin=self._LIST_STITCH_ROW_MARGIN,
+        )
 
         for scroll_idx in range(self._MAX_SCROLLS_CHEST):
             screenshot = self.get_screenshot()
             self._save_debug_screenshot(screenshot, f"chest_{scroll_idx:03d}")
+            step = stitcher.add_frame(screenshot)
+            if step.is_end_of_list:
+                end_of_list_count += 1
+                if end_of_list_count >= self._MAX_END_OF_LIST_FRAMES:
+                    logging.info("Contribution Ranking stopped scrolling. Finished.")
+                    break
+                self.swipe_up(x=540, sy=1400, ey=1100, duration=1.5)
+                self.wait_until_stable(roi=self._CHEST_LIST_ROI, max_wait=2.0)
+                continue
+            end_of_list_count = 0
             pairs = self._parse_chest_contribution_rows(
-                screenshot, nav_backend, frame_label=f"chest_{scroll_idx:03d}"
+                screenshot,
+                nav_backend,
+                frame_label=f"chest_{scroll_idx:03d}",
+                band_y_min=step.reveal_y_min,
             )
 
             new_this_frame = False
@@ -477,7 +509,7 @@ class _GuildScanActivenessMixin(_GuildScanRankingsMixin):
                 break
 
             self.swipe_up(x=540, sy=1400, ey=1100, duration=1.5)
-            sleep(2.0)
+            self.wait_until_stable(roi=self._CHEST_LIST_ROI, max_wait=2.0)
 
         return contributions
 
@@ -514,14 +546,33 @@ class _GuildScanActivenessMixin(_GuildScanRankingsMixin):
         seen_index: dict[str, int] = {}
         records: list[dict] = []
         no_new_count = 0
+        end_of_list_count = 0
+        stitcher = ListStitcher(
+            self._Y_ACTIVENESS_MIN,
+            self._Y_ACTIVENESS_MAX,
+            row_margin=self._LIST_STITCH_ROW_MARGIN,
+        )
 
         sleep(10)
 
         for scroll_idx in range(self._MAX_SCROLLS_ACTIVENESS):
             screenshot = self.get_screenshot()
             self._save_debug_screenshot(screenshot, f"activeness_{scroll_idx:03d}")
+            step = stitcher.add_frame(screenshot)
+            if step.is_end_of_list:
+                end_of_list_count += 1
+                if end_of_list_count >= self._MAX_END_OF_LIST_FRAMES:
+                    logging.info("Members list stopped scrolling. Finished.")
+                    break
+                self.swipe_up(x=540, sy=1400, ey=800, duration=1.0)
+                self.wait_until_stable(roi=self._ACTIVENESS_LIST_ROI, max_wait=2.0)
+                continue
+            end_of_list_count = 0
             pairs = self._parse_activeness_rows(
-                screenshot, ocr_backend, frame_label=f"activeness_{scroll_idx:03d}"
+                screenshot,
+                ocr_backend,
+                frame_label=f"activeness_{scroll_idx:03d}",
+                band_y_min=step.reveal_y_min,
             )
 
             new_this_frame = False
@@ -558,7 +609,7 @@ class _GuildScanActivenessMixin(_GuildScanRankingsMixin):
                 break
 
             self.swipe_up(x=540, sy=1400, ey=800, duration=1.0)
-            sleep(2)
+            self.wait_until_stable(roi=self._ACTIVENESS_LIST_ROI, max_wait=2.0)
 
         return records
 
@@ -10,6 +10,7 @@ from time import sleep
 import cv2
 from adb_auto_player.exceptions import AutoPlayerWarningError, GameTimeoutError
 from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.image_manipulation import ListStitcher
 from adb_auto_player.models import ConfidenceValue
 from adb_auto_player.models.geometry import Point
 from adb_auto_player.models.ocr import OCRResult
@@ -68,7 +69,7 @@ class _GuildScanRankingsMixin(_GuildScanNamesMixin):
                 logging.warning("No date tabs visible in this view.")
                 logging.info("Scrolling date bar left to reveal older dates...")
                 self.swipe_left(y=758, sx=900, ex=200, duration=0.8)
-                sleep(1.5)
+                self.wait_until_stable(max_wait=1.5)
                 continue
 
             self._scan_visible_date_tabs(
@@ -85,7 +86,7 @@ class _GuildScanRankingsMixin(_GuildScanNamesMixin):
             if len(processed_dates) < total_expected:
                 logging.info("Scrolling date bar left to reveal older dates...")
                 self.swipe_left(y=758, sx=900, ex=200, duration=0.8)
-                sleep(1.5)
+                self.wait_until_stable(max_wait=1.5)
 
         return rankings
 
@@ -162,6 +163,11 @@ class _GuildScanRankingsMixin(_GuildScanNamesMixin):
         observations: list[tuple[str | None, str | None]] = []
         seen_ranks: set[str] = set()
         no_new_ranks_count = 0
+        end_of_list_count = 0
+        # Rankings are canonicalized by voting across repeated observations of
+        # the same row, so frames are still read in full; the stitcher is only
+        # used to notice when the list has stopped scrolling.
+        stitcher = ListStitcher(self._Y_MIN_RANKINGS, self._Y_MAX_RANKINGS)
 
         prefix = debug_prefix or ("sa" if is_supreme_arena else "dr")
         safe_date = re.sub(r"[^A-Za-z0-9_-]", "_", date_name)
@@ -171,6 +177,15 @@ class _GuildScanRankingsMixin(_GuildScanNamesMixin):
             self._save_debug_screenshot(
                 screenshot, f"{prefix}_{safe_date}_{scroll_idx:03d}"
             )
+            if stitcher.add_frame(screenshot).is_end_of_list:
+                end_of_list_count += 1
+                if end_of_list_count >= self._MAX_END_OF_LIST_FRAMES:
+                    logging.info(f"Rankings stopped scrolling. Finished {date_name}.")
+                    break
+                self.swipe_up(x=540, sy=1300, ey=1050, duration=1.2)
+                self.wait_until_stable(roi=self._RANKINGS_LIST_ROI, max_wait=2.5)
+                continue
+            end_of_list_count = 0
             rows = self._parse_rankings_rows(
                 screenshot,
                 ocr_backend,
@@ -202,7 +217,7 @@ class _GuildScanRankingsMixin(_GuildScanNamesMixin):
                 break
 
             self.swipe_up(x=540, sy=1300, ey=1050, duration=1.2)
-            sleep(2.5)
+            self.wait_until_stable(roi=self._RANKINGS_LIST_ROI, max_wait=2.5)
 
         return self._canonicalize_observations(observations, date_name)
 
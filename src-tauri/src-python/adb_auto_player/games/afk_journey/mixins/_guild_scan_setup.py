@@ -11,9 +11,13 @@ import threading
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import cv2
+import numpy as np
 from adb_auto_player.exceptions import AutoPlayerWarningError
 from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.image_manipulation import DebugImageWriter
+from adb_auto_player.models.geometry import Point
+from adb_auto_player.models.image_manipulation import CropRegions
+from adb_auto_player.models.ocr import OCRResult
 from adb_auto_player.ocr import OCRBackend, RapidOCRBackend
 from adb_auto_player.ocr.qwen2vl_backend import QwenVLOCRBackend
 
@@ -48,6 +52,7 @@ if TYPE_CHECKING:
         def navigate_to_battle_modes_screen(self) -> None: ...
         def _find_in_battle_modes(self, *args, **kwargs) -> Any: ...
         def sleep_navigation(self) -> None: ...
+        def wait_until_stable(self, *args, **kwargs) -> float: ...
 
 else:
     BaseClass = object
@@ -86,6 +91,15 @@ class _GuildScanSetupMixin(BaseClass):
     _FUZZY_DEDUP_THRESHOLD = 0.75
     _MIN_NAME_ALNUM_RATIO = 0.5
     _MIN_UNRANKED_OBSERVATIONS = 2
+    # Scrolling list stitching: rows above the revealed strip that are re-read
+    # so a row cut off at the bottom edge is OCR'd in full, and how many
+    # consecutive frames without movement mark the end of the list.
+    _LIST_STITCH_ROW_MARGIN = 200
+    _MAX_END_OF_LIST_FRAMES = 2
+    _Y_SCREEN_HEIGHT = 1920
+    _RANKINGS_LIST_ROI = CropRegions(
+        top=_Y_MIN_RANKINGS, bottom=_Y_SCREEN_HEIGHT - _Y_MAX_RANKINGS
+    )
 
     # Guild activeness scan constants
     _Y_GUILD_NAV_MIN = 1840
@@ -102,6 +116,9 @@ class _GuildScanSetupMixin(BaseClass):
     _MIN_ACTIVENESS_VALUE = 10
     _MAX_ACTIVENESS_VALUE = 9999
     _MAX_NO_NEW_ACTIVENESS = 5
+    _ACTIVENESS_LIST_ROI = CropRegions(
+        top=_Y_ACTIVENESS_MIN, bottom=_Y_SCREEN_HEIGHT - _Y_ACTIVENESS_MAX
+    )
     _GUILD_NAV_SWIPE_MAX_ATTEMPTS = 2
     _GUILD_NAME_CORRECTION_THRESHOLD = 0.65
 
@@ -117,6 +134,9 @@ class _GuildScanSetupMixin(BaseClass):
     _MAX_CHEST_RANK_NUMBER = 200
     _X_CHEST_RANK_BADGE_MAX = 200
     _RE_CHEST_VALUE = re.compile(r"^\D{0,3}(\d+)$")
+    _CHEST_LIST_ROI = CropRegions(
+        top=_Y_CHEST_CONTRIB_MIN, bottom=_Y_SCREEN_HEIGHT - _Y_CHEST_CONTRIB_MAX
+    )
 
     # AFK Stage Season Phase Rankings scan constants.
     # The tab bar shows the current (highest-numbered) phase on the left and
@@ -411,11 +431,24 @@ class _GuildScanSetupMixin(BaseClass):
     def _save_debug_screenshot(self, screenshot, name: str) -> None:
         if self._screenshot_dir is None:
             return
-        try:
-            path = self._screenshot_dir / f"{name}.png"
-            cv2.imwrite(str(path), screenshot)
-        except Exception as e:
-            logging.warning(f"Could not save debug screenshot {name}: {e}")
+        DebugImageWriter.save(screenshot, self._screenshot_dir, name)
+
+    def _detect_text_blocks_in_band(
+        self,
+        screenshot,
+        ocr_backend: OCRBackend,
+        band_y_min: int | None = None,
+    ) -> list[OCRResult]:
+        """Run OCR on the screenshot below `band_y_min` only.
+
+        Results are returned in full-screenshot coordinates. Without a band, or
+        when the screenshot cannot be sliced, the whole screenshot is read.
+        """
+        if not band_y_min or not isinstance(screenshot, np.ndarray):
+            return ocr_backend.detect_text_blocks(screenshot)
+        band = np.ascontiguousarray(screenshot[band_y_min:])
+        offset = Point(0, band_y_min)
+        return [r.with_offset(offset) for r in ocr_backend.detect_text_blocks(band)]
 
     def _save_ocr_debug(self) -> None:
         """Write raw OCR frames to ocr_debug.json for troubleshooting."""
@@ -251,6 +251,7 @@ class QuestMixin(AFKJourneyBase, ABC):
             if nav_match is not None:
                 logging.info("Auto-pathing")
                 self.tap(nav_match, scale=True)
+                # Walking can pause on the way, a settled screen is no signal.
                 sleep(10)
 
         return False
@@ -12,8 +12,11 @@ import logging
 import os
 import re
 import shutil
+import threading
 import time
 import urllib.request
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from difflib import SequenceMatcher, get_close_matches
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -21,8 +24,10 @@ from typing import TYPE_CHECKING
 import cv2
 import numpy as np
 from adb_auto_player.file_loader.settings_loader import SettingsLoader
+from adb_auto_player.models import ConfidenceValue
 from adb_auto_player.models.geometry import Point
 from adb_auto_player.ocr import RapidOCRBackend
+from adb_auto_player.template_matching import DescriptorIndex
 from rapidocr import RapidOCR
 
 if TYPE_CHECKING:
@@ -82,6 +87,14 @@ _NAME_ROI_Y_MAX = 260
 _NAME_ROI_X_MIN = 110
 _NAME_ROI_X_MAX = 950
 
+_BADGE_MATCH_THRESHOLD = ConfidenceValue("97%")
+_MAX_BADGE_EXEMPLARS = 3
+# Badges of e.g. Supreme and Supreme+ only differ by the "+", which barely
+# changes the downsampled descriptor, so a descriptor match is confirmed by
+# comparing the pixels with the learned badge.
+_BADGE_PIXEL_TOLERANCE = 48
+_BADGE_MAX_DIFFERENT_PIXELS = 0.0005
+
 
 class HeroScanner:
     """Encapsulates all hero-scanning logic for AFK Journey.
@@ -102,16 +115,29 @@ class HeroScanner:
         self.canonical_hero_names: list[str] = []
         self.tracker_file: str = ""
         self._offset_hint_logged: bool = False
+        self._global_ascend_available: bool = False
+        self._paragons_unlocked_confirmed: bool = False
+        # Per-thread RapidOCR engine for the pipelined scan worker.
+        self._thread_ocr = threading.local()
+        # Ascension badges read by OCR, keyed "<tier>#<n>", so repeated badges
+        # are identified by a nearest-neighbour lookup instead of OCR.
+        self._ascension_index = DescriptorIndex(downscale=4)
+        self._ascension_badges: dict[str, np.ndarray] = {}
+        self._ascension_badge_keys: dict[str, list[str]] = {}
 
     # ------------------------------------------------------------------
     # Public entry point
     # ------------------------------------------------------------------
 
-    def scan_roster(self, total_heroes: int | None = None) -> None:  # noqa: PLR0912, PLR0915
+    def scan_roster(  # noqa: PLR0915
+        self, total_heroes: int | None = None, pipelined: bool = True
+    ) -> None:
         """Scan the entire hero roster and write results to the backup tracker.
 
         Args:
             total_heroes: Optional scan limit. If None, inferred from settings.
+            pipelined: Read each hero screen in a background worker while
+                already moving on to the next hero.
         """
         if total_heroes is None:
             try:
@@ -191,92 +217,21 @@ class HeroScanner:
             limit = len(self.canonical_hero_names) + 100
             logger.info(f"Adaptive scan limit set to {limit} heroes.")
 
-        heroes_scanned = 0
-        global_ascend_available = False
-        paragons_unlocked_confirmed = False
+        self._global_ascend_available = False
+        self._paragons_unlocked_confirmed = False
 
         first_hero_point = Point(130, 1050)
         self._game.tap(first_hero_point)
         self._game.sleep_navigation()
-        time.sleep(2)
-
-        while heroes_scanned < limit:
-            try:
-                screenshot = self._game.get_screenshot()
-                hero_data = self._process_hero_screen(screenshot)
-
-                if hero_data["name"] in ["Hammie", "Chippy"]:
-                    logger.info(
-                        f"Target hero {hero_data['name']} found. Stopping scan."
-                    )
-                    break
-
-                if hero_data["name"] != "Unknown":
-                    button_status = self._ascend_button_is_present()
-
-                    if button_status is True:
-                        global_ascend_available = True
-                        logger.debug(
-                            f"Ascend button found for {hero_data['name']} "
-                            "- Triggering Deep Scan"
-                        )
-                        deep_asc = self._scan_ascension_from_panel(
-                            hero_data["name"], hero_data["ascension"]
-                        )
-                        if deep_asc != "Unknown":
-                            hero_data["ascension"] = deep_asc
-
-                        if any(
-                            p in hero_data["ascension"]
-                            for p in ["Paragon 1", "Paragon 2", "Paragon 3"]
-                        ):
-                            paragons_unlocked_confirmed = True
-                    elif paragons_unlocked_confirmed:
-                        hero_data["ascension"] = "Paragon 4"
-                        logger.debug(
-                            f"Missing buttons for {hero_data['name']} "
-                            "(Paragons Unlocked) -> Forced Paragon 4"
-                        )
-                    else:
-                        hero_data["ascension"] = "Pending S+/P4"
-                        logger.debug(
-                            f"Missing buttons for {hero_data['name']} "
-                            "-> Forced Pending S+/P4"
-                        )
-
-                    hero_data["ex_weapon"] = self._parse_ex_level(
-                        hero_data["raw_ex"], hero_data["ascension"], hero_data["name"]
-                    )
-
-                    hero_data["currentAscension"] = hero_data["ascension"]
-                    hero_data["currentExWeaponLevel"] = hero_data["ex_weapon"]
-                    self._update_hero_in_json(full_data, hero_data)
+        self._game.wait_until_stable(max_wait=2.0)
 
-                    logger.info(
-                        f"Scan Hero #{heroes_scanned + 1}: {hero_data['name']} | "
-                        f"{hero_data['ascension']} | EX {hero_data['ex_weapon']}"
-                    )
-                else:
-                    logger.warning("!!! IDENTIFICATION FAILED !!! ")
-                    logger.warning(
-                        f"Hero #{heroes_scanned + 1}"
-                        f" - Raw OCR: '{hero_data['raw_name']}'"
-                    )
-
-                heroes_scanned += 1
-
-                next_arrow = Point(1045, 1080)
-                self._game.tap(next_arrow)
-                self._game.sleep_navigation()
-            except Exception as e:
-                logger.error(f"Error during scan at hero #{heroes_scanned + 1}: {e}")
-                next_arrow = Point(1045, 1080)
-                self._game.tap(next_arrow)
-                self._game.sleep_navigation()
-                heroes_scanned += 1
+        if pipelined:
+            heroes_scanned = self._walk_roster_pipelined(full_data, limit)
+        else:
+            heroes_scanned = self._walk_roster_sequential(full_data, limit)
 
         self._game.press_back_button()
-        self.resolve_locked_paragons(full_data, global_ascend_available)
+        self.resolve_locked_paragons(full_data, self._global_ascend_available)
 
         try:
             if template_file.exists():
@@ -295,6 +250,187 @@ class HeroScanner:
         )
         logger.info(f">>> {backup_file} <<<", extra={"no_sanitize": True})
 
+    # ------------------------------------------------------------------
+    # Roster walk
+    # ------------------------------------------------------------------
+
+    def _walk_roster_sequential(self, full_data: dict, limit: int) -> int:
+        """Read every hero screen before moving on to the next hero.
+
+        Returns:
+            Number of heroes processed.
+        """
+        heroes_scanned = 0
+        while heroes_scanned < limit:
+            try:
+                screenshot = self._game.get_screenshot()
+                hero_data = self._process_hero_screen(screenshot)
+
+                if self._is_roster_end(hero_data):
+                    break
+
+                button_status = (
+                    self._ascend_button_is_present()
+                    if hero_data["name"] != "Unknown"
+                    else False
+                )
+                self._record_hero(full_data, hero_data, button_status, heroes_scanned)
+            except Exception as e:
+                logger.error(f"Error during scan at hero #{heroes_scanned + 1}: {e}")
+            heroes_scanned += 1
+            self._tap_next_hero()
+        return heroes_scanned
+
+    def _walk_roster_pipelined(self, full_data: dict, limit: int) -> int:
+        """Move to the next hero as soon as the current screen is captured.
+
+        Captured screens are read by a background worker and the results are
+        recorded in roster order. Only the ascend-button check runs before
+        moving on; when the button is present, the worker result is awaited
+        so the panel deep scan can run while that hero is still on screen.
+
+        Returns:
+            Number of heroes processed.
+        """
+        pending: deque[tuple[int, Future[dict], bool | str]] = deque()
+        captured = 0
+        end_index: int | None = None
+        with ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="HeroScannerOCR",
+            initializer=self._init_worker_ocr,
+        ) as executor:
+            while end_index is None and captured < limit:
+                index = captured
+                captured += 1
+                try:
+                    screenshot = self._game.get_screenshot()
+                    button_status = self._ascend_button_is_present(screenshot)
+                    future = executor.submit(self._process_hero_screen, screenshot)
+                except Exception as e:
+                    logger.error(f"Error during scan at hero #{index + 1}: {e}")
+                    self._tap_next_hero()
+                    continue
+                pending.append((index, future, button_status))
+
+                if button_status is True:
+                    end_index = self._reconcile_pending(full_data, pending, wait=True)
+                    if end_index is None:
+                        self._tap_next_hero()
+                else:
+                    self._tap_next_hero()
+                    end_index = self._reconcile_pending(full_data, pending, wait=False)
+
+            if end_index is None:
+                end_index = self._reconcile_pending(full_data, pending, wait=True)
+            for _, future, _ in pending:
+                future.cancel()
+        return captured if end_index is None else end_index
+
+    def _reconcile_pending(
+        self,
+        full_data: dict,
+        pending: deque[tuple[int, Future[dict], bool | str]],
+        wait: bool,
+    ) -> int | None:
+        """Record worker results in roster order.
+
+        Args:
+            full_data: Tracker data to update.
+            pending: Queue of (index, future, ascend button status), oldest first.
+            wait: Block until every pending result is available. Otherwise stop
+                at the first result that is not ready yet.
+
+        Returns:
+            Index of the end-of-roster hero if it was reached, otherwise None.
+        """
+        while pending and (wait or pending[0][1].done()):
+            index, future, button_status = pending.popleft()
+            try:
+                hero_data = future.result()
+                if self._is_roster_end(hero_data):
+                    return index
+                self._record_hero(full_data, hero_data, button_status, index)
+            except Exception as e:
+                logger.error(f"Error during scan at hero #{index + 1}: {e}")
+        return None
+
+    def _init_worker_ocr(self) -> None:
+        """Give the background OCR worker its own RapidOCR engine."""
+        self._thread_ocr.engine = RapidOCR()
+
+    def _tap_next_hero(self) -> None:
+        self._game.tap(Point(1045, 1080))
+        self._game.sleep_navigation()
+
+    @staticmethod
+    def _is_roster_end(hero_data: dict) -> bool:
+        if hero_data["name"] in ["Hammie", "Chippy"]:
+            logger.info(f"Target hero {hero_data['name']} found. Stopping scan.")
+            return True
+        return False
+
+    def _record_hero(
+        self,
+        full_data: dict,
+        hero_data: dict,
+        button_status: bool | str,
+        index: int,
+    ) -> None:
+        """Resolve ascension/EX for one hero screen and write it to the tracker.
+
+        Args:
+            full_data: Tracker data to update.
+            hero_data: Result of `_process_hero_screen`.
+            button_status: Result of `_ascend_button_is_present` for the screen.
+            index: Zero-based position of the hero in the roster walk.
+        """
+        if hero_data["name"] == "Unknown":
+            logger.warning("!!! IDENTIFICATION FAILED !!! ")
+            logger.warning(f"Hero #{index + 1} - Raw OCR: '{hero_data['raw_name']}'")
+            return
+
+        if button_status is True:
+            self._global_ascend_available = True
+            logger.debug(
+                f"Ascend button found for {hero_data['name']} - Triggering Deep Scan"
+            )
+            deep_asc = self._scan_ascension_from_panel(
+                hero_data["name"], hero_data["ascension"]
+            )
+            if deep_asc != "Unknown":
+                hero_data["ascension"] = deep_asc
+
+            if any(
+                p in hero_data["ascension"]
+                for p in ["Paragon 1", "Paragon 2", "Paragon 3"]
+            ):
+                self._paragons_unlocked_confirmed = True
+        elif self._paragons_unlocked_confirmed:
+            hero_data["ascension"] = "Paragon 4"
+            logger.debug(
+                f"Missing buttons for {hero_data['name']} "
+                "(Paragons Unlocked) -> Forced Paragon 4"
+            )
+        else:
+            hero_data["ascension"] = "Pending S+/P4"
+            logger.debug(
+                f"Missing buttons for {hero_data['name']} -> Forced Pending S+/P4"
+            )
+
+        hero_data["ex_weapon"] = self._parse_ex_level(
+            hero_data["raw_ex"], hero_data["ascension"], hero_data["name"]
+        )
+
+        hero_data["currentAscension"] = hero_data["ascension"]
+        hero_data["currentExWeaponLevel"] = hero_data["ex_weapon"]
+        self._update_hero_in_json(full_data, hero_data)
+
+        logger.info(
+            f"Scan Hero #{index + 1}: {hero_data['name']} | "
+            f"{hero_data['ascension']} | EX {hero_data['ex_weapon']}"
+        )
+
     # ------------------------------------------------------------------
     # Post-scan resolution helpers
     # ------------------------------------------------------------------
@@ -449,15 +585,20 @@ class HeroScanner:
     # Device interaction helpers
     # ------------------------------------------------------------------
 
-    def _ascend_button_is_present(self) -> bool | str:
+    def _ascend_button_is_present(
+        self, screenshot: np.ndarray | None = None
+    ) -> bool | str:
         """Check if 'Ascend', 'Level Cap', or 'Phase' is at the bottom of the screen.
 
+        Args:
+            screenshot: Frame to check. A new screenshot is taken if omitted.
+
         Returns:
             True if Ascend found, False otherwise.
         """
         region_btn_check = (100, 1740, 700, 160)
         x1, y1, w, h = region_btn_check
-        full_ss = self._game.get_screenshot()
+        full_ss = self._game.get_screenshot() if screenshot is None else screenshot
         btn_img = full_ss[y1 : y1 + h, x1 : x1 + w]
         btn_img_scaled = cv2.resize(
             btn_img, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC
@@ -767,10 +908,15 @@ class HeroScanner:
             self._suggest_vertical_offset(screenshot)
 
         asc_img = screenshot[crop_asc[1] : crop_asc[3], crop_asc[0] : crop_asc[2]]
-        asc_img_scaled = cv2.resize(
-            asc_img, None, fx=3, fy=3, interpolation=cv2.INTER_CUBIC
-        )
-        raw_asc = self._ocr_text_rapid(asc_img_scaled)
+        raw_asc = ""
+        ascension = self._lookup_ascension_badge(asc_img)
+        if ascension is None:
+            asc_img_scaled = cv2.resize(
+                asc_img, None, fx=3, fy=3, interpolation=cv2.INTER_CUBIC
+            )
+            raw_asc = self._ocr_text_rapid(asc_img_scaled)
+            ascension = self._match_ascension(raw_asc)
+            self._learn_ascension_badge(asc_img, ascension, raw_asc)
 
         ex_img = screenshot[crop_ex[1] : crop_ex[3], crop_ex[0] : crop_ex[2]]
         ex_img_scaled = cv2.resize(
@@ -790,7 +936,6 @@ class HeroScanner:
 
         raw_ex_combined = f"{raw_ex_a} {raw_ex_b}"
 
-        ascension = self._match_ascension(raw_asc)
         ex = self._parse_ex_level(raw_ex_combined, ascension, name)
         raw_name = " | ".join(raw_names)
 
@@ -803,6 +948,50 @@ class HeroScanner:
             "raw_ex": raw_ex_combined,
         }
 
+    def _lookup_ascension_badge(self, badge: np.ndarray) -> str | None:
+        """Identify an ascension badge from badges already read by OCR this scan.
+
+        The closest learned badge of every tier is compared pixel by pixel, the
+        badge is only identified if exactly one tier matches.
+
+        Returns:
+            The ascension tier, or None if no learned badge is similar enough.
+        """
+        tiers = set()
+        for ascension, keys in self._ascension_badge_keys.items():
+            match = self._ascension_index.identify(badge, keys=keys)
+            if (
+                match is not None
+                and match.confidence >= _BADGE_MATCH_THRESHOLD
+                and _same_badge(badge, self._ascension_badges[match.template])
+            ):
+                tiers.add(ascension)
+        return tiers.pop() if len(tiers) == 1 else None
+
+    def _learn_ascension_badge(
+        self, badge: np.ndarray, ascension: str, raw_text: str
+    ) -> None:
+        """Remember a badge read by OCR so later heroes can skip the OCR call.
+
+        Only badges whose OCR text is exactly a tier are learned, tiers guessed
+        from partial reads could teach the index a wrong badge.
+        """
+        if ascension == "Unknown" or raw_text.strip() != ascension:
+            return
+        keys = self._ascension_badge_keys.setdefault(ascension, [])
+        if len(keys) >= _MAX_BADGE_EXEMPLARS:
+            return
+        known = self._lookup_ascension_badge(badge)
+        if known is not None and known != ascension:
+            logger.debug(
+                f"Not learning badge read as '{ascension}', it matches '{known}'"
+            )
+            return
+        key = f"{ascension}#{len(keys)}"
+        self._ascension_index.add(key, badge)
+        self._ascension_badges[key] = badge.copy()
+        keys.append(key)
+
     def _suggest_vertical_offset(self, screenshot: np.ndarray) -> None:
         """Look for readable text outside the expected hero-name region.
 
@@ -1154,10 +1343,13 @@ class HeroScanner:
         Returns:
             Extracted text string.
         """
-        if self._rapid_ocr is None:
-            self._rapid_ocr = RapidOCR()
+        engine = getattr(self._thread_ocr, "engine", None)
+        if engine is None:
+            if self._rapid_ocr is None:
+                self._rapid_ocr = RapidOCR()
+            engine = self._rapid_ocr
 
-        result = self._rapid_ocr(image)
+        result = engine(image)
         if result:
             if hasattr(result, "txts") and result.txts:
                 return " ".join(str(t) for t in result.txts).strip()  # ty: ignore[not-iterable]
@@ -1210,3 +1402,14 @@ class HeroScanner:
             return resource_dir
         except Exception:
             return Path(__file__).parents[6]
+
+
+def _same_badge(badge: np.ndarray, learned: np.ndarray) -> bool:
+    """Whether a badge shows the same tier as a learned badge of the same crop."""
+    if badge.shape != learned.shape:
+        return False
+    different = cv2.absdiff(badge, learned).reshape(badge.shape[0], badge.shape[1], -1)
+    ratio = np.count_nonzero(different.max(axis=2) > _BADGE_PIXEL_TOLERANCE) / (
+        badge.shape[0] * badge.shape[1]
+    )
+    return ratio <= _BADGE_MAX_DIFFERENT_PIXELS
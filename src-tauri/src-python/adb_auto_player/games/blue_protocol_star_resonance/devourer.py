@@ -78,9 +78,7 @@ class Devourer(BlueProtocolStarResonance):
         sleep(3)
         investigate = self.get_dungeon_start_interact_option()
         while investigate is None:
-            self.keyboard.hold(self.W)
-            sleep(1)
-            self.keyboard.release(self.W)
+            self.keyboard.press(self.W, duration=1)
             sleep(0.1)
             investigate = self.get_dungeon_start_interact_option()
 
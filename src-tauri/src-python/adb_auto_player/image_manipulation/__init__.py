@@ -2,7 +2,9 @@
 
 from .color import Color, ColorFormat
 from .cropping import Cropping
+from .debug_image_writer import DebugImageWriter
 from .io import IO
+from .list_stitcher import ListStitcher, ScrollStep
 from .scaling import Scaling
 
 __all__ = [
@@ -10,5 +12,8 @@ __all__ = [
     "Color",
     "ColorFormat",
     "Cropping",
+    "DebugImageWriter",
+    "ListStitcher",
     "Scaling",
+    "ScrollStep",
 ]
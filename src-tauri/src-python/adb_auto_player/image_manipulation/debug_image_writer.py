@@ -0,0 +1,215 @@
+"""Background writer for debug screenshots.
+
+Encoding a full screenshot as PNG takes tens of milliseconds, which stalls
+the automation thread when debug captures are taken on every scroll frame.
+DebugImageWriter moves encoding and disk IO to a single background thread.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+from adb_auto_player.models.image_manipulation import DebugImageFormat
+
+
+@dataclass(frozen=True)
+class _WriteJob:
+    image: np.ndarray
+    directory: Path
+    name: str
+    image_format: DebugImageFormat
+
+
+class DebugImageWriter:
+    """Singleton that writes debug screenshots on a background thread.
+
+    Images are queued and written in order. When the queue is full new images
+    are dropped instead of blocking the caller. After each write the oldest
+    files in the target directory are deleted until it is within the
+    per-directory quota, so every category rotates independently.
+    """
+
+    _instance = None
+
+    max_queue_size: int = 8
+    image_format: DebugImageFormat = DebugImageFormat.PNG
+    png_compression: int = 1
+    jpeg_quality: int = 90
+    max_files_per_directory: int = 200
+    max_bytes_per_directory: int = 200 * 1024 * 1024
+
+    def __new__(cls):
+        """Create or return the singleton instance of DebugImageWriter.
+
+        Returns:
+            The singleton instance of DebugImageWriter.
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self) -> None:
+        """Initialize DebugImageWriter, the worker thread is started lazily."""
+        if hasattr(self, "_queue"):
+            return
+        self._queue: queue.Queue[_WriteJob] = queue.Queue(self.max_queue_size)
+        self._lock = threading.Lock()
+        self._worker: threading.Thread | None = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        atexit.register(DebugImageWriter.flush)
+
+    @classmethod
+    def save(
+        cls,
+        image: np.ndarray,
+        directory: Path,
+        name: str,
+        image_format: DebugImageFormat | None = None,
+    ) -> bool:
+        """Queue an image to be written to `directory / name + extension`.
+
+        Never blocks and never raises.
+
+        Args:
+            image: Image to save (BGR or grayscale).
+            directory: Target directory, created if missing. It is also the
+                unit the disk quota is enforced on.
+            name: File name without extension.
+            image_format: Encoding, defaults to `DebugImageWriter.image_format`.
+
+        Returns:
+            True if the image was queued, False if it was dropped.
+        """
+        instance = cls()
+        if not isinstance(image, np.ndarray):
+            logging.debug(f"Debug image {name} skipped, not an image")
+            return False
+
+        job = _WriteJob(
+            image=image.copy(),
+            directory=directory,
+            name=name,
+            image_format=image_format or cls.image_format,
+        )
+        instance._ensure_worker()
+        try:
+            instance._queue.put_nowait(job)
+        except queue.Full:
+            instance.dropped += 1
+            logging.debug(f"Debug image queue full, dropped {name}")
+            return False
+        return True
+
+    @classmethod
+    def save_now(
+        cls,
+        image: np.ndarray,
+        directory: Path,
+        name: str,
+        image_format: DebugImageFormat | None = None,
+    ) -> bool:
+        """Write an image synchronously, e.g. right before raising an error.
+
+        Queued images are lost when the process is terminated, e.g. a stopped
+        task, which does not run atexit handlers. Never raises.
+
+        Args:
+            image: Image to save (BGR or grayscale).
+            directory: Target directory, created if missing.
+            name: File name without extension.
+            image_format: Encoding, defaults to `DebugImageWriter.image_format`.
+
+        Returns:
+            True if the image was written.
+        """
+        instance = cls()
+        if not isinstance(image, np.ndarray):
+            logging.debug(f"Debug image {name} skipped, not an image")
+            return False
+
+        job = _WriteJob(
+            image=image,
+            directory=directory,
+            name=name,
+            image_format=image_format or cls.image_format,
+        )
+        try:
+            instance._write(job)
+        except Exception as e:
+            instance.failed += 1
+            logging.warning(f"Could not save debug image {name}: {e}")
+            return False
+        instance.written += 1
+        return True
+
+    @classmethod
+    def flush(cls) -> None:
+        """Block until all queued images are written."""
+        instance = cls()
+        if instance._worker is not None:
+            instance._queue.join()
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(
+                target=self._run, name="DebugImageWriter", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                self._write(job)
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                logging.warning(f"Could not save debug image {job.name}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, job: _WriteJob) -> None:
+        if job.image_format == DebugImageFormat.JPEG:
+            params = [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality]
+        else:
+            params = [cv2.IMWRITE_PNG_COMPRESSION, self.png_compression]
+        success, encoded = cv2.imencode(job.image_format.value, job.image, params)
+        if not success:
+            raise ValueError(f"Failed to encode {job.image_format.value}")
+
+        job.directory.mkdir(parents=True, exist_ok=True)
+        # tofile handles non-ASCII paths unlike cv2.imwrite on Windows.
+        encoded.tofile(job.directory / f"{job.name}{job.image_format.value}")
+        self._enforce_quota(job.directory)
+
+    def _enforce_quota(self, directory: Path) -> None:
+        entries = [entry for entry in os.scandir(directory) if entry.is_file()]
+        total_bytes = sum(entry.stat().st_size for entry in entries)
+        if (
+            len(entries) <= self.max_files_per_directory
+            and total_bytes <= self.max_bytes_per_directory
+        ):
+            return
+
+        entries.sort(key=lambda entry: (entry.stat().st_mtime_ns, entry.name))
+        remaining = len(entries)
+        for entry in entries:
+            if (
+                remaining <= self.max_files_per_directory
+                and total_bytes <= self.max_bytes_per_directory
+            ):
+                break
+            size = entry.stat().st_size
+            Path(entry.path).unlink(missing_ok=True)
+            remaining -= 1
+            total_bytes -= size
@@ -0,0 +1,177 @@
+"""Stitch consecutive frames of a scrolling list into one virtual list."""
+
+from dataclasses import dataclass
+
+import cv2
+import numpy as np
+
+from .color import Color
+
+_MIN_IMAGE_DIMS = 2
+_SIGNATURE_WIDTH = 32
+_MIN_SIGNATURE_STD = 1.0
+
+
+@dataclass(frozen=True)
+class ScrollStep:
+    """Result of adding one frame to a ListStitcher.
+
+    Attributes:
+        shift: Pixels the list content moved up since the previous frame,
+            or None if it could not be estimated (first frame, no overlap).
+        reveal_y_min: Smallest screen Y that holds content not seen before;
+            OCR only needs to look at [reveal_y_min, y_max].
+        is_end_of_list: True when the list did not move after a scroll.
+    """
+
+    shift: int | None
+    reveal_y_min: int
+    is_end_of_list: bool
+
+
+class ListStitcher:
+    """Track the scroll offset of a vertical list across frames.
+
+    Frames are aligned using per-row intensity signatures of the list region,
+    which is cheap and robust to the small rendering differences between
+    frames. Each aligned frame contributes only the newly revealed strip to
+    the stitched image, so callers can OCR the strip instead of the whole
+    list region.
+    """
+
+    def __init__(
+        self,
+        y_min: int,
+        y_max: int,
+        row_margin: int = 200,
+        min_overlap: int = 120,
+        max_mean_diff: float = 12.0,
+    ) -> None:
+        """Initialize the stitcher.
+
+        Args:
+            y_min: Top of the scrolling list region in screen pixels.
+            y_max: Bottom of the scrolling list region in screen pixels.
+            row_margin: Extra pixels above the revealed strip to re-read, so a
+                row cut off by the bottom edge in the previous frame is read
+                in full.
+            min_overlap: Minimum overlapping rows to accept a shift estimate.
+            max_mean_diff: Maximum mean absolute signature difference for a
+                shift estimate to be accepted.
+        """
+        if y_max <= y_min:
+            raise ValueError(f"y_max ({y_max}) must be greater than y_min ({y_min})")
+        self.y_min = y_min
+        self.y_max = y_max
+        self.row_margin = row_margin
+        self.min_overlap = min_overlap
+        self.max_mean_diff = max_mean_diff
+        self.offset = 0
+        self._previous: np.ndarray | None = None
+        self._strips: list[np.ndarray] = []
+
+    def add_frame(self, image: np.ndarray) -> ScrollStep:
+        """Align a new frame with the previous one and record the revealed strip.
+
+        Args:
+            image: Full screenshot (BGR or grayscale).
+
+        Returns:
+            ScrollStep describing the shift and the region that needs OCR.
+        """
+        region = self._list_region(image)
+        if region is None:
+            self._previous = None
+            return ScrollStep(shift=None, reveal_y_min=self.y_min, is_end_of_list=False)
+
+        shift = None
+        if self._previous is not None and self._previous.shape == region.shape:
+            shift = self.estimate_vertical_shift(
+                self._previous,
+                region,
+                min_overlap=self.min_overlap,
+                max_mean_diff=self.max_mean_diff,
+            )
+
+        if shift is None:
+            if self._strips:
+                self.offset += self._strips[-1].shape[0]
+            self._strips.append(region)
+            self._previous = region
+            return ScrollStep(shift=None, reveal_y_min=self.y_min, is_end_of_list=False)
+
+        self._previous = region
+        if shift == 0:
+            return ScrollStep(shift=0, reveal_y_min=self.y_max, is_end_of_list=True)
+
+        self.offset += shift
+        self._strips.append(region[-shift:])
+        return ScrollStep(
+            shift=shift,
+            reveal_y_min=max(self.y_min, self.y_max - shift - self.row_margin),
+            is_end_of_list=False,
+        )
+
+    def to_virtual_y(self, y: int) -> int:
+        """Map a screen Y in the latest frame to a Y in the stitched list."""
+        return self.offset + (y - self.y_min)
+
+    def stitched_image(self) -> np.ndarray | None:
+        """Return the stitched list region, or None if no frame was added."""
+        if not self._strips:
+            return None
+        return np.vstack(self._strips)
+
+    def _list_region(self, image: np.ndarray) -> np.ndarray | None:
+        if not isinstance(image, np.ndarray) or image.ndim < _MIN_IMAGE_DIMS:
+            return None
+        if image.shape[0] < self.y_max:
+            return None
+        return image[self.y_min : self.y_max]
+
+    @staticmethod
+    def row_signatures(image: np.ndarray) -> np.ndarray:
+        """Return a (height, 32) float32 array of horizontally averaged rows."""
+        gray = Color.to_grayscale(image)
+        return cv2.resize(
+            gray, (_SIGNATURE_WIDTH, gray.shape[0]), interpolation=cv2.INTER_AREA
+        ).astype(np.float32)
+
+    @staticmethod
+    def estimate_vertical_shift(
+        previous: np.ndarray,
+        current: np.ndarray,
+        min_overlap: int = 120,
+        max_mean_diff: float = 12.0,
+    ) -> int | None:
+        """Estimate how many pixels the content moved up from previous to current.
+
+        Args:
+            previous: List region of the earlier frame.
+            current: List region of the later frame, same shape as previous.
+            min_overlap: Minimum number of overlapping rows to consider.
+            max_mean_diff: Reject the best match above this mean difference.
+
+        Returns:
+            Shift in pixels (0 if the list did not move), or None if the frames
+            cannot be aligned confidently.
+        """
+        prev_sig = ListStitcher.row_signatures(previous)
+        cur_sig = ListStitcher.row_signatures(current)
+        height = prev_sig.shape[0]
+        if height <= min_overlap or float(prev_sig.std()) < _MIN_SIGNATURE_STD:
+            return None
+
+        best_shift = None
+        best_cost = float("inf")
+        for shift in range(height - min_overlap + 1):
+            cost = float(np.abs(prev_sig[shift:] - cur_sig[: height - shift]).mean())
+            if cost < best_cost:
+                best_cost = cost
+                best_shift = shift
+                if cost == 0.0:
+                    break
+
+        if best_cost > max_mean_diff:
+            return None
+        return best_shift
@@ -8,6 +8,7 @@ from .command_gui_categories import CommandGUICategory
 from .game_gui import GameGUIOptions
 from .log_message import LogLevel, LogMessage
 from .menu_option import MenuOption
+from .profile_state import ProfileState, ProfileStateUpdate
 from .summary import Summary
 
 __all__: list[str] = [
@@ -16,5 +17,7 @@ __all__: list[str] = [
     "LogLevel",
     "LogMessage",
     "MenuOption",
+    "ProfileState",
+    "ProfileStateUpdate",
     "Summary",
 ]
@@ -0,0 +1,21 @@
+"""IPC Profile State."""
+
+from pydantic import BaseModel
+
+from .game_gui import GameGUIOptions
+
+
+class ProfileState(BaseModel):
+    """State of a profile shown in the GUI."""
+
+    game_menu: GameGUIOptions | None
+    device_id: str | None
+    active_task: str | None
+
+
+class ProfileStateUpdate(BaseModel):
+    """Profile state pushed to the GUI, timestamp is in ms."""
+
+    state: ProfileState
+    timestamp: float
+    index: int
@@ -7,9 +7,17 @@ from pathlib import Path
 
 from adb_auto_player.cli import ArgparseHelper
 from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.game import Game
 from adb_auto_player.log import setup_logging
 from adb_auto_player.task_loader import get_game_tasks
-from adb_auto_player.util import DevHelper, Execute
+from adb_auto_player.util import (
+    DevHelper,
+    Execute,
+    MemoryWatch,
+    MetricsLedger,
+    SamplingProfiler,
+    Tracer,
+)
 
 
 @lru_cache
@@ -81,6 +89,12 @@ def main() -> None:
     SettingsLoader.set_app_config_dir(app_config_dir)
     SettingsLoader.set_resource_dir(resource_dir)
 
+    if args.trace:
+        Tracer.enable()
+    SamplingProfiler.enabled = args.profile
+    MemoryWatch.enabled = args.memory_watch
+    Game.record_sessions = args.record
+    MetricsLedger.enabled = True
     e = Execute.find_command_and_execute(args.command, get_game_tasks())
     if isinstance(e, BaseException):
         logging.error(e, exc_info=True)
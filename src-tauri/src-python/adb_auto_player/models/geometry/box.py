@@ -166,3 +166,24 @@ class Box(Coordinates):
             TemplateMatchResult: New Template MatchResult with adjusted box coordinates
         """
         return Box(self.top_left + offset, self.width, self.height)
+
+    def scale(self, scale_factor: float | None) -> "Box":
+        """Return a new Box with position and dimensions scaled.
+
+        Raises:
+            ValueError: If the scale factor is negative.
+        """
+        if scale_factor is None:
+            return self
+
+        if scale_factor < 0:
+            raise ValueError(f"Scale factor must be non-negative, got {scale_factor}")
+
+        if scale_factor == 1.0:
+            return self
+
+        return Box(
+            self.top_left.scale(scale_factor),
+            max(1, round(self.width * scale_factor)),
+            max(1, round(self.height * scale_factor)),
+        )
@@ -3,5 +3,6 @@
 from .crop_regions import CropRegions
 from .crop_result import CropResult
 from .crop_value import CropValue
+from .debug_image_format import DebugImageFormat
 
-__all__ = ["CropRegions", "CropResult", "CropValue"]
+__all__ = ["CropRegions", "CropResult", "CropValue", "DebugImageFormat"]
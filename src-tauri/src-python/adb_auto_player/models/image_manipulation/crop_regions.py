@@ -80,6 +80,26 @@ class CropRegions:
                     f"crops >= 100% of image height"
                 )
 
+    def scale(self, scale_factor: float) -> "CropRegions":
+        """Return crop regions for an image resized by the scale factor.
+
+        Pixel values are scaled, percentages apply to any resolution as is.
+        """
+        if scale_factor == 1.0:
+            return self
+
+        def scaled(value: CropValue) -> int | float:
+            if value.is_pixels:
+                return round(value.pixels * scale_factor)
+            return value.percentage
+
+        return CropRegions(
+            left=scaled(self.left),
+            right=scaled(self.right),
+            top=scaled(self.top),
+            bottom=scaled(self.bottom),
+        )
+
     def __str__(self) -> str:
         """String representation."""
         return (
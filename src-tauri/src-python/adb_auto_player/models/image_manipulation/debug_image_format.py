@@ -0,0 +1,10 @@
+"""Debug Image Format."""
+
+from enum import StrEnum
+
+
+class DebugImageFormat(StrEnum):
+    """Encoding used for debug screenshots."""
+
+    PNG = ".png"
+    JPEG = ".jpg"
@@ -9,6 +9,7 @@ PortInt = Annotated[int, Field(ge=1024, le=65535)]
 FPSInt = Annotated[int, Field(ge=1, le=60)]
 NonNegativeInt = Annotated[int, Field(ge=0)]
 VerticalOffsetInt = Annotated[int, Field(ge=-500, le=500)]
+StreamScaleFloat = Annotated[float, Field(ge=0.25, le=1.0)]
 
 
 class AdvancedSettings(BaseModel):
@@ -21,6 +22,10 @@ class AdvancedSettings(BaseModel):
         True,
         title="Automatically Select Available Device",
     )
+    async_transport: bool = Field(
+        False,
+        title="Share One ADB Connection Thread Between Devices",
+    )
 
 
 class DeviceSettings(BaseModel):
@@ -29,6 +34,11 @@ class DeviceSettings(BaseModel):
     id: str = Field("127.0.0.1:5555", title="Device ID")
     streaming: bool = Field(True, title="Real-time Display Streaming")
     streaming_fps: FPSInt = Field(30, title="Streaming FPS")
+    stream_scale: StreamScaleFloat = Field(1.0, title="Streaming Resolution Scale")
+    frame_broker: bool = Field(
+        False,
+        title="Share Display Stream Between Processes",
+    )
     use_wm_resize: bool = Field(False, title="Resize Display (Phone/Tablet)")
     vertical_offset: VerticalOffsetInt = Field(
         0,
@@ -120,6 +120,14 @@ class AdvancedSettings(BaseModel):
         title="Navigation Delay (Seconds)",
         description="Wait time after a screen transition or navigation action.",
     )
+    wait_for_stable_screen: bool = Field(
+        default=True,
+        title="Wait For Screen To Settle",
+        description=(
+            "Continue as soon as the screen stops changing instead of always "
+            "waiting the full action or navigation delay."
+        ),
+    )
     template_timeout: float = Field(
         default=10.0,
         ge=1.0,
@@ -36,6 +36,21 @@ class TemplateMatchResult(Coordinates):
             box=self.box.with_offset(offset),
         )
 
+    def scale(self, scale_factor: float | None) -> "TemplateMatchResult":
+        """Return a new TemplateMatchResult with the box scaled.
+
+        Used to map a match found in a reduced-resolution screenshot back to
+        device coordinates.
+        """
+        if scale_factor is None or scale_factor == 1.0:
+            return self
+
+        return TemplateMatchResult(
+            template=self.template,
+            confidence=self.confidence,
+            box=self.box.scale(scale_factor),
+        )
+
     @property
     def x(self) -> int:
         """Center x-coordinate."""
@@ -11,6 +11,7 @@ from typing import Any
 import numpy as np
 from adb_auto_player.models import ConfidenceValue
 from adb_auto_player.models.ocr import OCRResult
+from adb_auto_player.util import Instrumentation, RunMetrics
 
 from ._backend import OCRBackend
 
@@ -335,6 +336,9 @@ class QwenVLOCRBackend(OCRBackend):
             crop = cv2.resize(crop, (new_w, new_h), interpolation=cv2.INTER_AREA)
         return Image.fromarray(cv2.cvtColor(crop, cv2.COLOR_BGR2RGB))
 
+    @Instrumentation.measured(
+        RunMetrics.OCR, "QwenVLOCRBackend.extract_activeness_from_screenshot"
+    )
     def extract_activeness_from_screenshot(
         self, screenshot
     ) -> list[tuple[str | None, str | None]] | None:
@@ -398,6 +402,9 @@ class QwenVLOCRBackend(OCRBackend):
             logger.warning(f"Qwen2-VL activeness extraction failed: {e}")
             return None
 
+    @Instrumentation.measured(
+        RunMetrics.OCR, "QwenVLOCRBackend.extract_chest_from_screenshot"
+    )
     def extract_chest_from_screenshot(
         self, screenshot
     ) -> list[tuple[str | None, str | None]] | None:
@@ -460,6 +467,9 @@ class QwenVLOCRBackend(OCRBackend):
             logger.warning(f"Qwen2-VL chest extraction failed: {e}")
             return None
 
+    @Instrumentation.measured(
+        RunMetrics.OCR, "QwenVLOCRBackend.extract_rankings_from_screenshot"
+    )
     def extract_rankings_from_screenshot(
         self, screenshot
     ) -> list[tuple[str | None, str | None, str | None]] | None:
@@ -533,6 +543,7 @@ class QwenVLOCRBackend(OCRBackend):
             logger.debug(f"Qwen2-VL rankings extraction failed: {e}")
             return None
 
+    @Instrumentation.measured(RunMetrics.OCR, "QwenVLOCRBackend.extract_player_name")
     def extract_player_name(self, image: np.ndarray) -> str:
         """Extract the player name from a single member-card row crop.
 
@@ -568,6 +579,7 @@ class QwenVLOCRBackend(OCRBackend):
             logger.warning(f"Qwen2-VL extract_player_name failed: {e}")
             return ""
 
+    @Instrumentation.measured(RunMetrics.OCR, "QwenVLOCRBackend.extract_text")
     def extract_text(self, image: np.ndarray) -> str:
         """Extract text from the given image crop using Qwen2-VL.
 
@@ -600,6 +612,7 @@ class QwenVLOCRBackend(OCRBackend):
             logger.error(f"Qwen2-VL extract_text failed: {e}")
             return ""
 
+    @Instrumentation.measured(RunMetrics.OCR, "QwenVLOCRBackend.detect_text_blocks")
     def detect_text_blocks(
         self,
         image: np.ndarray,
@@ -7,6 +7,7 @@ import numpy as np
 from adb_auto_player.models import ConfidenceValue
 from adb_auto_player.models.geometry import Box, Point
 from adb_auto_player.models.ocr import OCRResult
+from adb_auto_player.util import Instrumentation, RunMetrics
 from rapidocr import EngineType, LangDet, LangRec, ModelType, OCRVersion, RapidOCR
 
 from ._backend import OCRBackend
@@ -59,6 +60,7 @@ class RapidOCRBackend(OCRBackend):
         """Clean up resources."""
         self._engine = None
 
+    @Instrumentation.measured(RunMetrics.OCR, "RapidOCRBackend.extract_text")
     def extract_text(
         self,
         image: np.ndarray,
@@ -90,6 +92,7 @@ class RapidOCRBackend(OCRBackend):
             return " ".join(texts).strip()
         return ""
 
+    @Instrumentation.measured(RunMetrics.OCR, "RapidOCRBackend.detect_text_blocks")
     def detect_text_blocks(
         self,
         image: np.ndarray,
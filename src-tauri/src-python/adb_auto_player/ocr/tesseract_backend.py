@@ -12,6 +12,7 @@ from adb_auto_player.file_loader import SettingsLoader
 from adb_auto_player.models import ConfidenceValue
 from adb_auto_player.models.geometry import Box, Point
 from adb_auto_player.models.ocr import OCRResult
+from adb_auto_player.util import Instrumentation, RunMetrics
 from adb_auto_player.util.runtime import RuntimeInfo
 from pytesseract import pytesseract
 
@@ -131,6 +132,7 @@ class TesseractBackend(OCRBackend):
 
         self.config = config
 
+    @Instrumentation.measured(RunMetrics.OCR, "TesseractBackend.extract_text")
     def extract_text(
         self,
         image: np.ndarray,
@@ -156,6 +158,7 @@ class TesseractBackend(OCRBackend):
 
         return text
 
+    @Instrumentation.measured(RunMetrics.OCR, "TesseractBackend.detect_text")
     def detect_text(
         self,
         image: np.ndarray,
@@ -212,6 +215,7 @@ class TesseractBackend(OCRBackend):
 
         return results
 
+    @Instrumentation.measured(RunMetrics.OCR, "TesseractBackend.detect_text_blocks")
     def detect_text_blocks(
         self,
         image: np.ndarray,
@@ -342,6 +346,7 @@ class TesseractBackend(OCRBackend):
 
         return results
 
+    @Instrumentation.measured(RunMetrics.OCR, "TesseractBackend.detect_text_paragraphs")
     def detect_text_paragraphs(
         self,
         image: np.ndarray,
@@ -365,6 +370,7 @@ class TesseractBackend(OCRBackend):
             level=_GroupingLevel.PARAGRAPH,
         )
 
+    @Instrumentation.measured(RunMetrics.OCR, "TesseractBackend.detect_text_lines")
     def detect_text_lines(
         self,
         image: np.ndarray,
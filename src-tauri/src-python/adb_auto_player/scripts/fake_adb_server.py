@@ -0,0 +1,63 @@
+"""Script to run a fake ADB server with virtual devices for load testing.
+
+Point the ADB host and port in the ADB Settings at the printed address to run
+the app against the virtual devices.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from adb_auto_player.device.fake_adb import FakeAdbServer, Faults, VirtualDevice
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=5038)
+    parser.add_argument("--devices", type=int, default=1)
+    parser.add_argument("--screenshots", type=Path, help="Directory of PNG frames")
+    parser.add_argument("--video", type=Path, help="H264 Annex B recording")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--stall-rate", type=float, default=0.0)
+    parser.add_argument("--bandwidth", type=float, help="Bytes per second")
+    return parser.parse_args()
+
+
+def _main() -> None:
+    args = _parse_args()
+    screenshots = sorted(args.screenshots.glob("*.png")) if args.screenshots else []
+    devices = [
+        VirtualDevice.from_assets(
+            f"emulator-{5554 + index * 2}",
+            screenshots,
+            args.video,
+            faults=Faults(
+                latency=args.latency,
+                jitter=args.jitter,
+                fail_rate=args.fail_rate,
+                drop_rate=args.drop_rate,
+                stall_rate=args.stall_rate,
+                bandwidth=args.bandwidth,
+            ),
+        )
+        for index in range(args.devices)
+    ]
+    with FakeAdbServer(devices, port=args.port) as server:
+        print(f"Fake ADB server on {server.host}:{server.port}, Ctrl+C to stop")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        for device in devices:
+            print(
+                f"{device.serial}: {len(device.services)} services, "
+                f"{len(device.inputs)} inputs"
+            )
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,75 @@
+"""Script to run the micro-benchmarks and compare them against a baseline.
+
+Example:
+    python -m adb_auto_player.scripts.micro_benchmark --save baseline.json
+    python -m adb_auto_player.scripts.micro_benchmark --compare baseline.json
+        --filter TemplateMatcher
+
+Exits with 1 if a benchmark got at least `--threshold` slower than its baseline.
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from adb_auto_player.benchmarks import MicroBenchmark
+from adb_auto_player.benchmarks.micro_benchmark import (
+    DEFAULT_MIN_TIME,
+    DEFAULT_REPEAT,
+    DEFAULT_THRESHOLD,
+)
+from adb_auto_player.file_loader import SettingsLoader
+
+_SRC_PYTHON_DIR = Path(__file__).parents[2]
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--filter", help="Regex selecting benchmarks by name")
+    parser.add_argument("--list", action="store_true", help="List benchmarks")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--save", type=Path, help="Write the results as baseline")
+    parser.add_argument("--compare", type=Path, help="Baseline to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown flagged as regression, 0.25 means 25%%",
+    )
+    return parser.parse_args()
+
+
+def _main() -> None:
+    args = _parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    SettingsLoader.set_resource_dir(_SRC_PYTHON_DIR / "adb_auto_player")
+
+    if args.list:
+        for name in MicroBenchmark.names(args.filter):
+            print(name)
+        return
+
+    results = MicroBenchmark.run(
+        args.filter, repeat=args.repeat, min_time=args.min_time
+    )
+    if args.save:
+        logging.info(f"Baseline saved: {MicroBenchmark.save(results, args.save)}")
+    if not args.compare:
+        return
+
+    comparisons = MicroBenchmark.compare(results, MicroBenchmark.load(args.compare))
+    regressions = [c for c in comparisons if c.is_regression(args.threshold)]
+    logging.info(f"--- Compared with {args.compare} ---")
+    for comparison in comparisons:
+        logging.info(str(comparison))
+    if regressions:
+        logging.error(f"{len(regressions)} benchmarks regressed:")
+        for comparison in regressions:
+            logging.error(str(comparison))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    _main()
@@ -0,0 +1,51 @@
+"""Script to benchmark a game task against a recorded session.
+
+Example:
+    python -m adb_auto_player.scripts.replay_benchmark ArenaMixin run_arena
+        --session recordings/arena --runs 5
+"""
+
+import argparse
+import json
+import logging
+from pathlib import Path
+
+from adb_auto_player import games
+from adb_auto_player.device.replay import ReplayBenchmark, ReplayGraph
+from adb_auto_player.file_loader import SettingsLoader
+
+_SRC_PYTHON_DIR = Path(__file__).parents[2]
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("game", choices=games.__all__)
+    parser.add_argument("task", help="Game method, e.g. push_afk_stages")
+    parser.add_argument("--session", type=Path, required=True)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument(
+        "--app-config-dir", type=Path, default=_SRC_PYTHON_DIR.parent / "Settings"
+    )
+    parser.add_argument("--json", type=Path, help="Write the reports to this file")
+    return parser.parse_args()
+
+
+def _main() -> None:
+    args = _parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    SettingsLoader.set_app_config_dir(args.app_config_dir)
+    SettingsLoader.set_resource_dir(_SRC_PYTHON_DIR / "adb_auto_player")
+
+    benchmark = ReplayBenchmark(
+        getattr(games, args.game)(), ReplayGraph.load(args.session)
+    )
+    reports = [benchmark.run(args.task) for _ in range(args.runs)]
+    if args.json:
+        args.json.write_text(
+            json.dumps([report.to_dict() for report in reports], indent=2),
+            encoding="utf-8",
+        )
+
+
+if __name__ == "__main__":
+    _main()
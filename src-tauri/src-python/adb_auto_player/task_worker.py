@@ -0,0 +1,256 @@
+"""Pre-started task processes so tasks do not wait for imports and ADB setup.
+
+Every task still runs in its own process, a worker runs one task and exits.
+The pool keeps one spare worker per profile that already imported the games
+and set up the ADB client, and waits for its task on a pipe. Its device probe
+fills the persisted probe cache, the task probes again for the current state.
+Logs of the warm up are not forwarded, so they do not show up in the log of the
+task. Stopping a task terminates its worker, the next spare is started
+afterwards.
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+from dataclasses import dataclass
+from logging.handlers import QueueHandler
+from multiprocessing import Pipe, Process, Queue
+from multiprocessing.connection import Connection
+from pathlib import Path
+from time import monotonic, perf_counter
+
+from adb_auto_player.device.adb import AdbController
+from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.game import Game
+from adb_auto_player.task_loader import get_game_tasks
+from adb_auto_player.util import (
+    Execute,
+    MemoryWatch,
+    MetricsLedger,
+    SamplingProfiler,
+    SummaryGenerator,
+)
+
+
+@dataclass(frozen=True)
+class TaskRequest:
+    """Task sent to a worker.
+
+    Attributes:
+        command: Command name, e.g. `AFKJourney.push_afk_stages`.
+        profile: Write a sampling profile of the task.
+        memory_watch: Write a memory report of the task.
+        record: Record the task to an archive that can be replayed.
+    """
+
+    command: str
+    profile: bool = False
+    memory_watch: bool = False
+    record: bool = False
+
+
+class TaskWorker:
+    """A task process warming up in the background until a task is submitted."""
+
+    def __init__(self, app_config_dir: Path, resource_dir: Path) -> None:
+        """Start the process, it warms up until `submit` is called."""
+        self.app_config_dir = app_config_dir
+        self.resource_dir = resource_dir
+        self.log_queue: Queue = Queue()
+        self.summary_queue: Queue = Queue(maxsize=2)
+        self._connection, worker_connection = Pipe()
+        self._started = monotonic()
+        self._warm_up_seconds: float | None = None
+        self.process = Process(
+            target=_worker_main,
+            args=(
+                worker_connection,
+                self.log_queue,
+                self.summary_queue,
+                app_config_dir,
+                resource_dir,
+            ),
+        )
+        self.process.start()
+        worker_connection.close()
+
+    @property
+    def warm_up_seconds(self) -> float:
+        """Startup time already done, the full warm up if the worker is ready."""
+        if self._warm_up_seconds is None and self._connection.poll():
+            try:
+                self._warm_up_seconds = self._connection.recv()
+            except (EOFError, OSError):
+                self._warm_up_seconds = 0.0
+        if self._warm_up_seconds is not None:
+            return self._warm_up_seconds
+        return monotonic() - self._started
+
+    def submit(self, request: TaskRequest) -> None:
+        """Start the task, a worker runs a single task."""
+        self._connection.send(request)
+
+    def is_alive(self) -> bool:
+        """Whether the process is running."""
+        return self.process.is_alive()
+
+    @property
+    def exitcode(self) -> int | None:
+        """Exit code of the process, None while running."""
+        return self.process.exitcode
+
+    def terminate(self) -> None:
+        """Terminate the process and wait for it to exit."""
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self._connection.close()
+
+
+class TaskWorkerPool:
+    """One spare warm `TaskWorker` per profile."""
+
+    def __init__(self) -> None:
+        """Init."""
+        self._spares: dict[int, TaskWorker] = {}
+
+    def acquire(
+        self, profile_index: int, app_config_dir: Path, resource_dir: Path
+    ) -> TaskWorker:
+        """Take the spare worker of the profile, a new one is started if needed.
+
+        The startup time the spare already spent is logged as saved time.
+        """
+        worker = self._spares.pop(profile_index, None)
+        if (
+            worker is None
+            or not worker.is_alive()
+            or worker.app_config_dir != app_config_dir
+            or worker.resource_dir != resource_dir
+        ):
+            if worker is not None:
+                worker.terminate()
+            return TaskWorker(app_config_dir, resource_dir)
+        logging.debug(
+            f"Using warm task worker, saved {worker.warm_up_seconds:.1f}s of startup"
+        )
+        return worker
+
+    def prefork(
+        self, profile_index: int, app_config_dir: Path, resource_dir: Path
+    ) -> None:
+        """Start a spare worker for the profile if it has none."""
+        worker = self._spares.get(profile_index)
+        if worker is not None and worker.is_alive():
+            return
+        self._spares[profile_index] = TaskWorker(app_config_dir, resource_dir)
+
+    def has_spare(self, profile_index: int) -> bool:
+        """Whether the profile has a running spare worker."""
+        worker = self._spares.get(profile_index)
+        return worker is not None and worker.is_alive()
+
+    def recycle(self, profile_index: int | None = None) -> None:
+        """Terminate spare workers, e.g. because settings changed.
+
+        Args:
+            profile_index: Only the spare of this profile, all spares if None.
+        """
+        for index in list(self._spares):
+            if profile_index is None or index == profile_index:
+                self._spares.pop(index).terminate()
+
+
+def _worker_main(
+    connection: Connection,
+    log_queue: Queue,
+    summary_queue: Queue,
+    app_config_dir: Path,
+    resource_dir: Path,
+) -> None:
+    start = perf_counter()
+    _setup_process(summary_queue, app_config_dir, resource_dir)
+    _warm_up()
+    connection.send(perf_counter() - start)
+    # Forked siblings inherit the pipe, so EOF is not reliable when the app exits.
+    parent = multiprocessing.parent_process()
+    while not connection.poll(1.0):
+        if parent is not None and not parent.is_alive():
+            return
+    try:
+        request: TaskRequest = connection.recv()
+    except EOFError:
+        return
+    # Attached after the warm up, the app only shows the log of the task.
+    logging.getLogger().addHandler(QueueHandler(log_queue))
+    run_task(request)
+
+
+def _setup_process(
+    summary_queue: Queue,
+    app_config_dir: Path,
+    resource_dir: Path,
+) -> None:
+    logging.getLogger().setLevel(logging.DEBUG)
+
+    def summary_callback(msg: str | None):
+        # We are catching all exceptions here regardless
+        # because we never want the summary to actually stop the process via error
+        if summary_queue.full():
+            try:
+                summary_queue.get_nowait()
+            except (queue.Empty, Exception):
+                pass
+        try:
+            summary_queue.put_nowait(msg)
+        except (queue.Full, Exception):
+            # queue.Full should really never happen here but leaving as is
+            pass
+
+    SummaryGenerator.set_callback(summary_callback)
+    SettingsLoader.set_app_config_dir(app_config_dir)
+    SettingsLoader.set_resource_dir(resource_dir)
+
+
+def _warm_up() -> None:
+    get_game_tasks()
+    try:
+        AdbController().probe()
+    except Exception as e:
+        # The task reports connection errors itself.
+        logging.debug(f"Task worker could not connect to the device: {e}")
+
+
+def run_task(request: TaskRequest) -> None:
+    """Run the task in the current process and exit with 1 on errors."""
+    SamplingProfiler.enabled = request.profile
+    MemoryWatch.enabled = request.memory_watch
+    Game.record_sessions = request.record
+    MetricsLedger.enabled = True
+    if request.profile or request.memory_watch:
+        # stop_task terminates the process, unwind first so reports are written.
+        signal.signal(signal.SIGTERM, _raise_terminated)
+
+    try:
+        e = Execute.find_command_and_execute(request.command, get_game_tasks())
+        if isinstance(e, BaseException):
+            logging.error(e)
+            sys.exit(1)
+    except _TerminatedError:
+        # Die by SIGTERM so the app sees a stopped task and not a completed one.
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        os.kill(os.getpid(), signal.SIGTERM)
+    except Exception as exc:
+        logging.error(exc)
+        sys.exit(1)
+
+
+class _TerminatedError(BaseException):
+    """Raised on SIGTERM, not an Exception so task error handling ignores it."""
+
+
+def _raise_terminated(*_) -> None:
+    raise _TerminatedError
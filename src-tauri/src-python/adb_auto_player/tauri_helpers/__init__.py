@@ -1,6 +1,13 @@
-from .menu import get_game_gui_options, get_game_metadata
+from .menu import (
+    get_game_gui_options,
+    get_game_gui_options_for_app,
+    get_game_metadata,
+)
+from .profile_state_service import ProfileStateService
 
 __all__ = [
+    "ProfileStateService",
     "get_game_gui_options",
+    "get_game_gui_options_for_app",
     "get_game_metadata",
 ]
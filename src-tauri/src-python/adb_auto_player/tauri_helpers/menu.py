@@ -20,7 +20,22 @@ from adb_auto_player.tauri_context import profile_aware_cache
 
 def get_game_gui_options() -> GameGUIOptions | None:
     """Returns menu json string for a game."""
-    game = get_game_metadata()
+    return _get_game_gui_options_for_game(get_game_metadata())
+
+
+def get_game_gui_options_for_app(package_name: str | None) -> GameGUIOptions | None:
+    """Returns the menu of the game with the package name, None if not a game.
+
+    Does not query the device, used when the running app is already known.
+    """
+    return _get_game_gui_options_for_game(
+        _get_game_metadata_from_package_name(package_name)
+    )
+
+
+def _get_game_gui_options_for_game(
+    game: GameMetadata | None,
+) -> GameGUIOptions | None:
     if game is not None:
         options = _get_game_gui_options()
         return next((opt for opt in options if opt.game_title == game.name), None)
@@ -67,7 +82,9 @@ def _get_game_metadata_from_package_name(
     return None
 
 
+@lru_cache(maxsize=1)
 def _get_games() -> list[Game]:
+    # Game objects are only used for their package name prefixes.
     game_objects = []
     for class_name in games.__all__:
         cls = getattr(games, class_name)
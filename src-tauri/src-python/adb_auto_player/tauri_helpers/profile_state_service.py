@@ -0,0 +1,179 @@
+"""Background service pushing the state of a profile to the GUI.
+
+The GUI used to poll the state, which created a new device connection, ran the
+foreground app query and looked up the game on every poll for every profile.
+The service keeps one connection per profile, checks the foreground app
+periodically and only looks up the game menu when the foreground app changed.
+A state is only published when it changed or a refresh was requested.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from contextvars import copy_context
+from datetime import datetime
+
+from adb_auto_player.device.adb import AdbController
+from adb_auto_player.ipc import GameGUIOptions, ProfileState, ProfileStateUpdate
+
+from .menu import get_game_gui_options_for_app
+
+DEFAULT_INTERVAL = 3.0
+
+_NOT_CHECKED = object()
+
+
+class ProfileStateService:
+    """Watches the device of a profile in a background thread."""
+
+    def __init__(
+        self,
+        profile_index: int,
+        publish: Callable[[ProfileStateUpdate], None],
+        active_task: Callable[[], str | None],
+        on_device_error: Callable[[], None] | None = None,
+        interval: float = DEFAULT_INTERVAL,
+    ) -> None:
+        """Init.
+
+        Args:
+            profile_index: Profile index.
+            publish: Called with every changed state, from the service thread.
+            active_task: Returns the label of the running task of the profile.
+            on_device_error: Called when the device could not be queried, e.g. to
+                clear cached device information.
+            interval: Seconds between foreground app checks.
+        """
+        self.profile_index = profile_index
+        self.interval = interval
+        self._publish = publish
+        self._active_task = active_task
+        self._on_device_error = on_device_error
+        self._controller: AdbController | None = None
+        self._running_app: object = _NOT_CHECKED
+        self._game_menu: GameGUIOptions | None = None
+        self._last_state: ProfileState | None = None
+        self._last_error: str | None = None
+        self._force_publish = True
+        self._reset_requested = False
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start the service thread, publishes the state right away.
+
+        The thread runs in a copy of the current context, so the profile's
+        settings dirs and app handle have to be set by the caller.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=copy_context().run,
+                args=(self._run,),
+                name=f"ProfileStateService-{self.profile_index}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def is_running(self) -> bool:
+        """Whether the service thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def refresh(self) -> None:
+        """Check the device now and publish the state even if it did not change."""
+        with self._lock:
+            self._force_publish = True
+        self._wake.set()
+
+    def reset(self) -> None:
+        """Reconnect and look up the game again, e.g. after settings changed."""
+        with self._lock:
+            self._reset_requested = True
+            self._force_publish = True
+        self._wake.set()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the service thread."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.update()
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def update(self) -> ProfileState:
+        """Query the state and publish it if it changed.
+
+        Runs in the service thread, exposed to update synchronously in tests.
+
+        Returns:
+            ProfileState: Current state.
+        """
+        with self._lock:
+            force_publish = self._force_publish
+            self._force_publish = False
+            if self._reset_requested:
+                self._controller = None
+                self._running_app = _NOT_CHECKED
+                self._reset_requested = False
+
+        active_task = self._active_task()
+        # The task process uses the device, the foreground app is checked after.
+        if active_task is None or self._running_app is _NOT_CHECKED:
+            state = self._query_state(active_task)
+        else:
+            state = ProfileState(
+                game_menu=self._game_menu,
+                device_id=self._controller.d.serial if self._controller else None,
+                active_task=active_task,
+            )
+
+        if force_publish or state != self._last_state:
+            self._last_state = state
+            self._publish(
+                ProfileStateUpdate(
+                    state=state,
+                    # convert to ms for FE
+                    timestamp=int(datetime.now().timestamp() * 1000),
+                    index=self.profile_index,
+                )
+            )
+        return state
+
+    def _query_state(self, active_task: str | None) -> ProfileState:
+        try:
+            if self._controller is None:
+                self._controller = AdbController()
+            running_app = self._controller.get_running_app()
+            if running_app != self._running_app:
+                self._game_menu = get_game_gui_options_for_app(running_app)
+                self._running_app = running_app
+            self._last_error = None
+            return ProfileState(
+                game_menu=self._game_menu,
+                device_id=self._controller.d.serial,
+                active_task=active_task,
+            )
+        except Exception as e:
+            self._controller = None
+            self._running_app = _NOT_CHECKED
+            self._game_menu = None
+            if self._on_device_error is not None:
+                self._on_device_error()
+            # Log once instead of every interval while the device is unavailable.
+            if str(e) != self._last_error:
+                logging.error(e)
+                self._last_error = str(e)
+            return ProfileState(
+                game_menu=None,
+                device_id=None,
+                active_task=active_task,
+            )
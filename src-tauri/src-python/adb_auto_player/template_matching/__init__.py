@@ -1,7 +1,9 @@
 """Template Matching."""
 
+from .descriptor_index import DescriptorIndex
 from .template_matcher import TemplateMatcher
 
 __all__ = [
+    "DescriptorIndex",
     "TemplateMatcher",
 ]
@@ -0,0 +1,239 @@
+"""Nearest-neighbour lookup of small icons using downsampled image descriptors."""
+
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+from adb_auto_player.image_manipulation import IO
+from adb_auto_player.models import ConfidenceValue
+from adb_auto_player.models.geometry import Box, Point
+from adb_auto_player.models.template_matching import TemplateMatchResult
+from numpy.lib.stride_tricks import sliding_window_view
+
+_DEFAULT_DOWNSCALE = 6
+
+
+@dataclass
+class _DescriptorGroup:
+    """Descriptors that share the same downsampled size."""
+
+    keys: list[str]
+    descriptors: np.ndarray
+
+
+class DescriptorIndex:
+    """Index of normalized, downsampled icon descriptors.
+
+    Every icon is shrunk by `downscale` and flattened into a zero-mean,
+    unit-length vector, so the dot product of two descriptors is their
+    normalized cross-correlation at low resolution. Identifying an image is a
+    single matrix product against all indexed icons instead of one
+    `matchTemplate` call per template.
+    """
+
+    def __init__(self, downscale: int = _DEFAULT_DOWNSCALE) -> None:
+        """Create an empty index.
+
+        Args:
+            downscale: Factor by which icons and searched images are shrunk.
+        """
+        if downscale < 1:
+            raise ValueError(f"downscale must be >= 1, got {downscale}")
+        self.downscale = downscale
+        self._descriptors: dict[str, np.ndarray] = {}
+        self._descriptor_sizes: dict[str, tuple[int, int]] = {}
+        self._sizes: dict[str, tuple[int, int]] = {}
+        self._groups: dict[tuple[int, int], _DescriptorGroup] | None = None
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Path,
+        key_prefix: str = "",
+        downscale: int = _DEFAULT_DOWNSCALE,
+    ) -> "DescriptorIndex":
+        """Build an index from every PNG in a template directory.
+
+        Args:
+            directory: Directory containing the icon templates.
+            key_prefix: Prefix for keys, e.g. "heroes/" so keys match the
+                template names used with `wait_for_any_template`.
+            downscale: Factor by which icons and searched images are shrunk.
+
+        Returns:
+            DescriptorIndex keyed by `key_prefix + file name`.
+        """
+        index = cls(downscale=downscale)
+        for path in sorted(directory.glob("*.png")):
+            index.add(f"{key_prefix}{path.name}", IO.load_image(path))
+        logging.debug(f"Built descriptor index with {len(index)} icons: {directory}")
+        return index
+
+    def __len__(self) -> int:
+        """Number of indexed icons."""
+        return len(self._descriptors)
+
+    def __contains__(self, key: object) -> bool:
+        """Whether an icon with this key is indexed."""
+        return key in self._descriptors
+
+    def add(self, key: str, image: np.ndarray) -> None:
+        """Add or replace an icon.
+
+        Args:
+            key: Name returned when this icon is matched.
+            image: Icon image (BGR).
+        """
+        height, width = image.shape[:2]
+        size = self._descriptor_size(width, height)
+        self._descriptors[key] = self._describe(
+            cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+        )
+        self._descriptor_sizes[key] = size
+        self._sizes[key] = (width, height)
+        self._groups = None
+
+    def identify(
+        self, image: np.ndarray, keys: Iterable[str] | None = None
+    ) -> TemplateMatchResult | None:
+        """Return the indexed icon most similar to the whole image.
+
+        Args:
+            image: Image of a single icon, e.g. a fixed slot or badge crop.
+            keys: Only consider these icons. Defaults to all icons.
+
+        Returns:
+            Best match spanning the whole image, or None if nothing matched.
+        """
+        allowed = None if keys is None else set(keys)
+        best_key: str | None = None
+        best_score = -1.0
+        for size, group in self._get_groups().items():
+            descriptor = self._describe(
+                cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+            )
+            scores = group.descriptors @ descriptor
+            for key, score in zip(group.keys, scores, strict=True):
+                if (allowed is None or key in allowed) and score > best_score:
+                    best_key, best_score = key, float(score)
+
+        if best_key is None:
+            return None
+        height, width = image.shape[:2]
+        return TemplateMatchResult(
+            template=best_key,
+            confidence=ConfidenceValue(max(0.0, min(1.0, best_score))),
+            box=Box(Point(0, 0), width, height),
+        )
+
+    def find_all(
+        self,
+        image: np.ndarray,
+        keys: Iterable[str] | None = None,
+        threshold: ConfidenceValue = ConfidenceValue("85%"),
+    ) -> list[TemplateMatchResult]:
+        """Locate indexed icons anywhere in an image.
+
+        Every window of the downsampled image is scored against all icons of the
+        matching size in one matrix product. A hit is only kept if the icon is
+        also the nearest neighbour among all indexed icons for that window.
+
+        Args:
+            image: Image to search.
+            keys: Icons to look for. Defaults to all icons.
+            threshold: Minimum similarity for a hit.
+
+        Returns:
+            Best hit per icon, sorted by confidence (highest first).
+        """
+        wanted = set(self._descriptors) if keys is None else set(keys)
+        height, width = image.shape[:2]
+        small = cv2.resize(
+            image,
+            (max(1, width // self.downscale), max(1, height // self.downscale)),
+            interpolation=cv2.INTER_AREA,
+        )
+
+        candidates: dict[str, tuple[float, int, int]] = {}
+        for (group_w, group_h), group in self._get_groups().items():
+            columns = [i for i, key in enumerate(group.keys) if key in wanted]
+            if not columns or small.shape[0] < group_h or small.shape[1] < group_w:
+                continue
+            window_shape = (group_h, group_w, *small.shape[2:])
+            windows = sliding_window_view(small, window_shape)
+            grid_h, grid_w = windows.shape[:2]
+            flat = windows.reshape(grid_h * grid_w, -1).astype(np.float32)
+            scores = self._normalize_rows(flat) @ group.descriptors[columns].T
+            best_windows = scores.argmax(axis=0)
+            for i, (column, window) in enumerate(
+                zip(columns, best_windows, strict=True)
+            ):
+                score = float(scores[window, i])
+                if score >= threshold.cv2_format:
+                    key = group.keys[column]
+                    grid_y, grid_x = divmod(int(window), grid_w)
+                    candidates[key] = (score, grid_x, grid_y)
+
+        results: list[TemplateMatchResult] = []
+        for key, (score, grid_x, grid_y) in candidates.items():
+            icon_w, icon_h = self._sizes[key]
+            left = min(grid_x * self.downscale, max(0, width - icon_w))
+            top = min(grid_y * self.downscale, max(0, height - icon_h))
+            box = Box(
+                Point(left, top), min(icon_w, width - left), min(icon_h, height - top)
+            )
+            crop = image[
+                box.top : box.top + box.height, box.left : box.left + box.width
+            ]
+            nearest = self.identify(crop)
+            if nearest is None or nearest.template != key:
+                logging.debug(
+                    f"Descriptor hit {key} ({score:.3f}) rejected, nearest icon is "
+                    f"{nearest.template if nearest else None}"
+                )
+                continue
+            results.append(
+                TemplateMatchResult(
+                    template=key,
+                    confidence=ConfidenceValue(min(1.0, score)),
+                    box=box,
+                )
+            )
+        results.sort(key=lambda r: r.confidence.cv2_format, reverse=True)
+        return results
+
+    def _descriptor_size(self, width: int, height: int) -> tuple[int, int]:
+        return (
+            max(1, round(width / self.downscale)),
+            max(1, round(height / self.downscale)),
+        )
+
+    def _get_groups(self) -> dict[tuple[int, int], _DescriptorGroup]:
+        if self._groups is None:
+            keys_by_size: dict[tuple[int, int], list[str]] = {}
+            for key, size in self._descriptor_sizes.items():
+                keys_by_size.setdefault(size, []).append(key)
+            self._groups = {
+                size: _DescriptorGroup(
+                    keys=keys,
+                    descriptors=np.stack([self._descriptors[k] for k in keys]),
+                )
+                for size, keys in keys_by_size.items()
+            }
+        return self._groups
+
+    @staticmethod
+    def _describe(image: np.ndarray) -> np.ndarray:
+        return DescriptorIndex._normalize_rows(image.reshape(1, -1).astype(np.float32))[
+            0
+        ]
+
+    @staticmethod
+    def _normalize_rows(rows: np.ndarray) -> np.ndarray:
+        rows = rows - rows.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(rows, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return rows / norms
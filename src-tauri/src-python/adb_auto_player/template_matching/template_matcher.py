@@ -1,19 +1,24 @@
 """ADB Auto Player Template Matching Module."""
 
 import logging
+from pathlib import Path
 
 import cv2
 import numpy as np
-from adb_auto_player.image_manipulation import Color
+from adb_auto_player.image_manipulation import Color, DebugImageWriter
 from adb_auto_player.models import ConfidenceValue
 from adb_auto_player.models.geometry import Box, Point
 from adb_auto_player.models.template_matching import MatchMode, MatchResult
+from adb_auto_player.util import Instrumentation, RunMetrics
+
+_DEBUG_DIR = Path("debug")
 
 
 class TemplateMatcher:
     """A collection of static methods for template matching operations."""
 
     @staticmethod
+    @Instrumentation.measured(RunMetrics.TEMPLATE_MATCH)
     def similar_image(
         base_image: np.ndarray,
         template_image: np.ndarray,
@@ -43,6 +48,7 @@ class TemplateMatcher:
         return bool(np.max(result) >= threshold.cv2_format)
 
     @staticmethod
+    @Instrumentation.measured(RunMetrics.TEMPLATE_MATCH, "cv2.matchTemplate")
     def _match_template(
         image: cv2.typing.MatLike,
         templ: cv2.typing.MatLike,
@@ -59,11 +65,12 @@ class TemplateMatcher:
                 "CV2 Error detected please send cv2error_base.png and "
                 "cv2error_template.png from the debug dir to Yules for investigation"
             )
-            cv2.imwrite("debug/cv2error_base.png", image)
-            cv2.imwrite("debug/cv2error_template.png", templ)
+            DebugImageWriter.save_now(image, _DEBUG_DIR, "cv2error_base")
+            DebugImageWriter.save_now(templ, _DEBUG_DIR, "cv2error_template")
             raise e
 
     @staticmethod
+    @Instrumentation.measured(RunMetrics.TEMPLATE_MATCH)
     def find_template_match(
         base_image: np.ndarray,
         template_image: np.ndarray,
@@ -137,6 +144,7 @@ class TemplateMatcher:
         )
 
     @staticmethod
+    @Instrumentation.measured(RunMetrics.TEMPLATE_MATCH)
     def find_all_template_matches(
         base_image: np.ndarray,
         template_image: np.ndarray,
@@ -198,6 +206,7 @@ class TemplateMatcher:
             return []
 
     @staticmethod
+    @Instrumentation.measured(RunMetrics.TEMPLATE_MATCH)
     def find_worst_template_match(
         base_image: np.ndarray,
         template_image: np.ndarray,
@@ -279,8 +288,12 @@ def _validate_template_size(base_image: np.ndarray, template_image: np.ndarray)
     template_height, template_width = template_image.shape[:2]
 
     if template_height > base_height or template_width > base_width:
-        cv2.imwrite("debug/validate_template_size_base_image.png", base_image)
-        cv2.imwrite("debug/validate_template_size_template_image.png", template_image)
+        DebugImageWriter.save_now(
+            base_image, _DEBUG_DIR, "validate_template_size_base_image"
+        )
+        DebugImageWriter.save_now(
+            template_image, _DEBUG_DIR, "validate_template_size_template_image"
+        )
         raise ValueError(
             f"Template must be smaller than the base image. "
             f"Base size: ({base_width}, {base_height}), "
@@ -9,20 +9,35 @@ Util modules should aim to not have dependencies on internal packages besides
 
 from .dev_helper import DevHelper
 from .execute import Execute
+from .instrumentation import Instrumentation, Measurement
 from .log_message_factory import LogMessageFactory
+from .memory_watch import MemoryWatch
+from .metrics_ledger import MetricsLedger, TaskRun, TaskTrend
+from .run_metrics import RunMetrics
 from .runtime import RuntimeInfo
+from .sampling_profiler import SamplingProfiler
 from .string_helper import StringHelper
 from .summary_generator import SummaryGenerator
 from .traceback_helper import TracebackHelper
+from .tracer import Tracer
 from .type_helper import TypeHelper
 
 __all__ = [
     "DevHelper",
     "Execute",
+    "Instrumentation",
     "LogMessageFactory",
+    "Measurement",
+    "MemoryWatch",
+    "MetricsLedger",
+    "RunMetrics",
     "RuntimeInfo",
+    "SamplingProfiler",
     "StringHelper",
     "SummaryGenerator",
+    "TaskRun",
+    "TaskTrend",
     "TracebackHelper",
+    "Tracer",
     "TypeHelper",
 ]
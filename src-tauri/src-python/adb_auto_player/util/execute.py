@@ -13,6 +13,7 @@ an instance context or special error processing.
 """
 
 import _thread
+import datetime
 import importlib
 import inspect
 import logging
@@ -21,13 +22,23 @@ import threading
 import time
 import tomllib
 from collections.abc import Callable
+from pathlib import Path
 from typing import Any, cast
 
 from adb_auto_player.exceptions import AutoPlayerError, GenericAdbUnrecoverableError
 from adb_auto_player.file_loader import SettingsLoader
 from adb_auto_player.models.commands import Command
 
+from .memory_watch import MemoryWatch
+from .metrics_ledger import MetricsLedger, TaskRun
+from .run_metrics import RunMetrics
+from .sampling_profiler import SamplingProfiler
 from .summary_generator import SummaryGenerator
+from .tracer import Tracer
+
+_TRACE_DIR = Path("debug") / "traces"
+_PROFILE_DIR = Path("debug") / "profiles"
+_MEMORY_DIR = Path("debug") / "memory"
 
 
 class Execute:
@@ -39,16 +50,70 @@ class Execute:
     ) -> Exception | None:
         """Executes the command.
 
+        While `Tracer` is enabled the spans of the run are exported to debug/traces,
+        while `SamplingProfiler` is enabled sampled stacks to debug/profiles and
+        while `MemoryWatch` is enabled a memory report to debug/memory.
+        While `MetricsLedger` is enabled the run is recorded in the metrics ledger.
+
         Returns:
             Exception: The exception encountered during execution, if any. Specific
                 errors such as missing ADB permissions are logged with helpful messages.
             None: If the action completes successfully without raising any exceptions.
         """
-        return Execute.function(
-            callable_function=command_to_execute.action,
-            instance=instance,
-            kwargs=command_to_execute.kwargs,
-        )
+        started_at = datetime.datetime.now()
+        name = f"{command_to_execute.name}_{started_at:%Y%m%d_%H%M%S}"
+        profiler = SamplingProfiler() if SamplingProfiler.enabled else None
+        memory_watch = MemoryWatch() if MemoryWatch.enabled else None
+        if Tracer.enabled:
+            Tracer.clear()
+        if profiler is not None:
+            profiler.start()
+        if memory_watch is not None:
+            memory_watch.start()
+        error_counter = _ErrorCounter()
+        logging.getLogger().addHandler(error_counter)
+        RunMetrics.reset()
+        start = time.perf_counter()
+        result: Exception | None = None
+        try:
+            with Tracer.span(command_to_execute.name, "task"):
+                result = Execute.function(
+                    callable_function=command_to_execute.action,
+                    instance=instance,
+                    kwargs=command_to_execute.kwargs,
+                )
+                return result
+        finally:
+            logging.getLogger().removeHandler(error_counter)
+            if MetricsLedger.enabled:
+                _record_run(
+                    TaskRun(
+                        task=command_to_execute.name,
+                        device_serial=RunMetrics.device_serial,
+                        started_at=started_at.isoformat(timespec="seconds"),
+                        duration=time.perf_counter() - start,
+                        screenshots=RunMetrics.count(RunMetrics.SCREENSHOT),
+                        screenshot_seconds=RunMetrics.seconds(RunMetrics.SCREENSHOT),
+                        template_matches=RunMetrics.count(RunMetrics.TEMPLATE_MATCH),
+                        template_match_seconds=RunMetrics.seconds(
+                            RunMetrics.TEMPLATE_MATCH
+                        ),
+                        ocr_calls=RunMetrics.count(RunMetrics.OCR),
+                        ocr_seconds=RunMetrics.seconds(RunMetrics.OCR),
+                        errors=error_counter.count + int(result is not None),
+                    )
+                )
+            if memory_watch is not None:
+                memory_watch.stop()
+                report = memory_watch.write(_MEMORY_DIR / f"{name}.txt")
+                logging.info(f"Memory report saved: {report}")
+            if profiler is not None:
+                profiler.stop()
+                profile = profiler.write(_PROFILE_DIR / f"{name}.collapsed")
+                logging.info(f"Profile saved: {profile} ({profiler.samples} samples)")
+            if Tracer.enabled:
+                trace = Tracer.export(_TRACE_DIR / f"{name}.json")
+                logging.info(f"Trace saved: {trace}")
 
     @staticmethod
     def function(  # noqa: PLR0912, PLR0915
@@ -198,6 +263,8 @@ class Execute:
                                 getattr(instance, "stop_stream")
                             ):
                                 instance.stop_stream()
+                            if hasattr(instance, "stop_session_recording"):
+                                cast(Any, instance).stop_session_recording()
                     else:
                         # Function doesn't expect self — call it directly
                         callable_function(**kwargs)
@@ -280,3 +347,20 @@ class Execute:
                     result = Execute.command(cmd, instance=instance)
                     return True if result is None else result
         return False
+
+
+class _ErrorCounter(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__(logging.ERROR)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.count += 1
+
+
+def _record_run(run: TaskRun) -> None:
+    try:
+        ledger = MetricsLedger.in_app_config_dir(SettingsLoader.get_app_config_dir())
+        ledger.record(run)
+    except Exception as e:
+        logging.debug(f"Failed to record task metrics: {e}")
@@ -0,0 +1,125 @@
+"""Time screenshots, template matching and OCR once for every consumer.
+
+A measured call is timed a single time and reported to the `Tracer`, to
+`RunMetrics` and to the observer, e.g. a game recording its session.
+"""
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, ClassVar, ParamSpec, TypeVar
+
+from .run_metrics import RunMetrics
+from .tracer import Tracer
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+@dataclass
+class Measurement:
+    """One measured call.
+
+    Attributes:
+        metric: Run metric, e.g. `RunMetrics.OCR`.
+        name: What was measured, e.g. a template or an OCR method.
+        result: Result of the call, set by the caller inside `measure`.
+        seconds: Duration of the call.
+        details: Extra values the caller attached.
+    """
+
+    metric: str
+    name: str
+    result: Any = None
+    seconds: float = 0.0
+    details: dict[str, Any] = field(default_factory=dict)
+
+
+# Receives every outermost measurement that did not raise.
+MeasurementObserver = Callable[[Measurement], None]
+
+
+class Instrumentation:
+    """Single hook feeding the tracer, the run metrics and the observer.
+
+    Every measurement is traced. Only the outermost measurement of a metric
+    per thread is counted and observed, so an OCR method calling another OCR
+    method counts once.
+    """
+
+    _observer: ClassVar[MeasurementObserver | None] = None
+    _local: ClassVar[threading.local] = threading.local()
+
+    @classmethod
+    def set_observer(cls, observer: MeasurementObserver | None) -> None:
+        """Report every outermost measurement, None to stop."""
+        cls._observer = observer
+
+    @classmethod
+    @contextmanager
+    def measure(cls, metric: str, name: str, **details: Any) -> Iterator[Measurement]:
+        """Context manager measuring its block.
+
+        Args:
+            metric: Run metric the block counts towards.
+            name: Span and decision name.
+            **details: Values passed on to the observer.
+
+        Yields:
+            Measurement: Set `result` on it to report the result.
+        """
+        measurement = Measurement(metric, name, details=details)
+        active: set[str] = cls._local.__dict__.setdefault("active", set())
+        outermost = metric not in active
+        active.add(metric)
+        error: str | None = None
+        start = perf_counter_ns()
+        try:
+            yield measurement
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            duration = perf_counter_ns() - start
+            if outermost:
+                active.discard(metric)
+            if Tracer.enabled:
+                Tracer.add(
+                    name, metric, start, duration, {"error": error} if error else None
+                )
+            if outermost:
+                measurement.seconds = duration / _NS_PER_SECOND
+                RunMetrics.add(metric, measurement.seconds)
+                observer = cls._observer
+                if observer is not None and error is None:
+                    observer(measurement)
+
+    @staticmethod
+    def measured(
+        metric: str, name: str | None = None
+    ) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """Decorator measuring every call, the return value is the result.
+
+        Args:
+            metric: Run metric the calls count towards.
+            name: Span name, defaults to the qualified name of the function.
+        """
+
+        def decorator(func: Callable[P, R]) -> Callable[P, R]:
+            span_name = name or getattr(func, "__qualname__", repr(func))
+
+            @wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                with Instrumentation.measure(metric, span_name) as measurement:
+                    result = func(*args, **kwargs)
+                    measurement.result = result
+                return result
+
+            return wrapper
+
+        return decorator
@@ -0,0 +1,199 @@
+"""Watch memory of long running tasks for growth and its allocation sites."""
+
+import logging
+import threading
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import monotonic
+from typing import ClassVar
+
+import psutil
+
+_MB = 1024 * 1024
+DEFAULT_INTERVAL = 60.0
+DEFAULT_GROWTH_THRESHOLD_MB = 100.0
+# Frames kept per allocation, more frames cost more memory while tracing.
+TRACEBACK_FRAMES = 1
+_IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<unknown>")
+
+
+@dataclass
+class MemorySample:
+    """Memory at one point of the run.
+
+    Attributes:
+        elapsed: Seconds since the watch started.
+        rss: Resident set size of the process in bytes.
+        traced: Bytes allocated by Python and traced by tracemalloc.
+        top_growth: Allocation sites that grew most since the previous sample.
+    """
+
+    elapsed: float
+    rss: int
+    traced: int
+    top_growth: list[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        """Sample as one line."""
+        return (
+            f"{self.elapsed:8.0f}s  RSS {self.rss / _MB:8.1f} MB  "
+            f"traced {self.traced / _MB:8.1f} MB"
+        )
+
+
+class MemoryWatch:
+    """Sample RSS and tracemalloc snapshots in a background thread.
+
+    Every sample diffs the allocation sites against the previous snapshot and
+    logs the largest growth at debug level. A warning is logged every time RSS
+    grew by another `growth_threshold_mb` since the start.
+    """
+
+    # Watch every command run by Execute.command, see `--memory-watch`.
+    enabled: ClassVar[bool] = False
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_INTERVAL,
+        growth_threshold_mb: float = DEFAULT_GROWTH_THRESHOLD_MB,
+        top: int = 10,
+    ) -> None:
+        """Sample every `interval` seconds once started.
+
+        Args:
+            interval: Seconds between samples.
+            growth_threshold_mb: RSS growth in MB per warning.
+            top: Number of allocation sites kept per diff.
+        """
+        self.interval = interval
+        self.growth_threshold = int(growth_threshold_mb * _MB)
+        self.top = top
+        self.samples: list[MemorySample] = []
+        self._process = psutil.Process()
+        self._start = 0.0
+        self._warnings = 0
+        self._first: tracemalloc.Snapshot | None = None
+        self._previous: tracemalloc.Snapshot | None = None
+        self._started_tracing = False
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "MemoryWatch":
+        """Start watching."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Stop watching."""
+        self.stop()
+
+    def start(self) -> None:
+        """Start tracing allocations and sampling."""
+        if self._thread is not None:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEBACK_FRAMES)
+            self._started_tracing = True
+        self._start = monotonic()
+        self.sample()
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="MemoryWatch", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Take a last sample and stop tracing allocations."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.sample()
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def sample(self) -> MemorySample:
+        """Record RSS and allocation growth now."""
+        with self._lock:
+            snapshot = _snapshot()
+            top_growth = _top_growth(snapshot, self._previous, self.top)
+            sample = MemorySample(
+                elapsed=monotonic() - self._start,
+                rss=self._process.memory_info().rss,
+                traced=tracemalloc.get_traced_memory()[0],
+                top_growth=top_growth,
+            )
+            self.samples.append(sample)
+            self._previous = snapshot
+            if self._first is None:
+                self._first = snapshot
+
+        if top_growth:
+            logging.debug(f"Memory: {sample}\n  " + "\n  ".join(top_growth))
+        growth = sample.rss - self.samples[0].rss
+        if growth >= self.growth_threshold * (self._warnings + 1):
+            self._warnings = growth // self.growth_threshold
+            logging.warning(
+                f"Memory grew by {growth / _MB:.0f} MB since the task started, "
+                f"now {sample.rss / _MB:.0f} MB. Largest growth since last check:\n  "
+                + "\n  ".join(top_growth[:3])
+            )
+        return sample
+
+    def report(self) -> str:
+        """RSS over time and the allocation sites that grew most overall."""
+        if not self.samples:
+            return "No memory samples"
+        first, last = self.samples[0], self.samples[-1]
+        lines = [
+            f"RSS {first.rss / _MB:.1f} MB -> {last.rss / _MB:.1f} MB, "
+            f"traced {first.traced / _MB:.1f} MB -> {last.traced / _MB:.1f} MB "
+            f"over {last.elapsed:.0f}s",
+            "",
+            "Samples:",
+            *(f"  {sample}" for sample in self.samples),
+        ]
+        if self._first is not None and self._previous is not None:
+            lines += [
+                "",
+                "Largest growth since start:",
+                *(
+                    f"  {line}"
+                    for line in _top_growth(self._previous, self._first, self.top)
+                ),
+            ]
+        return "\n".join(lines)
+
+    def write(self, path: Path) -> Path:
+        """Write `report` to `path`, parent directories are created."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.report() + "\n", encoding="utf-8")
+        return path
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logging.debug(f"Memory sample failed: {e}")
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, filename) for filename in _IGNORED_FILES]
+    )
+
+
+def _top_growth(
+    snapshot: tracemalloc.Snapshot,
+    previous: tracemalloc.Snapshot | None,
+    top: int,
+) -> list[str]:
+    if previous is None:
+        return []
+    stats = snapshot.compare_to(previous, "lineno")
+    return [str(stat) for stat in stats[:top] if stat.size_diff > 0]
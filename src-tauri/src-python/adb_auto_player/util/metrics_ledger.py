@@ -0,0 +1,238 @@
+"""SQLite ledger of task runs for performance history across runs."""
+
+import sqlite3
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from dataclasses import astuple, dataclass, fields
+from pathlib import Path
+from typing import ClassVar
+
+DEFAULT_WINDOW = 5
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS task_runs (
+    id INTEGER PRIMARY KEY,
+    task TEXT NOT NULL,
+    device_serial TEXT,
+    started_at TEXT NOT NULL,
+    duration REAL NOT NULL,
+    screenshots INTEGER NOT NULL,
+    screenshot_seconds REAL NOT NULL,
+    template_matches INTEGER NOT NULL,
+    template_match_seconds REAL NOT NULL,
+    ocr_calls INTEGER NOT NULL,
+    ocr_seconds REAL NOT NULL,
+    errors INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS task_runs_task ON task_runs (task, started_at);
+"""
+
+
+@dataclass(frozen=True)
+class TaskRun:
+    """Metrics of one command run.
+
+    Attributes:
+        task: Command name, e.g. `LegendTrial`.
+        device_serial: Serial of the controlled device, None if none was used.
+        started_at: ISO 8601 local start time.
+        duration: Seconds the command ran.
+        screenshots: Number of screenshots taken.
+        screenshot_seconds: Total seconds spent taking screenshots.
+        template_matches: Number of template matches.
+        template_match_seconds: Total seconds spent matching templates.
+        ocr_calls: Number of OCR calls.
+        ocr_seconds: Total seconds spent in OCR.
+        errors: Logged errors plus the error the command failed with.
+    """
+
+    task: str
+    device_serial: str | None
+    started_at: str
+    duration: float
+    screenshots: int = 0
+    screenshot_seconds: float = 0.0
+    template_matches: int = 0
+    template_match_seconds: float = 0.0
+    ocr_calls: int = 0
+    ocr_seconds: float = 0.0
+    errors: int = 0
+
+    @property
+    def screenshot_latency(self) -> float:
+        """Average seconds per screenshot."""
+        return _average(self.screenshot_seconds, self.screenshots)
+
+    @property
+    def template_match_latency(self) -> float:
+        """Average seconds per template match."""
+        return _average(self.template_match_seconds, self.template_matches)
+
+    @property
+    def ocr_latency(self) -> float:
+        """Average seconds per OCR call."""
+        return _average(self.ocr_seconds, self.ocr_calls)
+
+
+_COLUMNS = tuple(field.name for field in fields(TaskRun))
+
+
+@dataclass(frozen=True)
+class TaskTrend:
+    """Average duration of the latest runs of a task against the runs before.
+
+    Attributes:
+        task: Command name.
+        recent: Latest runs, newest first.
+        previous: Runs before `recent`, newest first.
+    """
+
+    task: str
+    recent: list[TaskRun]
+    previous: list[TaskRun]
+
+    @property
+    def recent_duration(self) -> float:
+        """Average duration of the latest runs."""
+        return _average(sum(run.duration for run in self.recent), len(self.recent))
+
+    @property
+    def previous_duration(self) -> float:
+        """Average duration of the runs before."""
+        return _average(sum(run.duration for run in self.previous), len(self.previous))
+
+    @property
+    def change(self) -> float:
+        """Relative duration change, 0.3 means 30% slower."""
+        if not self.previous_duration:
+            return 0.0
+        return self.recent_duration / self.previous_duration - 1
+
+    def __str__(self) -> str:
+        """Trend as one line, e.g. `LegendTrial got 30% slower (...)`."""
+        direction = "slower" if self.change >= 0 else "faster"
+        return (
+            f"{self.task} got {abs(self.change):.0%} {direction} "
+            f"({self.previous_duration:.1f}s -> {self.recent_duration:.1f}s "
+            f"average of the last {len(self.recent)} runs)"
+        )
+
+
+class MetricsLedger:
+    """Append task runs to a SQLite database and query their history."""
+
+    # Record every command run by Execute.command, enabled in task processes.
+    enabled: ClassVar[bool] = False
+
+    def __init__(self, path: Path) -> None:
+        """Open the ledger, the database is created on first write."""
+        self.path = path
+
+    @classmethod
+    def in_app_config_dir(cls, app_config_dir: Path) -> "MetricsLedger":
+        """Ledger in data/metrics.sqlite3 of the app config dir."""
+        return cls(app_config_dir / "data" / "metrics.sqlite3")
+
+    def record(self, run: TaskRun) -> None:
+        """Append a run."""
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        with self._connect() as connection:
+            connection.execute(
+                f"INSERT INTO task_runs ({', '.join(_COLUMNS)}) "
+                f"VALUES ({placeholders})",
+                astuple(run),
+            )
+
+    def tasks(self) -> list[str]:
+        """Names of recorded tasks, most recently run first."""
+        if not self.path.exists():
+            return []
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT task FROM task_runs GROUP BY task ORDER BY MAX(id) DESC"
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def runs(self, task: str | None = None, limit: int = 50) -> list[TaskRun]:
+        """Recorded runs, newest first.
+
+        Args:
+            task: Only runs of this task, all tasks if None.
+            limit: Maximum number of runs.
+        """
+        if not self.path.exists():
+            return []
+        query = f"SELECT {', '.join(_COLUMNS)} FROM task_runs"
+        params: tuple = ()
+        if task is not None:
+            query += " WHERE task = ?"
+            params = (task,)
+        query += " ORDER BY id DESC LIMIT ?"
+        with self._connect() as connection:
+            rows = connection.execute(query, (*params, limit)).fetchall()
+        return [TaskRun(*row) for row in rows]
+
+    def trend(self, task: str, window: int = DEFAULT_WINDOW) -> TaskTrend | None:
+        """Latest `window` runs of `task` against the `window` runs before.
+
+        Returns:
+            TaskTrend | None: None if there are no runs to compare against.
+        """
+        runs = self.runs(task, limit=window * 2)
+        if len(runs) <= window:
+            return None
+        return TaskTrend(task=task, recent=runs[:window], previous=runs[window:])
+
+    def regressions(
+        self,
+        threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+        window: int = DEFAULT_WINDOW,
+    ) -> list[TaskTrend]:
+        """Tasks that got at least `threshold` slower, largest slowdown first."""
+        trends = [self.trend(task, window) for task in self.tasks()]
+        return sorted(
+            (t for t in trends if t is not None and t.change >= threshold),
+            key=lambda t: t.change,
+            reverse=True,
+        )
+
+    def summary(self, window: int = DEFAULT_WINDOW) -> str:
+        """Averages of the latest runs per task and detected regressions."""
+        lines = []
+        for task in self.tasks():
+            runs = self.runs(task, limit=window)
+            lines.append(
+                f"{task}: {_mean(runs, 'duration'):.1f}s average of the last "
+                f"{len(runs)} runs, "
+                f"screenshot {_mean_ms(runs, 'screenshot_latency'):.0f} ms, "
+                f"template match {_mean_ms(runs, 'template_match_latency'):.1f} ms, "
+                f"OCR {_mean_ms(runs, 'ocr_latency'):.0f} ms, "
+                f"{sum(run.errors for run in runs)} errors"
+            )
+        if not lines:
+            return "No task runs recorded"
+        regressions = self.regressions(window=window)
+        if regressions:
+            lines += ["", "Regressions:", *(f"  {trend}" for trend in regressions)]
+        return "\n".join(lines)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(sqlite3.connect(self.path, timeout=10)) as connection:
+            connection.executescript(_SCHEMA)
+            with connection:
+                yield connection
+
+
+def _average(total: float, count: int) -> float:
+    return total / count if count else 0.0
+
+
+def _mean(runs: list[TaskRun], attribute: str) -> float:
+    return _average(sum(getattr(run, attribute) for run in runs), len(runs))
+
+
+def _mean_ms(runs: list[TaskRun], attribute: str) -> float:
+    return _mean(runs, attribute) * 1000
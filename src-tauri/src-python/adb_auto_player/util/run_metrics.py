@@ -0,0 +1,45 @@
+"""Call counts and durations of screenshots, template matching and OCR per run."""
+
+import threading
+from collections import Counter
+from typing import ClassVar
+
+
+class RunMetrics:
+    """Process wide counters reset at the start of every command.
+
+    Counted by `Instrumentation.measure`.
+    """
+
+    SCREENSHOT: ClassVar[str] = "screenshot"
+    TEMPLATE_MATCH: ClassVar[str] = "template_match"
+    OCR: ClassVar[str] = "ocr"
+
+    device_serial: ClassVar[str | None] = None
+    _counts: ClassVar[Counter[str]] = Counter()
+    _seconds: ClassVar[Counter[str]] = Counter()
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def reset(cls) -> None:
+        """Discard counters of the previous run."""
+        with cls._lock:
+            cls._counts = Counter()
+            cls._seconds = Counter()
+
+    @classmethod
+    def add(cls, metric: str, seconds: float) -> None:
+        """Count one call of `metric` that took `seconds`."""
+        with cls._lock:
+            cls._counts[metric] += 1
+            cls._seconds[metric] += seconds
+
+    @classmethod
+    def count(cls, metric: str) -> int:
+        """Number of calls of `metric` since the last reset."""
+        return cls._counts[metric]
+
+    @classmethod
+    def seconds(cls, metric: str) -> float:
+        """Total seconds spent in `metric` since the last reset."""
+        return cls._seconds[metric]
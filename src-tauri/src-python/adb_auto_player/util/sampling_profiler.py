@@ -0,0 +1,103 @@
+"""Statistical profiler writing collapsed stacks for flame graphs.
+
+A background thread samples the stacks of all other threads, the profiled code
+is not instrumented. The output is the collapsed stack format, one line per
+distinct stack with its sample count, e.g.
+
+    MainThread;run_task (__main__.py:194);push_afk_stages (afk_stages.py:49) 42
+
+It can be opened with https://www.speedscope.app or turned into an SVG with
+flamegraph.pl.
+"""
+
+import sys
+import threading
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import ClassVar
+
+DEFAULT_INTERVAL = 0.01
+
+
+class SamplingProfiler:
+    """Sample thread stacks at a fixed interval while running."""
+
+    # Profile every command run by Execute.command, see `--profile`.
+    enabled: ClassVar[bool] = False
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        """Sample every `interval` seconds once started."""
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "SamplingProfiler":
+        """Start sampling."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        """Stop sampling."""
+        self.stop()
+
+    def start(self) -> None:
+        """Start the sampling thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="SamplingProfiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread, collected stacks are kept."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def write(self, path: Path) -> Path:
+        """Write the collapsed stacks, most frequent first.
+
+        Args:
+            path: Output file, parent directories are created.
+
+        Returns:
+            Path: The output file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common()),
+            encoding="utf-8",
+        )
+        return path
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                thread = names.get(ident, str(ident))
+                self.stacks[f"{thread};{_collapse(frame)}"] += 1
+            self.samples += 1
+
+
+def _collapse(frame: FrameType | None) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+@lru_cache(maxsize=4096)
+def _label(code: CodeType) -> str:
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
@@ -0,0 +1,174 @@
+"""Span tracing with export to the Chrome trace event format.
+
+Traces open in https://ui.perfetto.dev or chrome://tracing and show how long
+screenshots, template matching, OCR, ADB calls and sleeps took per thread.
+"""
+
+import json
+import os
+import threading
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from functools import wraps
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, ClassVar, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_NS_PER_US = 1000
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ("args", "category", "name", "start")
+
+    def __init__(self, name: str, category: str, args: dict[str, Any]) -> None:
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self) -> "_Span":
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        Tracer.add(self.name, self.category, self.start, end - self.start, self.args)
+
+
+class Tracer:
+    """Record durations of spans while enabled.
+
+    Disabled tracing costs one attribute lookup per span, so spans can stay in
+    hot paths. Events are kept in memory until `export` or `clear`.
+    """
+
+    enabled: ClassVar[bool] = False
+    _events: ClassVar[list[dict[str, Any]]] = []
+    _threads: ClassVar[dict[int, str]] = {}
+    _lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    def enable(cls) -> None:
+        """Start recording spans, previously recorded spans are discarded."""
+        cls.clear()
+        cls.enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """Stop recording spans."""
+        cls.enabled = False
+
+    @classmethod
+    def clear(cls) -> None:
+        """Discard recorded spans."""
+        with cls._lock:
+            cls._events = []
+            cls._threads = {}
+
+    @classmethod
+    def span(cls, name: str, category: str = "", **args: Any) -> AbstractContextManager:
+        """Context manager recording the duration of its block.
+
+        Args:
+            name: Span name, e.g. `screenshot`.
+            category: Span category, e.g. `adb` or `ocr`.
+            **args: JSON-serializable details shown with the span.
+        """
+        if not cls.enabled:
+            return _NULL_SPAN
+        return _Span(name, category, args)
+
+    @staticmethod
+    def trace(
+        name: str | None = None, category: str = ""
+    ) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        """Decorator recording a span per call.
+
+        Args:
+            name: Span name, defaults to the qualified name of the function.
+            category: Span category.
+        """
+
+        def decorator(func: Callable[P, R]) -> Callable[P, R]:
+            span_name = name or getattr(func, "__qualname__", repr(func))
+
+            @wraps(func)
+            def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+                if not Tracer.enabled:
+                    return func(*args, **kwargs)
+                with _Span(span_name, category, {}):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    @classmethod
+    def add(
+        cls,
+        name: str,
+        category: str,
+        start_ns: int,
+        duration_ns: int,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a span measured elsewhere, times from `time.perf_counter_ns`."""
+        thread = threading.current_thread()
+        event: dict[str, Any] = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_ns / _NS_PER_US,
+            "dur": duration_ns / _NS_PER_US,
+            "pid": os.getpid(),
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with cls._lock:
+            cls._events.append(event)
+            if thread.ident is not None:
+                cls._threads.setdefault(thread.ident, thread.name)
+
+    @classmethod
+    def events(cls) -> list[dict[str, Any]]:
+        """Recorded spans in the Chrome trace event format."""
+        with cls._lock:
+            return list(cls._events)
+
+    @classmethod
+    def export(cls, path: Path) -> Path:
+        """Write recorded spans as Chrome trace JSON and discard them.
+
+        Args:
+            path: Trace file, parent directories are created.
+
+        Returns:
+            Path: The trace file.
+        """
+        with cls._lock:
+            events, cls._events = cls._events, []
+            threads, cls._threads = cls._threads, {}
+        pid = os.getpid()
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": tid,
+                "args": {"name": thread_name},
+            }
+            for tid, thread_name in threads.items()
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"traceEvents": metadata + events, "displayTimeUnit": "ms"}),
+            encoding="utf-8",
+        )
+        return path
@@ -0,0 +1,72 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from adb_auto_player.benchmarks import BenchmarkResult, MicroBenchmark
+from adb_auto_player.models.template_matching import MatchMode
+
+
+def _result(name: str, median: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name, median=median, minimum=median, mean=median, stdev=0.0, calls=1
+    )
+
+
+class TestMicroBenchmark(unittest.TestCase):
+    """Test cases for MicroBenchmark."""
+
+    def test_measure_calls_fast_functions_repeatedly(self) -> None:
+        calls = []
+
+        result = MicroBenchmark.measure(
+            "append", lambda: calls.append(1), repeat=3, min_time=0.001
+        )
+
+        self.assertGreater(result.calls, 1)
+        # Warmup, calibration doubling up to `calls` and the two other repeats.
+        self.assertEqual(len(calls), 1 + (2 * result.calls - 1) + 2 * result.calls)
+        self.assertLessEqual(result.minimum, result.median)
+
+    def test_suite_covers_every_match_mode(self) -> None:
+        names = MicroBenchmark.names(r"find_template_match\[")
+
+        for match_mode in MatchMode:
+            self.assertIn(f"TemplateMatcher.find_template_match[{match_mode}]", names)
+
+    def test_run_skips_failing_benchmarks(self) -> None:
+        @MicroBenchmark.register("test.failing")
+        def _failing():
+            raise RuntimeError("engine not installed")
+
+        with self.assertLogs(level="WARNING"):
+            results = MicroBenchmark.run(r"^test\.failing$")
+        MicroBenchmark._setups.pop("test.failing")
+
+        self.assertEqual(results, [])
+
+    def test_run_suite_benchmark(self) -> None:
+        results = MicroBenchmark.run(r"^Cropping\.crop$", repeat=2, min_time=0.001)
+
+        self.assertEqual([result.name for result in results], ["Cropping.crop"])
+        self.assertGreater(results[0].median, 0)
+
+    def test_baseline_roundtrip_and_regressions(self) -> None:
+        baseline = [_result("a", 1.0), _result("b", 1.0)]
+
+        with TemporaryDirectory() as directory:
+            path = MicroBenchmark.save(baseline, Path(directory) / "baseline.json")
+            loaded = MicroBenchmark.load(path)
+        comparisons = MicroBenchmark.compare(
+            [_result("a", 1.3), _result("b", 1.1), _result("c", 5.0)], loaded
+        )
+
+        self.assertEqual(loaded["a"], baseline[0])
+        self.assertEqual([c.name for c in comparisons], ["a", "b"])
+        self.assertEqual(
+            [c.is_regression(threshold=0.25) for c in comparisons], [True, False]
+        )
+        self.assertAlmostEqual(comparisons[0].change, 0.3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""Tests for the asyncio ADB client and its blocking facade."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from adb_auto_player.device.adb import (
+    AdbEventLoop,
+    AsyncAdbClient,
+    AsyncSync,
+    AsyncTransportDevice,
+)
+from adb_auto_player.device.adb.adb_device import AdbDeviceWrapper
+from adb_auto_player.device.fake_adb import FakeAdbServer, VirtualDevice
+from adbutils import AdbClient, AdbError
+
+_SERIAL = "emulator-5554"
+
+
+async def _stream(_argv: list[str]):
+    for index in range(3):
+        yield f"chunk{index}".encode()
+        await asyncio.sleep(0.05)
+    await asyncio.sleep(60)
+
+
+@pytest.fixture
+def server():
+    device = VirtualDevice(_SERIAL, handlers={"stream": _stream})
+    with FakeAdbServer([device]) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server) -> AsyncAdbClient:
+    return AsyncAdbClient("127.0.0.1", server.port)
+
+
+@pytest.fixture
+def device(server, client) -> AsyncTransportDevice:
+    return AsyncTransportDevice(
+        AdbClient("127.0.0.1", server.port), _SERIAL, async_client=client
+    )
+
+
+class TestAsyncAdbClient:
+    def test_host_services(self, client):
+        assert AdbEventLoop.run(client.server_version()) == 41
+        assert AdbEventLoop.run(client.list_devices()) == [(_SERIAL, "device")]
+
+    def test_failure_is_raised_as_adb_error(self, client):
+        with pytest.raises(AdbError, match="not found"):
+            AdbEventLoop.run(client.shell("missing", "echo"))
+
+    def test_concurrent_shells_share_one_loop(self, client):
+        async def many():
+            return await asyncio.gather(
+                *(client.shell(_SERIAL, "sleep 0.2; echo done") for _ in range(50))
+            )
+
+        threads = threading.active_count()
+        start = time.monotonic()
+        outputs = AdbEventLoop.run(many())
+
+        assert outputs == ["done"] * 50
+        assert time.monotonic() - start < 5.0
+        assert threading.active_count() <= threads
+
+    def test_sync_push_and_pull(self, client, server):
+        data = bytes(range(256)) * 700
+        AdbEventLoop.run(client.push(_SERIAL, data, "/sdcard/test.bin"))
+
+        assert server.devices[_SERIAL].files["/sdcard/test.bin"] == data
+        assert AdbEventLoop.run(client.pull(_SERIAL, "/sdcard/test.bin")) == data
+
+
+class TestAsyncTransportDevice:
+    def test_shell_matches_adb_device_contract(self, device):
+        assert device.shell("echo hi") == "hi"
+        assert device.shell(["echo", "a b"], encoding=None) == b"a b\n"
+        assert device.get_state() == "device"
+
+    def test_device_wrapper_runs_on_async_transport(self, device):
+        wrapper = AdbDeviceWrapper(device)
+
+        assert wrapper.shell("echo hi") == "hi"
+        assert wrapper.screenshot().startswith(b"\x89PNG")
+
+    def test_sync_transfers_run_on_the_loop(self, device, server, tmp_path):
+        data = bytes(range(256)) * 700
+        sync = device.sync
+
+        assert isinstance(sync, AsyncSync)
+        assert sync.push(data, "/sdcard/test.bin", check=True) == len(data)
+        assert server.devices[_SERIAL].files["/sdcard/test.bin"] == data
+        assert sync.read_bytes("/sdcard/test.bin") == data
+        assert sync.pull("/sdcard/test.bin", tmp_path / "test.bin") == len(data)
+        assert (tmp_path / "test.bin").read_bytes() == data
+
+    def test_setting_enables_async_transport(self, server):
+        settings = MagicMock()
+        settings.advanced.async_transport = True
+        module = "adb_auto_player.device.adb.adb_device"
+        with (
+            patch(f"{module}.SettingsLoader.adb_settings", return_value=settings),
+            patch(
+                f"{module}.AdbClientHelper.resolve_adb_device",
+                return_value=MagicMock(serial=_SERIAL),
+            ),
+            patch(
+                f"{module}.AdbClientHelper.get_adb_client",
+                return_value=AdbClient("127.0.0.1", server.port),
+            ),
+        ):
+            wrapper = AdbDeviceWrapper.create_from_settings()
+
+        assert isinstance(wrapper.d, AsyncTransportDevice)
+        assert wrapper.shell("echo hi") == "hi"
+
+    def test_stream_read_and_close_unblocks_reader(self, device):
+        connection = device.shell("stream", stream=True)
+        assert connection.read(6) == b"chunk0"
+
+        reads: list[bytes] = []
+        reader = threading.Thread(
+            target=lambda: reads.append(connection.read_until_close(encoding=None))
+        )
+        reader.start()
+        time.sleep(0.2)
+        connection.close()
+        reader.join(timeout=5)
+
+        assert not reader.is_alive()
+        assert reads == [b""]
+
+    def test_socket_view_supports_non_blocking_reads(self, device):
+        with device.shell("cat", stream=True) as connection:
+            sock = connection.conn
+            sock.setblocking(False)
+            with pytest.raises(BlockingIOError):
+                sock.recv(16)
+
+            connection.send(b"ping")
+            sock.settimeout(2)
+            assert sock.recv(16) == b"ping"
+            sock.settimeout(0.1)
+            with pytest.raises(TimeoutError):
+                sock.recv(16)
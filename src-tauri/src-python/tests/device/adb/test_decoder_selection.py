@@ -0,0 +1,129 @@
+"""Tests for benchmark-driven H264 decoder selection."""
+
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+from adb_auto_player.device.adb import (
+    DecoderChoice,
+    DecoderSelector,
+    StreamingNotSupportedError,
+)
+from adb_auto_player.device.adb.decoder_selection import _benchmark, _fingerprint
+from adb_auto_player.file_loader import SettingsLoader
+
+_MODULE = "adb_auto_player.device.adb.decoder_selection"
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    SettingsLoader.set_app_config_dir(tmp_path)
+    DecoderSelector.reset()
+    yield tmp_path
+    DecoderSelector.reset()
+
+
+def _write_ranking(path, ranking, fingerprint=None):
+    path.write_text(
+        json.dumps(
+            {
+                "fingerprint": fingerprint or _fingerprint(),
+                "ranking": [choice.__dict__ for choice in ranking],
+            }
+        )
+    )
+
+
+def test_benchmark_ranks_software_decoders_and_persists(config_dir):
+    with patch(f"{_MODULE}._HARDWARE_DECODERS", []):
+        ranking = DecoderSelector.ranking(wait=True)
+
+    assert ranking
+    assert all(choice.decoder == "h264" for choice in ranking)
+    assert ranking == sorted(ranking, key=lambda choice: choice.score_ms)
+    assert all(
+        choice.ms_per_frame is not None and choice.ms_per_frame > 0
+        for choice in ranking
+    )
+
+    saved = json.loads((config_dir / "decoder_ranking.json").read_text())
+    assert saved["ranking"][0]["thread_count"] == ranking[0].thread_count
+
+
+def test_persisted_ranking_skips_benchmark(config_dir):
+    fast = DecoderChoice("h264", 2, "FRAME", ms_per_frame=1.0)
+    _write_ranking(config_dir / "decoder_ranking.json", [fast])
+
+    with patch(f"{_MODULE}._benchmark") as benchmark:
+        assert DecoderSelector.best(hardware_decoding=True) == fast
+    benchmark.assert_not_called()
+
+
+def test_fingerprint_mismatch_reruns_benchmark(config_dir):
+    stale = DecoderChoice("h264_cuvid", ms_per_frame=0.1)
+    _write_ranking(
+        config_dir / "decoder_ranking.json", [stale], fingerprint={"av": "0.0"}
+    )
+
+    with patch(f"{_MODULE}._HARDWARE_DECODERS", []):
+        assert DecoderSelector.best(hardware_decoding=True).decoder == "h264"
+        assert DecoderSelector.ranking(wait=True)[0].ms_per_frame is not None
+
+
+def test_hardware_decoders_are_skipped_when_disabled(config_dir):
+    hardware = DecoderChoice("h264_cuvid", ms_per_frame=0.5)
+    software = DecoderChoice("h264", 0, "SLICE", ms_per_frame=2.0)
+    _write_ranking(config_dir / "decoder_ranking.json", [hardware, software])
+
+    assert DecoderSelector.best(hardware_decoding=True) == hardware
+    assert DecoderSelector.best(hardware_decoding=False) == software
+
+
+def test_no_working_decoder(config_dir):
+    _write_ranking(config_dir / "decoder_ranking.json", [])
+
+    with pytest.raises(StreamingNotSupportedError):
+        DecoderSelector.best(hardware_decoding=True)
+
+
+def test_without_encoder_falls_back_to_preference_order(config_dir):
+    with (
+        patch(f"{_MODULE}._HARDWARE_DECODERS", []),
+        patch(f"{_MODULE}._create_sample_clip", return_value=None),
+    ):
+        choice = DecoderSelector.best(hardware_decoding=False)
+        ranking = DecoderSelector.ranking(wait=True)
+
+    assert choice.decoder == "h264"
+    assert choice.ms_per_frame is None
+    saved = json.loads((config_dir / "decoder_ranking.json").read_text())
+    assert saved["ranking"] == [choice.__dict__ for choice in ranking]
+
+
+def test_benchmark_does_not_block_stream_start(config_dir):
+    release = threading.Event()
+
+    def slow_benchmark(choice, _sample):
+        release.wait(10)
+        return DecoderChoice(
+            choice.decoder, choice.thread_count, choice.thread_type, ms_per_frame=1.0
+        )
+
+    with (
+        patch(f"{_MODULE}._HARDWARE_DECODERS", []),
+        patch(f"{_MODULE}._benchmark", side_effect=slow_benchmark),
+    ):
+        preferred = DecoderSelector.best(hardware_decoding=False)
+        assert preferred.ms_per_frame is None
+        assert not (config_dir / "decoder_ranking.json").exists()
+
+        release.set()
+        ranking = DecoderSelector.ranking(wait=True)
+
+    assert ranking[0].ms_per_frame == 1.0
+    assert DecoderSelector.best(hardware_decoding=False) == ranking[0]
+
+
+def test_failing_decoder_is_dropped():
+    assert _benchmark(DecoderChoice("h264"), b"not h264") is None
@@ -0,0 +1,120 @@
+"""Tests for concurrent ADB device discovery."""
+
+import socket
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from adb_auto_player.device.adb.adb_scanner import scan_emulator_ports
+from adb_auto_player.device.adb.device_discovery import (
+    discover_devices,
+    first_device,
+    probe_devices,
+)
+
+
+def _connect(delays: dict[str, float], available: set[str], calls: list[str]):
+    def connect(device_id: str):
+        calls.append(device_id)
+        time.sleep(delays.get(device_id, 0))
+        if device_id in available:
+            return MagicMock(serial=device_id)
+        return None
+
+    return connect
+
+
+def test_devices_are_yielded_as_they_are_confirmed():
+    calls: list[str] = []
+    connect = _connect({"slow": 0.3, "fast": 0.0}, {"slow", "fast"}, calls)
+
+    serials = [d.serial for d in discover_devices(connect, ["slow", "fast"])]
+
+    assert serials == ["fast", "slow"]
+
+
+def test_probes_run_concurrently_within_deadline():
+    calls: list[str] = []
+    ids = [f"emulator-{5554 + i * 2}" for i in range(10)]
+    connect = _connect(dict.fromkeys(ids, 0.5), set(), calls)
+
+    start = time.monotonic()
+    assert list(probe_devices(connect, ids)) != []
+    # Sequential probing would take 5 seconds.
+    assert time.monotonic() - start < 2.5
+    assert sorted(calls) == sorted(ids)
+
+
+def test_deadline_abandons_hanging_handshakes():
+    hang = threading.Event()
+    calls: list[str] = []
+    fast = _connect({}, {"ok"}, calls)
+
+    def connect(device_id: str):
+        if device_id == "hanging":
+            hang.wait(5)
+        return fast(device_id)
+
+    start = time.monotonic()
+    results = list(probe_devices(connect, ["hanging", "ok"], deadline=0.2))
+    hang.set()
+
+    assert time.monotonic() - start < 2.5
+    assert [device_id for device_id, _ in results] == ["ok"]
+
+
+def test_first_device_respects_priority_order():
+    calls: list[str] = []
+    connect = _connect({"preferred": 0.2}, {"preferred", "other"}, calls)
+
+    device = first_device(connect, ["missing", "preferred", "other"])
+
+    assert device is not None
+    assert device.serial == "preferred"
+
+
+def test_first_device_after_deadline_uses_confirmed_device():
+    hang = threading.Event()
+    calls: list[str] = []
+    fast = _connect({}, {"other"}, calls)
+
+    def connect(device_id: str):
+        if device_id == "preferred":
+            hang.wait(5)
+        return fast(device_id)
+
+    device = first_device(connect, ["preferred", "other"], deadline=0.2)
+    hang.set()
+
+    assert device is not None
+    assert device.serial == "other"
+
+
+def test_closed_loopback_port_skips_handshake():
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        open_port = server.getsockname()[1]
+        with socket.socket() as closed:
+            closed.bind(("127.0.0.1", 0))
+            closed_port = closed.getsockname()[1]
+
+        calls: list[str] = []
+        ids = [f"127.0.0.1:{open_port}", f"127.0.0.1:{closed_port}"]
+        list(probe_devices(_connect({}, set(), calls), ids))
+
+    assert calls == [f"127.0.0.1:{open_port}"]
+
+
+def test_scan_reports_each_device_before_the_scan_finishes():
+    reported: list[str] = []
+
+    def devices(_deadline):
+        yield "emulator-5554"
+        assert reported == ["emulator-5554"]
+        yield "127.0.0.1:5555"
+
+    with patch("adb_auto_player.device.adb.adb_scanner.iter_emulator_devices", devices):
+        serials = scan_emulator_ports(on_device=reported.append)
+
+    assert serials == reported == ["emulator-5554", "127.0.0.1:5555"]
@@ -0,0 +1,169 @@
+"""Tests for per-device health tracking and the escalation in `adb_retry`."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from adb_auto_player.device.adb import (
+    AdbServerRestartGate,
+    CircuitState,
+    DeviceHealthMonitor,
+)
+from adb_auto_player.device.adb.retry_decorator import adb_retry
+from adb_auto_player.exceptions import GenericAdbUnrecoverableError
+from adbutils import AdbDevice
+
+_MODULE = "adb_auto_player.device.adb.retry_decorator"
+
+
+@pytest.fixture(autouse=True)
+def _reset_monitor():
+    DeviceHealthMonitor.reset()
+    yield
+    DeviceHealthMonitor.reset()
+
+
+def _device(serial: str = "127.0.0.1:5555") -> MagicMock:
+    device = MagicMock(spec=AdbDevice)
+    device.serial = serial
+    return device
+
+
+class _Wrapper:
+    def __init__(self, side_effect):
+        self.d = _device()
+        self.call = MagicMock(side_effect=side_effect)
+
+    @adb_retry
+    def run(self):
+        return self.call()
+
+
+class TestDeviceHealthMonitor:
+    def test_latency_and_error_rate(self):
+        DeviceHealthMonitor.record_success("a", 0.010)
+        DeviceHealthMonitor.record_failure("a")
+
+        stats = DeviceHealthMonitor.snapshot()["a"]
+        assert stats["calls"] == 2
+        assert stats["errors"] == 1
+        assert stats["error_rate"] == 0.5
+        assert stats["latency_ms"] == pytest.approx(10.0)
+
+    def test_recovery_time_is_measured(self):
+        DeviceHealthMonitor.record_failure("a")
+        DeviceHealthMonitor.record_success("a", 0.01)
+
+        health = DeviceHealthMonitor.get("a")
+        assert health.recoveries == 1
+        assert health.last_recovery_seconds is not None
+        assert health.consecutive_failures == 0
+
+    def test_trip_backs_off_exponentially(self):
+        assert DeviceHealthMonitor.trip("a") == 2.0
+        assert DeviceHealthMonitor.trip("a") == 4.0
+        assert DeviceHealthMonitor.get("a").state == CircuitState.OPEN
+        assert DeviceHealthMonitor.get("b").state == CircuitState.CLOSED
+
+    def test_success_closes_circuit(self):
+        DeviceHealthMonitor.record_failure("a")
+        DeviceHealthMonitor.trip("a")
+        DeviceHealthMonitor.record_success("a", 0.01)
+
+        health = DeviceHealthMonitor.get("a")
+        assert health.state == CircuitState.CLOSED
+        assert health.backoff_seconds == 0.0
+
+    def test_wait_if_open_moves_to_half_open(self):
+        DeviceHealthMonitor.trip("a")
+        with patch("adb_auto_player.device.adb.device_health.time.sleep") as sleep:
+            DeviceHealthMonitor.wait_if_open("a")
+        sleep.assert_called_once()
+        assert DeviceHealthMonitor.get("a").state == CircuitState.HALF_OPEN
+
+
+class TestAdbServerRestartGate:
+    def test_only_one_restart_within_cooldown(self, tmp_path):
+        first = AdbServerRestartGate(5037, directory=tmp_path)
+        second = AdbServerRestartGate(5037, directory=tmp_path)
+
+        assert first.try_acquire("a")
+        assert not second.try_acquire("b")
+        first.release()
+        assert not second.try_acquire("b")
+
+    def test_cooldown_expired(self, tmp_path):
+        gate = AdbServerRestartGate(5037, directory=tmp_path)
+        assert gate.try_acquire("a")
+        gate.release()
+
+        with patch.object(AdbServerRestartGate, "cooldown_seconds", 0.0):
+            assert gate.try_acquire("a")
+
+    def test_ports_are_independent(self, tmp_path):
+        assert AdbServerRestartGate(5037, directory=tmp_path).try_acquire("a")
+        assert AdbServerRestartGate(5038, directory=tmp_path).try_acquire("a")
+
+
+@patch(f"{_MODULE}.time.sleep")
+class TestAdbRetry:
+    def test_success_records_latency(self, _sleep):
+        wrapper = _Wrapper(side_effect=["ok"])
+        assert wrapper.run() == "ok"
+        assert DeviceHealthMonitor.get("127.0.0.1:5555").calls == 1
+
+    def test_transport_reconnect_without_server_restart(self, _sleep):
+        wrapper = _Wrapper(side_effect=[OSError(), OSError(), "ok"])
+        new_device = _device()
+        with (
+            patch(f"{_MODULE}.AdbClientHelper") as helper,
+            patch(f"{_MODULE}._restart_adb_server") as restart,
+        ):
+            helper.get_adb_device.return_value = new_device
+            assert wrapper.run() == "ok"
+
+        helper.get_adb_client.return_value.disconnect.assert_called_once_with(
+            "127.0.0.1:5555"
+        )
+        restart.assert_not_called()
+        assert wrapper.d is new_device
+        health = DeviceHealthMonitor.get("127.0.0.1:5555")
+        assert health.transport_reconnects == 1
+        assert health.server_restarts == 0
+        assert health.recoveries == 1
+
+    def test_server_restart_requires_gate(self, _sleep):
+        wrapper = _Wrapper(side_effect=OSError())
+        with (
+            patch(f"{_MODULE}.AdbClientHelper") as helper,
+            patch(f"{_MODULE}._restart_adb_server") as restart,
+            patch(f"{_MODULE}.AdbServerRestartGate") as gate,
+        ):
+            helper.get_adb_device.return_value = _device()
+            gate.return_value.try_acquire.return_value = False
+            with pytest.raises(GenericAdbUnrecoverableError):
+                wrapper.run()
+
+        restart.assert_not_called()
+        assert wrapper.call.call_count == 6
+        assert DeviceHealthMonitor.get("127.0.0.1:5555").state == CircuitState.OPEN
+
+    def test_server_restart_when_granted(self, _sleep):
+        wrapper = _Wrapper(side_effect=[OSError()] * 4 + ["ok"])
+        with (
+            patch(f"{_MODULE}.AdbClientHelper") as helper,
+            patch(f"{_MODULE}._restart_adb_server") as restart,
+            patch(f"{_MODULE}.AdbServerRestartGate") as gate,
+        ):
+            helper.get_adb_device.return_value = _device()
+            gate.return_value.try_acquire.return_value = True
+            assert wrapper.run() == "ok"
+
+        restart.assert_called_once()
+        gate.return_value.release.assert_called_once()
+        assert DeviceHealthMonitor.get("127.0.0.1:5555").server_restarts == 1
+
+    def test_unrecoverable_error_is_not_retried(self, _sleep):
+        wrapper = _Wrapper(side_effect=GenericAdbUnrecoverableError("denied"))
+        with pytest.raises(GenericAdbUnrecoverableError):
+            wrapper.run()
+        assert wrapper.call.call_count == 1
@@ -0,0 +1,137 @@
+"""Tests for `DeviceProbe` and its use in `AdbController`."""
+
+import json
+from typing import Any
+
+import pytest
+from adb_auto_player.device.adb import AdbController, DeviceProbe
+from adb_auto_player.device.adb.device_probe import _MARKER
+from adb_auto_player.exceptions import GenericAdbUnrecoverableError
+from adb_auto_player.models.device import Orientation
+
+_OUTPUTS = {
+    "getprop": "[ro.product.model]: [Android SDK Build]\n[ro.build.type]: [user]",
+    "getevent": 'add device 1: /dev/input/event2\n  name: "BlueStacks Virtual Touch"',
+    "build_fingerprint": "google/sdk/x86:9/PSR1/1:user/release-keys",
+    "input_devices": 'N: Name="BlueStacks Virtual Touch"\nH: Handlers=event2',
+    "wm_size": "Physical size: 1080x1920",
+    "surface_orientation": "SurfaceOrientation: 0",
+    "current_rotation": "mCurrentRotation=ROTATION_0",
+    "display_orientation": "orientation=0",
+    "display_viewports": "mViewports=[DisplayViewport{displayId=0, "
+    "uniqueId='local:1'}]",
+}
+
+
+class _FakeDevice:
+    """Answers probe scripts from `outputs`, recording the probed sections."""
+
+    def __init__(self, outputs: dict[str, str], serial: str = "emulator-5554"):
+        self.outputs = outputs
+        self.serial = serial
+        self.scripts: list[list[str]] = []
+        self.commands: list[str] = []
+
+    def shell(self, cmdargs, **_):
+        if _MARKER not in cmdargs:
+            self.commands.append(cmdargs)
+            return ""
+        names = [
+            part.split(_MARKER)[1].rstrip("'")
+            for part in cmdargs.split("; ")
+            if _MARKER in part
+        ]
+        self.scripts.append(names)
+        return "\n".join(
+            f"{_MARKER}{name}\n{self.outputs.get(name, '')}" for name in names
+        )
+
+
+def _device(outputs: dict[str, str]) -> Any:
+    """A `_FakeDevice` standing in for an `AdbDeviceWrapper`."""
+    return _FakeDevice(outputs)
+
+
+@pytest.fixture(autouse=True)
+def _clear_probes():
+    DeviceProbe.clear()
+    yield
+    DeviceProbe.clear()
+
+
+def test_first_probe_queries_everything_in_one_round_trip(tmp_path):
+    device = _device(_OUTPUTS)
+
+    probe = DeviceProbe.run(device, tmp_path)
+
+    assert probe.round_trips == 1
+    assert not probe.from_cache
+    assert set(device.scripts[0]) == set(_OUTPUTS)
+    assert probe.section("getprop") == _OUTPUTS["getprop"]
+    assert probe.take("wm_size") == _OUTPUTS["wm_size"]
+    assert probe.take("wm_size") is None
+    saved = json.loads((tmp_path / "emulator-5554.json").read_text())
+    assert set(saved["sections"]) == {"getprop", "getevent"}
+
+
+def test_persisted_sections_are_reused_while_fingerprint_matches(tmp_path):
+    DeviceProbe.run(_device(_OUTPUTS), tmp_path)
+    device = _device(_OUTPUTS | {"getprop": "changed"})
+
+    probe = DeviceProbe.run(device, tmp_path)
+
+    assert probe.from_cache
+    assert probe.round_trips == 1
+    assert "getprop" not in device.scripts[0]
+    assert probe.section("getprop") == _OUTPUTS["getprop"]
+    assert probe.section("input_devices") == _OUTPUTS["input_devices"]
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        {"build_fingerprint": "google/sdk/x86:10/QSR1/2:user/release-keys"},
+        {"wm_size": "Physical size: 1440x2560"},
+    ],
+)
+def test_fingerprint_change_probes_again(tmp_path, changed):
+    DeviceProbe.run(_device(_OUTPUTS), tmp_path)
+    device = _device(_OUTPUTS | changed | {"getprop": "new"})
+
+    probe = DeviceProbe.run(device, tmp_path)
+
+    assert not probe.from_cache
+    assert probe.round_trips == 2
+    assert probe.section("getprop") == "new"
+    assert DeviceProbe.run(device, tmp_path).from_cache
+
+
+def test_failed_probe_is_not_persisted(tmp_path):
+    probe = DeviceProbe.run(_device({}), tmp_path)
+
+    assert probe.fingerprint == ""
+    assert not list(tmp_path.iterdir())
+
+
+def test_controller_uses_probe_instead_of_single_commands(tmp_path):
+    device = _device(_OUTPUTS)
+    controller = AdbController(device)
+    DeviceProbe.run(device, tmp_path)
+
+    display_info = controller.get_display_info()
+
+    assert display_info.resolution.width == 1080
+    assert display_info.orientation == Orientation.PORTRAIT
+    assert controller.is_controlling_emulator
+    assert controller.get_input_device("BlueStacks Virtual Touch") == (
+        "/dev/input/event2"
+    )
+    assert controller._resolve_display_ids(["com.example"]) == (None, None)
+    assert device.commands == []
+
+    # Volatile sections are only used once.
+    controller.get_display_info.cache_clear()
+    device.outputs = {}
+    with pytest.raises(GenericAdbUnrecoverableError):
+        controller.get_display_info()
+    assert device.commands == ["wm size"]
@@ -0,0 +1,139 @@
+"""Tests for `EventStreamWriter` and the input devices built on it."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from adb_auto_player.device.adb import (
+    ATTranslatedSet2Keyboard,
+    EventStreamWriter,
+    Gesture,
+    XiaomiJoystick,
+)
+from adb_auto_player.device.adb.event_stream_writer import EV_ABS, EV_KEY
+
+DEVICE_FILE = "/dev/input/event3"
+
+
+def _writer() -> tuple[EventStreamWriter, MagicMock, MagicMock]:
+    device = MagicMock()
+    connection = MagicMock()
+    connection.conn.recv.side_effect = BlockingIOError
+    device.shell_unsafe.return_value = connection
+    return EventStreamWriter(device, DEVICE_FILE), device, connection
+
+
+def _sent_lines(connection: MagicMock) -> list[str]:
+    return [c.args[0].decode() for c in connection.send.call_args_list]
+
+
+class TestGesture:
+    def test_builder(self):
+        gesture = Gesture().key(30, down=True).syn().pause(0.5).key(30, down=False)
+        assert gesture.duration == 0.5
+        assert len(gesture.steps) == 4
+
+    def test_segments(self):
+        gesture = Gesture().abs(0, 1).syn().pause(0.2).pause(0.3).abs(0, 0).syn()
+        segments = gesture.segments()
+        assert [offset for offset, _ in segments] == [0.0, 0.5]
+        assert [len(events) for _, events in segments] == [2, 2]
+
+    def test_zero_pause_is_dropped(self):
+        assert Gesture().pause(0).steps == []
+
+
+class TestEventStreamWriter:
+    def test_gesture_is_one_write_on_persistent_shell(self):
+        writer, device, connection = _writer()
+        writer.play(Gesture().abs(0, 5).syn().pause(0.25).abs(0, 0).syn(), wait=False)
+        writer.play(Gesture().key(30, down=True).syn(), wait=False)
+
+        device.shell_unsafe.assert_called_once_with("sh", stream=True)
+        first, second = _sent_lines(connection)
+        assert first == (
+            f"sendevent {DEVICE_FILE} {EV_ABS} 0 5; sendevent {DEVICE_FILE} 0 0 0; "
+            f"sleep 0.250; sendevent {DEVICE_FILE} {EV_ABS} 0 0; "
+            f"sendevent {DEVICE_FILE} 0 0 0\n"
+        )
+        assert second.startswith(f"sendevent {DEVICE_FILE} {EV_KEY} 30 1")
+
+    def test_wait_reads_until_marker(self):
+        writer, _, connection = _writer()
+        sock = connection.conn
+        recv_calls = iter([BlockingIOError, b"__aap_", b"0__\n"])
+
+        def recv(_size):
+            value = next(recv_calls)
+            if value is BlockingIOError:
+                raise value
+            return value
+
+        sock.recv.side_effect = recv
+        writer.play(Gesture().syn(), wait=True)
+
+        assert _sent_lines(connection)[0].endswith("; echo __aap_0__\n")
+
+    def test_falls_back_to_one_shot_shell(self):
+        writer, device, _ = _writer()
+        device.shell_unsafe.side_effect = OSError("closed")
+        writer.play(Gesture().syn(), wait=False)
+
+        device.shell.assert_called_once()
+        assert device.shell.call_args.args[0] == f"sendevent {DEVICE_FILE} 0 0 0"
+
+    def test_send_failure_is_not_repeated(self):
+        writer, device, connection = _writer()
+        connection.conn.settimeout = MagicMock()
+        connection.conn.recv.side_effect = [BlockingIOError, TimeoutError]
+        writer.play(Gesture().syn(), wait=True)
+
+        assert connection.send.call_count == 1
+        device.shell.assert_not_called()
+
+    def test_realtime_schedules_segments(self):
+        writer, _, connection = _writer()
+        with patch(
+            "adb_auto_player.device.adb.event_stream_writer._sleep_until"
+        ) as sleep_until:
+            writer.play(
+                Gesture().abs(0, 1).syn().pause(0.5).abs(0, 0).syn(),
+                wait=False,
+                realtime=True,
+            )
+
+        assert connection.send.call_count == 2
+        first, second = (c.args[0] for c in sleep_until.call_args_list)
+        assert second - first == pytest.approx(0.5)
+        assert "sleep" not in "".join(_sent_lines(connection))
+
+
+class TestInputDevicesUseWriter:
+    @staticmethod
+    def _device(device_cls):
+        device = device_cls()
+        device._input_device = DEVICE_FILE
+        device._event_writer = MagicMock()
+        return device, device._event_writer
+
+    def test_keyboard_press_is_single_gesture(self):
+        keyboard, writer = self._device(ATTranslatedSet2Keyboard)
+        keyboard.press(30, duration=0.2)
+
+        (gesture,) = (c.args[0] for c in writer.play.call_args_list)
+        assert gesture.duration == pytest.approx(0.2)
+        assert writer.play.call_args.kwargs["wait"] is True
+
+    def test_joystick_timed_move_is_single_gesture(self):
+        joystick, writer = self._device(XiaomiJoystick)
+        joystick.left_stick.up(duration=0.3)
+
+        writer.play.assert_called_once()
+        gesture = writer.play.call_args.args[0]
+        assert gesture.duration == pytest.approx(0.3)
+        assert gesture.steps[-1].ev_type == 0
+
+    def test_joystick_hold_does_not_block(self):
+        joystick, writer = self._device(XiaomiJoystick)
+        joystick.left_stick.hold_left()
+
+        assert writer.play.call_args.kwargs["wait"] is False
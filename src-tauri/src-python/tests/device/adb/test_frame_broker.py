@@ -0,0 +1,168 @@
+"""Tests for the shared-memory frame ring and `FrameBroker`."""
+
+import json
+import os
+import uuid
+from multiprocessing import shared_memory
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+from adb_auto_player.device.adb import FrameBroker, SharedFrameRing
+from adb_auto_player.device.adb.frame_broker import _publish_frames
+
+_MODULE = "adb_auto_player.device.adb.frame_broker"
+_DEAD_PID = 2**22 + 1
+
+
+def _name() -> str:
+    return f"aap_test_{uuid.uuid4().hex[:8]}"
+
+
+def _frame(value: int, height: int = 4, width: int = 6) -> np.ndarray:
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image[..., 0] = value
+    return image
+
+
+@pytest.fixture
+def ring():
+    ring = SharedFrameRing.create(_name(), slot_count=3, slot_capacity=4 * 6 * 3)
+    yield ring
+    ring.close()
+
+
+class TestSharedFrameRing:
+    def test_reader_sees_latest_frame(self, ring):
+        reader = SharedFrameRing.attach(ring.name)
+        assert reader.latest() is None
+
+        ring.write(_frame(1))
+        ring.write(_frame(2))
+        frame = reader.latest()
+
+        assert frame is not None
+        assert frame.frame_id == 2
+        np.testing.assert_array_equal(frame.image, _frame(2))
+        assert reader.last_read_ns > 0
+        reader.close()
+
+    def test_conversion_is_written_into_slot(self, ring):
+        ring.write(_frame(7), cv2.COLOR_RGB2BGR)
+        image = ring.latest().image
+        assert image[0, 0].tolist() == [0, 0, 7]
+
+    def test_zero_copy_frame_is_invalidated_when_slot_is_reused(self, ring):
+        ring.write(_frame(1))
+        frame = ring.latest(copy=False)
+        assert not frame.image.flags.writeable
+        assert ring.is_valid(frame)
+
+        for value in range(2, 5):
+            ring.write(_frame(value))
+        assert not ring.is_valid(frame)
+        del frame
+
+    def test_grayscale_and_smaller_frames_fit(self, ring):
+        ring.write(np.full((2, 3), 9, dtype=np.uint8))
+        assert ring.latest().image.shape == (2, 3)
+
+    def test_rejects_oversized_frames(self, ring):
+        with pytest.raises(ValueError, match="exceeds slot capacity"):
+            ring.write(_frame(1, height=8))
+
+    def test_attach_rejects_foreign_shared_memory(self):
+        shm = shared_memory.SharedMemory(name=_name(), create=True, size=128)
+        try:
+            with pytest.raises(ValueError, match="not a frame ring"):
+                SharedFrameRing.attach(shm.name)
+        finally:
+            shm.close()
+            shm.unlink()
+
+
+class TestFrameBroker:
+    @staticmethod
+    def _publish(broker: FrameBroker, ring: SharedFrameRing) -> None:
+        broker.info_path.parent.mkdir(parents=True, exist_ok=True)
+        broker.info_path.write_text(
+            json.dumps({"pid": os.getpid(), "shm_name": ring.name})
+        )
+
+    def test_attach_without_broker(self, tmp_path):
+        broker = FrameBroker("emulator-5554", directory=tmp_path)
+        assert not broker.is_running()
+        assert broker.attach() is None
+
+    def test_attach_ignores_dead_broker(self, tmp_path, ring):
+        broker = FrameBroker("emulator-5554", directory=tmp_path)
+        broker.info_path.write_text(
+            json.dumps({"pid": _DEAD_PID, "shm_name": ring.name})
+        )
+        assert broker.attach() is None
+
+    def test_reader_follows_replaced_ring(self, tmp_path, ring):
+        broker = FrameBroker("emulator-5554", directory=tmp_path)
+        self._publish(broker, ring)
+        reader = broker.attach()
+        assert reader is not None
+        ring.write(_frame(1))
+        image = reader.get_latest_frame()
+        assert image is not None
+        assert image[0, 0, 0] == 1
+
+        bigger = SharedFrameRing.create(_name(), 3, 8 * 6 * 3)
+        bigger.write(_frame(2, height=8))
+        self._publish(broker, bigger)
+        ring.mark_closed()
+
+        image = reader.get_latest_frame()
+        assert image is not None
+        assert image.shape == (8, 6, 3)
+        reader.close()
+        bigger.close()
+
+    def test_start_replaces_stale_info(self, tmp_path):
+        broker = FrameBroker("emulator-5554", directory=tmp_path)
+        broker.info_path.write_text(json.dumps({"pid": _DEAD_PID, "shm_name": "x"}))
+        process = MagicMock(pid=os.getpid())
+
+        with (
+            patch(f"{_MODULE}.multiprocessing.Process", return_value=process),
+            patch(f"{_MODULE}.SettingsLoader"),
+        ):
+            assert broker.start()
+
+        process.start.assert_called_once()
+        assert json.loads(broker.info_path.read_text()) == {
+            "pid": os.getpid(),
+            "shm_name": None,
+        }
+        assert broker.start()
+        process.start.assert_called_once()
+
+
+class TestPublishFrames:
+    def test_publishes_new_frames_until_idle(self, tmp_path):
+        frames = iter([_frame(1), None, _frame(2, height=8)])
+        stream = MagicMock()
+        stream.get_latest_frame.side_effect = lambda: next(frames, None)
+        info_path = tmp_path / "broker.json"
+        names = []
+
+        original_write = SharedFrameRing.write
+
+        def write(ring, image, conversion=None):
+            names.append(ring.name)
+            return original_write(ring, image, conversion)
+
+        with patch.object(SharedFrameRing, "write", write):
+            _publish_frames(stream, info_path, _name(), 2, idle_timeout=0.05)
+
+        # The bigger frame needed a new ring.
+        assert len(names) == 2
+        assert names[0] != names[1]
+        assert json.loads(info_path.read_text())["shm_name"] == names[1]
+        with pytest.raises(FileNotFoundError):
+            SharedFrameRing.attach(names[1])
@@ -0,0 +1,118 @@
+"""Tests for `ScreenrecordSegmentManager` with recorded H264 segments."""
+
+import io
+import threading
+import time
+
+import av
+import numpy as np
+import pytest
+from adb_auto_player.device.adb import ScreenrecordSegmentManager
+from av.video.codeccontext import VideoCodecContext
+
+_SEGMENT_SECONDS = 0.3
+_SPAWN_SECONDS = 0.1
+
+
+def _record_segment(value: int, frame_count: int = 6) -> bytes:
+    """Encode a short H264 elementary stream like `screenrecord` produces."""
+    output = io.BytesIO()
+    container = av.open(output, "w", format="h264")
+    stream = container.add_stream("h264", rate=20)
+    stream.width = 64
+    stream.height = 48
+    stream.pix_fmt = "yuv420p"
+    # MediaCodec encoders emit frames without reordering delay.
+    stream.options = {"tune": "zerolatency"}
+    rng = np.random.default_rng(value)
+    for _ in range(frame_count):
+        # Noise keeps the frame sizes similar, so frames arrive evenly spaced.
+        image = (value + rng.integers(0, 8, (48, 64, 3))).astype(np.uint8)
+        frame = av.VideoFrame.from_ndarray(image, format="rgb24")
+        for packet in stream.encode(frame.reformat(format="yuv420p")):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+    return output.getvalue()
+
+
+class _TimedConnection:
+    """Releases a recorded segment over `duration` seconds, then ends."""
+
+    def __init__(self, data: bytes, duration: float) -> None:
+        self.data = data
+        self.duration = duration
+        self.opened_at = time.monotonic()
+        self.position = 0
+        self.closed = False
+
+    def read(self, size: int) -> bytes:
+        while not self.closed:
+            elapsed = time.monotonic() - self.opened_at
+            available = int(len(self.data) * min(1.0, elapsed / self.duration))
+            if self.position < available:
+                chunk = self.data[self.position : min(available, self.position + size)]
+                self.position += len(chunk)
+                return chunk
+            if elapsed >= self.duration:
+                return b""
+            time.sleep(0.005)
+        return b""
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture(scope="module")
+def segments() -> list[bytes]:
+    return [_record_segment(value) for value in (40, 120, 200, 40, 120, 200)]
+
+
+def _run(segments: list[bytes], lead_seconds: float):
+    recorded = iter(segments)
+    frames: list[int] = []
+    running = threading.Event()
+    running.set()
+
+    def open_segment():
+        data = next(recorded, None)
+        if data is None:
+            running.clear()
+            raise OSError("no more segments")
+        time.sleep(_SPAWN_SECONDS)
+        return _TimedConnection(data, _SEGMENT_SECONDS)
+
+    manager = ScreenrecordSegmentManager(
+        open_segment=open_segment,
+        create_codec=lambda: VideoCodecContext.create("h264", "r"),
+        on_frame=lambda image: frames.append(int(image.mean()) // 80),
+        is_running=running.is_set,
+    )
+    manager.segment_seconds = _SEGMENT_SECONDS
+    manager.lead_seconds = lead_seconds
+    thread = threading.Thread(target=manager.run, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+    manager.stop()
+    return manager.stats(), frames
+
+
+def test_handoff_to_pre_spawned_segment_is_seamless(segments):
+    stats, frames = _run(segments[:4], lead_seconds=0.25)
+
+    assert stats.handoffs >= 2
+    assert stats.seamless_handoffs >= 2
+    assert stats.segments_started == 4
+    # Segments overlap, but frames are only published from one at a time.
+    runs = [v for i, v in enumerate(frames) if i == 0 or frames[i - 1] != v]
+    assert runs == [0, 1, 2, 0]
+
+
+def test_sequential_restarts_leave_gaps(segments):
+    stats, frames = _run(segments[:3], lead_seconds=0.0)
+
+    assert frames
+    assert stats.seamless_handoffs == 0
+    assert stats.gaps >= 1
+    assert stats.max_gap_ms >= _SPAWN_SECONDS * 1000 * 0.5
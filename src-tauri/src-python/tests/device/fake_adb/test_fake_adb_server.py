@@ -0,0 +1,252 @@
+"""Tests driving the real ADB client stack against `FakeAdbServer`."""
+
+import asyncio
+import time
+from functools import partial
+from pathlib import Path
+
+import pytest
+from adb_auto_player.device.adb import (
+    AdbController,
+    AdbEventLoop,
+    AsyncAdbClient,
+    DeviceHealthMonitor,
+    DeviceProbe,
+    DeviceStream,
+)
+from adb_auto_player.device.adb.adb_client import _connect_to_device
+from adb_auto_player.device.adb.adb_device import AdbDeviceWrapper
+from adb_auto_player.device.adb.device_discovery import discover_devices
+from adb_auto_player.device.fake_adb import (
+    FakeAdbServer,
+    Fault,
+    Faults,
+    VirtualDevice,
+)
+from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.models.device import Orientation
+from adbutils import AdbClient, AdbError
+
+_DATA_DIR = Path(__file__).parents[2] / "data"
+_SCREENSHOTS = [
+    _DATA_DIR / "records_formation_1.png",
+    _DATA_DIR / "records_formation_2.png",
+]
+
+
+@pytest.fixture
+def server():
+    with FakeAdbServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(server) -> AdbClient:
+    return AdbClient("127.0.0.1", server.port)
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    DeviceProbe.clear()
+    DeviceHealthMonitor.reset()
+    yield
+    DeviceProbe.clear()
+    DeviceHealthMonitor.reset()
+
+
+def _wrapper(client: AdbClient, serial: str) -> AdbDeviceWrapper:
+    return AdbDeviceWrapper(client.device(serial))
+
+
+class TestHostProtocol:
+    def test_devices_connect_and_disconnect(self, server, client):
+        server.add_device(VirtualDevice("emulator-5554"))
+        server.add_device(VirtualDevice("127.0.0.1:5555", listed=False))
+
+        assert client.server_version() == 41
+        assert [d.serial for d in client.list()] == ["emulator-5554"]
+        assert client.connect("127.0.0.1:5555") == "connected to 127.0.0.1:5555"
+        assert client.connect("127.0.0.1:5555").startswith("already connected")
+        assert "cannot connect" in client.connect("127.0.0.1:5557")
+        assert len(client.list(extended=True)) == 2
+
+        client.disconnect("127.0.0.1:5555")
+        with pytest.raises(AdbError, match="not found"):
+            client.device("127.0.0.1:5555").get_state()
+
+    def test_sync_push_pull_and_list(self, server, client):
+        device = server.add_device(VirtualDevice("emulator-5554"))
+        d = client.device("emulator-5554")
+
+        d.sync.push(b"x" * 200_000, "/sdcard/data.bin")
+
+        assert device.files["/sdcard/data.bin"] == b"x" * 200_000
+        assert d.sync.read_bytes("/sdcard/data.bin") == b"x" * 200_000
+        assert [f.path for f in d.sync.list("/sdcard")] == ["data.bin"]
+        assert d.shell("cat /sdcard/data.bin")[:3] == "xxx"
+
+
+class TestVirtualDevice:
+    def test_controller_reads_display_and_running_app(self, server, client):
+        server.add_device(
+            VirtualDevice("emulator-5554", width=720, height=1280, rotation=1)
+        )
+        controller = AdbController(_wrapper(client, "emulator-5554"))
+
+        display_info = controller.get_display_info()
+        controller.d.shell(["monkey", "-p", "com.example", "1"])
+
+        assert display_info.resolution.width == 720
+        assert display_info.orientation == Orientation.LANDSCAPE
+        assert controller.get_running_app() == "com.example"
+        assert not controller.is_controlling_emulator
+
+    def test_probe_script_is_answered_in_one_round_trip(self, server, client, tmp_path):
+        device = server.add_device(VirtualDevice("emulator-5554"))
+
+        probe = DeviceProbe.run(_wrapper(client, "emulator-5554"), tmp_path)
+
+        assert probe.round_trips == 1
+        assert len(device.services) == 1
+        assert probe.take("wm_size") == "Physical size: 1080x1920"
+        input_devices = probe.section("input_devices")
+        assert input_devices is not None
+        assert input_devices.startswith("I: Bus=0000")
+        current_rotation = probe.take("current_rotation")
+        assert current_rotation is not None
+        assert "ROTATION_0" in current_rotation
+
+    def test_screencap_replays_png_assets(self, server, client):
+        server.add_device(VirtualDevice.from_assets("emulator-5554", _SCREENSHOTS))
+        wrapper = _wrapper(client, "emulator-5554")
+
+        screenshots = [wrapper.screenshot() for _ in range(3)]
+
+        assert screenshots[0] == _SCREENSHOTS[0].read_bytes()
+        assert screenshots[1] == _SCREENSHOTS[1].read_bytes()
+        assert screenshots[2] == screenshots[0]
+
+    def test_input_is_logged(self, server, client):
+        device = server.add_device(VirtualDevice("emulator-5554"))
+        wrapper = _wrapper(client, "emulator-5554")
+
+        wrapper.tap("10", "20")
+        wrapper.keyevent("KEYCODE_BACK", display_id="2")
+        wrapper.swipe("1", "2", "3", "4", "200")
+
+        assert [(r.action, r.args, r.display_id) for r in device.inputs] == [
+            ("tap", ("10", "20"), None),
+            ("keyevent", ("KEYCODE_BACK",), "2"),
+            ("swipe", ("1", "2", "3", "4", "200"), None),
+        ]
+        assert device.inputs[2].timestamp - device.inputs[1].timestamp < 1.0
+
+    def test_interactive_shell_runs_event_scripts(self, server, client):
+        device = server.add_device(VirtualDevice("emulator-5554"))
+
+        with client.device("emulator-5554").shell("sh", stream=True) as connection:
+            connection.send(b"sendevent /dev/input/event1 3 53 100; echo __m__\n")
+            assert connection.read(len("__m__\n")) == b"__m__\n"
+
+        assert device.inputs[0].args == ("/dev/input/event1", "3", "53", "100")
+
+    def test_device_stream_decodes_replayed_recording(self, server, client):
+        SettingsLoader.set_app_config_dir(Path(__file__).parents[4] / "Settings")
+        server.add_device(
+            VirtualDevice.from_assets("emulator-5554", _SCREENSHOTS, video_fps=10)
+        )
+        stream = DeviceStream(AdbController(_wrapper(client, "emulator-5554")))
+
+        stream.start()
+        try:
+            end = time.monotonic() + 10
+            while stream.get_latest_frame() is None and time.monotonic() < end:
+                time.sleep(0.05)
+            frame = stream.get_latest_frame()
+        finally:
+            stream.stop()
+
+        assert frame is not None
+        assert frame.shape[2] == 3
+
+
+class TestLatencyAndFaults:
+    def test_latency_is_added_to_every_service(self, server, client):
+        server.add_device(VirtualDevice("emulator-5554", faults=Faults(latency=0.2)))
+        d = client.device("emulator-5554")
+
+        start = time.monotonic()
+        d.shell("echo hi")
+
+        assert time.monotonic() - start >= 0.2
+
+    def test_scheduled_faults_fail_the_next_requests(self, server, client):
+        device = server.add_device(VirtualDevice("emulator-5554"))
+        d = client.device("emulator-5554")
+        device.faults.schedule(Fault.FAIL)
+        device.faults.schedule(Fault.DROP)
+
+        with pytest.raises(AdbError, match="offline"):
+            d.shell("echo hi")
+        with pytest.raises(AdbError):
+            d.shell("echo hi")
+        assert d.shell("echo hi") == "hi"
+
+    def test_retry_recovers_from_a_dropped_connection(self, server, client):
+        device = server.add_device(VirtualDevice("emulator-5554"))
+        device.faults.schedule(Fault.DROP)
+
+        assert _wrapper(client, "emulator-5554").shell("echo hi") == "hi"
+        assert DeviceHealthMonitor.get("emulator-5554").errors == 1
+
+    def test_bandwidth_limits_transfers(self, server, client):
+        server.add_device(
+            VirtualDevice.from_assets(
+                "emulator-5554", _SCREENSHOTS[:1], faults=Faults(bandwidth=200_000)
+            )
+        )
+        size = len(_SCREENSHOTS[0].read_bytes())
+
+        start = time.monotonic()
+        _wrapper(client, "emulator-5554").screenshot()
+
+        assert time.monotonic() - start >= size / 200_000
+
+
+class TestLoad:
+    def test_dozens_of_devices_are_served_concurrently(self, server):
+        for index in range(40):
+            server.add_device(
+                VirtualDevice(
+                    f"emulator-{5554 + index * 2}", faults=Faults(latency=0.2)
+                )
+            )
+        async_client = AsyncAdbClient("127.0.0.1", server.port)
+
+        async def shell_everywhere():
+            return await asyncio.gather(
+                *(async_client.shell(serial, "wm size") for serial in server.devices)
+            )
+
+        start = time.monotonic()
+        outputs = AdbEventLoop.run(shell_everywhere())
+
+        assert outputs == ["Physical size: 1080x1920"] * 40
+        assert time.monotonic() - start < 5.0
+
+    def test_discovery_abandons_stalled_devices_at_the_deadline(self, server, client):
+        for index in range(30):
+            device = server.add_device(
+                VirtualDevice(f"192.168.56.{index}:5555", listed=False)
+            )
+            if index % 10 == 0:
+                device.faults.stall_rate = 1.0
+        device_ids = [*server.devices, "192.168.56.99:5555"]
+
+        start = time.monotonic()
+        found = list(
+            discover_devices(partial(_connect_to_device, client), device_ids, 2.0)
+        )
+
+        assert len(found) == 27
+        assert time.monotonic() - start < 4.0
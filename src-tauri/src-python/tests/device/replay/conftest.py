@@ -0,0 +1,57 @@
+"""Recorded sessions shared by the replay tests."""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.game import Game
+from adb_auto_player.models.device import Resolution
+from pydantic import BaseModel
+
+_DATA_DIR = Path(__file__).parents[2] / "data"
+
+
+class _ReplayGame(Game):
+    def __init__(self) -> None:
+        super().__init__()
+        self.base_resolution = Resolution(1080, 1920)
+
+    @property
+    def template_dir(self) -> Path:
+        return _DATA_DIR
+
+    @property
+    def settings(self) -> BaseModel:
+        return BaseModel()
+
+
+@pytest.fixture
+def session(tmp_path) -> Path:
+    SettingsLoader.set_app_config_dir(tmp_path)
+    shutil.copy(_DATA_DIR / "template_match_base.png", tmp_path / "base.png")
+    shutil.copy(_DATA_DIR / "records_formation_1.png", tmp_path / "formation.png")
+    graph = {
+        "package": "com.example",
+        "start": "base",
+        "states": {
+            "base": {
+                "frames": ["base.png"],
+                "transitions": [
+                    {"on": "tap", "region": [205, 1745, 421, 1895], "to": "formation"}
+                ],
+            },
+            "formation": {
+                "frames": ["formation.png"],
+                "transitions": [{"on": "back", "to": "base"}],
+            },
+        },
+    }
+    (tmp_path / "replay.json").write_text(json.dumps(graph))
+    return tmp_path
+
+
+@pytest.fixture
+def game() -> Game:
+    return _ReplayGame()
@@ -0,0 +1,86 @@
+"""Tests replaying recorded sessions through `Game`."""
+
+import json
+
+import pytest
+from adb_auto_player.device.replay import (
+    ReplayBenchmark,
+    ReplayController,
+    ReplayGraph,
+)
+from adb_auto_player.models.device import Resolution
+from adb_auto_player.models.geometry import Point
+
+
+def test_inputs_follow_the_state_graph(session):
+    graph = ReplayGraph.load(session)
+    controller = ReplayController(graph)
+
+    assert graph.resolution == Resolution(1080, 1920)
+    assert controller.screenshot() == (session / "base.png").read_bytes()
+    controller.tap(Point(10, 10))
+    assert controller.state == "base"
+    controller.tap(Point(300, 1800))
+    assert controller.screenshot() == (session / "formation.png").read_bytes()
+    controller.press_back_button()
+
+    assert controller.visited == ["base", "formation", "base"]
+    assert [event.state for event in controller.events] == [
+        "base",
+        "formation",
+        "base",
+    ]
+
+
+def test_frame_directories_replay_in_name_order(session):
+    graph = ReplayGraph.from_frames(session)
+    controller = ReplayController(graph)
+
+    controller.tap(Point(1, 1))
+
+    assert graph.start == "base"
+    assert controller.state == "formation"
+
+
+def test_invalid_graphs_are_rejected(session):
+    graph = json.loads((session / "replay.json").read_text())
+    graph["states"]["base"]["transitions"][0]["to"] = "missing"
+    (session / "replay.json").write_text(json.dumps(graph))
+
+    with pytest.raises(ValueError, match="missing"):
+        ReplayGraph.load(session)
+    with pytest.raises(ValueError, match="No frames"):
+        ReplayGraph.from_frames(session, pattern="*.jpg")
+
+
+def test_benchmark_reports_task_and_call_timings(session, game):
+    benchmark = ReplayBenchmark(game, ReplayGraph.load(session))
+
+    def open_formation() -> None:
+        result = game.wait_for_template("template_match_template.png", timeout=1)
+        game.tap(result, blocking=True)
+        game.wait_for_template("records_formation_1.png", timeout=1)
+
+    report = benchmark.run(open_formation)
+
+    assert report.error is None
+    assert report.final_state == "formation"
+    assert report.visited_states == ["base", "formation"]
+    assert report.calls["game.wait_for_template"].count == 2
+    assert report.calls["device.tap"].count == 1
+    assert report.calls["device.screenshot"].count == report.screenshots
+    assert report.wall_seconds > 0
+    assert report.cpu_seconds > 0
+    assert "device.tap" in report.to_dict()["calls"]
+    assert game._device is None
+    assert "wait_for_template" not in vars(game)
+
+
+def test_benchmark_records_task_errors(session, game):
+
+    report = ReplayBenchmark(game, ReplayGraph.load(session)).run(
+        "wait_for_template", "records_formation_1.png", timeout=0.2
+    )
+
+    assert report.error is not None
+    assert report.final_state == "base"
@@ -0,0 +1,127 @@
+"""Tests recording task runs with `Game` and replaying the archives."""
+
+import numpy as np
+from adb_auto_player.device.replay import (
+    ReplayBenchmark,
+    ReplayController,
+    ReplayGraph,
+    SessionArchive,
+    SessionRecorder,
+)
+from adb_auto_player.image_manipulation import IO
+from adb_auto_player.models import ConfidenceValue
+from adb_auto_player.models.geometry import Box, Point
+from adb_auto_player.models.ocr import OCRResult
+from adb_auto_player.ocr import OCRBackend
+from adb_auto_player.util import Instrumentation, RunMetrics
+
+
+class _FakeOCRBackend(OCRBackend):
+    @Instrumentation.measured(RunMetrics.OCR)
+    def extract_text(self, image: np.ndarray) -> str:
+        return " ".join(r.text for r in self.detect_text_blocks(image))
+
+    @Instrumentation.measured(RunMetrics.OCR)
+    def detect_text_blocks(
+        self,
+        image: np.ndarray,
+        min_confidence: ConfidenceValue = ConfidenceValue(0.0),
+    ) -> list[OCRResult]:
+        return [
+            OCRResult(
+                text="Confirm",
+                confidence=ConfidenceValue(0.9),
+                box=Box(Point(1, 2), 30, 10),
+            )
+        ]
+
+
+def _open_formation(game) -> None:
+    result = game.wait_for_template("template_match_template.png", timeout=1)
+    game.tap(result)
+    game.wait_for_template("records_formation_1.png", timeout=1)
+    game.press_back_button()
+    game.get_screenshot()
+
+
+def test_game_records_frames_inputs_and_decisions(session, game, tmp_path):
+    game._device = ReplayController(ReplayGraph.load(session))
+    game.start_session_recording(tmp_path / "run.zip")
+
+    _open_formation(game)
+    path = game.stop_session_recording()
+
+    archive = SessionArchive(path)
+    frames = [e["frame"] for e in archive.events if e["type"] == "frame"]
+    inputs = [e["kind"] for e in archive.events if e["type"] == "input"]
+    templates = archive.decisions("template")
+    assert len(set(frames)) == 2
+    assert inputs == ["tap", "back"]
+    assert [d["name"] for d in templates] == [
+        "template_match_template.png",
+        "records_formation_1.png",
+    ]
+    assert templates[0]["score"] > 0.9
+    assert templates[0]["frame"] == frames[0]
+    assert np.array_equal(
+        IO.get_bgr_np_array_from_png_bytes(archive.frame(frames[0])),
+        IO.load_image(session / "base.png"),
+    )
+    assert archive.frame_at(archive.events[-1]["t"]) == frames[-1]
+    assert game.session_recorder is None
+
+
+def test_recorded_archive_replays_the_run(session, game, tmp_path):
+    game._device = ReplayController(ReplayGraph.load(session))
+    game.start_session_recording(tmp_path / "run.zip")
+    _open_formation(game)
+    path = game.stop_session_recording()
+
+    graph = ReplayGraph.load(path)
+    report = ReplayBenchmark(game, graph).run(_open_formation, game)
+
+    assert len(graph.states) == 2
+    assert report.error is None
+    assert report.final_state == graph.start
+    assert len(report.visited_states) == 3
+
+
+def test_ocr_results_of_any_backend_are_recorded(session, game, tmp_path):
+    game._device = ReplayController(ReplayGraph.load(session))
+    backend = _FakeOCRBackend()
+    backend.extract_text(np.zeros((1, 1), np.uint8))
+
+    game.start_session_recording(tmp_path / "run.zip")
+    image = game.get_screenshot()
+    assert backend.extract_text(image) == "Confirm"
+    backend.detect_text_blocks(image)
+    path = game.stop_session_recording()
+    backend.extract_text(image)
+
+    decisions = SessionArchive(path).decisions("ocr")
+    assert [d["name"] for d in decisions] == [
+        "_FakeOCRBackend.extract_text",
+        "_FakeOCRBackend.detect_text_blocks",
+    ]
+    assert decisions[0]["texts"] == ["Confirm"]
+    assert decisions[1]["score"] == 0.9
+
+
+def test_frames_are_stored_once_and_unchanged_frames_advance(tmp_path):
+    black = np.zeros((20, 10, 3), np.uint8)
+    white = np.full((20, 10, 3), 255, np.uint8)
+
+    with SessionRecorder(tmp_path / "run.zip") as recorder:
+        recorder.frame(black)
+        recorder.frame(black)
+        recorder.frame(white)
+        recorder.input("tap", Point(5, 5))
+
+    graph = ReplayGraph.load(tmp_path / "run.zip")
+    controller = ReplayController(graph)
+    controller.screenshot()
+    controller.screenshot()
+
+    assert len(graph.states) == 2
+    assert str(graph.resolution) == "10x20"
+    assert controller.state != graph.start
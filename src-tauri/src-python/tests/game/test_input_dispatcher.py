@@ -0,0 +1,103 @@
+"""Tests for `InputDispatcher` and non-blocking taps in `_InputMixin`."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+from adb_auto_player.game._input_dispatcher import InputDispatcher
+from adb_auto_player.game._input_mixin import _InputMixin
+from adb_auto_player.models.geometry import Point
+
+
+def _wait_for(gate: threading.Event):
+    """Command blocking the dispatcher until the gate is set."""
+
+    def wait() -> None:
+        gate.wait()
+
+    return wait
+
+
+class TestInputDispatcher:
+    def test_commands_run_in_order(self):
+        dispatcher = InputDispatcher()
+        executed = []
+        for i in range(5):
+            dispatcher.submit(lambda i=i: executed.append(i))
+        assert dispatcher.wait_idle(timeout=5)
+
+        assert executed == [0, 1, 2, 3, 4]
+        stats = dispatcher.stats()
+        assert stats.executed == 5
+        assert stats.depth == 0
+        assert stats.max_latency_ms >= stats.avg_latency_ms >= 0
+
+    def test_duplicate_pending_commands_are_coalesced(self):
+        dispatcher = InputDispatcher()
+        gate = threading.Event()
+        executed = []
+        dispatcher.submit(_wait_for(gate))
+        # Wait until the worker is blocked on the first command.
+        while dispatcher.depth:
+            pass
+
+        assert dispatcher.submit(lambda: executed.append("a"), key="a")
+        assert not dispatcher.submit(lambda: executed.append("a"), key="a")
+        assert dispatcher.submit(lambda: executed.append("b"), key="b")
+        gate.set()
+        assert dispatcher.wait_idle(timeout=5)
+
+        assert executed == ["a", "b"]
+        assert dispatcher.stats().coalesced == 1
+
+    def test_full_queue_applies_backpressure(self):
+        dispatcher = InputDispatcher(max_queue_size=1)
+        gate = threading.Event()
+        dispatcher.submit(_wait_for(gate))
+        while dispatcher.depth:
+            pass
+        assert dispatcher.submit(lambda: None)
+
+        assert not dispatcher.submit(lambda: None, timeout=0.05)
+        assert dispatcher.stats().backpressure_waits == 1
+        gate.set()
+        assert dispatcher.wait_idle(timeout=5)
+
+    def test_failing_command_does_not_stop_worker(self):
+        dispatcher = InputDispatcher()
+        executed = []
+        dispatcher.submit(MagicMock(side_effect=RuntimeError("adb")))
+        dispatcher.submit(lambda: executed.append(1))
+        assert dispatcher.wait_idle(timeout=5)
+
+        assert executed == [1]
+        assert dispatcher.stats().failed == 1
+
+
+class TestNonBlockingTap:
+    @staticmethod
+    def _mixin() -> MagicMock:
+        mixin = MagicMock(spec=_InputMixin)
+        mixin.input_dispatcher = InputDispatcher()
+        return mixin
+
+    def test_non_blocking_tap_uses_dispatcher(self):
+        mixin = self._mixin()
+        with patch("adb_auto_player.game._input_mixin.sleep"):
+            _InputMixin.tap(mixin, Point(1, 2), blocking=False)
+        assert mixin.input_dispatcher.wait_idle(timeout=5)
+
+        mixin._click.assert_called_once_with(Point(1, 2), "Tapped: Point(x=1, y=2)")
+
+    def test_blocking_tap_waits_for_queued_taps(self):
+        mixin = self._mixin()
+        order = []
+        gate = threading.Event()
+        mixin.input_dispatcher.submit(lambda: (gate.wait(), order.append("queued")))
+        mixin._click.side_effect = lambda *_: order.append("blocking")
+
+        timer = threading.Timer(0.05, gate.set)
+        timer.start()
+        _InputMixin.tap(mixin, Point(1, 2), log=False)
+        timer.join()
+
+        assert order == ["queued", "blocking"]
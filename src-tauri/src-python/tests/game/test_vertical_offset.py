@@ -10,6 +10,7 @@ from unittest.mock import MagicMock, patch
 import numpy as np
 from adb_auto_player.game._input_mixin import _InputMixin
 from adb_auto_player.game._screenshot_mixin import _ScreenshotMixin
+from adb_auto_player.image_manipulation import DebugImageWriter
 from adb_auto_player.models.geometry import Point
 
 
@@ -103,6 +104,7 @@ class TestSaveDebugScreenshot:
             _ScreenshotMixin.save_debug_screenshot(
                 mock_instance, screenshot, "navigation_failed"
             )
+        DebugImageWriter.flush()
 
         saved_dir = tmp_path / "data" / "screenshots" / "navigation_failed"
         assert saved_dir.exists()
@@ -59,6 +59,7 @@ class MockAllAFKJ(
         self.battle_state = MagicMock()
         self.battle_state.section_header = "Test Stage"
         self._stream = MagicMock()
+        self._stream.scale = 1.0
         self._device = MagicMock()
         self._device.get_running_app.return_value = "com.farlightgames.igame.gp"
         self._target_package_name = "com.farlightgames.igame.gp"
@@ -10,6 +10,7 @@ import json
 import logging
 from unittest.mock import MagicMock, patch
 
+import cv2
 import numpy as np
 import pytest
 from adb_auto_player.games.afk_journey.services.hero_scanner import HeroScanner
@@ -314,6 +315,85 @@ class TestMatchAscension:
         assert result == "Paragon 4"
 
 
+class TestAscensionBadgeIndex:
+    @staticmethod
+    def _badge(seed: int) -> np.ndarray:
+        rng = np.random.default_rng(seed)
+        return rng.integers(0, 256, size=(165, 125, 3), dtype=np.uint8)
+
+    @staticmethod
+    def _tier_badge(text: str, seed: int) -> np.ndarray:
+        """Badge with the tier text, with stream noise that differs per seed."""
+        badge = np.zeros((165, 125, 3), dtype=np.uint8)
+        badge[:] = np.linspace(60, 180, 165, dtype=np.uint8)[:, None, None]
+        cv2.circle(badge, (62, 70), 45, (40, 160, 220), -1)
+        cv2.putText(
+            badge, text, (4, 150), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2
+        )
+        noise = np.random.default_rng(seed).integers(-6, 7, badge.shape)
+        return np.clip(badge + noise, 0, 255).astype(np.uint8)
+
+    def test_empty_index_returns_none(self):
+        scanner = _make_scanner()
+        assert scanner._lookup_ascension_badge(self._badge(0)) is None
+
+    def test_learned_badge_is_identified(self):
+        scanner = _make_scanner()
+        scanner._learn_ascension_badge(self._badge(0), "Mythic", "Mythic")
+        scanner._learn_ascension_badge(self._badge(1), "Supreme+", "Supreme+")
+
+        assert scanner._lookup_ascension_badge(self._badge(0)) == "Mythic"
+        assert scanner._lookup_ascension_badge(self._badge(1)) == "Supreme+"
+        assert scanner._lookup_ascension_badge(self._badge(2)) is None
+
+    def test_supreme_and_supreme_plus_are_told_apart(self):
+        scanner = _make_scanner()
+        scanner._learn_ascension_badge(
+            self._tier_badge("Supreme", 0), "Supreme", "Supreme"
+        )
+
+        assert scanner._lookup_ascension_badge(self._tier_badge("Supreme+", 1)) is None
+        assert (
+            scanner._lookup_ascension_badge(self._tier_badge("Supreme", 2)) == "Supreme"
+        )
+
+        scanner._learn_ascension_badge(
+            self._tier_badge("Supreme+", 1), "Supreme+", "Supreme+"
+        )
+
+        assert (
+            scanner._lookup_ascension_badge(self._tier_badge("Supreme+", 3))
+            == "Supreme+"
+        )
+        assert (
+            scanner._lookup_ascension_badge(self._tier_badge("Supreme", 4)) == "Supreme"
+        )
+
+    def test_unknown_is_not_learned(self):
+        scanner = _make_scanner()
+        scanner._learn_ascension_badge(self._badge(0), "Unknown", "Unknown")
+        assert len(scanner._ascension_index) == 0
+
+    def test_inexact_ocr_read_is_not_learned(self):
+        scanner = _make_scanner()
+        scanner._learn_ascension_badge(self._badge(0), "Supreme", "Subreme")
+        scanner._learn_ascension_badge(self._badge(1), "Supreme", "Supreme+ 3")
+        assert len(scanner._ascension_index) == 0
+
+    def test_badge_matching_another_tier_is_not_learned(self):
+        scanner = _make_scanner()
+        scanner._learn_ascension_badge(self._badge(0), "Mythic", "Mythic")
+        scanner._learn_ascension_badge(self._badge(0), "Legendary", "Legendary")
+        assert len(scanner._ascension_index) == 1
+        assert scanner._lookup_ascension_badge(self._badge(0)) == "Mythic"
+
+    def test_exemplars_per_tier_are_capped(self):
+        scanner = _make_scanner()
+        for seed in range(10):
+            scanner._learn_ascension_badge(self._badge(seed), "Mythic", "Mythic")
+        assert len(scanner._ascension_index) == 3
+
+
 # ---------------------------------------------------------------------------
 # _parse_ex_level
 # ---------------------------------------------------------------------------
@@ -750,3 +830,72 @@ class TestSuggestVerticalOffset:
 
         assert caplog.text == ""
         assert scanner._offset_hint_logged is True
+
+
+# ---------------------------------------------------------------------------
+# Roster walk
+# ---------------------------------------------------------------------------
+
+
+def _hero_screen(name: str) -> dict:
+    return {
+        "name": name,
+        "raw_name": name,
+        "raw_asc": "",
+        "ascension": "Mythic",
+        "ex_weapon": 0,
+        "raw_ex": "",
+    }
+
+
+class TestWalkRoster:
+    def _run(self, pipelined: bool, names: list[str], buttons: list[bool]):
+        scanner = _make_scanner()
+        recorded: list[tuple[str, bool, int]] = []
+
+        def record(full_data, hero_data, button_status, index):
+            recorded.append((hero_data["name"], button_status, index))
+
+        with (
+            patch("adb_auto_player.games.afk_journey.services.hero_scanner.RapidOCR"),
+            patch.object(
+                scanner,
+                "_process_hero_screen",
+                side_effect=[_hero_screen(n) for n in names],
+            ),
+            patch.object(scanner, "_ascend_button_is_present", side_effect=buttons),
+            patch.object(scanner, "_record_hero", side_effect=record),
+        ):
+            if pipelined:
+                count = scanner._walk_roster_pipelined({}, limit=len(names))
+            else:
+                count = scanner._walk_roster_sequential({}, limit=len(names))
+        return scanner, count, recorded
+
+    def test_pipelined_records_heroes_in_order(self):
+        names = ["Odie", "Lily May", "Unknown", "Thoran"]
+        scanner, count, recorded = self._run(True, names, [False, True, False, False])
+
+        assert count == len(names)
+        assert recorded == [
+            ("Odie", False, 0),
+            ("Lily May", True, 1),
+            ("Unknown", False, 2),
+            ("Thoran", False, 3),
+        ]
+        assert scanner._game.tap.call_count == len(names)
+
+    def test_pipelined_stops_at_roster_end(self):
+        names = ["Odie", "Hammie", "Thoran"]
+        _, count, recorded = self._run(True, names, [False, False, False])
+
+        assert count == 1
+        assert [r[0] for r in recorded] == ["Odie"]
+
+    def test_pipelined_matches_sequential(self):
+        names = ["Odie", "Lily May", "Thoran"]
+        _, seq_count, seq = self._run(False, names, [True, False, False])
+        _, pipe_count, pipe = self._run(True, names, [True, False, False])
+
+        assert seq_count == pipe_count
+        assert [r[0] for r in seq] == [r[0] for r in pipe]
@@ -1,13 +1,62 @@
+from contextlib import contextmanager
+from itertools import count
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from adb_auto_player.exceptions import GameActionFailedError, GameTimeoutError
+import numpy as np
+import pytest
+from adb_auto_player.exceptions import GameActionFailedError
 from adb_auto_player.games.afk_journey.base import AFKJourneyBase
+from adb_auto_player.image_manipulation import IO
 from adb_auto_player.models import ConfidenceValue
 from adb_auto_player.models.geometry import Box, Point
 from adb_auto_player.models.template_matching.template_match_result import (
     TemplateMatchResult,
 )
 
+TEMPLATE_DIR = (
+    Path(__file__).parents[3]
+    / "adb_auto_player"
+    / "games"
+    / "afk_journey"
+    / "templates"
+)
+HEROES_DIR = TEMPLATE_DIR / "heroes"
+DATA_DIR = Path(__file__).parents[2] / "data"
+# Heroes in each formation fixture, as found by a full resolution
+# matchTemplate of every portrait template at 85%.
+FORMATION_HEROES = {
+    "records_formation_1.png": ["bonnie", "eironn", "rowan", "tasi", "ulmus"],
+    "records_formation_2.png": ["arden", "eironn", "elijahlailah", "hugin", "ulmus"],
+}
+
+
+class _PortraitBot(AFKJourneyBase):
+    """AFKJourneyBase showing a fixed screenshot, without device or settings."""
+
+    def __init__(self, screenshot: np.ndarray) -> None:
+        self._screenshot = screenshot
+
+    @property
+    def template_dir(self) -> Path:
+        return TEMPLATE_DIR
+
+    def get_screenshot(self) -> np.ndarray:
+        return self._screenshot
+
+
+@contextmanager
+def _no_wait():
+    """Run the polling loop twice without sleeping."""
+    with (
+        patch("adb_auto_player.games.afk_journey.base.sleep"),
+        patch(
+            "adb_auto_player.games.afk_journey.base.monotonic",
+            side_effect=count(0, 0.6),
+        ),
+    ):
+        yield
+
 
 class TestAFKJourneyBaseCoverage:
     def test_start_battle_failure_coverage(self):
@@ -35,26 +84,44 @@ class TestAFKJourneyBaseCoverage:
             # The method should return False when GameActionFailedError is caught
             assert bot._start_battle() is False
 
-    def test_find_any_excluded_hero(self):
-        """Test _find_any_excluded_hero success path."""
-        bot = AFKJourneyBase.__new__(AFKJourneyBase)
+    def test_find_any_excluded_hero_rejects_unconfirmed_hit(self):
+        """Test descriptor hits without a full resolution match are ignored."""
+        bot = _PortraitBot(np.zeros((1920, 1080, 3), dtype=np.uint8))
+        index = MagicMock(downscale=6)
+        index.find_all.return_value = [
+            TemplateMatchResult(
+                template="heroes/evie.png",
+                confidence=ConfidenceValue(1.0),
+                box=Box(Point(20, 20), 100, 100),
+            )
+        ]
+        bot.__dict__["_hero_portrait_index"] = index
 
-        match_result = TemplateMatchResult(
-            template="heroes/evie.png",
-            confidence=ConfidenceValue(1.0),
-            box=Box(Point(0, 0), 10, 10),
-        )
-        bot.wait_for_any_template = MagicMock(return_value=match_result)
+        with _no_wait():
+            assert bot._find_any_excluded_hero({"heroes/evie.png": "Evie"}) is None
+        assert set(index.find_all.call_args.kwargs["keys"]) == {"heroes/evie.png"}
 
-        excluded = {"heroes/evie.png": "Evie"}
-        result = bot._find_any_excluded_hero(excluded)
-        assert result == "Evie"
 
-    def test_find_any_excluded_hero_timeout(self):
-        """Test _find_any_excluded_hero timeout path."""
-        bot = AFKJourneyBase.__new__(AFKJourneyBase)
-        bot.wait_for_any_template = MagicMock(side_effect=GameTimeoutError("timeout"))
+@pytest.mark.parametrize("fixture", sorted(FORMATION_HEROES))
+class TestFindAnyExcludedHero:
+    def test_every_hero_in_formation_is_found(self, fixture):
+        bot = _PortraitBot(IO.load_image(DATA_DIR / fixture))
+        for name in FORMATION_HEROES[fixture]:
+            key = f"heroes/{name}.png"
+            with _no_wait():
+                assert bot._find_any_excluded_hero({key: name}) == name
+
+    def test_heroes_not_in_formation_are_not_found(self, fixture):
+        bot = _PortraitBot(IO.load_image(DATA_DIR / fixture))
+        absent = {
+            f"heroes/{template.name}": template.stem
+            for template in HEROES_DIR.glob("*.png")
+            if template.stem not in FORMATION_HEROES[fixture]
+        }
+        with _no_wait():
+            assert bot._find_any_excluded_hero(absent) is None
+
 
-        excluded = {"heroes/evie.png": "Evie"}
-        result = bot._find_any_excluded_hero(excluded)
-        assert result is None
+def test_every_formation_fixture_is_covered():
+    fixtures = {path.name for path in DATA_DIR.glob("records_formation_*.png")}
+    assert fixtures == set(FORMATION_HEROES)
@@ -9,6 +9,7 @@ from adb_auto_player.games.afk_journey.popup_message_handler import (
     PopupPreprocessResult,
 )
 from adb_auto_player.games.afk_journey.settings import OCREngine
+from adb_auto_player.image_manipulation import DebugImageWriter
 from adb_auto_player.models import ConfidenceValue
 from adb_auto_player.models.geometry import Box, Coordinates, Point
 from adb_auto_player.models.image_manipulation import CropRegions
@@ -74,6 +75,7 @@ class MockHandler(PopupMessageHandler):
         grayscale: bool = False,
         crop_regions: CropRegions = CropRegions(),
         screenshot: np.ndarray | None = None,
+        screenshot_scale: float = 1.0,
     ) -> TemplateMatchResult | None:
         return None
 
@@ -244,6 +246,7 @@ class TestPopupHandlerFullCoverage:
             return_value=tmp_path,
         ):
             result = handler._get_popup_message_from_ocr_results([], preprocess_result)
+        DebugImageWriter.flush()
 
         assert result is None
         saved_dir = tmp_path / "data" / "screenshots" / "unknown_popups"
@@ -0,0 +1,87 @@
+import queue
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from adb_auto_player.image_manipulation import IO, DebugImageWriter
+from adb_auto_player.models.image_manipulation import DebugImageFormat
+
+
+@pytest.fixture
+def image() -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, size=(40, 30, 3), dtype=np.uint8)
+
+
+class TestDebugImageWriter:
+    def test_singleton(self):
+        assert DebugImageWriter() is DebugImageWriter()
+
+    def test_save_png(self, tmp_path, image):
+        assert DebugImageWriter.save(image, tmp_path / "category", "frame")
+        DebugImageWriter.flush()
+
+        saved = tmp_path / "category" / "frame.png"
+        np.testing.assert_array_equal(IO.load_image(saved), image)
+
+    def test_save_jpeg(self, tmp_path, image):
+        DebugImageWriter.save(image, tmp_path, "frame", DebugImageFormat.JPEG)
+        DebugImageWriter.flush()
+
+        assert (tmp_path / "frame.jpg").exists()
+
+    def test_save_now_writes_synchronously(self, tmp_path, image):
+        assert DebugImageWriter.save_now(image, tmp_path, "frame")
+
+        np.testing.assert_array_equal(IO.load_image(tmp_path / "frame.png"), image)
+
+    def test_flush_is_registered_once(self, tmp_path, image):
+        with patch(
+            "adb_auto_player.image_manipulation.debug_image_writer.atexit.register"
+        ) as register:
+            writer = DebugImageWriter()
+            writer._worker = None
+            DebugImageWriter.save(image, tmp_path, "a")
+            DebugImageWriter.flush()
+            writer._worker = None
+            DebugImageWriter.save(image, tmp_path, "b")
+            DebugImageWriter.flush()
+
+        register.assert_not_called()
+
+    def test_image_is_copied(self, tmp_path, image):
+        expected = image.copy()
+        DebugImageWriter.save(image, tmp_path, "frame")
+        image[:] = 0
+        DebugImageWriter.flush()
+
+        np.testing.assert_array_equal(IO.load_image(tmp_path / "frame.png"), expected)
+
+    def test_rotation_keeps_newest_files(self, tmp_path, image):
+        with patch.object(DebugImageWriter, "max_files_per_directory", 3):
+            for i in range(6):
+                DebugImageWriter.save(image, tmp_path, f"frame_{i}")
+                DebugImageWriter.flush()
+
+        remaining = sorted(path.name for path in tmp_path.iterdir())
+        assert remaining == ["frame_3.png", "frame_4.png", "frame_5.png"]
+
+    def test_quota_is_per_directory(self, tmp_path, image):
+        with patch.object(DebugImageWriter, "max_files_per_directory", 1):
+            DebugImageWriter.save(image, tmp_path / "a", "frame")
+            DebugImageWriter.save(image, tmp_path / "b", "frame")
+            DebugImageWriter.flush()
+
+        assert (tmp_path / "a" / "frame.png").exists()
+        assert (tmp_path / "b" / "frame.png").exists()
+
+    def test_full_queue_drops_frame(self, tmp_path, image):
+        writer = DebugImageWriter()
+        dropped = writer.dropped
+        with patch.object(writer._queue, "put_nowait", side_effect=queue.Full):
+            assert not DebugImageWriter.save(image, tmp_path, "frame")
+
+        assert writer.dropped == dropped + 1
+
+    def test_non_image_is_skipped(self, tmp_path):
+        assert not DebugImageWriter.save(None, tmp_path, "frame")  # ty: ignore[invalid-argument-type]
@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from adb_auto_player.image_manipulation import ListStitcher
+
+Y_MIN = 100
+Y_MAX = 700
+SCREEN_HEIGHT = 800
+WIDTH = 200
+
+
+def _make_list(height: int = 3000, seed: int = 0) -> np.ndarray:
+    """Create a tall BGR image of random 'rows' to scroll over."""
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, 256, size=(height, WIDTH, 3), dtype=np.uint8)
+    # Smooth horizontally so rows look like rendered content, not noise.
+    return np.repeat(rows[:, ::8], 8, axis=1)[:, :WIDTH]
+
+
+def _frame(full_list: np.ndarray, scroll: int) -> np.ndarray:
+    """Render a screen whose list region shows full_list starting at scroll."""
+    frame = np.zeros((SCREEN_HEIGHT, WIDTH, 3), dtype=np.uint8)
+    frame[Y_MIN:Y_MAX] = full_list[scroll : scroll + (Y_MAX - Y_MIN)]
+    return frame
+
+
+class TestListStitcher:
+    def test_estimate_vertical_shift(self):
+        full_list = _make_list()
+        prev = full_list[0:600]
+        cur = full_list[237:837]
+        assert ListStitcher.estimate_vertical_shift(prev, cur) == 237
+
+    def test_estimate_vertical_shift_unrelated_frames(self):
+        prev = _make_list(seed=1)[:600]
+        cur = _make_list(seed=2)[:600]
+        assert ListStitcher.estimate_vertical_shift(prev, cur) is None
+
+    def test_estimate_vertical_shift_flat_frames(self):
+        flat = np.full((600, WIDTH, 3), 40, dtype=np.uint8)
+        assert ListStitcher.estimate_vertical_shift(flat, flat) is None
+
+    def test_add_frame_reveals_only_new_rows(self):
+        full_list = _make_list()
+        stitcher = ListStitcher(Y_MIN, Y_MAX, row_margin=50)
+
+        first = stitcher.add_frame(_frame(full_list, 0))
+        assert first.shift is None
+        assert first.reveal_y_min == Y_MIN
+
+        second = stitcher.add_frame(_frame(full_list, 250))
+        assert second.shift == 250
+        assert second.reveal_y_min == Y_MAX - 250 - 50
+        assert not second.is_end_of_list
+        assert stitcher.to_virtual_y(Y_MIN) == 250
+
+    def test_end_of_list(self):
+        full_list = _make_list()
+        stitcher = ListStitcher(Y_MIN, Y_MAX)
+        stitcher.add_frame(_frame(full_list, 400))
+
+        step = stitcher.add_frame(_frame(full_list, 400))
+        assert step.shift == 0
+        assert step.is_end_of_list
+
+    def test_stitched_image_matches_source(self):
+        full_list = _make_list()
+        stitcher = ListStitcher(Y_MIN, Y_MAX)
+        for scroll in (0, 200, 450, 700):
+            stitcher.add_frame(_frame(full_list, scroll))
+
+        stitched = stitcher.stitched_image()
+        assert stitched is not None
+        assert stitched.shape[0] == 700 + (Y_MAX - Y_MIN)
+        np.testing.assert_array_equal(stitched, full_list[: stitched.shape[0]])
+
+    def test_non_image_frame_is_read_in_full(self):
+        stitcher = ListStitcher(Y_MIN, Y_MAX)
+        step = stitcher.add_frame(MagicMock())
+        assert step.shift is None
+        assert step.reveal_y_min == Y_MIN
+        assert stitcher.stitched_image() is None
+
+    def test_invalid_region(self):
+        with pytest.raises(ValueError):
+            ListStitcher(500, 500)
@@ -132,3 +132,19 @@ class TestBox(unittest.TestCase):
         p = Point(10, 20)
         box = box.with_offset(p)
         self.assertEqual(box.top_left, Point(10, 20))
+
+    def test_scale(self):
+        box = Box(Point(10, 20), 30, 41)
+        self.assertIs(box.scale(1.0), box)
+        self.assertIs(box.scale(None), box)
+
+        scaled = box.scale(2.0)
+        self.assertEqual(scaled.top_left, Point(20, 40))
+        self.assertEqual((scaled.width, scaled.height), (60, 82))
+
+        # Dimensions never collapse to zero.
+        self.assertEqual(Box(Point(0, 0), 1, 1).scale(0.1).width, 1)
+
+    def test_scale_negative(self):
+        with self.assertRaises(ValueError):
+            Box(Point(10, 20), 30, 41).scale(-0.5)
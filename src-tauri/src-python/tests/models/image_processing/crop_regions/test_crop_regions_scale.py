@@ -0,0 +1,28 @@
+from adb_auto_player.models.image_manipulation import CropRegions
+
+
+class TestCropRegionsScale:
+    """Test scaling crop regions to a resized image."""
+
+    def test_scale_pixels(self):
+        """Test pixel values are scaled."""
+        crop_regions = CropRegions(left="480px", right=101, top=0, bottom="25px")
+        scaled = crop_regions.scale(0.5)
+        assert scaled.left.value == 240
+        assert scaled.right.value == 50
+        assert scaled.top.value == 0
+        assert scaled.bottom.value == 12
+        assert scaled.left.is_pixels is True
+
+    def test_scale_keeps_percentages(self):
+        """Test percentage values are not scaled."""
+        crop_regions = CropRegions(left="480px", right=0.3, top="25%")
+        scaled = crop_regions.scale(0.5)
+        assert scaled.right.value == 0.3
+        assert scaled.right.is_pixels is False
+        assert scaled.top.value == 0.25
+
+    def test_scale_one_returns_same(self):
+        """Test scale 1.0 returns the crop regions unchanged."""
+        crop_regions = CropRegions(left="480px")
+        assert crop_regions.scale(1.0) is crop_regions
@@ -45,3 +45,11 @@ class TestTemplateMatchResult(unittest.TestCase):
         # Check that a new instance is returned (immutability)
         self.assertIsNot(new_result, self.result)
         self.assertIsNot(new_result.box, self.result.box)
+
+    def test_scale(self):
+        self.assertIs(self.result.scale(1.0), self.result)
+
+        scaled = self.result.scale(2.0)
+        self.assertEqual(scaled.box, self.box.scale(2.0))
+        self.assertEqual(scaled.template, self.template)
+        self.assertEqual(scaled.confidence, self.result.confidence)
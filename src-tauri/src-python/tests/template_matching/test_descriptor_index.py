@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+from adb_auto_player.image_manipulation import IO, Cropping
+from adb_auto_player.models import ConfidenceValue
+from adb_auto_player.models.image_manipulation import CropRegions
+from adb_auto_player.template_matching import DescriptorIndex
+
+HEROES_DIR = (
+    Path(__file__).parents[2]
+    / "adb_auto_player"
+    / "games"
+    / "afk_journey"
+    / "templates"
+    / "heroes"
+)
+FORMATION_REGIONS = CropRegions(left="10%", right="30%", top="35%", bottom="40%")
+
+
+@pytest.fixture(scope="module")
+def hero_index() -> DescriptorIndex:
+    return DescriptorIndex.from_directory(HEROES_DIR, key_prefix="heroes/")
+
+
+def _formation(name: str) -> np.ndarray:
+    image = IO.load_image(Path(__file__).parents[1] / "data" / name)
+    return Cropping.crop(image, FORMATION_REGIONS).image
+
+
+class TestDescriptorIndex:
+    def test_from_directory(self, hero_index):
+        assert len(hero_index) == len(list(HEROES_DIR.glob("*.png")))
+        assert "heroes/eironn.png" in hero_index
+
+    def test_identify_template(self, hero_index):
+        template = IO.load_image(HEROES_DIR / "rowan.png")
+        result = hero_index.identify(template)
+        assert result is not None
+        assert result.template == "heroes/rowan.png"
+        assert result.confidence >= ConfidenceValue("99%")
+
+    def test_find_all_formation(self, hero_index):
+        results = hero_index.find_all(_formation("records_formation_1.png"))
+        found = {result.template for result in results}
+        assert {
+            "heroes/eironn.png",
+            "heroes/bonnie.png",
+            "heroes/rowan.png",
+            "heroes/ulmus.png",
+            "heroes/tasi.png",
+        } <= found
+
+    def test_find_all_keys_subset(self, hero_index):
+        formation = _formation("records_formation_1.png")
+        results = hero_index.find_all(
+            formation, keys=["heroes/rowan.png", "heroes/arden.png"]
+        )
+        assert [result.template for result in results] == ["heroes/rowan.png"]
+
+    def test_find_all_box_locates_icon(self, hero_index):
+        formation = _formation("records_formation_1.png")
+        template = IO.load_image(HEROES_DIR / "rowan.png")
+        (result,) = hero_index.find_all(formation, keys=["heroes/rowan.png"])
+        crop = formation[
+            result.box.top : result.box.top + result.box.height,
+            result.box.left : result.box.left + result.box.width,
+        ]
+        assert crop.shape == template.shape
+
+    def test_empty_index(self):
+        index = DescriptorIndex()
+        image = np.zeros((50, 50, 3), dtype=np.uint8)
+        assert index.identify(image) is None
+        assert index.find_all(image) == []
+
+    def test_invalid_downscale(self):
+        with pytest.raises(ValueError):
+            DescriptorIndex(downscale=0)
@@ -6,6 +6,14 @@ from adb_auto_player.template_matching.template_matcher import (
 from .test_image_creator import TestImageCreator
 
 
+@pytest.fixture(autouse=True)
+def _debug_dir(tmp_path, monkeypatch):
+    """Keep debug dumps of invalid template sizes out of the working directory."""
+    monkeypatch.setattr(
+        "adb_auto_player.template_matching.template_matcher._DEBUG_DIR", tmp_path
+    )
+
+
 class TestPrepareImagesForProcessing:
     """Tests for _prepare_images_for_processing function."""
 
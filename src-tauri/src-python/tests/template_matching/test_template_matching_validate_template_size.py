@@ -4,6 +4,14 @@ from adb_auto_player.template_matching.template_matcher import _validate_templat
 from .test_image_creator import TestImageCreator
 
 
+@pytest.fixture(autouse=True)
+def _debug_dir(tmp_path, monkeypatch):
+    """Keep debug dumps of invalid template sizes out of the working directory."""
+    monkeypatch.setattr(
+        "adb_auto_player.template_matching.template_matcher._DEBUG_DIR", tmp_path
+    )
+
+
 class TestValidateTemplateSize:
     """Tests for _validate_template_size function."""
 
@@ -25,6 +33,17 @@ class TestValidateTemplateSize:
         ):
             _validate_template_size(base_image, template_image)
 
+    def test_larger_template_is_dumped_before_raising(self, tmp_path):
+        """Test the debug dumps are written when the error is raised."""
+        base_image = TestImageCreator.create_solid_color_image(100, 200)
+        template_image = TestImageCreator.create_solid_color_image(150, 100)
+
+        with pytest.raises(ValueError):
+            _validate_template_size(base_image, template_image)
+
+        assert (tmp_path / "validate_template_size_base_image.png").exists()
+        assert (tmp_path / "validate_template_size_template_image.png").exists()
+
     def test_template_larger_height_raises_error(self):
         """Test that template larger in height raises ValueError."""
         base_image = TestImageCreator.create_solid_color_image(200, 100)
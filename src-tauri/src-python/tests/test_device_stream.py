@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch
 import av
 import numpy as np
 from adb_auto_player.device.adb import DeviceStream, StreamingNotSupportedError
+from adb_auto_player.device.adb.device_stream import _scaled_size
 from adb_auto_player.file_loader import SettingsLoader
 from av.container.output import OutputContainer
 from av.video.stream import VideoStream
@@ -184,6 +185,32 @@ class TestDeviceStream(unittest.TestCase):
         stream.start()
         # Should return at line 108 without starting a new thread
 
+    def test_scaled_stream_requests_reduced_size(self):
+        """--size keeps the aspect ratio with even dimensions."""
+        mock_device = Mock()
+        mock_device.is_controlling_emulator = False
+        mock_device.screenshot_display_id = None
+        mock_device.get_display_info.return_value.resolution = Mock(
+            width=1080, height=1920
+        )
+        stream = DeviceStream(mock_device, fps=5, scale=0.33)
+
+        cmdargs = stream._screenrecord_cmdargs(time_limit=False)
+
+        self.assertIn("--size 342x608", cmdargs)
+        self.assertAlmostEqual(stream.scale, 342 / 1080)
+        self.assertAlmostEqual(stream.scale, 608 / 1920)
+
+    def test_scaled_size_without_common_even_size_is_full_size(self):
+        self.assertEqual(_scaled_size(1080, 2400, 0.5), (540, 1200))
+        self.assertEqual(_scaled_size(1081, 1921, 0.5), (1081, 1921))
+
+    def test_invalid_scale(self):
+        mock_device = Mock()
+        mock_device.is_controlling_emulator = False
+        with self.assertRaises(ValueError):
+            DeviceStream(mock_device, fps=5, scale=1.5)
+
     def test_handle_stream_success_coverage(self):
         """Cover line 166: buffer.clear() on success."""
         mock_device = Mock()
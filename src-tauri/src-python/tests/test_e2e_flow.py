@@ -29,6 +29,7 @@ from unittest.mock import patch
 import adb_auto_player.__main__ as main_mod
 import pytest
 from adb_auto_player.__main__ import StartTaskBody, start_task
+from adb_auto_player.task_worker import TaskRequest
 
 
 @pytest.fixture
@@ -50,33 +51,35 @@ async def test_start_task_e2e_flow():
     main_mod._base_app_config_dir = MagicMock()
     main_mod._base_resource_dir = MagicMock()
 
-    # Mock the multiprocessing.Process to control its lifecycle
-    mock_process = MagicMock()
+    # Mock the task worker to control its lifecycle
+    mock_worker = MagicMock()
     # Simulates running twice, then stopping
-    mock_process.is_alive.side_effect = [True, True, False]
-    mock_process.exitcode = 0
+    mock_worker.is_alive.side_effect = [True, True, False]
+    mock_worker.exitcode = 0
 
     # Mock Queue messages
-    mock_queue = MagicMock()
-    mock_queue.empty.side_effect = [False, True]
-    mock_queue.get_nowait.return_value = "Success: 5 stages cleared"
+    mock_worker.summary_queue.empty.side_effect = [False, True]
+    mock_worker.summary_queue.get_nowait.return_value = "Success: 5 stages cleared"
 
     with (
-        patch(
-            "adb_auto_player.__main__.Process", return_value=mock_process
-        ) as mock_process_cls,
-        patch("adb_auto_player.__main__.Queue", return_value=mock_queue),
+        patch("adb_auto_player.__main__.task_worker_pool") as mock_pool,
         patch("adb_auto_player.__main__.QueueListener") as mock_listener_cls,
         patch("adb_auto_player.__main__.Emitter.emit") as mock_emit,
     ):
+        mock_pool.acquire.return_value = mock_worker
+
         # Run start_task
         await start_task(app_handle_mock, body)
 
-        # Assert process was created with correct args
-        mock_process_cls.assert_called_once()
-        _, kwargs = mock_process_cls.call_args
-        assert kwargs["target"].__name__ == "run_task"
-        assert kwargs["args"][0] == "AFKStages --season False"
+        # Assert the task was submitted to a worker of the profile
+        mock_pool.acquire.assert_called_once()
+        assert mock_pool.acquire.call_args[0][0] == 0
+        mock_worker.submit.assert_called_once_with(
+            TaskRequest(command="AFKStages --season False")
+        )
+
+        # Assert a spare worker is started for the next task
+        mock_pool.prefork.assert_called_once()
 
         # Assert listener was started and stopped
         mock_listener_cls.return_value.start.assert_called_once()
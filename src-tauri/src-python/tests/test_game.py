@@ -8,6 +8,7 @@ from typing import cast
 from unittest.mock import DEFAULT, MagicMock, patch
 
 import cv2
+import numpy as np
 from adb_auto_player.exceptions import (
     AutoPlayerError,
     AutoPlayerUnrecoverableError,
@@ -44,6 +45,20 @@ class MockGame(Game):
         return MockSettings()
 
 
+def _small_frames() -> tuple[np.ndarray, np.ndarray]:
+    """Two different screens, downscaled so comparing them is fast under load."""
+    f1, f2 = (
+        cv2.resize(
+            IO.load_image(TEST_DATA_DIR / f"records_formation_{index}.png"),
+            None,
+            fx=0.25,
+            fy=0.25,
+        )
+        for index in (1, 2)
+    )
+    return f1, f2
+
+
 class TestGame(unittest.TestCase):
     """Test Game class."""
 
@@ -136,6 +151,78 @@ class TestGame(unittest.TestCase):
             )
         )
 
+    @patch.object(Game, "get_screenshot")
+    def test_wait_until_stable_returns_early(self, get_screenshot) -> None:
+        """Test wait_until_stable returns once the changed screen settled."""
+        game = MockGame()
+        f1, f2 = _small_frames()
+        frames = iter([f1] + [f2] * 100)
+        get_screenshot.side_effect = lambda: next(frames)
+
+        waited = game.wait_until_stable(
+            max_wait=5.0, settle_frames=2, poll_interval=0.01
+        )
+
+        self.assertLess(waited, 1.0)
+        self.assertEqual(get_screenshot.call_count, 4)
+        self.assertGreater(game._stable_wait_saved, 4.0)
+
+    @patch.object(Game, "get_screenshot")
+    def test_wait_until_stable_lagging_change(self, get_screenshot) -> None:
+        """Test wait_until_stable waits for a change that starts after a lag."""
+        game = MockGame()
+        f1, f2 = _small_frames()
+        # The stream returns the old frame until the transition starts.
+        frames = iter([f1] * 6 + [f2] * 100)
+        get_screenshot.side_effect = lambda: next(frames)
+
+        waited = game.wait_until_stable(
+            max_wait=5.0, settle_frames=2, poll_interval=0.01
+        )
+
+        self.assertLess(waited, 2.0)
+        self.assertEqual(get_screenshot.call_count, 9)
+
+    @patch.object(Game, "get_screenshot")
+    def test_wait_until_stable_unchanged_screen(self, get_screenshot) -> None:
+        """Test wait_until_stable waits min_wait if the screen never changes."""
+        game = MockGame()
+        get_screenshot.return_value = IO.load_image(
+            TEST_DATA_DIR / "records_formation_1.png"
+        )
+
+        waited = game.wait_until_stable(
+            max_wait=5.0, min_wait=0.3, settle_frames=2, poll_interval=0.01
+        )
+
+        self.assertGreaterEqual(waited, 0.3)
+        self.assertLess(waited, 5.0)
+
+    @patch.object(Game, "get_screenshot")
+    def test_wait_until_stable_changing_screen(self, get_screenshot) -> None:
+        """Test wait_until_stable waits max_wait while the screen keeps changing."""
+        game = MockGame()
+        f1 = IO.load_image(TEST_DATA_DIR / "records_formation_1.png")
+        f2 = IO.load_image(TEST_DATA_DIR / "records_formation_2.png")
+        frames = iter([f1, f2] * 100)
+        get_screenshot.side_effect = lambda: next(frames)
+
+        waited = game.wait_until_stable(max_wait=0.3, poll_interval=0.01)
+
+        self.assertGreaterEqual(waited, 0.3)
+        self.assertEqual(game._stable_wait_saved, 0.0)
+
+    @patch("adb_auto_player.game._template_mixin.sleep")
+    @patch.object(Game, "get_screenshot")
+    def test_wait_until_stable_disabled(self, get_screenshot, mock_sleep) -> None:
+        """Test wait_until_stable falls back to a fixed sleep when disabled."""
+        game = MockGame()
+        game.app_settings.advanced.wait_for_stable_screen = False
+
+        self.assertEqual(game.wait_until_stable(max_wait=2.0), 2.0)
+        mock_sleep.assert_called_once_with(2.0)
+        get_screenshot.assert_not_called()
+
     @patch.multiple(
         Game,
         get_screenshot=DEFAULT,
@@ -339,3 +426,116 @@ class TestGame(unittest.TestCase):
         error = AutoPlayerError("test")
         game._handle_task_error("task1", error)
         mock_start.assert_not_called()
+
+    @patch.object(
+        Game, "_apply_vertical_offset_to_screenshot", side_effect=lambda i, *_: i
+    )
+    def test_get_screenshot_prefers_frame_broker(self, _offset) -> None:
+        """Test get_screenshot reads from an attached Frame Broker first."""
+        game = MockGame()
+        game._stream = MagicMock()
+        reader = MagicMock()
+        reader.get_latest_frame.return_value = "broker frame"
+        game._frame_reader = reader
+
+        self.assertEqual(game.get_screenshot(), "broker frame")
+        game._stream.get_latest_frame.assert_not_called()
+
+        game.stop_stream()
+        reader.close.assert_called_once()
+        self.assertIsNone(game._frame_reader)
+
+    @patch("adb_auto_player.game._screenshot_mixin.FrameBroker")
+    @patch("adb_auto_player.game._screenshot_mixin.SettingsLoader.adb_settings")
+    def test_frame_broker_is_opt_in(self, adb_settings, frame_broker) -> None:
+        """Test no Frame Broker is probed unless it is enabled."""
+        game = MockGame()
+        game._device = MagicMock()
+        adb_settings.return_value.device.frame_broker = False
+
+        self.assertFalse(game._attach_frame_broker())
+        frame_broker.assert_not_called()
+
+        adb_settings.return_value.device.frame_broker = True
+        frame_broker.return_value.start.return_value = True
+        reader = frame_broker.return_value.attach.return_value
+        reader.get_latest_frame.return_value = "broker frame"
+
+        self.assertTrue(game._attach_frame_broker())
+        frame_broker.return_value.start.assert_called_once()
+        self.assertIs(game._frame_reader, reader)
+
+    @patch("adb_auto_player.game._screenshot_mixin.DeviceStream")
+    @patch("adb_auto_player.game._screenshot_mixin.SettingsLoader.adb_settings")
+    def test_stream_scale_setting(self, adb_settings, device_stream) -> None:
+        """Test the stream is scaled by the device setting unless overridden."""
+        game = MockGame()
+        game._device = MagicMock()
+        adb_settings.return_value.device.frame_broker = False
+        adb_settings.return_value.device.stream_scale = 0.5
+        device_stream.return_value.get_latest_frame.return_value = "frame"
+
+        game.start_stream()
+        self.assertEqual(device_stream.call_args.kwargs["scale"], 0.5)
+
+        game.stream_scale = 0.25
+        game.start_stream()
+        self.assertEqual(device_stream.call_args.kwargs["scale"], 0.25)
+
+    @patch.object(Game, "get_scaled_screenshot")
+    def test_find_template_in_scaled_screenshot(self, get_scaled_screenshot) -> None:
+        """Test matches in a half-resolution stream map back to device space."""
+        game = MockGame()
+        base_image = IO.load_image(TEST_DATA_DIR / "template_match_base.png")
+        template_image = "template_match_template.png"
+        get_scaled_screenshot.return_value = (base_image, 1.0)
+        full = game.game_find_template_match(template_image)
+
+        half = cv2.resize(base_image, None, fx=0.5, fy=0.5)
+        get_scaled_screenshot.return_value = (half, 0.5)
+        scaled = game.game_find_template_match(template_image)
+
+        assert full is not None
+        assert scaled is not None
+        self.assertLessEqual(abs(scaled.x - full.x), 2)
+        self.assertLessEqual(abs(scaled.y - full.y), 2)
+        self.assertLessEqual(abs(scaled.box.width - full.box.width), 2)
+
+    @patch.object(Game, "get_scaled_screenshot")
+    def test_pixel_crop_in_scaled_screenshot(self, get_scaled_screenshot) -> None:
+        """Test pixel crop regions are in device pixels for a scaled stream."""
+        game = MockGame()
+        base_image = IO.load_image(TEST_DATA_DIR / "template_match_base.png")
+        template_image = "template_match_template.png"
+        crop_regions = CropRegions(left="100px", top="1600px")
+        get_scaled_screenshot.return_value = (base_image, 1.0)
+        full = game.game_find_template_match(template_image, crop_regions=crop_regions)
+
+        half = cv2.resize(base_image, None, fx=0.5, fy=0.5)
+        get_scaled_screenshot.return_value = (half, 0.5)
+        scaled = game.game_find_template_match(
+            template_image, crop_regions=crop_regions
+        )
+
+        assert full is not None
+        assert scaled is not None
+        self.assertLessEqual(abs(scaled.x - full.x), 2)
+        self.assertLessEqual(abs(scaled.y - full.y), 2)
+
+    @patch.object(Game, "display_info")
+    def test_get_screenshot_upscales_scaled_stream(self, display_info) -> None:
+        """Test get_screenshot returns device resolution for a scaled stream."""
+        game = MockGame()
+        game.stream_scale = 0.5
+        game._stream = MagicMock(scale=0.5)
+        game._stream.get_latest_frame.return_value = np.zeros(
+            (960, 540, 3), dtype=np.uint8
+        )
+        display_info.dimensions = (1080, 1920)
+
+        with patch.object(
+            Game, "_apply_vertical_offset_to_screenshot", side_effect=lambda i, *_: i
+        ):
+            image, scale = game.get_scaled_screenshot()
+            self.assertEqual((image.shape[:2], scale), ((960, 540), 0.5))
+            self.assertEqual(game.get_screenshot().shape[:2], (1920, 1080))
@@ -0,0 +1,137 @@
+"""Tests for the profile state service pushing state changes to the GUI."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from adb_auto_player.exceptions import GenericAdbUnrecoverableError
+from adb_auto_player.ipc import GameGUIOptions, ProfileStateUpdate
+from adb_auto_player.tauri_helpers import ProfileStateService
+
+_MODULE = "adb_auto_player.tauri_helpers.profile_state_service"
+
+_MENU = GameGUIOptions(game_title="AFK Journey", menu_options=[], categories=[])
+
+
+@pytest.fixture
+def controller():
+    controller = MagicMock()
+    controller.d.serial = "127.0.0.1:5555"
+    controller.get_running_app.return_value = "com.farlightgames.igame.gp"
+    with patch(f"{_MODULE}.AdbController", return_value=controller) as cls:
+        controller.cls = cls
+        yield controller
+
+
+@pytest.fixture
+def menu_lookup():
+    def lookup(package_name):
+        return _MENU if package_name == "com.farlightgames.igame.gp" else None
+
+    with patch(f"{_MODULE}.get_game_gui_options_for_app", side_effect=lookup) as m:
+        yield m
+
+
+class _Service:
+    def __init__(self, **kwargs):
+        self.updates: list[ProfileStateUpdate] = []
+        self.active_task: str | None = None
+        self.service = ProfileStateService(
+            1,
+            publish=self.updates.append,
+            active_task=lambda: self.active_task,
+            **kwargs,
+        )
+
+
+def test_publishes_only_changes(controller, menu_lookup):
+    s = _Service()
+
+    s.service.update()
+    s.service.update()
+
+    assert len(s.updates) == 1
+    assert s.updates[0].index == 1
+    assert s.updates[0].state.game_menu == _MENU
+    assert s.updates[0].state.device_id == "127.0.0.1:5555"
+
+    controller.get_running_app.return_value = "com.android.launcher"
+    s.service.update()
+
+    assert len(s.updates) == 2
+    assert s.updates[1].state.game_menu is None
+    controller.cls.assert_called_once()
+    assert menu_lookup.call_count == 2
+
+
+def test_refresh_publishes_unchanged_state(controller, menu_lookup):
+    s = _Service()
+    s.service.update()
+
+    s.service.refresh()
+    s.service.update()
+
+    assert len(s.updates) == 2
+    assert s.updates[0].state == s.updates[1].state
+    assert menu_lookup.call_count == 1
+
+
+def test_device_error_reconnects(controller, menu_lookup, caplog):
+    on_device_error = MagicMock()
+    s = _Service(on_device_error=on_device_error)
+    controller.get_running_app.side_effect = GenericAdbUnrecoverableError("offline")
+
+    s.service.update()
+    s.service.update()
+
+    assert len(s.updates) == 1
+    assert s.updates[0].state.device_id is None
+    assert on_device_error.call_count == 2
+    assert caplog.text.count("offline") == 1
+
+    controller.get_running_app.side_effect = None
+    s.service.update()
+
+    assert s.updates[-1].state.game_menu == _MENU
+    assert controller.cls.call_count == 3
+
+
+def test_no_device_queries_while_task_runs(controller, menu_lookup):
+    s = _Service()
+    s.service.update()
+
+    s.active_task = "AFK Stages"
+    s.service.update()
+    s.service.update()
+
+    assert controller.get_running_app.call_count == 1
+    assert s.updates[-1].state.active_task == "AFK Stages"
+    assert s.updates[-1].state.game_menu == _MENU
+
+
+def test_reset_looks_up_the_game_again(controller, menu_lookup):
+    s = _Service()
+    s.service.update()
+
+    s.service.reset()
+    s.service.update()
+
+    assert controller.cls.call_count == 2
+    assert menu_lookup.call_count == 2
+    assert len(s.updates) == 2
+
+
+def test_thread_publishes_on_start(controller, menu_lookup):
+    published = threading.Event()
+    service = ProfileStateService(
+        0, publish=lambda _: published.set(), active_task=lambda: None
+    )
+
+    service.start()
+    try:
+        assert published.wait(5)
+        assert service.is_running()
+    finally:
+        service.stop(timeout=5)
+
+    assert not service.is_running()
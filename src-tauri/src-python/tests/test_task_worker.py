@@ -0,0 +1,121 @@
+"""Pytest Task Worker Module."""
+
+import multiprocessing
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import sleep
+from unittest.mock import patch
+
+from adb_auto_player.task_worker import TaskRequest, TaskWorkerPool, run_task
+
+RESOURCE_DIR: Path = Path(__file__).parents[1] / "adb_auto_player"
+
+
+class TestTaskWorkerPool(unittest.TestCase):
+    """Test cases for TaskWorkerPool."""
+
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.app_config_dir = Path(self.directory.name)
+        self.pool = TaskWorkerPool()
+
+    def tearDown(self) -> None:
+        self.pool.recycle()
+        self.directory.cleanup()
+
+    def test_acquire_uses_the_warm_spare(self) -> None:
+        self.pool.prefork(0, self.app_config_dir, RESOURCE_DIR)
+        self.assertTrue(self.pool.has_spare(0))
+
+        with self.assertLogs(level="DEBUG") as logs:
+            worker = self.pool.acquire(0, self.app_config_dir, RESOURCE_DIR)
+
+        self.assertFalse(self.pool.has_spare(0))
+        self.assertIn("Using warm task worker", logs.output[0])
+        worker.submit(TaskRequest(command="UnknownCommand"))
+        worker.process.join(timeout=60)
+        self.assertEqual(worker.exitcode, 0)
+        self.assertGreater(worker.warm_up_seconds, 0)
+
+    def test_warm_up_logs_are_not_forwarded(self) -> None:
+        worker = self.pool.acquire(0, self.app_config_dir, RESOURCE_DIR)
+        while worker.is_alive() and not worker._connection.poll(0.1):
+            pass
+
+        self.assertTrue(worker.log_queue.empty())
+        worker.submit(TaskRequest(command="UnknownCommand"))
+        worker.process.join(timeout=60)
+        messages = []
+        while not worker.log_queue.empty():
+            messages.append(worker.log_queue.get(timeout=1).getMessage())
+        self.assertFalse(any("could not connect to the device" in m for m in messages))
+
+    def test_acquire_without_spare_starts_a_worker(self) -> None:
+        worker = self.pool.acquire(1, self.app_config_dir, RESOURCE_DIR)
+
+        self.assertTrue(worker.is_alive())
+        worker.terminate()
+        self.assertIsNotNone(worker.exitcode)
+
+    def test_spare_of_other_settings_is_replaced(self) -> None:
+        self.pool.prefork(0, self.app_config_dir, RESOURCE_DIR)
+        spare = self.pool._spares[0]
+
+        worker = self.pool.acquire(0, self.app_config_dir / "other", RESOURCE_DIR)
+
+        self.assertIsNot(worker, spare)
+        self.assertFalse(spare.is_alive())
+        worker.terminate()
+
+    def test_recycle_terminates_spares(self) -> None:
+        self.pool.prefork(0, self.app_config_dir, RESOURCE_DIR)
+        self.pool.prefork(1, self.app_config_dir, RESOURCE_DIR)
+        spare = self.pool._spares[0]
+
+        self.pool.recycle(0)
+
+        self.assertFalse(spare.is_alive())
+        self.assertFalse(self.pool.has_spare(0))
+        self.assertTrue(self.pool.has_spare(1))
+
+
+class TestRunTask(unittest.TestCase):
+    """Test cases for run_task."""
+
+    def test_stopped_profiled_task_exits_by_sigterm(self) -> None:
+        # -15 is how start_task tells a stopped task from a completed one.
+        self.assertEqual(self._stop_task(TaskRequest("Long", profile=True)), -15)
+
+    def test_stopped_memory_watched_task_exits_by_sigterm(self) -> None:
+        request = TaskRequest("Long", memory_watch=True)
+        self.assertEqual(self._stop_task(request), -15)
+
+    def _stop_task(self, request: TaskRequest) -> int | None:
+        started = multiprocessing.Event()
+
+        def long_task(*_):
+            started.set()
+            sleep(30)
+
+        with (
+            patch("adb_auto_player.task_worker.get_game_tasks", return_value={}),
+            patch(
+                "adb_auto_player.task_worker.Execute.find_command_and_execute",
+                side_effect=long_task,
+            ),
+        ):
+            process = multiprocessing.get_context("fork").Process(
+                target=run_task,
+                args=(request,),
+            )
+            process.start()
+            self.assertTrue(started.wait(10))
+            process.terminate()
+            process.join(10)
+
+        return process.exitcode
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from adb_auto_player.util import Instrumentation, Measurement, RunMetrics, Tracer
+
+
+@Instrumentation.measured(RunMetrics.OCR)
+def _ocr(nested: bool = False) -> str:
+    if nested:
+        _ocr()
+    return "text"
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for Instrumentation."""
+
+    def setUp(self) -> None:
+        self.measurements: list[Measurement] = []
+        RunMetrics.reset()
+        Instrumentation.set_observer(self.measurements.append)
+        Tracer.enable()
+
+    def tearDown(self) -> None:
+        Instrumentation.set_observer(None)
+        Tracer.disable()
+        Tracer.clear()
+        RunMetrics.reset()
+
+    def test_nested_calls_are_traced_but_counted_and_observed_once(self) -> None:
+        self.assertEqual(_ocr(nested=True), "text")
+
+        self.assertEqual(RunMetrics.count(RunMetrics.OCR), 1)
+        self.assertEqual([m.name for m in self.measurements], ["_ocr"])
+        self.assertEqual(self.measurements[0].result, "text")
+        self.assertAlmostEqual(
+            RunMetrics.seconds(RunMetrics.OCR), self.measurements[0].seconds
+        )
+        events = Tracer.events()
+        self.assertEqual([e["name"] for e in events], ["_ocr", "_ocr"])
+        self.assertEqual({e["cat"] for e in events}, {RunMetrics.OCR})
+
+    def test_block_result_and_details_reach_the_observer(self) -> None:
+        with Instrumentation.measure(
+            RunMetrics.TEMPLATE_MATCH, "battle.png", kind="worst_match"
+        ) as measurement:
+            measurement.result = None
+
+        self.assertEqual(self.measurements[0].details, {"kind": "worst_match"})
+        self.assertEqual(RunMetrics.count(RunMetrics.TEMPLATE_MATCH), 1)
+
+    def test_failed_calls_are_counted_and_traced_but_not_observed(self) -> None:
+        with (
+            self.assertRaises(ValueError),
+            Instrumentation.measure(RunMetrics.OCR, "failing"),
+        ):
+            raise ValueError
+
+        self.assertEqual(self.measurements, [])
+        self.assertEqual(RunMetrics.count(RunMetrics.OCR), 1)
+        self.assertEqual(Tracer.events()[0]["args"], {"error": "ValueError"})
+
+
+if __name__ == "__main__":
+    unittest.main()
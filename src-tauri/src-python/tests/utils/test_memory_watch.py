@@ -0,0 +1,66 @@
+import tracemalloc
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from adb_auto_player.models.commands import Command
+from adb_auto_player.util import Execute, MemoryWatch
+
+_leak: list[bytes] = []
+
+
+def _grow(count: int = 200) -> None:
+    _leak.extend(bytes(10_000) for _ in range(count))
+
+
+class TestMemoryWatch(unittest.TestCase):
+    """Test cases for MemoryWatch."""
+
+    def tearDown(self) -> None:
+        MemoryWatch.enabled = False
+        _leak.clear()
+
+    def test_sample_diffs_allocation_sites(self) -> None:
+        with MemoryWatch(interval=60) as watch:
+            _grow()
+            sample = watch.sample()
+
+        self.assertEqual(len(watch.samples), 3)
+        self.assertGreater(sample.traced, watch.samples[0].traced)
+        self.assertIn("test_memory_watch.py", sample.top_growth[0])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_growth_above_threshold_logs_a_warning(self) -> None:
+        watch = MemoryWatch(growth_threshold_mb=1)
+
+        with (
+            patch.object(watch._process, "memory_info") as memory_info,
+            self.assertLogs(level="WARNING") as logs,
+        ):
+            memory_info.return_value.rss = 100 * 1024 * 1024
+            watch.start()
+            memory_info.return_value.rss = 103 * 1024 * 1024
+            watch.sample()
+            watch.sample()
+            watch.stop()
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("grew by 3 MB", logs.output[0])
+
+    def test_command_writes_a_report_when_enabled(self) -> None:
+        MemoryWatch.enabled = True
+        command = Command(name="WatchedCommand", action=_grow)
+
+        with TemporaryDirectory() as directory:
+            with patch("adb_auto_player.util.execute._MEMORY_DIR", Path(directory)):
+                Execute.command(command)
+            reports = list(Path(directory).glob("WatchedCommand_*.txt"))
+            report = reports[0].read_text()
+
+        self.assertIn("Largest growth since start:", report)
+        self.assertIn("test_memory_watch.py", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import contextvars
+import logging
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from adb_auto_player.file_loader import SettingsLoader
+from adb_auto_player.models.commands import Command
+from adb_auto_player.util import (
+    Execute,
+    Instrumentation,
+    MetricsLedger,
+    RunMetrics,
+    TaskRun,
+)
+
+
+def _run(task: str, duration: float, **metrics) -> TaskRun:
+    return TaskRun(
+        task=task,
+        device_serial="emulator-5554",
+        started_at="2026-01-01T00:00:00",
+        duration=duration,
+        **metrics,
+    )
+
+
+@Instrumentation.measured(RunMetrics.OCR)
+def _ocr(nested: bool = False) -> None:
+    if nested:
+        _ocr()
+
+
+def _task() -> None:
+    _ocr(nested=True)
+    _ocr()
+    logging.error("Something went wrong")
+
+
+class TestMetricsLedger(unittest.TestCase):
+    """Test cases for MetricsLedger."""
+
+    def setUp(self) -> None:
+        self.directory = TemporaryDirectory()
+        self.ledger = MetricsLedger(Path(self.directory.name) / "metrics.sqlite3")
+
+    def tearDown(self) -> None:
+        MetricsLedger.enabled = False
+        self.directory.cleanup()
+
+    def test_empty_ledger(self) -> None:
+        self.assertEqual(self.ledger.tasks(), [])
+        self.assertEqual(self.ledger.runs(), [])
+        self.assertEqual(self.ledger.summary(), "No task runs recorded")
+
+    def test_runs_are_returned_newest_first(self) -> None:
+        self.ledger.record(_run("A", 1.0, screenshots=4, screenshot_seconds=0.2))
+        self.ledger.record(_run("B", 2.0))
+        self.ledger.record(_run("A", 3.0))
+
+        self.assertEqual(self.ledger.tasks(), ["A", "B"])
+        runs = self.ledger.runs("A")
+        self.assertEqual([run.duration for run in runs], [3.0, 1.0])
+        self.assertAlmostEqual(runs[1].screenshot_latency, 0.05)
+
+    def test_regressions_compare_latest_runs_with_runs_before(self) -> None:
+        for duration in [10.0, 10.0, 13.0, 13.0]:
+            self.ledger.record(_run("LegendTrial", duration))
+        for duration in [10.0, 10.0, 10.0, 10.0]:
+            self.ledger.record(_run("AFKStages", duration))
+
+        self.assertIsNone(self.ledger.trend("LegendTrial", window=4))
+        regressions = self.ledger.regressions(window=2)
+        self.assertEqual([trend.task for trend in regressions], ["LegendTrial"])
+        self.assertAlmostEqual(regressions[0].change, 0.3)
+        self.assertIn("LegendTrial got 30% slower", self.ledger.summary(window=2))
+
+    def test_command_records_a_run_when_enabled(self) -> None:
+        MetricsLedger.enabled = True
+
+        def execute() -> None:
+            SettingsLoader.set_app_config_dir(Path(self.directory.name))
+            Execute.command(Command(name="MeasuredCommand", action=_task))
+
+        with self.assertLogs(level="ERROR"):
+            contextvars.copy_context().run(execute)
+
+        ledger = MetricsLedger.in_app_config_dir(Path(self.directory.name))
+        run = ledger.runs("MeasuredCommand")[0]
+        self.assertEqual(run.ocr_calls, 2)
+        self.assertEqual(run.errors, 1)
+        self.assertGreater(run.duration, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
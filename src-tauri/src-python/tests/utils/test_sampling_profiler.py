@@ -0,0 +1,60 @@
+import threading
+import time
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from adb_auto_player.models.commands import Command
+from adb_auto_player.util import Execute, SamplingProfiler
+
+
+def _busy_loop(seconds: float = 0.3) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        sum(range(1000))
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """Test cases for SamplingProfiler."""
+
+    def tearDown(self) -> None:
+        SamplingProfiler.enabled = False
+
+    def test_samples_collapsed_stacks_of_other_threads(self) -> None:
+        with SamplingProfiler(interval=0.005) as profiler:
+            _busy_loop()
+
+        busy = [s for s in profiler.stacks if "_busy_loop" in s]
+        self.assertGreater(profiler.samples, 0)
+        self.assertTrue(busy)
+        self.assertTrue(
+            all(s.startswith(f"{threading.current_thread().name};") for s in busy)
+        )
+        self.assertFalse(any("SamplingProfiler._run" in s for s in profiler.stacks))
+
+    def test_write_outputs_one_line_per_stack(self) -> None:
+        profiler = SamplingProfiler()
+        profiler.stacks.update({"MainThread;a;b": 3, "MainThread;a": 1})
+
+        with TemporaryDirectory() as directory:
+            path = profiler.write(Path(directory) / "profiles" / "run.collapsed")
+            lines = path.read_text().splitlines()
+
+        self.assertEqual(lines, ["MainThread;a;b 3", "MainThread;a 1"])
+
+    def test_command_writes_a_profile_when_enabled(self) -> None:
+        SamplingProfiler.enabled = True
+        command = Command(name="ProfiledCommand", action=_busy_loop)
+
+        with TemporaryDirectory() as directory:
+            with patch("adb_auto_player.util.execute._PROFILE_DIR", Path(directory)):
+                Execute.command(command)
+            profiles = list(Path(directory).glob("ProfiledCommand_*.collapsed"))
+            content = profiles[0].read_text()
+
+        self.assertIn("_busy_loop", content)
+
+
+if __name__ == "__main__":
+    unittest.main()
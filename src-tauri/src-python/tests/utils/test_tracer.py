@@ -0,0 +1,86 @@
+import json
+import threading
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+import numpy as np
+from adb_auto_player.models.commands import Command
+from adb_auto_player.template_matching import TemplateMatcher
+from adb_auto_player.util import Execute, Tracer
+
+
+@Tracer.trace(category="test")
+def _work(value: int) -> int:
+    return value * 2
+
+
+class TestTracer(unittest.TestCase):
+    """Test cases for Tracer."""
+
+    def tearDown(self) -> None:
+        Tracer.disable()
+        Tracer.clear()
+
+    def test_disabled_tracer_records_nothing(self) -> None:
+        with Tracer.span("idle"):
+            _work(1)
+
+        self.assertEqual(Tracer.events(), [])
+
+    def test_spans_and_decorated_calls_are_recorded(self) -> None:
+        Tracer.enable()
+
+        with Tracer.span("outer", "test", step=1):
+            self.assertEqual(_work(2), 4)
+        thread = threading.Thread(target=_work, args=(3,), name="worker")
+        thread.start()
+        thread.join()
+
+        events = Tracer.events()
+        self.assertEqual([e["name"] for e in events], ["_work", "outer", "_work"])
+        self.assertEqual(events[1]["args"], {"step": 1})
+        self.assertGreaterEqual(events[1]["dur"], events[0]["dur"])
+        self.assertNotEqual(events[0]["tid"], events[2]["tid"])
+
+    def test_errors_are_recorded_on_the_span(self) -> None:
+        Tracer.enable()
+
+        with self.assertRaises(ValueError), Tracer.span("failing"):
+            raise ValueError
+
+        self.assertEqual(Tracer.events()[0]["args"], {"error": "ValueError"})
+
+    def test_export_writes_chrome_trace_json(self) -> None:
+        Tracer.enable()
+        image = np.zeros((20, 20, 3), np.uint8)
+        TemplateMatcher.find_template_match(image, image[:10, :10])
+
+        with TemporaryDirectory() as directory:
+            path = Tracer.export(Path(directory) / "traces" / "run.json")
+            trace = json.loads(path.read_text())
+
+        phases = {e["ph"] for e in trace["traceEvents"]}
+        names = [e["name"] for e in trace["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual(phases, {"M", "X"})
+        self.assertIn("cv2.matchTemplate", names)
+        self.assertIn("TemplateMatcher.find_template_match", names)
+        self.assertEqual(Tracer.events(), [])
+
+    def test_command_exports_a_trace_per_run(self) -> None:
+        Tracer.enable()
+        command = Command(name="TracedCommand", action=lambda: _work(1))
+
+        with TemporaryDirectory() as directory:
+            with patch("adb_auto_player.util.execute._TRACE_DIR", Path(directory)):
+                Execute.command(command)
+            traces = list(Path(directory).glob("TracedCommand_*.json"))
+            trace = json.loads(traces[0].read_text())
+
+        names = [e["name"] for e in trace["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual(names, ["_work", "TracedCommand"])
+
+
+if __name__ == "__main__":
+    unittest.main()
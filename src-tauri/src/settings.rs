@@ -47,6 +47,12 @@ const APP_SETTINGS_SCHEMA: &str = r##"
             "multipleOf": 0.1,
             "formType": "slider"
           },
+          "wait_for_stable_screen": {
+            "default": true,
+            "title": "Wait For Screen To Settle",
+            "description": "Continue as soon as the screen stops changing instead of always waiting the full action or navigation delay.",
+            "type": "boolean"
+          },
           "template_timeout": {
             "default": 10.0,
             "title": "Template Timeout (Seconds)",
@@ -291,6 +297,8 @@ pub struct AdvancedSettings {
     pub action_delay: f32,
     #[serde(default = "default_navigation_delay")]
     pub navigation_delay: f32,
+    #[serde(default = "default_wait_for_stable_screen")]
+    pub wait_for_stable_screen: bool,
     #[serde(default = "default_template_timeout")]
     pub template_timeout: f32,
     #[serde(default = "default_watchdog_restart_delay")]
@@ -305,6 +313,7 @@ impl Default for AdvancedSettings {
             restart_stuck_task_after_mins: default_restart_mins(),
             action_delay: default_action_delay(),
             navigation_delay: default_navigation_delay(),
+            wait_for_stable_screen: default_wait_for_stable_screen(),
             template_timeout: default_template_timeout(),
             watchdog_restart_delay: default_watchdog_restart_delay(),
         }
@@ -319,6 +328,10 @@ fn default_navigation_delay() -> f32 {
     2.0
 }
 
+fn default_wait_for_stable_screen() -> bool {
+    true
+}
+
 fn default_template_timeout() -> f32 {
     10.0
 }
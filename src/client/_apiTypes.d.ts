@@ -8,6 +8,9 @@
 export type ProfileIndex = number
 export type Args = string[]
 export type Label = string
+export type Profile = boolean
+export type MemoryWatch = boolean
+export type RecordSession = boolean
 export type RootModelNoneType = null
 export type ProfileIndex1 = number
 /**
@@ -108,6 +111,9 @@ export interface StartTaskBody {
 profile_index: ProfileIndex
 args: Args
 label: Label
+profile?: Profile
+memory_watch?: MemoryWatch
+record_session?: RecordSession
 [k: string]: unknown
 }
 export interface ProfileContext {
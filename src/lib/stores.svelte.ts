@@ -57,6 +57,9 @@ const defaultUiState = {
   accentHue: 272,
   customizerOpen: false,
   taskViewVariant: "cards" as "cards" | "palette" | "accordion",
+  profileTasks: false,
+  watchMemory: false,
+  recordTasks: false,
 };
 
 class UiStore {
@@ -68,6 +71,9 @@ class UiStore {
   accentHue = $state(defaultUiState.accentHue);
   customizerOpen = $state(defaultUiState.customizerOpen);
   taskViewVariant = $state(defaultUiState.taskViewVariant);
+  profileTasks = $state(defaultUiState.profileTasks);
+  watchMemory = $state(defaultUiState.watchMemory);
+  recordTasks = $state(defaultUiState.recordTasks);
 
   constructor() {
     if (typeof window !== "undefined") {
@@ -142,6 +148,18 @@ class UiStore {
     this.taskViewVariant = variant;
     this.save();
   }
+
+  setProfileTasks(profile: boolean) {
+    this.profileTasks = profile;
+  }
+
+  setWatchMemory(watch: boolean) {
+    this.watchMemory = watch;
+  }
+
+  setRecordTasks(record: boolean) {
+    this.recordTasks = record;
+  }
 }
 
 export const profiles = new ProfileStore();